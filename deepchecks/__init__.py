@@ -16,9 +16,6 @@ import types
 import warnings
 from importlib._bootstrap import _init_module_attrs
 
-import matplotlib
-import plotly.io as pio
-
 from deepchecks.analytics.anonymous_telemetry import send_anonymous_import_event
 from deepchecks.core import (BaseCheck, BaseSuite, CheckFailure, CheckResult, Condition, ConditionCategory,
                              ConditionResult, ModelOnlyBaseCheck, SingleDatasetBaseCheck, SuiteResult,
@@ -54,18 +51,26 @@ __all__ = [
 
 
 # Matplotlib has multiple backends. If we are in a context that does not support GUI (For example, during unit tests)
-# we can't use a GUI backend. Thus we must use a non-GUI backend.
+# we can't use a GUI backend. Thus we must use a non-GUI backend. Matplotlib is imported lazily by the checks that
+# plot with it, so unless it is already imported, the backend is selected through its environment variable.
 if not is_notebook():
-    matplotlib.use('Agg')
+    if 'matplotlib' in sys.modules:
+        sys.modules['matplotlib'].use('Agg')
+    else:
+        os.environ.setdefault('MPLBACKEND', 'Agg')
 
 
 # We can't rely on that the user will have an active internet connection, thus we change the default backend to
-# "notebook" If plotly detects the 'notebook-connected' backend.
+# "notebook" If plotly detects the 'notebook-connected' backend. Plotly renders to notebooks only, so outside of
+# them it isn't imported at all.
 # for more info, see: https://plotly.com/python/renderers/
-pio_backends = pio.renderers.default.split('+')
-if 'notebook_connected' in pio_backends:
-    pio_backends[pio_backends.index('notebook_connected')] = 'notebook'
-    pio.renderers.default = '+'.join(pio_backends)
+if is_notebook():
+    import plotly.io as pio  # pylint: disable=ungrouped-imports
+
+    pio_backends = pio.renderers.default.split('+')
+    if 'notebook_connected' in pio_backends:
+        pio_backends[pio_backends.index('notebook_connected')] = 'notebook'
+        pio.renderers.default = '+'.join(pio_backends)
 
 
 # Set version info
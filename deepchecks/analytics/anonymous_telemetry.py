@@ -16,6 +16,7 @@ No credentials, data, personal information or anything private is collected (and
 import http.client
 import os
 import pathlib
+import threading
 import uuid
 
 import deepchecks
@@ -25,19 +26,30 @@ ANALYTICS_DISABLED = os.environ.get('DISABLE_DEEPCHECKS_ANONYMOUS_TELEMETRY', Fa
 
 
 def send_anonymous_import_event():
-    """Send an anonymous import event to PostHog."""
+    """Send an anonymous import event to PostHog.
+
+    The event is sent from a background daemon thread, so importing deepchecks never waits on the network and the
+    interpreter can exit without waiting for the request to finish.
+    """
     if not ANALYTICS_DISABLED:
-        try:
-            if os.path.exists(os.path.join(MODULE_DIR, '.user_id')):
-                with open(os.path.join(MODULE_DIR, '.user_id'), 'r', encoding='utf8') as f:
-                    user_id = f.read()
-            else:
-                user_id = str(uuid.uuid4())
-                with open(os.path.join(MODULE_DIR, '.user_id'), 'w', encoding='utf8') as f:
-                    f.write(user_id)
-
-            conn = http.client.HTTPSConnection('api.deepchecks.com', timeout=3)
-            conn.request('GET', f'/metrics?version={deepchecks.__version__}&uuid={user_id}')
-            _ = conn.getresponse()
-        except Exception:  # pylint: disable=broad-except
-            pass
+        thread = threading.Thread(target=_send_import_event, name='deepchecks-telemetry', daemon=True)
+        thread.start()
+        return thread
+    return None
+
+
+def _send_import_event():
+    try:
+        if os.path.exists(os.path.join(MODULE_DIR, '.user_id')):
+            with open(os.path.join(MODULE_DIR, '.user_id'), 'r', encoding='utf8') as f:
+                user_id = f.read()
+        else:
+            user_id = str(uuid.uuid4())
+            with open(os.path.join(MODULE_DIR, '.user_id'), 'w', encoding='utf8') as f:
+                f.write(user_id)
+
+        conn = http.client.HTTPSConnection('api.deepchecks.com', timeout=3)
+        conn.request('GET', f'/metrics?version={deepchecks.__version__}&uuid={user_id}')
+        _ = conn.getresponse()
+    except Exception:  # pylint: disable=broad-except
+        pass
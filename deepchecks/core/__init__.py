@@ -16,6 +16,7 @@ from .check_json import CheckFailureJson, CheckResultJson
 from .check_result import CheckFailure, CheckResult
 from .checks import BaseCheck, DatasetKind, ModelOnlyBaseCheck, SingleDatasetBaseCheck, TrainTestBaseCheck
 from .condition import Condition, ConditionCategory, ConditionResult
+from .result_cache import ResultCache
 from .suite import BaseSuite, SuiteResult
 
 __all__ = [
@@ -32,5 +33,6 @@ __all__ = [
     'SingleDatasetBaseCheck',
     'TrainTestBaseCheck',
     'ModelOnlyBaseCheck',
-    'DatasetKind'
+    'DatasetKind',
+    'ResultCache'
 ]
@@ -9,14 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing the check results classes."""
-# pylint: disable=super-init-not-called
+# pylint: disable=super-init-not-called,import-outside-toplevel
 import base64
 import io
 from typing import Dict, List, Union
 
 import jsonpickle
 import pandas as pd
-import plotly
 
 from deepchecks.core.check_result import CheckFailure, CheckResult
 from deepchecks.core.condition import Condition, ConditionCategory, ConditionResult
@@ -81,8 +80,9 @@ class CheckResultJson(CheckResult):
                     df = pd.DataFrame.from_records(payload)
                     self.display.append(df)
                 elif display_type == 'plotly':
+                    import plotly.io as pio
                     plotly_json = io.StringIO(payload)
-                    self.display.append(plotly.io.read_json(plotly_json))
+                    self.display.append(pio.read_json(plotly_json))
                 elif display_type == 'plt':
                     self.display.append((f'<img src=\'data:image/png;base64,{payload}\'>'))
                 elif display_type == 'images':
@@ -11,6 +11,7 @@
 """Module containing the check results classes."""
 # pylint: disable=broad-except,import-outside-toplevel,unused-argument
 import io
+import sys
 import traceback
 import warnings
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
@@ -18,33 +19,26 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, ca
 import jsonpickle
 import jsonpickle.ext.pandas as jsonpickle_pd
 import pandas as pd
-import plotly.io as pio
-from IPython.display import display, display_html
-from ipywidgets import Widget
-from pandas.io.formats.style import Styler
-from plotly.basedatatypes import BaseFigure
 
 from deepchecks.core.checks import ReduceMixin
 from deepchecks.core.condition import ConditionCategory, ConditionResult
 from deepchecks.core.errors import DeepchecksValueError
-from deepchecks.core.serialization.check_failure.html import CheckFailureSerializer as CheckFailureHtmlSerializer
-from deepchecks.core.serialization.check_failure.json import CheckFailureSerializer as CheckFailureJsonSerializer
-from deepchecks.core.serialization.check_failure.widget import CheckFailureSerializer as CheckFailureWidgetSerializer
-from deepchecks.core.serialization.check_result.html import CheckResultSerializer as CheckResultHtmlSerializer
-from deepchecks.core.serialization.check_result.json import CheckResultSerializer as CheckResultJsonSerializer
-from deepchecks.core.serialization.check_result.widget import CheckResultSerializer as CheckResultWidgetSerializer
-from deepchecks.utils.ipython import is_colab_env, is_kaggle_env, is_notebook, is_widgets_enabled
+from deepchecks.utils.ipython import display, display_html, is_colab_env, is_kaggle_env, is_notebook, is_widgets_enabled
 from deepchecks.utils.strings import create_new_file_name, widget_to_html, widget_to_html_string
 from deepchecks.utils.wandb_utils import wandb_run
 
-from .serialization.check_failure.ipython import CheckFailureSerializer as CheckFailureIPythonSerializer
-from .serialization.check_result.ipython import CheckResultSerializer as CheckResultIPythonSerializer
-
 # registers jsonpickle pandas extension for pandas support in the to_json function
 jsonpickle_pd.register_handlers()
 
 
+# NOTE:
+# The display stack (plotly, matplotlib, IPython, ipywidgets, pandas styler and the serializers built on top of them)
+# is imported only by the methods that display or serialize a result, so computing results doesn't pay for it
 if TYPE_CHECKING:
+    from ipywidgets import Widget
+    from pandas.io.formats.style import Styler
+    from plotly.basedatatypes import BaseFigure
+
     from deepchecks.core.checks import BaseCheck
 
 
@@ -52,7 +46,14 @@ __all__ = ['CheckResult', 'CheckFailure']
 
 
 TDisplayCallable = Callable[[], None]
-TDisplayItem = Union[str, pd.DataFrame, Styler, BaseFigure, TDisplayCallable]
+TDisplayItem = Union[str, pd.DataFrame, 'Styler', 'BaseFigure', TDisplayCallable]
+
+
+def _is_lazy_instance(item: Any, module_name: str, class_name: str) -> bool:
+    """Return whether the item is an instance of the class, without importing its module if it wasn't imported."""
+    # An instance can exist only if its module was already imported
+    module = sys.modules.get(module_name)
+    return module is not None and isinstance(item, getattr(module, class_name))
 
 
 class BaseCheckResult:
@@ -145,7 +146,9 @@ class CheckResult(BaseCheckResult):
             self.display = display or []
 
         for item in self.display:
-            if not isinstance(item, (str, pd.DataFrame, Styler, Callable, BaseFigure)):
+            if not (isinstance(item, (str, pd.DataFrame, Callable))
+                    or _is_lazy_instance(item, 'pandas.io.formats.style', 'Styler')
+                    or _is_lazy_instance(item, 'plotly.basedatatypes', 'BaseFigure')):
                 raise DeepchecksValueError(f'Can\'t display item of type: {type(item)}')
 
     def process_conditions(self):
@@ -206,7 +209,7 @@ class CheckResult(BaseCheckResult):
         unique_id: Optional[str] = None,
         as_widget: bool = True,
         show_additional_outputs: bool = True,
-    ) -> Optional[Widget]:
+    ) -> Optional['Widget']:
         """Display the check result or return the display as widget.
 
         Parameters
@@ -223,6 +226,8 @@ class CheckResult(BaseCheckResult):
         Widget
             Widget representation of the display if as_widget is True.
         """
+        from .serialization.check_result.ipython import CheckResultSerializer as IPythonSerializer
+
         check_sections = (
             ['condition-table', 'additional-output']
             if show_additional_outputs
@@ -252,7 +257,7 @@ class CheckResult(BaseCheckResult):
                     'Widgets are not enabled (or not supported) '
                     'and cannot be used.'
                 )
-            display(*CheckResultIPythonSerializer(self).serialize(
+            display(*IPythonSerializer(self).serialize(
                 output_id=unique_id,
                 check_sections=check_sections  # type: ignore
             ))
@@ -281,6 +286,8 @@ class CheckResult(BaseCheckResult):
         Optional[str] :
             name of newly create file
         """
+        from .serialization.check_result.html import CheckResultSerializer as HtmlSerializer
+
         if file is None:
             file = 'output.html'
         if isinstance(file, str):
@@ -297,7 +304,7 @@ class CheckResult(BaseCheckResult):
                 requirejs=requirejs
             )
         else:
-            html = CheckResultHtmlSerializer(self).serialize(
+            html = HtmlSerializer(self).serialize(
                 output_id=unique_id,
                 full_html=True,
                 include_requirejs=requirejs,
@@ -328,6 +335,8 @@ class CheckResult(BaseCheckResult):
         unique_id : str
             The unique id given by the suite that displays the check.
         """
+        import plotly.io as pio
+
         if is_notebook():
             widget = self.display_check(
                 unique_id=unique_id,
@@ -361,7 +370,7 @@ class CheckResult(BaseCheckResult):
         self,
         unique_id: Optional[str] = None,
         show_additional_outputs: bool = True
-    ) -> Widget:
+    ) -> 'Widget':
         """Return CheckResult as a ipywidgets.Widget instance.
 
         Parameters
@@ -375,12 +384,14 @@ class CheckResult(BaseCheckResult):
         -------
         Widget
         """
+        from .serialization.check_result.widget import CheckResultSerializer as WidgetSerializer
+
         check_sections = (
             ['condition-table', 'additional-output']
             if show_additional_outputs is True
             else ['condition-table']
         )
-        return CheckResultWidgetSerializer(self).serialize(
+        return WidgetSerializer(self).serialize(
             output_id=unique_id,
             check_sections=check_sections  # type: ignore
         )
@@ -446,8 +457,10 @@ class CheckResult(BaseCheckResult):
         -------
         str
         """
+        from .serialization.check_result.json import CheckResultSerializer as JsonSerializer
+
         return jsonpickle.dumps(
-            CheckResultJsonSerializer(self).serialize(
+            JsonSerializer(self).serialize(
                 with_display=with_display
             ),
             unpicklable=False
@@ -475,7 +488,9 @@ class CheckResult(BaseCheckResult):
         )
 
     def _repr_json_(self, **kwargs):
-        return CheckResultJsonSerializer(self).serialize()
+        from .serialization.check_result.json import CheckResultSerializer as JsonSerializer
+
+        return JsonSerializer(self).serialize()
 
     def _repr_mimebundle_(self, **kwargs):
         return {
@@ -519,7 +534,7 @@ class CheckFailure(BaseCheckResult):
         self.exception = exception
         self.header = check.name() + header_suffix
 
-    def display_check(self, as_widget: bool = True) -> Optional[Widget]:
+    def display_check(self, as_widget: bool = True) -> Optional['Widget']:
         """Display the check failure or return the display as widget.
 
         Parameters
@@ -532,6 +547,8 @@ class CheckFailure(BaseCheckResult):
         Widget
             Widget representation of the display if as_widget is True.
         """
+        from .serialization.check_failure.ipython import CheckFailureSerializer as IPythonSerializer
+
         is_colab = is_colab_env()
 
         if is_colab and as_widget:
@@ -546,7 +563,7 @@ class CheckFailure(BaseCheckResult):
         elif is_widgets_enabled() and as_widget and not is_kaggle_env():
             return self.to_widget()
         else:
-            display(*CheckFailureIPythonSerializer(self).serialize())
+            display(*IPythonSerializer(self).serialize())
 
     def save_as_html(
         self,
@@ -570,6 +587,8 @@ class CheckFailure(BaseCheckResult):
         Optional[str] :
             name of newly create file
         """
+        from .serialization.check_failure.html import CheckFailureSerializer as HtmlSerializer
+
         if file is None:
             file = 'output.html'
         if isinstance(file, str):
@@ -583,7 +602,7 @@ class CheckFailure(BaseCheckResult):
                 requirejs=requirejs
             )
         else:
-            html = CheckFailureHtmlSerializer(self).serialize(
+            html = HtmlSerializer(self).serialize(
                 full_html=True
             )
 
@@ -600,6 +619,8 @@ class CheckFailure(BaseCheckResult):
 
     def show(self):
         """Display the check failure."""
+        import plotly.io as pio
+
         if is_notebook():
             widget = self.display_check()
             if widget is not None:
@@ -623,9 +644,11 @@ class CheckFailure(BaseCheckResult):
                 'an IPython shell (etc Jupyter)'
             )
 
-    def to_widget(self) -> Widget:
+    def to_widget(self) -> 'Widget':
         """Return CheckFailure as a ipywidgets.Widget instance."""
-        return CheckFailureWidgetSerializer(self).serialize()
+        from .serialization.check_failure.widget import CheckFailureSerializer as WidgetSerializer
+
+        return WidgetSerializer(self).serialize()
 
     def to_json(self, with_display: Optional[bool] = None):
         """Return check failure as json.
@@ -654,6 +677,8 @@ class CheckFailure(BaseCheckResult):
         -------
         str
         """
+        from .serialization.check_failure.json import CheckFailureSerializer as JsonSerializer
+
         if with_display is not None:
             warnings.warn(
                 '"with_display" parameter is deprecated and does not have any effect '
@@ -661,7 +686,7 @@ class CheckFailure(BaseCheckResult):
                 DeprecationWarning
             )
         return jsonpickle.dumps(
-            CheckFailureJsonSerializer(self).serialize(),
+            JsonSerializer(self).serialize(),
             unpicklable=False
         )
 
@@ -700,10 +725,14 @@ class CheckFailure(BaseCheckResult):
         return self.get_header() + ': ' + str(self.exception)
 
     def _repr_html_(self):
-        return CheckFailureHtmlSerializer(self).serialize()
+        from .serialization.check_failure.html import CheckFailureSerializer as HtmlSerializer
+
+        return HtmlSerializer(self).serialize()
 
     def _repr_json_(self):
-        return CheckFailureJsonSerializer(self).serialize()
+        from .serialization.check_failure.json import CheckFailureSerializer as JsonSerializer
+
+        return JsonSerializer(self).serialize()
 
     def _repr_mimebundle_(self, **kwargs):
         return {
@@ -713,7 +742,9 @@ class CheckFailure(BaseCheckResult):
 
     def _ipython_display_(self):
         """Display the check failure."""
-        display(*CheckFailureIPythonSerializer(self).serialize())
+        from .serialization.check_failure.ipython import CheckFailureSerializer as IPythonSerializer
+
+        display(*IPythonSerializer(self).serialize())
 
     def print_traceback(self):
         """Print the traceback of the failure."""
@@ -9,11 +9,11 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing common feature label correlation (PPS) utils."""
+# pylint: disable=import-outside-toplevel
 from typing import Optional
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 
 import deepchecks.ppscore as pps
 from deepchecks.utils.plot import colors
@@ -23,6 +23,8 @@ from deepchecks.utils.typing import Hashable
 
 def get_pps_figure(per_class: bool, n_of_features: int):
     """If per_class is True, then no title is defined on the figure."""
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     fig.update_layout(
         yaxis_title='Predictive Power Score (PPS)',
@@ -51,6 +53,8 @@ def get_pps_figure(per_class: bool, n_of_features: int):
 
 def pd_series_to_trace(s_pps: pd.Series, name: str):
     """Create bar plotly bar trace out of pandas Series."""
+    import plotly.graph_objects as go
+
     name = name.capitalize() if name else None
     return go.Bar(x=s_pps.index,
                   y=s_pps,
@@ -63,6 +67,8 @@ def pd_series_to_trace(s_pps: pd.Series, name: str):
 
 def pd_series_to_trace_with_diff(s_pps: pd.Series, name: str, diffs: pd.Series):
     """Create bar plotly bar trace out of pandas Series, with difference shown in percentages."""
+    import plotly.graph_objects as go
+
     diffs_text = '(' + diffs.apply(format_percent, floating_point=0, add_positive_prefix=True) + ')'
     text = diffs_text + '<br>' + s_pps.round(2).astype(str)
     name = name.capitalize() if name else None
@@ -80,7 +86,9 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
                                   test_label_name: Optional[Hashable], ppscore_params: dict,
                                   n_show_top: int,
                                   min_pps_to_show: float = 0.05,
-                                  random_state: int = None):
+                                  random_state: int = None,
+                                  n_jobs: int = 1,
+                                  with_display: bool = True):
     """
     Calculate the PPS for train, test and difference for feature label correlation checks.
 
@@ -106,12 +114,17 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
             Minimum PPS to show a class in the graph
         random_state: int, default None
             Random state for the ppscore.predictors function
+        n_jobs: int, default 1
+            Number of threads to calculate the PPS with, -1 means using all the processors
+        with_display: bool, default True
+            Whether to build the display graphs
 
     Returns:
         CheckResult
             value: dictionaries of PPS values for train, test and train-test difference.
             display: bar graph of the PPS of each feature.
     """
+    ppscore_params = {'n_jobs': n_jobs, **ppscore_params}
     df_pps_train = pps.predictors(df=train_df, y=train_label_name,
                                   random_seed=random_state,
                                   **ppscore_params)
@@ -123,6 +136,13 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
     s_pps_test = df_pps_test.set_index('x', drop=True)['ppscore']
     s_difference = s_pps_train - s_pps_test
 
+    ret_value = {'train': s_pps_train.to_dict(), 'test': s_pps_test.to_dict(),
+                 'train-test difference': s_difference.to_dict()}
+
+    # display only if not all scores are above min_pps_to_show
+    if not with_display or not (any(s_pps_train > min_pps_to_show) or any(s_pps_test > min_pps_to_show)):
+        return ret_value, None
+
     sorted_order_for_display = np.abs(s_difference).sort_values(ascending=False).head(n_show_top).index
     s_pps_train_to_display = s_pps_train[sorted_order_for_display]
     s_pps_test_to_display = s_pps_test[sorted_order_for_display]
@@ -132,13 +152,7 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
     fig.add_trace(pd_series_to_trace(s_pps_train_to_display, 'train'))
     fig.add_trace(pd_series_to_trace_with_diff(s_pps_test_to_display, 'test', -s_difference_to_display))
 
-    ret_value = {'train': s_pps_train.to_dict(), 'test': s_pps_test.to_dict(),
-                 'train-test difference': s_difference.to_dict()}
-
-    # display only if not all scores are above min_pps_to_show
-    display = [fig] if any(s_pps_train > min_pps_to_show) or any(s_pps_test > min_pps_to_show) else None
-
-    return ret_value, display
+    return ret_value, [fig]
 
 
 def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_name: Optional[Hashable],
@@ -146,7 +160,9 @@ def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_
                                             test_label_name: Optional[Hashable], ppscore_params: dict,
                                             n_show_top: int,
                                             min_pps_to_show: float = 0.05,
-                                            random_state: int = None):
+                                            random_state: int = None,
+                                            n_jobs: int = 1,
+                                            with_display: bool = True):
     """
     Calculate the PPS for train, test and difference for feature label correlation checks per class.
 
@@ -172,6 +188,10 @@ def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_
             Minimum PPS to show a class in the graph
         random_state: int, default None
             Random state for the ppscore.predictors function
+        n_jobs: int, default 1
+            Number of threads to calculate the PPS with, -1 means using all the processors
+        with_display: bool, default True
+            Whether to build the display graphs
 
     Returns:
         CheckResult
@@ -185,21 +205,17 @@ def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_
     display = []
     ret_value = {}
 
-    for c in train_df[train_label_name].unique():
-        train_df_all_vs_one = train_df.copy()
-        test_df_all_vs_one = test_df.copy()
-
-        train_df_all_vs_one[train_label_name] = train_df_all_vs_one[train_label_name].apply(
-            lambda x: 1 if x == c else 0)  # pylint: disable=cell-var-from-loop
-        test_df_all_vs_one[test_label_name] = test_df_all_vs_one[test_label_name].apply(
-            lambda x: 1 if x == c else 0)  # pylint: disable=cell-var-from-loop
+    # The one-vs-all PPS of all the classes is calculated in a single pool of threads
+    ppscore_params = {'n_jobs': n_jobs, **ppscore_params}
+    classes = train_df[train_label_name].unique()
+    pps_train_per_class = pps.predictors_per_class(df=train_df, y=train_label_name, classes=classes,
+                                                   random_seed=random_state, **ppscore_params)
+    pps_test_per_class = pps.predictors_per_class(df=test_df, y=test_label_name, classes=classes,
+                                                  random_seed=random_state, **ppscore_params)
 
-        df_pps_train = pps.predictors(df=train_df_all_vs_one, y=train_label_name,
-                                      random_seed=random_state,
-                                      **ppscore_params)
-        df_pps_test = pps.predictors(df=test_df_all_vs_one,
-                                     y=test_label_name,
-                                     random_seed=random_state, **ppscore_params)
+    for c in classes:
+        df_pps_train = pps_train_per_class[c]
+        df_pps_test = pps_test_per_class[c]
 
         s_pps_train = df_pps_train.set_index('x', drop=True)['ppscore']
         s_pps_test = df_pps_test.set_index('x', drop=True)['ppscore']
@@ -218,7 +234,7 @@ def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_
                               'train-test difference': s_difference.to_dict()}
 
         # display only if not all scores are above min_pps_to_show
-        if any(s_train > min_pps_to_show) or any(s_test > min_pps_to_show):
+        if with_display and (any(s_train > min_pps_to_show) or any(s_test > min_pps_to_show)):
             sorted_order_for_display = np.abs(s_difference).sort_values(ascending=False).head(n_show_top).index
 
             s_train_to_display = s_train[sorted_order_for_display]
@@ -9,13 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing common WholeDatasetDriftCheck (domain classifier drift) utils."""
+# pylint: disable=import-outside-toplevel
 
 import warnings
 from typing import Container, List
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 
@@ -41,7 +41,7 @@ def run_whole_dataset_drift(train_dataframe: pd.DataFrame, test_dataframe: pd.Da
                             numerical_features: List[Hashable], cat_features: List[Hashable], sample_size: int,
                             random_state: int, test_size: float, n_top_columns: int, min_feature_importance: float,
                             max_num_categories_for_display: int, show_categories_by: str,
-                            min_meaningful_drift_score: float):
+                            min_meaningful_drift_score: float, with_display: bool = True):
     """Calculate whole dataset drift."""
     domain_classifier = generate_model(numerical_features, cat_features, random_state)
 
@@ -96,7 +96,7 @@ def run_whole_dataset_drift(train_dataframe: pd.DataFrame, test_dataframe: pd.Da
     else:
         top_fi = None
 
-    if top_fi is not None and len(top_fi):
+    if with_display and top_fi is not None and len(top_fi):
         score = values_dict['domain_classifier_drift_score']
 
         displays = [
@@ -160,6 +160,8 @@ def auc_to_drift_score(auc: float) -> float:
 
 def build_drift_plot(score):
     """Build traffic light drift plot."""
+    import plotly.graph_objects as go
+
     bar_traces, x_axis, y_axis = drift_score_bar_traces(score)
     x_axis['title'] = 'Drift score'
     drift_plot = go.Figure(layout=dict(
@@ -182,6 +184,8 @@ def display_dist(
     show_categories_by: str
 ):
     """Create a distribution comparison plot for the given columns."""
+    import plotly.graph_objects as go
+
     column_name = train_column.name or ''
     column_fi = fi.loc[column_name]
     title = f'Feature: {column_name} - Explains {format_percent(column_fi)} of dataset difference'
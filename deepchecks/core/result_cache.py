@@ -0,0 +1,228 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Module containing an on-disk cache of check results."""
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import typing as t
+
+from deepchecks.core.check_result import BaseCheckResult, CheckResult
+from deepchecks.core.checks import BaseCheck
+from deepchecks.core.errors import DeepchecksValueError
+
+__all__ = ['ResultCache', 'hash_object']
+
+
+_SUFFIX = '.pkl'
+
+
+def hash_object(obj: t.Any) -> t.Optional[str]:
+    """Return a hash of the pickled object, or None if the object can't be pickled.
+
+    Parameters
+    ----------
+    obj : Any
+        object to hash
+
+    Returns
+    -------
+    Optional[str]
+        hex digest of the object
+    """
+    try:
+        return hashlib.sha256(pickle.dumps(obj, protocol=4)).hexdigest()
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None
+
+
+class ResultCache:
+    """On-disk cache of check results, keyed by the fingerprints of the check and of the data and model it ran on.
+
+    Every entry is stored in its own file in the cache directory. Once the directory grows beyond `max_size`,
+    the least recently used entries are evicted. Results that can't be pickled (for example, results with a
+    display holding local functions) are not cached. Other calculations shared between runs, such as the permutation
+    feature importance, are stored in the same entries with the load and store methods.
+
+    Parameters
+    ----------
+    directory : Union[str, os.PathLike]
+        directory to store the results in, created if it doesn't exist
+    max_size : int , default: 1 GiB
+        maximal total size in bytes of the cached results
+    """
+
+    def __init__(self, directory: t.Union[str, os.PathLike], max_size: int = 2 ** 30):
+        if max_size <= 0:
+            raise DeepchecksValueError(f'max_size must be positive, but got: {max_size}')
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def from_argument(cls, cache: t.Union['ResultCache', str, os.PathLike]) -> 'ResultCache':
+        """Return the given cache, or a cache in the given directory."""
+        if isinstance(cache, ResultCache):
+            return cache
+        if isinstance(cache, (str, os.PathLike)):
+            return cls(cache)
+        raise DeepchecksValueError(f'cache must be a ResultCache or a directory path, but got: {type(cache).__name__}')
+
+    @staticmethod
+    def check_fingerprint(check: BaseCheck) -> t.Optional[str]:
+        """Return the fingerprint of the check class and parameters, or None if the parameters can't be hashed."""
+        check_class = type(check)
+        return hash_object((check_class.__module__, check_class.__qualname__, check.params(show_defaults=True)))
+
+    def key(self, check: BaseCheck, run_fingerprint: t.Optional[str], mode: str = '') -> t.Optional[str]:
+        """Return the key of the check results on the run inputs, or None if they can't be fingerprinted."""
+        import deepchecks  # pylint: disable=import-outside-toplevel
+
+        check_fingerprint = self.check_fingerprint(check)
+        if run_fingerprint is None or check_fingerprint is None:
+            return None
+        return hash_object((deepchecks.__version__, mode, run_fingerprint, check_fingerprint))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def load(self, key: str) -> t.Any:
+        """Return the object stored under the key, or None if it is not stored."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                obj = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return obj
+
+    def store(self, key: str, obj: t.Any) -> bool:
+        """Store the object under the key, and return whether it was stored.
+
+        Objects that can't be pickled, or are larger than the maximal size of the cache, are not stored.
+        """
+        try:
+            data = pickle.dumps(obj, protocol=4)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+        if len(data) > self.max_size:
+            return False
+
+        # Write to a temporary file first, so concurrent runs never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        self.evict()
+        return True
+
+    def get(self, key: str) -> t.Optional[t.List[BaseCheckResult]]:
+        """Return the cached results of the key, or None if they are not cached."""
+        return self.load(key)
+
+    def put(self, key: str, results: t.List[BaseCheckResult]) -> bool:
+        """Store the results of the key, and return whether they were stored."""
+        # The check itself isn't stored, it is set back on the results when they are loaded
+        stored = []
+        for result in results:
+            result = copy.copy(result)
+            result.check = None
+            if isinstance(result, CheckResult):
+                result.conditions_results = []
+            stored.append(result)
+        return self.store(key, stored)
+
+    def run_check(
+        self,
+        check: BaseCheck,
+        run: t.Callable[[BaseCheck], t.List[BaseCheckResult]],
+        run_fingerprint: t.Optional[str],
+        mode: str = ''
+    ) -> t.List[BaseCheckResult]:
+        """Return the cached results of the check, or run it and cache its results.
+
+        Parameters
+        ----------
+        check : BaseCheck
+            the check to run
+        run : Callable[[BaseCheck], List[BaseCheckResult]]
+            function running the check and returning its results
+        run_fingerprint : Optional[str]
+            fingerprint of the data, model and other inputs the check runs on, or None if they can't be fingerprinted
+        mode : str , default: ''
+            name of the way the check is run, the same check run by a suite and alone is cached separately
+
+        Returns
+        -------
+        List[BaseCheckResult]
+            the check results
+        """
+        key = self.key(check, run_fingerprint, mode)
+        results = self.get(key) if key is not None else None
+        if results is not None:
+            for result in results:
+                result.check = check
+                if isinstance(result, CheckResult):
+                    result.process_conditions()
+            return results
+
+        results = run(check)
+        # Failures may be caused by the environment, so they are always run again
+        if key is not None and all(isinstance(result, CheckResult) for result in results):
+            self.put(key, results)
+        return results
+
+    def _entries(self) -> t.List[t.Tuple[float, int, str]]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    @property
+    def size(self) -> int:
+        """Return the total size in bytes of the cached results."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove the least recently used results until the cache size is below its maximal size."""
+        entries = self._entries()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+
+    def clear(self):
+        """Remove all the cached results."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
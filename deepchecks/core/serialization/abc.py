@@ -23,10 +23,8 @@ from typing_extensions import Protocol, runtime_checkable
 from deepchecks.core import check_result as check_types  # pylint: disable=unused-import
 from deepchecks.core.serialization import common
 
-try:
+if t.TYPE_CHECKING:
     from wandb.sdk.data_types.base_types.wb_value import WBValue  # pylint: disable=unused-import
-except ImportError:
-    pass
 
 
 __all__ = [
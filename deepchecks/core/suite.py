@@ -14,23 +14,19 @@ import abc
 import io
 import warnings
 from collections import OrderedDict
-from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import jsonpickle
-from IPython.core.display import display, display_html
-from ipywidgets import Widget
 
 from deepchecks.core.check_result import BaseCheckResult, CheckFailure, CheckResult
 from deepchecks.core.checks import BaseCheck
 from deepchecks.core.errors import DeepchecksValueError
-from deepchecks.core.serialization.suite_result.html import SuiteResultSerializer as SuiteResultHtmlSerializer
-from deepchecks.core.serialization.suite_result.json import SuiteResultSerializer as SuiteResultJsonSerializer
-from deepchecks.core.serialization.suite_result.widget import SuiteResultSerializer as SuiteResultWidgetSerializer
-from deepchecks.utils.ipython import is_colab_env, is_kaggle_env, is_notebook, is_widgets_enabled
+from deepchecks.utils.ipython import display, display_html, is_colab_env, is_kaggle_env, is_notebook, is_widgets_enabled
 from deepchecks.utils.strings import create_new_file_name, get_random_string, widget_to_html, widget_to_html_string
 from deepchecks.utils.wandb_utils import wandb_run
 
-from .serialization.suite_result.ipython import SuiteResultSerializer as SuiteResultIPythonSerializer
+if TYPE_CHECKING:
+    from ipywidgets import Widget
 
 __all__ = ['BaseSuite', 'SuiteResult']
 
@@ -113,7 +109,9 @@ class SuiteResult:
         )
 
     def _repr_json_(self):
-        return SuiteResultJsonSerializer(self).serialize()
+        from deepchecks.core.serialization.suite_result.json import SuiteResultSerializer as JsonSerializer
+
+        return JsonSerializer(self).serialize()
 
     def _repr_mimebundle_(self, **kwargs):
         return {
@@ -126,6 +124,8 @@ class SuiteResult:
         as_widget: bool = True,
         unique_id: Optional[str] = None
     ):
+        from deepchecks.core.serialization.suite_result.ipython import SuiteResultSerializer as IPythonSerializer
+
         output_id = (
             unique_id or get_random_string(n=25)
             if not is_colab_env()
@@ -148,7 +148,7 @@ class SuiteResult:
                     'Widgets are not enabled (or not supported) '
                     'and cannot be used.'
                 )
-            display(*SuiteResultIPythonSerializer(self).serialize(
+            display(*IPythonSerializer(self).serialize(
                 output_id=output_id,
             ))
 
@@ -190,6 +190,8 @@ class SuiteResult:
         Optional[str] :
             name of newly create file
         """
+        from deepchecks.core.serialization.suite_result.html import SuiteResultSerializer as HtmlSerializer
+
         if file is None:
             file = 'output.html'
         if isinstance(file, str):
@@ -203,7 +205,7 @@ class SuiteResult:
                 requirejs=requirejs
             )
         else:
-            html = SuiteResultHtmlSerializer(self).serialize(
+            html = HtmlSerializer(self).serialize(
                 output_id=unique_id or get_random_string(n=25),
                 full_html=True,
                 include_requirejs=requirejs,
@@ -223,7 +225,7 @@ class SuiteResult:
     def to_widget(
         self,
         unique_id : Optional[str] = None,
-    ) -> Widget:
+    ) -> 'Widget':
         """Return SuiteResult as a ipywidgets.Widget instance.
 
         Parameters
@@ -235,7 +237,9 @@ class SuiteResult:
         -------
         Widget
         """
-        return SuiteResultWidgetSerializer(self).serialize(
+        from deepchecks.core.serialization.suite_result.widget import SuiteResultSerializer as WidgetSerializer
+
+        return WidgetSerializer(self).serialize(
             output_id=unique_id,
         )
 
@@ -252,8 +256,10 @@ class SuiteResult:
         -------
         str
         """
+        from deepchecks.core.serialization.suite_result.json import SuiteResultSerializer as JsonSerializer
+
         return jsonpickle.dumps(
-            SuiteResultJsonSerializer(self).serialize(with_display=with_display),
+            JsonSerializer(self).serialize(with_display=with_display),
             unpicklable=False
         )
 
@@ -31,6 +31,7 @@
 
 # pylint: skip-file
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 warnings.filterwarnings('ignore', message='The least populated class in y has only')
 
@@ -43,6 +44,7 @@ from sklearn.metrics import f1_score, mean_absolute_error
 from sklearn.model_selection import cross_val_score
 
 from deepchecks.utils.typing import Hashable
+from deepchecks.utils.validation import validate_n_jobs
 
 NOT_SUPPORTED_ANYMORE = "NOT_SUPPORTED_ANYMORE"
 TO_BE_CALCULATED = -1
@@ -74,17 +76,7 @@ def _calculate_model_cv_score_(
         target_series = df[target]
 
     # preprocess feature
-    if _dtype_represents_categories(df[feature]):
-        one_hot_encoder = preprocessing.OneHotEncoder()
-        array = df[feature].__array__()
-        sparse_matrix = one_hot_encoder.fit_transform(array.reshape(-1, 1))
-        feature_input = sparse_matrix
-    else:
-        # reshaping needed because there is only 1 feature
-        array = df[feature].values
-        if not isinstance(array, np.ndarray):  # e.g Int64 IntegerArray
-            array = array.to_numpy()
-        feature_input = array.reshape(-1, 1)
+    feature_input = _feature_input(df[feature])
 
     # Cross-validation is stratifiedKFold for classification, KFold for regression
     # CV on one core (n_job=1; default) has shown to be fastest
@@ -95,6 +87,19 @@ def _calculate_model_cv_score_(
     return scores.mean()
 
 
+def _feature_input(series):
+    """Return the model input of a single feature column."""
+    if _dtype_represents_categories(series):
+        one_hot_encoder = preprocessing.OneHotEncoder()
+        array = series.__array__()
+        return one_hot_encoder.fit_transform(array.reshape(-1, 1))
+    # reshaping needed because there is only 1 feature
+    array = series.values
+    if not isinstance(array, np.ndarray):  # e.g Int64 IntegerArray
+        array = array.to_numpy()
+    return array.reshape(-1, 1)
+
+
 def _normalized_mae_score(model_mae, naive_mae):
     """Normalize the model MAE score, given the baseline score."""
     # # Value range of MAE is [0, infinity), 0 is best
@@ -255,43 +260,53 @@ def _determine_case_and_prepare_df(df, x, y, sample=5_000, random_seed=123):
     if _feature_is_id(df, x):
         return df, "feature_is_id"
 
-    category_count = df[y].value_counts().count()
+    return df, _target_case(df[y])
+
+
+def _target_case(series):
+    """Return str with the name of the case determined by the target column, given the feature is not an ID."""
+    category_count = series.value_counts().count()
     if category_count == 1:
         # it is helpful to separate this case in order to save unnecessary calculation time
-        return df, "target_is_constant"
-    if _dtype_represents_categories(df[y]) and (category_count == len(df[y])):
+        return "target_is_constant"
+    if _dtype_represents_categories(series) and (category_count == len(series)):
         # it is important to separate this case in order to save unnecessary calculation time
-        return df, "target_is_id"
+        return "target_is_id"
 
-    if _dtype_represents_categories(df[y]):
-        return df, "classification"
-    if is_numeric_dtype(df[y]):
+    if _dtype_represents_categories(series):
+        return "classification"
+    if is_numeric_dtype(series):
         # this check needs to be after is_bool_dtype (which is part of _dtype_represents_categories) because bool is
         # considered numeric by pandas
-        return df, "regression"
+        return "regression"
 
-    if is_datetime64_any_dtype(df[y]) or is_timedelta64_dtype(df[y]):
+    if is_datetime64_any_dtype(series) or is_timedelta64_dtype(series):
         # IDEA: show warning
         # raise TypeError(
-        #     f"The target column {y} has the dtype {df[y].dtype} which is not supported. A possible solution might be
+        #     f"The target column {y} has the dtype {series.dtype} which is not supported. A possible solution might be
         #     to convert {y} to a string column"
         # )
-        return df, "target_is_datetime"
+        return "target_is_datetime"
 
     # IDEA: show warning
     # raise Exception(
-    #     f"Could not infer a valid task based on the target {y}. The dtype {df[y].dtype} is not yet supported"
+    #     f"Could not infer a valid task based on the target {y}. The dtype {series.dtype} is not yet supported"
     # )  # pragma: no cover
-    return df, "target_data_type_not_supported"
+    return "target_data_type_not_supported"
 
 
 def _feature_is_id(df, x):
     """Return Boolean if the feature column x is an ID."""
-    if not _dtype_represents_categories(df[x]):
+    return _series_is_id(df[x])
+
+
+def _series_is_id(series):
+    """Return Boolean if the column is an ID."""
+    if not _dtype_represents_categories(series):
         return False
 
-    category_count = df[x].value_counts().count()
-    return category_count == len(df[x])
+    category_count = series.value_counts().count()
+    return category_count == len(series)
 
 
 def _maybe_sample(df, sample, random_seed=None):
@@ -355,6 +370,10 @@ def _score(
         baseline_score = task["baseline_score"]
         ppscore = task["ppscore"]
 
+    return _result(x, y, case_type, task, ppscore, baseline_score, model_score)
+
+
+def _result(x, y, case_type, task, ppscore, baseline_score, model_score):
     return {
         "x": x,
         "y": y,
@@ -368,6 +387,12 @@ def _score(
     }
 
 
+def _error_result(x, y, invalid_score):
+    case_type = "unknown_error"
+    task = _get_task(case_type, invalid_score)
+    return _result(x, y, case_type, task, task["ppscore"], task["baseline_score"], task["model_score"])
+
+
 def score(
         df,
         x,
@@ -470,19 +495,7 @@ def score(
         )
     except Exception as exception:
         if catch_errors:
-            case_type = "unknown_error"
-            task = _get_task(case_type, invalid_score)
-            return {
-                "x": x,
-                "y": y,
-                "ppscore": task["ppscore"],
-                "case": case_type,
-                "is_valid_score": task["is_valid_score"],
-                "metric": task["metric_name"],
-                "baseline_score": task["baseline_score"],
-                "model_score": task["model_score"],  # sklearn returns negative mae
-                "model": task["model"],
-            }
+            return _error_result(x, y, invalid_score)
         else:
             raise exception
 
@@ -505,6 +518,171 @@ def _get_task(case_type, invalid_score):
     raise Exception(f"case_type {case_type} is not supported")
 
 
+def _normalized_score(case_type, model_score, baseline_score):
+    """Derive the PPS from the model score, given the baseline score of the target."""
+    if case_type == "regression":
+        return _normalized_mae_score(abs(model_score), baseline_score)
+    return _normalized_f1_score(model_score, baseline_score)
+
+
+def _prepare_target(target, y, sample, random_seed):
+    """Prepare the calculations shared by all the features that have no missing values.
+
+    For such features the rows left after dropping missing values are the rows in which the target is not missing.
+    The sampling and the shuffling of these rows depend only on their number and on the random seed, so the sampled
+    and shuffled rows are the same for all these features, as are the case of the target, the encoded target and the
+    baseline score.
+    """
+    rows = np.flatnonzero(target.notna().to_numpy())
+    prepared = {"rows": rows}
+    if len(rows) == 0:
+        prepared["case"] = "empty_dataframe_after_dropping_na"
+        return prepared
+    try:
+        sampled = _maybe_sample(pd.Series(rows), sample, random_seed=random_seed)
+        shuffled = sampled.sample(frac=1, random_state=random_seed, replace=False).to_numpy()
+        sampled = sampled.to_numpy()
+        sampled_target = target.iloc[sampled]
+        case_type = _target_case(sampled_target)
+        prepared.update(sampled=sampled, case=case_type)
+        if case_type in ["classification", "regression"]:
+            task = VALID_CALCULATIONS[case_type]
+            target_input = target.iloc[shuffled]
+            if case_type == "classification":
+                target_input = preprocessing.LabelEncoder().fit_transform(target_input)
+            _, baseline_score = task["score_normalizer"](
+                sampled_target.to_frame(name=y), y, 0, random_seed=random_seed
+            )
+            prepared.update(shuffled=shuffled, target_input=target_input, baseline_score=baseline_score)
+    except Exception as exception:
+        # The calculation of every feature would have failed on it
+        prepared["error"] = exception
+    return prepared
+
+
+def _predictor_score(
+        df, x, y, target, prepared, sample, cross_validation, random_seed, invalid_score, catch_errors
+):
+    """Calculate the PPS of the column x predicting the target, reusing the prepared calculations when possible."""
+    column = df[x]
+    if column.iloc[prepared["rows"]].isna().any():
+        # The rows left after dropping missing values are specific to this feature
+        frame = pd.DataFrame({x: column.array, y: target.array})
+        return score(
+            frame,
+            x,
+            y,
+            sample=sample,
+            cross_validation=cross_validation,
+            random_seed=random_seed,
+            invalid_score=invalid_score,
+            catch_errors=catch_errors,
+        )
+
+    try:
+        if "error" in prepared:
+            raise prepared["error"]
+        case_type = prepared["case"]
+        if case_type != "empty_dataframe_after_dropping_na" and _series_is_id(column.iloc[prepared["sampled"]]):
+            case_type = "feature_is_id"
+        task = _get_task(case_type, invalid_score)
+
+        if case_type in ["classification", "regression"]:
+            model_score = cross_val_score(
+                task["model"],
+                _feature_input(column.iloc[prepared["shuffled"]]),
+                prepared["target_input"],
+                cv=cross_validation,
+                scoring=task["metric_key"],
+            ).mean()
+            baseline_score = prepared["baseline_score"]
+            ppscore = _normalized_score(case_type, model_score, baseline_score)
+        else:
+            model_score = task["model_score"]
+            baseline_score = task["baseline_score"]
+            ppscore = task["ppscore"]
+        return _result(x, y, case_type, task, ppscore, baseline_score, model_score)
+    except Exception as exception:
+        if catch_errors:
+            return _error_result(x, y, invalid_score)
+        raise exception
+
+
+def _targets_scores(
+        df,
+        targets,
+        n_jobs=1,
+        task=NOT_SUPPORTED_ANYMORE,
+        sample=5_000,
+        cross_validation=4,
+        random_seed=123,
+        invalid_score=0,
+        catch_errors=True,
+):
+    """
+    Calculate the PPS of the columns of the dataframe against each of the given targets.
+
+    The scores of all the targets are calculated in a single pool of threads. The sampling, shuffling and baseline of
+    each target are calculated once and shared by all the columns that have no missing values.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The dataframe that contains the features
+    targets : list of tuple
+        Pairs of the name of a target and its values, with the same length as the dataframe. The column of the
+        dataframe with the name of the target is not used as a feature of it
+    n_jobs : int
+        Number of threads to calculate the scores with, -1 means using all the processors
+    kwargs:
+        Other key-word arguments of the pps.score method
+
+    Returns
+    -------
+    list of Dict
+        For each target, a dict from the name of each column to its PPS dict
+    """
+    if task is not NOT_SUPPORTED_ANYMORE:
+        raise AttributeError(
+            "The attribute 'task' is no longer supported because it led to confusion and inconsistencies.\nThe task of the model is now determined based on the data types of the columns. If you want to change the task please adjust the data type of the column.\nFor more details, please refer to the README"
+        )
+    n_workers = validate_n_jobs(n_jobs)
+    duplicated_columns = df.columns[df.columns.duplicated()]
+    if len(duplicated_columns) > 0:
+        x = duplicated_columns[0]
+        raise AssertionError(
+            f"The dataframe has {len(df[[x]].columns)} columns with the same column name {x}\nPlease adjust the "
+            f"dataframe and make sure that only 1 column has the name {x}"
+        )
+
+    if random_seed is None:
+        from random import random
+
+        random_seed = int(random() * 1000)
+
+    calculations = []
+    for target_index, (y, target) in enumerate(targets):
+        prepared = _prepare_target(target, y, sample, random_seed)
+        calculations.extend((target_index, x, y, target, prepared) for x in df.columns if x != y)
+
+    def calculate(calculation):
+        _, x, y, target, prepared = calculation
+        return _predictor_score(
+            df, x, y, target, prepared, sample, cross_validation, random_seed, invalid_score, catch_errors
+        )
+
+    if n_workers == 1 or len(calculations) <= 1:
+        scores = [calculate(calculation) for calculation in calculations]
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            scores = list(executor.map(calculate, calculations))
+
+    targets_scores = [{} for _ in targets]
+    for (target_index, x, *_), pps in zip(calculations, scores):
+        targets_scores[target_index][x] = pps
+    return targets_scores
+
+
 def _format_list_of_dicts(scores, output, sorted):
     """
     Format list of score dicts `scores`.
@@ -534,7 +712,30 @@ def _format_list_of_dicts(scores, output, sorted):
     return scores
 
 
-def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
+def _validate_predictors_arguments(df, y, output, sorted):
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError(
+            f"The 'df' argument should be a pandas.DataFrame but you passed a {type(df)}\nPlease convert your input to a pandas.DataFrame"
+        )
+    if not _is_column_in_df(y, df):
+        raise ValueError(
+            f"The 'y' argument should be the name of a dataframe column but the variable that you passed is not a column in the given dataframe.\nPlease review the column name or your dataframe"
+        )
+    if len(df[[y]].columns) >= 2:
+        raise AssertionError(
+            f"The dataframe has {len(df[[y]].columns)} columns with the same column name {y}\nPlease adjust the dataframe and make sure that only 1 column has the name {y}"
+        )
+    if not output in ["df", "list"]:
+        raise ValueError(
+            f"""The 'output' argument should be one of ["df", "list"] but you passed: {output}\nPlease adjust your input to one of the valid values"""
+        )
+    if not sorted in [True, False]:
+        raise ValueError(
+            f"""The 'sorted' argument should be one of [True, False] but you passed: {sorted}\nPlease adjust your input to one of the valid values"""
+        )
+
+
+def predictors(df, y: Hashable, output="df", sorted=True, n_jobs=1, **kwargs):
     """
     Calculate the Predictive Power Score (PPS) of all the features in the dataframe.
 
@@ -550,6 +751,8 @@ def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
         Control the type of the output. Either return a pandas.DataFrame (df) or a list with the score dicts
     sorted: bool
         Whether or not to sort the output dataframe/list by the ppscore
+    n_jobs: int
+        Number of threads to calculate the scores of the features with, -1 means using all the processors
     kwargs:
         Other key-word arguments that shall be forwarded to the pps.score method,
         e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
@@ -560,33 +763,57 @@ def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
         Either returns a tidy dataframe or a list of all the PPS dicts. This can be influenced
         by the output argument
     """
-    if not isinstance(df, pd.DataFrame):
-        raise TypeError(
-            f"The 'df' argument should be a pandas.DataFrame but you passed a {type(df)}\nPlease convert your input to a pandas.DataFrame"
-        )
-    if not _is_column_in_df(y, df):
-        raise ValueError(
-            f"The 'y' argument should be the name of a dataframe column but the variable that you passed is not a column in the given dataframe.\nPlease review the column name or your dataframe"
-        )
-    if len(df[[y]].columns) >= 2:
-        raise AssertionError(
-            f"The dataframe has {len(df[[y]].columns)} columns with the same column name {y}\nPlease adjust the dataframe and make sure that only 1 column has the name {y}"
-        )
-    if not output in ["df", "list"]:
-        raise ValueError(
-            f"""The 'output' argument should be one of ["df", "list"] but you passed: {output}\nPlease adjust your input to one of the valid values"""
-        )
-    if not sorted in [True, False]:
-        raise ValueError(
-            f"""The 'sorted' argument should be one of [True, False] but you passed: {sorted}\nPlease adjust your input to one of the valid values"""
-        )
+    _validate_predictors_arguments(df, y, output, sorted)
 
-    scores = [score(df, column, y, **kwargs) for column in df if column != y]
+    scores = list(_targets_scores(df, [(y, df[y])], n_jobs=n_jobs, **kwargs)[0].values())
 
     return _format_list_of_dicts(scores=scores, output=output, sorted=sorted)
 
 
-def matrix(df, output="df", sorted=False, **kwargs):
+def predictors_per_class(df, y: Hashable, classes=None, output="df", sorted=True, n_jobs=1, **kwargs):
+    """
+    Calculate the Predictive Power Score (PPS) of all the features in the dataframe against each class of the target.
+
+    The PPS of each class is calculated in a one-vs-all manner, against a target that is 1 for the samples of the class
+    and 0 for the rest. The scores of all the classes are calculated in a single pool of threads.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The dataframe that contains the data
+    y : str
+        Name of the column y which contains the classes
+    classes: list or `None`
+        The classes to calculate the PPS for. If `None` all the unique values of the column y are used
+    output: str - potential values: "df", "list"
+        Control the type of the output. Either return a pandas.DataFrame (df) or a list with the score dicts
+    sorted: bool
+        Whether or not to sort the output dataframe/list by the ppscore
+    n_jobs: int
+        Number of threads to calculate the scores with, -1 means using all the processors
+    kwargs:
+        Other key-word arguments that shall be forwarded to the pps.score method,
+        e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
+
+    Returns
+    -------
+    Dict
+        A dict from each class to the output of pps.predictors for it
+    """
+    _validate_predictors_arguments(df, y, output, sorted)
+
+    if classes is None:
+        classes = df[y].unique()
+    targets = [(y, (df[y] == class_name).astype(int)) for class_name in classes]
+    targets_scores = _targets_scores(df, targets, n_jobs=n_jobs, **kwargs)
+
+    return {
+        class_name: _format_list_of_dicts(scores=list(scores.values()), output=output, sorted=sorted)
+        for class_name, scores in zip(classes, targets_scores)
+    }
+
+
+def matrix(df, output="df", sorted=False, n_jobs=1, **kwargs):
     """
     Calculate the Predictive Power Score (PPS) matrix for all columns in the dataframe.
 
@@ -597,6 +824,8 @@ def matrix(df, output="df", sorted=False, **kwargs):
             Control the type of the output. Either return a pandas.DataFrame (df) or a list with the score dicts
         sorted: bool
             Whether or not to sort the output dataframe/list by the ppscore
+        n_jobs: int
+            Number of threads to calculate the scores with, -1 means using all the processors
         kwargs:
             Other key-word arguments that shall be forwarded to the pps.score method,
             e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
@@ -619,6 +848,13 @@ def matrix(df, output="df", sorted=False, **kwargs):
             f"""The 'sorted' argument should be one of [True, False] but you passed: {sorted}\nPlease adjust your input to one of the valid values"""
         )
 
-    scores = [score(df, x, y, **kwargs) for x in df for y in df]
+    targets_scores = dict(zip(df.columns, _targets_scores(df, [(y, df[y]) for y in df], n_jobs=n_jobs, **kwargs)))
+    predict_itself = _get_task("predict_itself", None)
+    scores = [
+        _result(x, y, "predict_itself", predict_itself, predict_itself["ppscore"], predict_itself["baseline_score"],
+                predict_itself["model_score"])
+        if x == y else targets_scores[y][x]
+        for x in df for y in df
+    ]
 
     return _format_list_of_dicts(scores=scores, output=output, sorted=sorted)
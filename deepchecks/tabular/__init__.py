@@ -10,13 +10,17 @@
 #
 """Package for tabular functionality."""
 from .base_checks import ModelComparisonCheck, ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
+from .chunked_dataset import ChunkedDataset
 from .context import Context
 from .dataset import Dataset
 from .model_base import ModelComparisonContext, ModelComparisonSuite
+from .reference_profile import ReferenceProfile
 from .suite import Suite
 
 __all__ = [
     "Dataset",
+    "ChunkedDataset",
+    "ReferenceProfile",
     "Context",
     "SingleDatasetCheck",
     "TrainTestCheck",
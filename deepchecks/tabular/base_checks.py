@@ -16,10 +16,12 @@ from typing import Any, List, Mapping, Union
 from deepchecks.core.check_result import CheckFailure, CheckResult
 from deepchecks.core.checks import BaseCheck, ModelOnlyBaseCheck, SingleDatasetBaseCheck, TrainTestBaseCheck
 from deepchecks.core.errors import DeepchecksNotSupportedError
+from deepchecks.core.result_cache import ResultCache
 from deepchecks.tabular import deprecation_warnings  # pylint: disable=unused-import # noqa: F401
 from deepchecks.tabular.context import Context
 from deepchecks.tabular.dataset import Dataset
 from deepchecks.tabular.model_base import ModelComparisonContext
+from deepchecks.tabular.utils.fingerprint import run_fingerprint
 
 __all__ = [
     'SingleDatasetCheck',
@@ -34,6 +36,10 @@ def wrap_run(func, check_instance: BaseCheck):
     @wraps(func)
     def wrapped(*args, **kwargs):
         result = func(*args, **kwargs)
+        context = args[0] if args else kwargs.get('context')
+        if isinstance(result, CheckResult) and not getattr(context, 'with_display', True):
+            # Checks which build their display anyway don't keep it when it is not needed
+            result.display = []
         return check_instance.finalize_check_result(result)
 
     return wrapped
@@ -49,14 +55,22 @@ class SingleDatasetCheck(SingleDatasetBaseCheck):
         # Replace the run_logic function with wrapped run function
         setattr(self, 'run_logic', wrap_run(getattr(self, 'run_logic'), self))
 
-    def run(self, dataset, model=None, **kwargs) -> CheckResult:
-        """Run check."""
+    def run(self, dataset, model=None, cache=None, model_version=None, **kwargs) -> CheckResult:
+        """Run check.
+
+        If a cache (or a cache directory) is given, the result is loaded from it when the check already ran on the
+        same data, model (identified by model_version if given) and parameters.
+        """
         assert self.context_type is not None
-        return self.run_logic(self.context_type(  # pylint: disable=not-callable
-            dataset,
-            model=model,
-            **kwargs
-        ))
+
+        def run(check):
+            # pylint: disable=not-callable
+            return [check.run_logic(check.context_type(dataset, model=model, model_version=model_version, **kwargs))]
+
+        if cache is None:
+            return run(self)[0]
+        fingerprint = run_fingerprint(dataset, None, model, model_version, **kwargs)
+        return ResultCache.from_argument(cache).run_check(self, run, fingerprint, mode='single_dataset')[0]
 
     @abc.abstractmethod
     def run_logic(self, context, dataset_type: str = 'train') -> CheckResult:
@@ -77,15 +91,24 @@ class TrainTestCheck(TrainTestBaseCheck):
         # Replace the run_logic function with wrapped run function
         setattr(self, 'run_logic', wrap_run(getattr(self, 'run_logic'), self))
 
-    def run(self, train_dataset, test_dataset, model=None, **kwargs) -> CheckResult:
-        """Run check."""
+    def run(self, train_dataset, test_dataset, model=None, cache=None, model_version=None, **kwargs) -> CheckResult:
+        """Run check.
+
+        If a cache (or a cache directory) is given, the result is loaded from it when the check already ran on the
+        same data, model (identified by model_version if given) and parameters.
+        """
         assert self.context_type is not None
-        return self.run_logic(self.context_type(  # pylint: disable=not-callable
-            train_dataset,
-            test_dataset,
-            model=model,
-            **kwargs
-        ))
+
+        def run(check):
+            # pylint: disable=not-callable
+            context = check.context_type(train_dataset, test_dataset, model=model, model_version=model_version,
+                                         **kwargs)
+            return [check.run_logic(context)]
+
+        if cache is None:
+            return run(self)[0]
+        fingerprint = run_fingerprint(train_dataset, test_dataset, model, model_version, **kwargs)
+        return ResultCache.from_argument(cache).run_check(self, run, fingerprint, mode='train_test')[0]
 
     @abc.abstractmethod
     def run_logic(self, context) -> CheckResult:
@@ -104,10 +127,22 @@ class ModelOnlyCheck(ModelOnlyBaseCheck):
         # Replace the run_logic function with wrapped run function
         setattr(self, 'run_logic', wrap_run(getattr(self, 'run_logic'), self))
 
-    def run(self, model, **kwargs) -> CheckResult:
-        """Run check."""
+    def run(self, model, cache=None, model_version=None, **kwargs) -> CheckResult:
+        """Run check.
+
+        If a cache (or a cache directory) is given, the result is loaded from it when the check already ran on the
+        same model (identified by model_version if given) and parameters.
+        """
         assert self.context_type is not None
-        return self.run_logic(self.context_type(model=model, **kwargs))  # pylint: disable=not-callable
+
+        def run(check):
+            # pylint: disable=not-callable
+            return [check.run_logic(check.context_type(model=model, model_version=model_version, **kwargs))]
+
+        if cache is None:
+            return run(self)[0]
+        fingerprint = run_fingerprint(None, None, model, model_version, **kwargs)
+        return ResultCache.from_argument(cache).run_check(self, run, fingerprint, mode='model_only')[0]
 
     @abc.abstractmethod
     def run_logic(self, context) -> CheckResult:
@@ -9,18 +9,24 @@
 # ----------------------------------------------------------------------------
 #
 """Module importing all tabular checks."""
-from .data_integrity import (ColumnsInfo, ConflictingLabels, DataDuplicates, FeatureLabelCorrelation, IsSingleValue,
-                             MixedDataTypes, MixedNulls, OutlierSampleDetection, SpecialCharacters,
-                             StringLengthOutOfBounds, StringMismatch)
-from .model_evaluation import (BoostingOverfit, CalibrationScore, ConfusionMatrixReport, ModelErrorAnalysis,
-                               ModelInferenceTime, ModelInfo, MultiModelPerformanceReport, PerformanceReport,
-                               RegressionErrorDistribution, RegressionSystematicError, RocReport, SegmentPerformance,
-                               SimpleModelComparison, TrainTestPredictionDrift, UnusedFeatures)
-from .train_test_validation import (CategoryMismatchTrainTest, DatasetsSizeComparison, DateTrainTestLeakageDuplicates,
-                                    DateTrainTestLeakageOverlap, DominantFrequencyChange, FeatureLabelCorrelationChange,
-                                    IdentifierLeakage, IndexTrainTestLeakage, NewLabelTrainTest,
-                                    StringMismatchComparison, TrainTestFeatureDrift, TrainTestLabelDrift,
-                                    TrainTestSamplesMix, WholeDatasetDrift)
+from typing import TYPE_CHECKING
+
+from deepchecks.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .data_integrity import (ColumnsInfo, ConflictingLabels, DataDuplicates, FeatureLabelCorrelation, IsSingleValue,
+                                 MixedDataTypes, MixedNulls, OutlierSampleDetection, SpecialCharacters,
+                                 StringLengthOutOfBounds, StringMismatch)
+    from .model_evaluation import (BoostingOverfit, CalibrationScore, ConfusionMatrixReport, ModelErrorAnalysis,
+                                   ModelInferenceTime, ModelInfo, MultiModelPerformanceReport, PerformanceReport,
+                                   RegressionErrorDistribution, RegressionSystematicError, RocReport,
+                                   SegmentPerformance, SimpleModelComparison, TrainTestPredictionDrift, UnusedFeatures)
+    from .train_test_validation import (CategoryMismatchTrainTest, DatasetsSizeComparison,
+                                        DateTrainTestLeakageDuplicates, DateTrainTestLeakageOverlap,
+                                        DominantFrequencyChange, FeatureLabelCorrelationChange, IdentifierLeakage,
+                                        IndexTrainTestLeakage, NewLabelTrainTest, StringMismatchComparison,
+                                        TrainTestFeatureDrift, TrainTestLabelDrift, TrainTestSamplesMix,
+                                        WholeDatasetDrift)
 
 __all__ = [
     # integrity checks
@@ -73,3 +79,48 @@ __all__ = [
     'MultiModelPerformanceReport',
     'ModelErrorAnalysis'
 ]
+
+# Checks are imported on first access, so that importing the package doesn't import all the checks and their
+# dependencies
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'ColumnsInfo': '.data_integrity',
+    'ConflictingLabels': '.data_integrity',
+    'DataDuplicates': '.data_integrity',
+    'FeatureLabelCorrelation': '.data_integrity',
+    'IsSingleValue': '.data_integrity',
+    'MixedDataTypes': '.data_integrity',
+    'MixedNulls': '.data_integrity',
+    'OutlierSampleDetection': '.data_integrity',
+    'SpecialCharacters': '.data_integrity',
+    'StringLengthOutOfBounds': '.data_integrity',
+    'StringMismatch': '.data_integrity',
+    'BoostingOverfit': '.model_evaluation',
+    'CalibrationScore': '.model_evaluation',
+    'ConfusionMatrixReport': '.model_evaluation',
+    'ModelErrorAnalysis': '.model_evaluation',
+    'ModelInferenceTime': '.model_evaluation',
+    'ModelInfo': '.model_evaluation',
+    'MultiModelPerformanceReport': '.model_evaluation',
+    'PerformanceReport': '.model_evaluation',
+    'RegressionErrorDistribution': '.model_evaluation',
+    'RegressionSystematicError': '.model_evaluation',
+    'RocReport': '.model_evaluation',
+    'SegmentPerformance': '.model_evaluation',
+    'SimpleModelComparison': '.model_evaluation',
+    'TrainTestPredictionDrift': '.model_evaluation',
+    'UnusedFeatures': '.model_evaluation',
+    'CategoryMismatchTrainTest': '.train_test_validation',
+    'DatasetsSizeComparison': '.train_test_validation',
+    'DateTrainTestLeakageDuplicates': '.train_test_validation',
+    'DateTrainTestLeakageOverlap': '.train_test_validation',
+    'DominantFrequencyChange': '.train_test_validation',
+    'FeatureLabelCorrelationChange': '.train_test_validation',
+    'IdentifierLeakage': '.train_test_validation',
+    'IndexTrainTestLeakage': '.train_test_validation',
+    'NewLabelTrainTest': '.train_test_validation',
+    'StringMismatchComparison': '.train_test_validation',
+    'TrainTestFeatureDrift': '.train_test_validation',
+    'TrainTestLabelDrift': '.train_test_validation',
+    'TrainTestSamplesMix': '.train_test_validation',
+    'WholeDatasetDrift': '.train_test_validation',
+})
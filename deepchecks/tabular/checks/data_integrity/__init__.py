@@ -9,17 +9,22 @@
 # ----------------------------------------------------------------------------
 #
 """Module contains all data integrity checks."""
-from .columns_info import ColumnsInfo
-from .conflicting_labels import ConflictingLabels
-from .data_duplicates import DataDuplicates
-from .feature_label_correlation import FeatureLabelCorrelation
-from .is_single_value import IsSingleValue
-from .mixed_data_types import MixedDataTypes
-from .mixed_nulls import MixedNulls
-from .outlier_sample_detection import OutlierSampleDetection
-from .special_chars import SpecialCharacters
-from .string_length_out_of_bounds import StringLengthOutOfBounds
-from .string_mismatch import StringMismatch
+from typing import TYPE_CHECKING
+
+from deepchecks.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .columns_info import ColumnsInfo
+    from .conflicting_labels import ConflictingLabels
+    from .data_duplicates import DataDuplicates
+    from .feature_label_correlation import FeatureLabelCorrelation
+    from .is_single_value import IsSingleValue
+    from .mixed_data_types import MixedDataTypes
+    from .mixed_nulls import MixedNulls
+    from .outlier_sample_detection import OutlierSampleDetection
+    from .special_chars import SpecialCharacters
+    from .string_length_out_of_bounds import StringLengthOutOfBounds
+    from .string_mismatch import StringMismatch
 
 __all__ = [
     'ColumnsInfo',
@@ -34,3 +39,19 @@ __all__ = [
     'OutlierSampleDetection',
     'FeatureLabelCorrelation',
 ]
+
+# Checks are imported on first access, so that importing the package doesn't import all the checks and their
+# dependencies
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'ColumnsInfo': '.columns_info',
+    'ConflictingLabels': '.conflicting_labels',
+    'DataDuplicates': '.data_duplicates',
+    'FeatureLabelCorrelation': '.feature_label_correlation',
+    'IsSingleValue': '.is_single_value',
+    'MixedDataTypes': '.mixed_data_types',
+    'MixedNulls': '.mixed_nulls',
+    'OutlierSampleDetection': '.outlier_sample_detection',
+    'SpecialCharacters': '.special_chars',
+    'StringLengthOutOfBounds': '.string_length_out_of_bounds',
+    'StringMismatch': '.string_mismatch',
+})
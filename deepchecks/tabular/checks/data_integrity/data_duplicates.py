@@ -12,6 +12,7 @@
 from typing import List, Union
 
 import numpy as np
+import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
 from deepchecks.core.errors import DatasetValidationError
@@ -77,33 +78,27 @@ class DataDuplicates(SingleDatasetCheck):
         if category_columns:
             df = df.astype({c: 'object' for c in category_columns})
 
-        group_unique_data = df[data_columns].groupby(data_columns, dropna=False).size()
-        n_unique = len(group_unique_data)
+        # A single hash-based grouping pass gives each row the id of its group of identical rows (nulls are equal
+        # to each other), from which both the groups sizes and their member rows are derived
+        group_ids = df[data_columns].groupby(data_columns, dropna=False).ngroup().to_numpy()
+        group_sizes = pd.Series(np.bincount(group_ids))
+        n_unique = len(group_sizes)
 
         percent_duplicate = 1 - (1.0 * int(n_unique)) / (1.0 * int(n_samples))
 
         if percent_duplicate > 0:
-            # patched for anonymous_series
-            is_anonymous_series = 0 in group_unique_data.keys().names
-            if is_anonymous_series:
-                new_name = str(group_unique_data.keys().names)
-                new_index = group_unique_data.keys()
-                new_index.names = [new_name if name == 0 else name for name in new_index.names]
-                group_unique_data = group_unique_data.reindex(new_index)
-            duplicates_counted = group_unique_data.reset_index().rename(columns={0: 'Number of Duplicates'})
-            if is_anonymous_series:
-                duplicates_counted.rename(columns={new_name: 0}, inplace=True)
-
-            most_duplicates = duplicates_counted[duplicates_counted['Number of Duplicates'] > 1]. \
-                nlargest(self.n_to_show, ['Number of Duplicates'])
-
-            indexes = []
-            for row in most_duplicates.iloc():
-                indexes.append(format_list(df.index[np.all(df == row[data_columns], axis=1)].to_list()))
-
-            most_duplicates['Instances'] = indexes
-
-            most_duplicates = most_duplicates.set_index(['Instances', 'Number of Duplicates'])
+            most_duplicates_sizes = group_sizes[group_sizes > 1].nlargest(self.n_to_show)
+            is_most_duplicated_row = np.isin(group_ids, most_duplicates_sizes.index)
+            instances = pd.Series(df.index[is_most_duplicated_row]) \
+                .groupby(group_ids[is_most_duplicated_row]).agg(lambda indexes: format_list(indexes.to_list()))
+            first_rows = pd.Series(np.flatnonzero(is_most_duplicated_row)) \
+                .groupby(group_ids[is_most_duplicated_row]).first()
+
+            most_duplicates = df[data_columns].iloc[first_rows[most_duplicates_sizes.index]]
+            most_duplicates.index = pd.MultiIndex.from_arrays(
+                [instances[most_duplicates_sizes.index], most_duplicates_sizes],
+                names=['Instances', 'Number of Duplicates']
+            )
 
             text = f'{format_percent(percent_duplicate)} of data samples are duplicates. '
             explanation = 'Each row in the table shows an example of duplicate data and the number of times it appears.'
@@ -48,6 +48,8 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         Number of features to show, sorted by the magnitude of difference in PPS
     random_state : int , default: None
         Random state for the ppscore.predictors function
+    n_jobs : int , default: 1
+        Number of threads to calculate the PPS of the features with, -1 means using all the processors
     """
 
     def __init__(
@@ -55,12 +57,14 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         ppscore_params=None,
         n_top_features: int = 5,
         random_state: int = None,
+        n_jobs: int = 1,
         **kwargs
     ):
         super().__init__()
         self.ppscore_params = ppscore_params or {}
         self.n_top_features = n_top_features
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_type: str = 'train') -> CheckResult:
         """Run check.
@@ -86,8 +90,12 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         relevant_columns = dataset.features + [dataset.label_name]
 
         df_pps = pps.predictors(df=dataset.data[relevant_columns], y=dataset.label_name, random_seed=self.random_state,
-                                **self.ppscore_params)
+                                **{'n_jobs': self.n_jobs, **self.ppscore_params})
         s_ppscore = df_pps.set_index('x', drop=True)['ppscore']
+        # display only if not all scores are 0
+        if not context.with_display or not s_ppscore.sum():
+            return CheckResult(value=s_ppscore.to_dict(), header='Feature Label Correlation')
+
         top_to_show = s_ppscore.head(self.n_top_features)
 
         fig = get_pps_figure(per_class=False, n_of_features=len(top_to_show))
@@ -100,10 +108,7 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
             ' actually due to data leakage - meaning that the feature holds information that is based on the label '
             'to begin with.']
 
-        # display only if not all scores are 0
-        display = [fig, *text] if s_ppscore.sum() else None
-
-        return CheckResult(value=s_ppscore.to_dict(), display=display, header='Feature Label Correlation')
+        return CheckResult(value=s_ppscore.to_dict(), display=[fig, *text], header='Feature Label Correlation')
 
     def add_condition_feature_pps_not_greater_than(self: FLC, threshold: float = 0.8) -> FLC:
         """
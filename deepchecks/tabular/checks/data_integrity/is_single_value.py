@@ -13,10 +13,10 @@ from typing import List, Union
 
 import pandas as pd
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
+from deepchecks.tabular.utils.column_profile import ColumnProfile
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['IsSingleValue']
@@ -58,15 +58,14 @@ class IsSingleValue(SingleDatasetCheck):
             value of result is a dict of all columns with number of unique values in format {column: number_of_uniques}
             display is a series with columns that have only one unique
         """
-        # Validate parameters
-        if dataset_type == 'train':
-            df = context.train.data
-        else:
-            df = context.test.data
-
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
-
-        num_unique_per_col = df.nunique(dropna=self.ignore_nan)
+        kind = DatasetKind.TRAIN if dataset_type == 'train' else DatasetKind.TEST
+
+        column_profiles = context.get_column_profiles(kind, self.columns, self.ignore_columns)
+        # Each type of null counts as a separate value, like in value_counts(dropna=False)
+        num_unique_per_col = pd.Series({
+            column_name: len(profile.value_counts) + (0 if self.ignore_nan else len(profile.null_counts))
+            for column_name, profile in column_profiles.items()
+        }, dtype='int64')
         is_single_unique_value = (num_unique_per_col == 1)
 
         if is_single_unique_value.any():
@@ -74,8 +73,8 @@ class IsSingleValue(SingleDatasetCheck):
             # pylint: disable=unsubscriptable-object
             cols_with_single = is_single_unique_value[is_single_unique_value].index.to_list()
             uniques = pd.DataFrame({
-                column_name: [column.sort_values(kind='mergesort').values[0]]
-                for column_name, column in df.loc[:, cols_with_single].items()
+                column_name: [_single_value(column_profiles[column_name])]
+                for column_name in cols_with_single
             })
             uniques.index = ['Single unique value']
             display = ['The following columns have only one unique value', uniques]
@@ -98,3 +97,10 @@ class IsSingleValue(SingleDatasetCheck):
                 return ConditionResult(ConditionCategory.PASS, get_condition_passed_message(result))
 
         return self.add_condition(name, condition)
+
+
+def _single_value(profile: ColumnProfile):
+    if len(profile.value_counts) > 0:
+        return profile.value_counts.index[0]
+    # The only value of the column is a null
+    return next(iter(profile.null_counts))
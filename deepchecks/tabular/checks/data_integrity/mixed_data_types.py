@@ -14,11 +14,11 @@ from typing import List, Tuple, Union
 import numpy as np
 import pandas as pd
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
-from deepchecks.utils.dataframes import select_from_dataframe
+from deepchecks.tabular.utils.column_profile import ColumnProfile
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
-from deepchecks.utils.strings import format_list, format_number, format_percent, get_ellipsis, is_string_column
+from deepchecks.utils.strings import format_list, format_number, format_percent, get_ellipsis
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['MixedDataTypes']
@@ -63,19 +63,18 @@ class MixedDataTypes(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            kind = DatasetKind.TEST
         features_importance = context.features_importance
 
-        df = select_from_dataframe(dataset.data, self.columns, self.ignore_columns)
-
         # Result value: { Column Name: {string: pct, numbers: pct}}
         display_dict = {}
         result_dict = {}
 
-        for column_name in df.columns:
-            column_data = df[column_name].dropna()
-            mix = self._get_data_mix(column_data)
+        for column_name, profile in context.get_column_profiles(kind, self.columns, self.ignore_columns).items():
+            mix = self._get_data_mix(profile)
             result_dict[column_name] = mix
             if mix:
                 # Format percents for display
@@ -97,35 +96,23 @@ class MixedDataTypes(SingleDatasetCheck):
 
         return CheckResult(result_dict, display=display)
 
-    def _get_data_mix(self, column_data: pd.Series) -> dict:
-        if is_string_column(column_data):
-            return self._check_mixed_percentage(column_data)
+    def _get_data_mix(self, profile: ColumnProfile) -> dict:
+        if profile.is_string:
+            return self._check_mixed_percentage(profile)
         return {}
 
-    def _check_mixed_percentage(self, column_data: pd.Series) -> dict:
-        total_rows = column_data.count()
-
-        numbers_in_col = set()
-        strings_in_col = set()
-
-        def is_float(x) -> bool:
-            try:
-                float(x)
-                if len(numbers_in_col) < 3:
-                    numbers_in_col.add(x)
-                return True
-            except ValueError:
-                if len(strings_in_col) < 3:
-                    strings_in_col.add(x)
-                return False
-
-        nums = sum(column_data.apply(is_float))
+    def _check_mixed_percentage(self, profile: ColumnProfile) -> dict:
+        total_rows = profile.n_values
+        nums = int(profile.value_counts[profile.is_number].sum())
         if nums in (total_rows, 0):
             return {}
 
         # Then we've got a mix
         nums_pct = nums / total_rows
         strs_pct = (np.abs(nums - total_rows)) / total_rows
+        # Examples are the first values of each type in the column
+        numbers_in_col = set(profile.value_counts.index[profile.is_number][:3])
+        strings_in_col = set(profile.value_counts.index[~profile.is_number][:3])
 
         return {'strings': strs_pct, 'numbers': nums_pct,
                 'strings_examples': strings_in_col, 'numbers_examples': numbers_in_col}
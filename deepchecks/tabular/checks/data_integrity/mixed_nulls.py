@@ -11,14 +11,13 @@
 """Module contains Mixed Nulls check."""
 from typing import Dict, Iterable, List, Union
 
-import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
 from deepchecks.utils.strings import format_percent, string_baseform
 from deepchecks.utils.typing import Hashable
@@ -75,29 +74,34 @@ class MixedNulls(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            kind = DatasetKind.TRAIN
         else:
             dataset = context.test
-        df = dataset.data
-
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
+            kind = DatasetKind.TEST
         null_string_list = self._validate_null_string_list(self.null_string_list)
 
+        # Null values are counted from the profiles of the columns, most common first
+        column_profiles = context.get_column_profiles(kind, self.columns, self.ignore_columns)
+        null_counts_per_column = {}
+        for column_name, profile in column_profiles.items():
+            # Numeric columns can't contain strings
+            string_null_counts = [] if is_numeric_dtype(profile.dtype) else \
+                [(value, count) for value, count in profile.value_counts.items()
+                 if string_baseform(value) in null_string_list]
+            null_counts_per_column[column_name] = {
+                **dict(sorted(string_null_counts, key=lambda item: -item[1])),
+                **dict(sorted(profile.null_counts.items(), key=lambda item: -item[1]))
+            }
+
         # Result value
         display_array = []
         result_dict = {}
 
-        for column_name in list(df.columns):
-            column_data = df[column_name]
-
-            string_null_counts = {value: count for value, count in column_data.value_counts(dropna=True).iteritems()
-                                  if string_baseform(value) in null_string_list}
-            nan_data_counts = column_data[column_data.isna()].apply(nan_type).value_counts().to_dict()
-            null_counts = {**string_null_counts, **nan_data_counts}
-
+        for column_name, null_counts in null_counts_per_column.items():
             result_dict[column_name] = {}
             # Save the column nulls info
             for null_value, count in null_counts.items():
-                percent = count / len(column_data)
+                percent = count / column_profiles[column_name].n_samples
                 display_array.append([column_name, null_value, count, format_percent(percent)])
                 result_dict[column_name][null_value] = {'count': count, 'percent': percent}
 
@@ -160,13 +164,3 @@ class MixedNulls(SingleDatasetCheck):
 
         return self.add_condition(f'Not more than {max_allowed_null_types} different null types',
                                   condition)
-
-
-def nan_type(x):
-    if x is np.nan:
-        return 'numpy.nan'
-    elif x is pd.NA:
-        return 'pandas.NA'
-    elif x is pd.NaT:
-        return 'pandas.NaT'
-    return str(x)
@@ -60,6 +60,9 @@ class OutlierSampleDetection(SingleDatasetCheck):
         random seed for all check internals.
     timeout : int, default: 10
         Check will be interrupted if it takes more than this number of seconds. If 0, check will not be interrupted.
+    n_jobs : int, default: 1
+        Number of threads to use for calculating the distances to the nearest neighbors. -1 means using all
+        processors.
     """
 
     def __init__(
@@ -72,6 +75,7 @@ class OutlierSampleDetection(SingleDatasetCheck):
             n_to_show: int = 5,
             random_state: int = 42,
             timeout: int = 10,
+            n_jobs: int = 1,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -87,6 +91,7 @@ class OutlierSampleDetection(SingleDatasetCheck):
         self.n_to_show = n_to_show
         self.random_state = random_state
         self.timeout = timeout
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_type: str = 'train') -> CheckResult:
         """Run check."""
@@ -114,7 +119,7 @@ class OutlierSampleDetection(SingleDatasetCheck):
 
         try:
             dist_matrix, idx_matrix = gower_distance.calculate_nearest_neighbours_distances(
-                df[dataset.cat_features], df[dataset.numerical_features], num_neighbours)
+                df[dataset.cat_features], df[dataset.numerical_features], num_neighbours, n_jobs=self.n_jobs)
         except MemoryError as e:
             raise DeepchecksProcessError('Out of memory error occurred while calculating the distance matrix. Try '
                                          'reducing n_samples or nearest_neighbors_percent parameters values.') from e
@@ -9,16 +9,14 @@
 # ----------------------------------------------------------------------------
 #
 """module contains Invalid Chars check."""
-from collections import defaultdict
 from typing import List, Union
 
 import pandas as pd
-from pandas.api.types import infer_dtype
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
+from deepchecks.tabular.utils.column_profile import ColumnProfile
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
 from deepchecks.utils.strings import format_percent, string_baseform
 from deepchecks.utils.typing import Hashable
@@ -66,22 +64,21 @@ class SpecialCharacters(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            kind = DatasetKind.TRAIN
         else:
             dataset = context.test
-
-        df = select_from_dataframe(dataset.data, self.columns, self.ignore_columns)
+            kind = DatasetKind.TEST
 
         # Result value: { Column Name: pct}
         display_array = []
         result = {}
 
-        for column_name in df.columns:
-            column_data = df[column_name]
+        for column_name, profile in context.get_column_profiles(kind, self.columns, self.ignore_columns).items():
             # Get dict of samples to count
-            special_samples = _get_special_samples(column_data)
+            special_samples = _get_special_samples(profile)
             if special_samples:
-                result[column_name] = sum(special_samples.values()) / column_data.size
-                percent = format_percent(sum(special_samples.values()) / column_data.size)
+                result[column_name] = sum(special_samples.values()) / profile.n_samples
+                percent = format_percent(sum(special_samples.values()) / profile.n_samples)
                 top_n_samples_items = \
                     sorted(special_samples.items(), key=lambda x: x[1], reverse=True)[:self.n_most_common]
                 top_n_samples_values = [item[0] for item in top_n_samples_items]
@@ -120,16 +117,14 @@ class SpecialCharacters(SingleDatasetCheck):
         return self.add_condition(name, condition)
 
 
-def _get_special_samples(column_data: pd.Series) -> Union[dict, None]:
-    if not _is_stringed_type(column_data):
+def _get_special_samples(profile: ColumnProfile) -> Union[dict, None]:
+    if not _is_stringed_type(profile):
         return None
-    samples_to_count = defaultdict(lambda: 0)
-    for sample in column_data:
-        if isinstance(sample, str) and len(sample) > 0 and len(string_baseform(sample)) == 0:
-            samples_to_count[sample] = samples_to_count[sample] + 1
+    samples_to_count = {sample: count for sample, count in profile.value_counts.items()
+                        if isinstance(sample, str) and len(sample) > 0 and len(string_baseform(sample)) == 0}
 
     return samples_to_count or None
 
 
-def _is_stringed_type(col) -> bool:
-    return infer_dtype(col) not in ['integer', 'decimal', 'floating']
+def _is_stringed_type(profile: ColumnProfile) -> bool:
+    return profile.inferred_type not in ['integer', 'decimal', 'floating']
@@ -13,15 +13,13 @@ from typing import Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from pandas import DataFrame, Series
-from scipy import stats
+from pandas import DataFrame
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
-from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df, is_categorical
-from deepchecks.utils.strings import format_number, format_percent, is_string_column
+from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
+from deepchecks.utils.strings import format_number, format_percent
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['StringLengthOutOfBounds']
@@ -96,34 +94,42 @@ class StringLengthOutOfBounds(SingleDatasetCheck):
         """Run check."""
         if dataset_type == 'train':
             dataset = context.train
+            kind = DatasetKind.TRAIN
         else:
             dataset = context.test
-
-        df = select_from_dataframe(dataset.data, self.columns, self.ignore_columns)
+            kind = DatasetKind.TEST
 
         display_format = []
         results = {}
 
-        for column_name in df.columns:
-            column: Series = df[column_name].dropna()
-
-            if not is_string_column(column) or is_categorical(column,
-                                                              max_categorical_ratio=self.min_unique_value_ratio,
-                                                              max_categories=self.min_unique_values):
+        for column_name, profile in context.get_column_profiles(kind, self.columns, self.ignore_columns).items():
+            if not profile.is_string or profile.is_categorical(max_categorical_ratio=self.min_unique_value_ratio,
+                                                               max_categories=self.min_unique_values):
                 continue
 
             results[column_name] = {'outliers': []}
-            string_length_column = column.map(lambda x: len(str(x)))
+            # The distinct values sorted by length, and the number of samples of every distinct length
+            length_order = np.argsort(profile.string_lengths, kind='stable')
+            lengths = profile.string_lengths[length_order]
+            counts = profile.value_counts.to_numpy()[length_order]
+            values = profile.value_counts.index.to_numpy()[length_order]
+            unique_lengths, first_of_length = np.unique(lengths, return_index=True)
+            cumulative_counts = np.cumsum(np.add.reduceat(counts, first_of_length))
+            n_samples = cumulative_counts[-1]
 
             # If not a lot of unique values, calculate the percentiles for existing values.
-            if string_length_column.nunique() < self.num_percentiles:
-                string_length_column = string_length_column.sort_values()
-                quantile_list = 100 * stats.rankdata(string_length_column, 'ordinal') / len(string_length_column)
-                percentile_histogram = {quantile_list[i]: string_length_column.iloc[i] for i in
-                                        range(len(string_length_column))}
+            if len(unique_lengths) < self.num_percentiles:
+                # The samples of a length are represented by the first and last of their percentiles, which are the
+                # only ones the outlier sections can start or end at
+                first_ranks = np.concatenate([[0], cumulative_counts[:-1]]) + 1
+                ranks = np.stack([first_ranks, cumulative_counts], axis=1).ravel()
+                percentile_histogram = dict(zip(100 * ranks / n_samples, np.repeat(unique_lengths, 2)))
+                quantile_list = list(percentile_histogram)
             else:
                 quantile_list = list(np.linspace(0.0, 100.0, self.num_percentiles + 1))
-                quantile_values = np.percentile(string_length_column, quantile_list, interpolation='nearest')
+                # Nearest rank of every percentile, as calculated by np.percentile with the nearest method
+                nearest_ranks = np.around((n_samples - 1) * (np.array(quantile_list) / 100)).astype(int)
+                quantile_values = unique_lengths[np.searchsorted(cumulative_counts, nearest_ranks, side='right')]
                 percentile_histogram = dict(zip(quantile_list, list(quantile_values)))
 
             outlier_sections = outlier_on_percentile_histogram(percentile_histogram, self.inner_quantile_range,
@@ -145,31 +151,35 @@ class StringLengthOutOfBounds(SingleDatasetCheck):
                     if lower_range > upper_range:
                         continue
 
-                    outlier_samples = string_length_column[
-                        string_length_column.between(lower_range, upper_range, inclusive='both')]
+                    is_outlier = (lengths >= lower_range) & (lengths <= upper_range)
+                    n_outlier_samples = int(counts[is_outlier].sum())
 
-                    if not outlier_samples.empty:
-                        outlier_examples = column[outlier_samples[:self.samples_per_range_to_show].index]
-                        outlier_examples = [trim(x, self.outlier_length_to_show) for x in outlier_examples]
+                    if n_outlier_samples > 0:
+                        # The examples are the first outlier samples by length, repeating values with several samples
+                        examples_index = np.flatnonzero(is_outlier)[:self.samples_per_range_to_show]
+                        outlier_examples = np.repeat(values[examples_index],
+                                                     np.minimum(counts[examples_index], self.samples_per_range_to_show))
+                        outlier_examples = [trim(x, self.outlier_length_to_show)
+                                            for x in outlier_examples[:self.samples_per_range_to_show]]
 
                         display_format.append([column_name,
                                                f'{format_number(non_outlier_lower_limit)} -'
                                                f' {format_number(non_outlier_upper_limit)}',
                                                f'{format_number(lower_range)} -'
                                                f' {format_number(upper_range)}',
-                                               f'{outlier_samples.size}',
+                                               f'{n_outlier_samples}',
                                                outlier_examples
                                                ])
                         results[column_name]['normal_range'] = {
                                 'min': non_outlier_lower_limit,
                                 'max': non_outlier_upper_limit
                             }
-                        results[column_name]['n_samples'] = column.size
+                        results[column_name]['n_samples'] = profile.n_values
                         results[column_name]['outliers'].append({
                             'range': {'min': lower_range,
                                       'max': upper_range
                                       },
-                            'n_samples': outlier_samples.size
+                            'n_samples': n_outlier_samples
                         })
 
         # Create dataframe to display graph
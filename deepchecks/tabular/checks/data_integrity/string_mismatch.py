@@ -15,12 +15,13 @@ from typing import List, Union
 
 import pandas as pd
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
+from deepchecks.tabular.utils.column_profile import ColumnProfile
 from deepchecks.tabular.utils.messages import get_condition_passed_message
 from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
-from deepchecks.utils.strings import format_percent, get_base_form_to_variants_dict, is_string_column
+from deepchecks.utils.strings import format_percent, get_base_form_to_variants_dict
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['StringMismatch']
@@ -70,33 +71,37 @@ class StringMismatch(SingleDatasetCheck):
         """Run check."""
         if dataset_type == 'train':
             dataset = context.train
+            kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            kind = DatasetKind.TEST
 
-        df = select_from_dataframe(dataset.sample(self.n_samples, random_state=self.random_state).data,
-                                   self.columns, self.ignore_columns)
+        column_profiles = context.get_column_profiles(kind, self.columns, self.ignore_columns)
+        if any(profile.n_samples > self.n_samples for profile in column_profiles.values()):
+            # The shared profiles are of the whole data, so a sampled dataset is profiled separately
+            df = select_from_dataframe(dataset.sample(self.n_samples, random_state=self.random_state).data,
+                                       self.columns, self.ignore_columns)
+            column_profiles = {column_name: ColumnProfile.from_column(df[column_name]) for column_name in df.columns}
 
         sampling_footnote = context.get_is_sampled_footnote(self.n_samples)
 
         display_results = []
         result_dict = {}
 
-        for column_name in df.columns:
-            column: pd.Series = df[column_name]
-            if not is_string_column(column):
+        for column_name, profile in column_profiles.items():
+            if not profile.is_string:
                 continue
 
             result_dict[column_name] = {}
-            value_counts = column.value_counts()
-            uniques = column.unique()
-            base_form_to_variants = get_base_form_to_variants_dict(uniques)
+            value_counts = profile.value_counts
+            base_form_to_variants = get_base_form_to_variants_dict(value_counts.index)
             for base_form, variants in base_form_to_variants.items():
                 if len(variants) == 1:
                     continue
                 result_dict[column_name][base_form] = []
                 for variant in variants:
                     count = value_counts[variant]
-                    percent = count / len(column)
+                    percent = count / profile.n_samples
                     display_results.append([column_name, base_form, variant, count, format_percent(percent)])
                     result_dict[column_name][base_form].append({
                         'variant': variant, 'count': count, 'percent': percent
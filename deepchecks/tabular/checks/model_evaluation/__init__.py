@@ -9,21 +9,26 @@
 # ----------------------------------------------------------------------------
 #
 """Module contains checks of model evaluation."""
-from .boosting_overfit import BoostingOverfit
-from .calibration_score import CalibrationScore
-from .confusion_matrix_report import ConfusionMatrixReport
-from .model_error_analysis import ModelErrorAnalysis
-from .model_inference_time import ModelInferenceTime
-from .model_info import ModelInfo
-from .multi_model_performance_report import MultiModelPerformanceReport
-from .performance_report import PerformanceReport
-from .regression_error_distribution import RegressionErrorDistribution
-from .regression_systematic_error import RegressionSystematicError
-from .roc_report import RocReport
-from .segment_performance import SegmentPerformance
-from .simple_model_comparison import SimpleModelComparison
-from .train_test_prediction_drift import TrainTestPredictionDrift
-from .unused_features import UnusedFeatures
+from typing import TYPE_CHECKING
+
+from deepchecks.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .boosting_overfit import BoostingOverfit
+    from .calibration_score import CalibrationScore
+    from .confusion_matrix_report import ConfusionMatrixReport
+    from .model_error_analysis import ModelErrorAnalysis
+    from .model_inference_time import ModelInferenceTime
+    from .model_info import ModelInfo
+    from .multi_model_performance_report import MultiModelPerformanceReport
+    from .performance_report import PerformanceReport
+    from .regression_error_distribution import RegressionErrorDistribution
+    from .regression_systematic_error import RegressionSystematicError
+    from .roc_report import RocReport
+    from .segment_performance import SegmentPerformance
+    from .simple_model_comparison import SimpleModelComparison
+    from .train_test_prediction_drift import TrainTestPredictionDrift
+    from .unused_features import UnusedFeatures
 
 __all__ = [
     'BoostingOverfit',
@@ -42,3 +47,23 @@ __all__ = [
     'TrainTestPredictionDrift',
     'UnusedFeatures'
 ]
+
+# Checks are imported on first access, so that importing the package doesn't import all the checks and their
+# dependencies
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'BoostingOverfit': '.boosting_overfit',
+    'CalibrationScore': '.calibration_score',
+    'ConfusionMatrixReport': '.confusion_matrix_report',
+    'ModelErrorAnalysis': '.model_error_analysis',
+    'ModelInferenceTime': '.model_inference_time',
+    'ModelInfo': '.model_info',
+    'MultiModelPerformanceReport': '.multi_model_performance_report',
+    'PerformanceReport': '.performance_report',
+    'RegressionErrorDistribution': '.regression_error_distribution',
+    'RegressionSystematicError': '.regression_systematic_error',
+    'RocReport': '.roc_report',
+    'SegmentPerformance': '.segment_performance',
+    'SimpleModelComparison': '.simple_model_comparison',
+    'TrainTestPredictionDrift': '.train_test_prediction_drift',
+    'UnusedFeatures': '.unused_features',
+})
@@ -10,10 +10,12 @@
 #
 """Boosting overfit check module."""
 from copy import deepcopy
-from typing import Callable, Tuple, Union
+from functools import partial
+from itertools import repeat
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
-import plotly.graph_objects as go
+import pandas as pd
 from sklearn.pipeline import Pipeline
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
@@ -124,6 +126,56 @@ class PartialBoostingModel:
                 model_type=model_class
             ))
 
+    @classmethod
+    def staged_predictions(cls, model, features: pd.DataFrame,
+                           steps: List[int]) -> Optional[Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]]:
+        """Return the predictions of the model limited to each of the steps, calculated in a single pass.
+
+        The predictions are accumulated over the iterations of the model using the staged (or cumulative raw score)
+        prediction API of its library, so the trees of the model are evaluated once for all the steps.
+
+        Parameters
+        ----------
+        model
+            boosting model (or a pipeline ending with one).
+        features : pd.DataFrame
+            features to predict on.
+        steps : List[int]
+            increasing numbers of iterations/estimators to limit the model on predictions.
+
+        Returns
+        -------
+        Optional[Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]]
+            iterator over the predictions and predicted probabilities (None for regression models) of each step, or
+            None if the model does not support staged predictions.
+        """
+        estimator = get_model_of_pipeline(model)
+        model_class = estimator.__class__.__name__
+        if isinstance(model, Pipeline):
+            features = model[:-1].transform(features)
+        is_classifier = model_class in cls._SUPPORTED_CLASSIFICATION_MODELS
+
+        if model_class in ['AdaBoostClassifier', 'GradientBoostingClassifier', 'AdaBoostRegressor',
+                           'GradientBoostingRegressor']:
+            staged = zip(estimator.staged_predict(features),
+                         estimator.staged_predict_proba(features) if is_classifier else repeat(None))
+            return _select_steps(staged, steps)
+        elif model_class in ['CatBoostClassifier', 'CatBoostRegressor']:
+            transform = _catboost_raw_score_transform(estimator, is_classifier)
+            if transform is None:
+                return None
+            raw_scores = _select_steps(estimator.staged_predict(features, prediction_type='RawFormulaVal'), steps)
+            return _predictions_from_raw_scores(raw_scores, estimator, is_classifier, transform)
+        elif model_class in ['XGBClassifier', 'XGBRegressor']:
+            return _xgb_staged_predictions(estimator, features, steps, is_classifier)
+        elif model_class in ['LGBMClassifier', 'LGBMRegressor']:
+            transform = _lgbm_raw_score_transform(estimator)
+            if transform is None:
+                return None
+            raw_scores = _lgbm_staged_raw_scores(estimator, features, steps)
+            return _predictions_from_raw_scores(raw_scores, estimator, is_classifier, transform)
+        return None
+
 
 class BoostingOverfit(TrainTestCheck):
     """Check for overfit caused by using too many iterations in a gradient boosted model.
@@ -173,11 +225,14 @@ class BoostingOverfit(TrainTestCheck):
         num_estimators = PartialBoostingModel.n_estimators(model)
         estimator_steps = _calculate_steps(self.num_steps, num_estimators)
 
-        train_scores = []
-        test_scores = []
-        for step in estimator_steps:
-            train_scores.append(_partial_score(scorer, train_dataset, model, step))
-            test_scores.append(_partial_score(scorer, test_dataset, model, step))
+        train_scores = _staged_scores(scorer, train_dataset, model, estimator_steps)
+        test_scores = _staged_scores(scorer, test_dataset, model, estimator_steps)
+
+        result = {'test': test_scores, 'train': train_scores}
+        if not context.with_display:
+            return CheckResult(result, header='Boosting Overfit')
+
+        import plotly.graph_objects as go  # pylint: disable=import-outside-toplevel
 
         fig = go.Figure()
         fig.add_trace(go.Scatter(x=estimator_steps, y=np.array(train_scores),
@@ -198,7 +253,6 @@ class BoostingOverfit(TrainTestCheck):
             {scorer.name} calculated for each subset of estimators for both the train dataset and the test dataset.
         </span>"""
 
-        result = {'test': test_scores, 'train': train_scores}
         return CheckResult(result, display=[display_text, fig], header='Boosting Overfit')
 
     def add_condition_test_score_percent_decline_not_greater_than(self, threshold: float = 0.05):
@@ -230,6 +284,149 @@ def _partial_score(scorer, dataset, model, step):
     return scorer(partial_model, dataset)
 
 
+def _staged_scores(scorer, dataset, model, steps):
+    """Calculate the score of the model limited to each of the steps."""
+    staged = PartialBoostingModel.staged_predictions(model, dataset.features_columns, steps)
+    if staged is None:
+        return [_partial_score(scorer, dataset, model, step) for step in steps]
+    staged_model = _StagedModel(model)
+    return [scorer(staged_model, dataset, y_pred=y_pred, y_proba=y_proba) for y_pred, y_proba in staged]
+
+
+class _StagedModel:
+    """Stand-in for the model limited to a step, whose predictions are given to the scorer.
+
+    Only the prediction API of the model is exposed, so scorers can't use other methods of the full model (like
+    decision_function) instead of the given predictions.
+    """
+
+    _EXPOSED_ATTRIBUTES = ('predict', 'predict_proba', 'classes_')
+
+    def __init__(self, model):
+        self._model = model
+
+    def __getattr__(self, name):
+        if name in self._EXPOSED_ATTRIBUTES:
+            return getattr(self._model, name)
+        raise AttributeError(f'{type(self).__name__} object has no attribute {name}')
+
+
+def _select_steps(staged, steps):
+    """Yield the items of the staged iterator (starting from step 1) which are in the given steps."""
+    steps = set(steps)
+    for step, item in enumerate(staged, start=1):
+        if step in steps:
+            yield item
+            steps.remove(step)
+            if not steps:
+                return
+
+
+def _xgb_staged_predictions(estimator, features, steps, is_classifier):
+    """Return the predictions of each step, or None if the objective of the classifier is not known."""
+    import xgboost  # pylint: disable=import-outside-toplevel
+
+    if is_classifier and estimator.objective not in ['binary:logistic', 'multi:softprob']:
+        return None
+    booster = estimator.get_booster()
+    dmatrix = xgboost.DMatrix(features, missing=estimator.missing, nthread=estimator.n_jobs,
+                              enable_categorical=estimator.enable_categorical)
+    return _xgb_staged_predictions_from_dmatrix(booster, dmatrix, estimator, steps, is_classifier)
+
+
+def _xgb_staged_predictions_from_dmatrix(booster, dmatrix, estimator, steps, is_classifier):
+    """Yield the predictions of each step, using the margin of the previous step as the base margin of the next."""
+    previous_step = 0
+    for step in steps:
+        iteration_range = (previous_step, step)
+        output = booster.predict(dmatrix, iteration_range=iteration_range)
+        dmatrix.set_base_margin(booster.predict(dmatrix, output_margin=True, iteration_range=iteration_range))
+        previous_step = step
+        if is_classifier:
+            y_proba = _binary_proba_from_positive(output) if output.ndim == 1 else output
+            yield estimator.classes_[np.argmax(y_proba, axis=1)], y_proba
+        else:
+            yield output, None
+
+
+def _binary_proba_from_positive(positive_proba):
+    return np.vstack([1 - positive_proba, positive_proba]).T
+
+
+def _binary_proba(raw_score, sigmoid=1.0):
+    return _binary_proba_from_positive(1 / (1 + np.exp(-sigmoid * raw_score)))
+
+
+def _softmax(raw_score):
+    exp = np.exp(raw_score - raw_score.max(axis=1, keepdims=True))
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def _identity(raw_score):
+    return raw_score
+
+
+_LGBM_IDENTITY_OBJECTIVES = frozenset({
+    'regression', 'regression_l2', 'l2', 'mean_squared_error', 'mse', 'l2_root', 'root_mean_squared_error', 'rmse',
+    'regression_l1', 'l1', 'mean_absolute_error', 'mae', 'huber', 'fair', 'quantile', 'mape',
+    'mean_absolute_percentage_error'
+})
+_LGBM_EXP_OBJECTIVES = frozenset({'poisson', 'gamma', 'tweedie'})
+
+
+def _lgbm_raw_score_transform(estimator) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Return the function converting LightGBM raw scores to predictions, or None if the objective is not known."""
+    objective = estimator.objective_
+    params = estimator.get_params()
+    if not isinstance(objective, str):
+        return None
+    if objective == 'binary':
+        return partial(_binary_proba, sigmoid=params.get('sigmoid', 1.0))
+    if objective in ['multiclass', 'softmax']:
+        return _softmax
+    if objective in _LGBM_IDENTITY_OBJECTIVES and not params.get('reg_sqrt', False):
+        return _identity
+    if objective in _LGBM_EXP_OBJECTIVES:
+        return np.exp
+    return None
+
+
+def _catboost_raw_score_transform(estimator, is_classifier) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Return the function converting CatBoost raw scores to predictions, or None if the loss is not known."""
+    if is_classifier:
+        loss_function = estimator.get_all_params().get('loss_function')
+        if loss_function in ['Logloss', 'CrossEntropy']:
+            return _binary_proba
+        if loss_function == 'MultiClass':
+            return _softmax
+        return None
+    # pylint: disable=protected-access
+    prediction_type = estimator._get_default_prediction_type() \
+        if hasattr(estimator, '_get_default_prediction_type') else 'RawFormulaVal'
+    return {'RawFormulaVal': _identity, 'Exponent': np.exp}.get(prediction_type)
+
+
+def _lgbm_staged_raw_scores(estimator, features, steps):
+    """Yield the raw scores of each step, accumulating the raw scores of the iterations between the steps."""
+    raw_score = 0
+    previous_step = 0
+    for step in steps:
+        raw_score = raw_score + estimator.predict(features, raw_score=True, start_iteration=previous_step,
+                                                  num_iteration=step - previous_step)
+        previous_step = step
+        yield raw_score
+
+
+def _predictions_from_raw_scores(raw_scores, estimator, is_classifier, transform):
+    """Yield the predictions and predicted probabilities matching each of the raw scores."""
+    for raw_score in raw_scores:
+        if is_classifier:
+            y_proba = transform(raw_score)
+            yield estimator.classes_[np.argmax(y_proba, axis=1)], y_proba
+        else:
+            yield transform(raw_score), None
+
+
 def _calculate_steps(num_steps, num_estimators):
     """Calculate steps (integers between 1 to num_estimators) to work on."""
     if num_steps >= num_estimators:
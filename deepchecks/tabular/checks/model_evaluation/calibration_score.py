@@ -9,15 +9,12 @@
 # ----------------------------------------------------------------------------
 #
 """The calibration score check module."""
-import typing as t
 
-import plotly.graph_objects as go
 from sklearn.calibration import calibration_curve
 from sklearn.metrics import brier_score_loss
 
-from deepchecks.core import CheckResult
+from deepchecks.core import CheckResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
-from deepchecks.utils.typing import ClassificationModel
 
 __all__ = ['CalibrationScore']
 
@@ -40,17 +37,16 @@ class CalibrationScore(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            dataset_kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            dataset_kind = DatasetKind.TEST
 
         context.assert_classification_task()
-        ds_x = dataset.features_columns
         ds_y = dataset.label_col
         dataset_classes = dataset.classes
-        model = t.cast(ClassificationModel, context.model)
-
         # Expect predict_proba to return in order of the sorted classes.
-        y_pred = model.predict_proba(ds_x)
+        y_pred = context.get_probabilities(dataset_kind)
 
         briers_scores = {}
 
@@ -62,6 +58,11 @@ class CalibrationScore(SingleDatasetCheck):
                 clf_score = brier_score_loss(ds_y == class_name, prob_pos)
                 briers_scores[class_name] = clf_score
 
+        if not context.with_display:
+            return CheckResult(briers_scores, header='Calibration Metric')
+
+        import plotly.graph_objects as go  # pylint: disable=import-outside-toplevel
+
         fig = go.Figure()
 
         fig.add_trace(go.Scatter(
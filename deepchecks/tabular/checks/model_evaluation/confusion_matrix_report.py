@@ -13,7 +13,7 @@ import numpy as np
 import pandas as pd
 from sklearn import metrics
 
-from deepchecks.core import CheckResult
+from deepchecks.core import CheckResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.utils.plot import create_confusion_matrix_figure
 
@@ -50,18 +50,21 @@ class ConfusionMatrixReport(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            dataset_kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            dataset_kind = DatasetKind.TEST
 
         context.assert_classification_task()
         ds_y = dataset.label_col
-        ds_x = dataset.features_columns
-        model = context.model
 
-        y_pred = np.array(model.predict(ds_x)).reshape(len(ds_y), )
-        total_classes = sorted(list(set(pd.concat([ds_y, pd.Series(y_pred)]).to_list())))
+        y_pred = np.array(context.get_predictions(dataset_kind)).reshape(len(ds_y), )
         confusion_matrix = metrics.confusion_matrix(ds_y, y_pred)
 
+        if not context.with_display:
+            return CheckResult(confusion_matrix)
+
+        total_classes = sorted(list(set(pd.concat([ds_y, pd.Series(y_pred)]).to_list())))
         fig = create_confusion_matrix_figure(confusion_matrix, total_classes,
                                              total_classes, self.normalized)
 
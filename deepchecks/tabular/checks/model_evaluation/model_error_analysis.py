@@ -14,7 +14,7 @@ from typing import Callable, Dict, Tuple, Union
 from sklearn import preprocessing
 
 from deepchecks import CheckFailure
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.core.errors import DeepchecksProcessError
 from deepchecks.tabular import Context, Dataset, TrainTestCheck
 from deepchecks.utils.metrics import ModelType
@@ -123,20 +123,31 @@ class ModelErrorAnalysis(TrainTestCheck):
         train_dataset = train_dataset.sample(self.n_samples, random_state=self.random_state, drop_na_label=True)
         test_dataset = test_dataset.sample(self.n_samples, random_state=self.random_state, drop_na_label=True)
 
+        def get_sample_predictions(dataset: Dataset, kind: DatasetKind, proba: bool):
+            # Reuse the context cached predictions of the full dataset when the samples can be located by index
+            full_data = context.get_data_by_kind(kind).data
+            if full_data.index.is_unique:
+                positions = full_data.index.get_indexer(dataset.data.index)
+                predictions = context.get_probabilities(kind) if proba else context.get_predictions(kind)
+                return predictions[positions]
+            if proba:
+                return model.predict_proba(dataset.features_columns)
+            return model.predict(dataset.features_columns)
+
         # Create scoring function, used to calculate the per sample model error
         if task_type == ModelType.REGRESSION:
-            def scoring_func(dataset: Dataset):
-                return per_sample_mse(dataset.label_col, model.predict(dataset.features_columns))
+            def scoring_func(dataset: Dataset, kind: DatasetKind):
+                return per_sample_mse(dataset.label_col, get_sample_predictions(dataset, kind, proba=False))
         else:
-            def scoring_func(dataset: Dataset):
+            def scoring_func(dataset: Dataset, kind: DatasetKind):
                 le = preprocessing.LabelEncoder()
                 le.fit(dataset.classes)
                 encoded_label = le.transform(dataset.label_col)
                 return per_sample_cross_entropy(encoded_label,
-                                                model.predict_proba(dataset.features_columns))
+                                                get_sample_predictions(dataset, kind, proba=True))
 
-        train_scores = scoring_func(train_dataset)
-        test_scores = scoring_func(test_dataset)
+        train_scores = scoring_func(train_dataset, DatasetKind.TRAIN)
+        test_scores = scoring_func(test_dataset, DatasetKind.TEST)
 
         cat_features = train_dataset.cat_features
         numeric_features = train_dataset.numerical_features
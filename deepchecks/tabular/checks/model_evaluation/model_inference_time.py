@@ -9,10 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """The model inference time check module."""
+import time
 import timeit
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.core.condition import ConditionCategory
@@ -26,21 +29,78 @@ __all__ = ['ModelInferenceTime']
 MI = t.TypeVar('MI', bound='ModelInferenceTime')
 
 
+_PREDICTION_METHODS = ('predict', 'predict_proba')
+
+
 class ModelInferenceTime(SingleDatasetCheck):
     """Measure model average inference time (in seconds) per sample.
 
+    In benchmark mode, the check instead measures the latency of inference calls and the throughput of the model for
+    every combination of batch size, prediction method and number of concurrent threads. Each combination runs a few
+    untimed warm-up calls and then a number of timed calls on a sample of the dataset in every thread.
+
     Parameters
     ----------
     n_samples : int , default: 1000
         number of samples to use for inference, but if actual
         dataset is smaller then all samples will be used
+    benchmark : bool , default: False
+        whether to run the benchmark of the latency percentiles and throughput, instead of measuring the average
+        inference time per sample.
+    batch_sizes : t.Sequence[int] , default: (1, 10, 100, 1000)
+        benchmark mode - number of samples in every inference call. Batch sizes larger than the dataset are limited
+        to its size.
+    prediction_methods : t.Sequence[str] , default: ('predict', 'predict_proba')
+        benchmark mode - the prediction methods of the model to benchmark. Methods the model doesn't have are skipped.
+    n_threads : t.Sequence[int] , default: (1,)
+        benchmark mode - numbers of threads calling the model concurrently.
+    n_warmup : int , default: 3
+        benchmark mode - number of untimed calls before timing each combination.
+    n_repeats : int , default: 20
+        benchmark mode - number of timed calls in every thread.
+    percentiles : t.Sequence[int] , default: (50, 95, 99)
+        benchmark mode - percentiles of the latency to report.
+    random_state : int , default: 42
+        benchmark mode - random state for sampling the batches.
     """
 
-    def __init__(self, n_samples: int = 1000, **kwargs):
+    def __init__(
+        self,
+        n_samples: int = 1000,
+        benchmark: bool = False,
+        batch_sizes: t.Sequence[int] = (1, 10, 100, 1000),
+        prediction_methods: t.Sequence[str] = _PREDICTION_METHODS,
+        n_threads: t.Sequence[int] = (1,),
+        n_warmup: int = 3,
+        n_repeats: int = 20,
+        percentiles: t.Sequence[int] = (50, 95, 99),
+        random_state: int = 42,
+        **kwargs
+    ):
         super().__init__(**kwargs)
         self.n_samples = n_samples
         if n_samples == 0 or n_samples < 0:
             raise DeepchecksValueError('n_samples cannot be le than 0!')
+        self.benchmark = benchmark
+        self.batch_sizes = list(batch_sizes)
+        self.prediction_methods = list(prediction_methods)
+        self.n_threads = list(n_threads)
+        self.n_warmup = n_warmup
+        self.n_repeats = n_repeats
+        self.percentiles = list(percentiles)
+        self.random_state = random_state
+        if not self.batch_sizes or any(not isinstance(size, int) or size < 1 for size in self.batch_sizes):
+            raise DeepchecksValueError('batch_sizes must be a non-empty list of positive integers')
+        if not self.n_threads or any(not isinstance(threads, int) or threads < 1 for threads in self.n_threads):
+            raise DeepchecksValueError('n_threads must be a non-empty list of positive integers')
+        if not self.prediction_methods or not set(self.prediction_methods).issubset(_PREDICTION_METHODS):
+            raise DeepchecksValueError(f'prediction_methods must be a non-empty list of {_PREDICTION_METHODS}')
+        if not isinstance(n_warmup, int) or n_warmup < 0:
+            raise DeepchecksValueError('n_warmup must be a non-negative integer')
+        if not isinstance(n_repeats, int) or n_repeats < 1:
+            raise DeepchecksValueError('n_repeats must be a positive integer')
+        if not self.percentiles or any(not 0 < percentile <= 100 for percentile in self.percentiles):
+            raise DeepchecksValueError('percentiles must be a non-empty list of numbers between 0 and 100')
 
     def run_logic(self, context: Context, dataset_type: str = 'train') -> CheckResult:
         """Run check.
@@ -62,6 +122,8 @@ class ModelInferenceTime(SingleDatasetCheck):
             dataset = context.test
 
         model = context.model
+        if self.benchmark:
+            return self._run_benchmark(dataset, model)
         df = dataset.features_columns
 
         prediction_method = model.predict  # type: ignore
@@ -82,6 +144,36 @@ class ModelInferenceTime(SingleDatasetCheck):
             f'{format_number(result, floating_point=8)}'
         ))
 
+    def _run_benchmark(self, dataset, model) -> CheckResult:
+        methods = [method for method in self.prediction_methods if hasattr(model, method)]
+        if not methods:
+            raise DeepchecksValueError(f'Model has none of the prediction methods {self.prediction_methods}')
+
+        rows = []
+        for batch_size in self.batch_sizes:
+            batch = dataset.sample(batch_size, random_state=self.random_state).features_columns
+            for method in methods:
+                predict = getattr(model, method)
+                for _ in range(self.n_warmup):
+                    predict(batch)
+                for n_threads in self.n_threads:
+                    latencies, total_time = _time_calls(predict, batch, n_threads, self.n_repeats)
+                    rows.append({
+                        'Method': method,
+                        'Batch Size': len(batch),
+                        'Threads': n_threads,
+                        **{f'p{percentile}': np.percentile(latencies, percentile) for percentile in self.percentiles},
+                        'Throughput': len(latencies) * len(batch) / total_time
+                    })
+
+        result = pd.DataFrame(rows)
+        display = [
+            'Latency percentiles of a single inference call (in seconds), and throughput (rows per second) of the '
+            'model with the given number of threads calling it concurrently',
+            result.set_index(['Method', 'Batch Size', 'Threads'])
+        ]
+        return CheckResult(value=result, display=display, header='Model Inference Time')
+
     def add_condition_inference_time_is_not_greater_than(self: MI, value: float = 0.001) -> MI:
         """Add condition - checking that the average model inference time (in seconds) per sample is not greater than X.
 
@@ -94,6 +186,8 @@ class ModelInferenceTime(SingleDatasetCheck):
         MI
         """
         def condition(avarage_time: float) -> ConditionResult:
+            if isinstance(avarage_time, pd.DataFrame):
+                raise DeepchecksValueError('Condition is relevant only when the check does not run in benchmark mode')
             details = f'Found average inference time (seconds): {format_number(avarage_time, floating_point=8)}'
             category = ConditionCategory.FAIL if avarage_time > value else ConditionCategory.PASS
             return ConditionResult(category=category, details=details)
@@ -101,3 +195,101 @@ class ModelInferenceTime(SingleDatasetCheck):
         return self.add_condition(condition_func=condition, name=(
             f'Average model inference time for one sample is not greater than {format_number(value, floating_point=8)}'
         ))
+
+    def add_condition_latency_percentile_not_greater_than(self: MI, percentile: int = 99,
+                                                          value: float = 0.1) -> MI:
+        """Add condition - checking that a percentile of the inference call latency (in seconds) is not greater than X.
+
+        The condition is checked for every benchmarked combination of batch size, prediction method and threads.
+
+        Parameters
+        ----------
+        percentile : int , default: 99
+            the latency percentile, must be one of the percentiles of the check.
+        value : float , default: 0.1
+            condition threshold.
+        Returns
+        -------
+        MI
+        """
+        if percentile not in self.percentiles:
+            raise DeepchecksValueError(f'percentile must be one of the percentiles of the check {self.percentiles}, '
+                                       f'but got {percentile}')
+        column = f'p{percentile}'
+
+        def condition(result: pd.DataFrame) -> ConditionResult:
+            _assert_benchmark_result(result)
+            failed = result[result[column] > value]
+            if len(failed):
+                details = f'Found {len(failed)} out of {len(result)} benchmarks with {column} latency (seconds) ' \
+                          f'above threshold: {failed[["Method", "Batch Size", "Threads", column]].to_dict("records")}'
+                return ConditionResult(ConditionCategory.FAIL, details)
+            details = f'Found maximal {column} latency (seconds): ' \
+                      f'{format_number(result[column].max(), floating_point=8)}'
+            return ConditionResult(ConditionCategory.PASS, details)
+
+        return self.add_condition(condition_func=condition, name=(
+            f'{column} inference latency is not greater than {format_number(value, floating_point=8)} seconds'
+        ))
+
+    def add_condition_throughput_is_not_less_than(self: MI, value: float = 1000) -> MI:
+        """Add condition - checking that the throughput (rows per second) is not less than X.
+
+        The condition is checked for every benchmarked combination of batch size, prediction method and threads.
+
+        Parameters
+        ----------
+        value : float , default: 1000
+            condition threshold.
+        Returns
+        -------
+        MI
+        """
+        def condition(result: pd.DataFrame) -> ConditionResult:
+            _assert_benchmark_result(result)
+            failed = result[result['Throughput'] < value]
+            if len(failed):
+                failed = failed[['Method', 'Batch Size', 'Threads', 'Throughput']]
+                details = f'Found {len(failed)} out of {len(result)} benchmarks with throughput (rows per second) ' \
+                          f'below threshold: {failed.to_dict("records")}'
+                return ConditionResult(ConditionCategory.FAIL, details)
+            details = f'Found minimal throughput (rows per second): {format_number(result["Throughput"].min())}'
+            return ConditionResult(ConditionCategory.PASS, details)
+
+        return self.add_condition(condition_func=condition, name=(
+            f'Inference throughput is not less than {format_number(value)} rows per second'
+        ))
+
+
+def _time_calls(predict: t.Callable, batch: pd.DataFrame, n_threads: int, n_repeats: int) -> t.Tuple[np.ndarray, float]:
+    """Time n_repeats calls of the prediction function in every one of n_threads concurrent threads.
+
+    Returns
+    -------
+    t.Tuple[np.ndarray, float]
+        the latency of every call, and the total time of all the calls.
+    """
+    def time_thread_calls():
+        latencies = []
+        for _ in range(n_repeats):
+            start = time.perf_counter()
+            predict(batch)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    if n_threads == 1:
+        start = time.perf_counter()
+        latencies = time_thread_calls()
+        return np.array(latencies), time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        start = time.perf_counter()
+        futures = [executor.submit(time_thread_calls) for _ in range(n_threads)]
+        latencies = [latency for future in futures for latency in future.result()]
+        total_time = time.perf_counter() - start
+    return np.array(latencies), total_time
+
+
+def _assert_benchmark_result(result):
+    if not isinstance(result, pd.DataFrame):
+        raise DeepchecksValueError('Condition is relevant only when the check runs in benchmark mode')
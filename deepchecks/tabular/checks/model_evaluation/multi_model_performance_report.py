@@ -12,11 +12,10 @@
 from typing import Callable, Dict, cast
 
 import pandas as pd
-import plotly.express as px
 
-from deepchecks.core import CheckResult
+from deepchecks.core import CheckResult, DatasetKind
 from deepchecks.tabular import ModelComparisonCheck, ModelComparisonContext
-from deepchecks.utils.metrics import ModelType
+from deepchecks.utils.metrics import ModelType, run_scorers
 
 __all__ = ['MultiModelPerformanceReport']
 
@@ -49,25 +48,30 @@ class MultiModelPerformanceReport(ModelComparisonCheck):
                 model = context.model
                 label = cast(pd.Series, test.label_col)
                 n_samples = label.groupby(label).count()
+                scores = run_scorers(scorers, model, test, **context.get_scorer_predictions(DatasetKind.TEST))
                 results.extend(
                     [context.model_name, class_score, scorer.name, class_name, n_samples[class_name]]
-                    for scorer in scorers
+                    for scorer, scorer_scores in zip(scorers, scores)
                     # scorer returns numpy array of results with item per class
-                    for class_score, class_name in zip(scorer(model, test), test.classes)
+                    for class_score, class_name in zip(scorer_scores, test.classes)
                 )
 
             results_df = pd.DataFrame(results, columns=['Model', 'Value', 'Metric', 'Class', 'Number of samples'])
 
         else:
             plot_x_axis = 'Model'
-            results = [
-                [context.model_name, scorer(context.model, context.test), scorer.name,
-                 cast(pd.Series, context.test.label_col).count()]
-                for context in multi_context
-                for scorer in scorers
-            ]
+            results = []
+            for context in multi_context:
+                scores = run_scorers(scorers, context.model, context.test,
+                                     **context.get_scorer_predictions(DatasetKind.TEST))
+                results.extend(
+                    [context.model_name, score, scorer.name, cast(pd.Series, context.test.label_col).count()]
+                    for scorer, score in zip(scorers, scores)
+                )
             results_df = pd.DataFrame(results, columns=['Model', 'Value', 'Metric', 'Number of samples'])
 
+        import plotly.express as px  # pylint: disable=import-outside-toplevel
+
         fig = px.histogram(
             results_df,
             x=plot_x_axis,
@@ -12,14 +12,13 @@
 from typing import Callable, Dict, TypeVar, cast
 
 import pandas as pd
-import plotly.express as px
 
 from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.core.checks import DatasetKind, ReduceMixin
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, TrainTestCheck
-from deepchecks.utils.metrics import MULTICLASS_SCORERS_NON_AVERAGE, ModelType
+from deepchecks.utils.metrics import MULTICLASS_SCORERS_NON_AVERAGE, ModelType, run_scorers
 from deepchecks.utils.strings import format_number, format_percent
 
 __all__ = ['PerformanceReport']
@@ -91,21 +90,27 @@ class PerformanceReport(TrainTestCheck, ReduceMixin):
         task_type = context.task_type
 
         scorers = context.get_scorers(self.user_scorers, class_avg=False)
-        datasets = {'Train': train_dataset, 'Test': test_dataset}
+        datasets = {'Train': (train_dataset, DatasetKind.TRAIN), 'Test': (test_dataset, DatasetKind.TEST)}
+
+        # All scorers of a dataset are calculated together over the context cached predictions
+        scores = {
+            dataset_name: run_scorers(scorers, model, dataset, **context.get_scorer_predictions(dataset_kind))
+            for dataset_name, (dataset, dataset_kind) in datasets.items()
+        }
 
         if task_type in {ModelType.MULTICLASS, ModelType.BINARY}:
             plot_x_axis = 'Class'
             results = []
 
-            for dataset_name, dataset in datasets.items():
+            for dataset_name, (dataset, _) in datasets.items():
                 classes = dataset.classes
                 label = cast(pd.Series, dataset.label_col)
                 n_samples = label.groupby(label).count()
                 results.extend(
                     [dataset_name, class_name, scorer.name, class_score, n_samples[class_name]]
-                    for scorer in scorers
+                    for scorer, scorer_scores in zip(scorers, scores[dataset_name])
                     # scorer returns numpy array of results with item per class
-                    for class_score, class_name in zip(scorer(model, dataset), classes)
+                    for class_score, class_name in zip(scorer_scores, classes)
                 )
 
             results_df = pd.DataFrame(results, columns=['Dataset', 'Class', 'Metric', 'Value', 'Number of samples'])
@@ -113,12 +118,17 @@ class PerformanceReport(TrainTestCheck, ReduceMixin):
         else:
             plot_x_axis = 'Dataset'
             results = [
-                [dataset_name, scorer.name, scorer(model, dataset), cast(pd.Series, dataset.label_col).count()]
-                for dataset_name, dataset in datasets.items()
-                for scorer in scorers
+                [dataset_name, scorer.name, score, cast(pd.Series, dataset.label_col).count()]
+                for dataset_name, (dataset, _) in datasets.items()
+                for scorer, score in zip(scorers, scores[dataset_name])
             ]
             results_df = pd.DataFrame(results, columns=['Dataset', 'Metric', 'Value', 'Number of samples'])
 
+        if not context.with_display:
+            return CheckResult(results_df, header='Performance Report')
+
+        import plotly.express as px  # pylint: disable=import-outside-toplevel
+
         fig = px.histogram(
             results_df,
             x=plot_x_axis,
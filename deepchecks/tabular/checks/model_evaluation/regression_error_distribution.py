@@ -10,10 +10,9 @@
 #
 """The regression_error_distribution check module."""
 import pandas as pd
-import plotly.express as px
 from scipy.stats import kurtosis
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.utils.strings import format_number
 
@@ -57,19 +56,21 @@ class RegressionErrorDistribution(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            dataset_kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            dataset_kind = DatasetKind.TEST
 
         context.assert_regression_task()
-        model = context.model
-        x_test = dataset.features_columns
         y_test = dataset.label_col
 
-        y_pred = model.predict(x_test)
+        y_pred = context.get_predictions(dataset_kind)
         y_pred = pd.Series(y_pred, name='predicted ' + str(dataset.label_name), index=y_test.index)
 
         diff = y_test - y_pred
         kurtosis_value = kurtosis(diff)
+        if not context.with_display:
+            return CheckResult(value=kurtosis_value)
 
         n_largest_diff = diff.nlargest(self.n_top_samples)
         n_largest_diff.name = str(dataset.label_name) + ' Prediction Difference'
@@ -81,6 +82,8 @@ class RegressionErrorDistribution(SingleDatasetCheck):
         n_smallest = pd.concat([dataset.data.loc[n_smallest_diff.index], y_pred.loc[n_smallest_diff.index],
                                 n_smallest_diff], axis=1)
 
+        import plotly.express as px  # pylint: disable=import-outside-toplevel
+
         display = [
             px.histogram(
                 x=diff.values,
@@ -9,10 +9,9 @@
 # ----------------------------------------------------------------------------
 #
 """The RegressionSystematicError check module."""
-import plotly.graph_objects as go
 from sklearn.metrics import mean_squared_error
 
-from deepchecks.core import CheckResult, ConditionResult
+from deepchecks.core import CheckResult, ConditionResult, DatasetKind
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.utils.strings import format_number
@@ -39,18 +38,25 @@ class RegressionSystematicError(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            dataset_kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            dataset_kind = DatasetKind.TEST
 
         context.assert_regression_task()
         y_test = dataset.label_col
-        x_test = dataset.features_columns
-        y_pred = context.model.predict(x_test)
+        y_pred = context.get_predictions(dataset_kind)
 
         rmse = mean_squared_error(y_test, y_pred, squared=False)
         diff = y_test - y_pred
         diff_mean = diff.mean()
 
+        value = {'rmse': rmse, 'mean_error': diff_mean}
+        if not context.with_display:
+            return CheckResult(value)
+
+        import plotly.graph_objects as go  # pylint: disable=import-outside-toplevel
+
         fig = (
             go.Figure()
             .add_trace(go.Box(
@@ -71,7 +77,7 @@ class RegressionSystematicError(SingleDatasetCheck):
             fig
         ]
 
-        return CheckResult(value={'rmse': rmse, 'mean_error': diff_mean}, display=display)
+        return CheckResult(value, display=display)
 
     def add_condition_systematic_error_ratio_to_rmse_not_greater_than(self, max_ratio: float = 0.01):
         """Add condition - require the absolute mean systematic error to be not greater than (max_ratio * RMSE).
@@ -9,13 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """The roc_report check module."""
+# pylint: disable=import-outside-toplevel
 from typing import Dict, List
 
 import numpy as np
-import plotly.graph_objects as go
 import sklearn
 
-from deepchecks.core import CheckResult, ConditionResult
+from deepchecks.core import CheckResult, ConditionResult, DatasetKind
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.utils.strings import format_number
@@ -53,13 +53,14 @@ class RocReport(SingleDatasetCheck):
         """
         if dataset_type == 'train':
             dataset = context.train
+            dataset_kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            dataset_kind = DatasetKind.TEST
 
         context.assert_classification_task()
         ds_y = dataset.label_col
-        ds_x = dataset.features_columns
-        y_pred_prob = context.model.predict_proba(ds_x)
+        y_pred_prob = context.get_probabilities(dataset_kind)
 
         dataset_classes = dataset.classes
         multi_y = (np.array(ds_y)[:, None] == np.unique(ds_y)).astype(int)
@@ -75,6 +76,11 @@ class RocReport(SingleDatasetCheck):
                 sklearn.metrics.roc_curve(multi_y[:, i], y_pred_prob[:, i])
             roc_auc[class_name] = sklearn.metrics.auc(fpr[class_name], tpr[class_name])
 
+        if not context.with_display:
+            return CheckResult(roc_auc, header='ROC Report')
+
+        import plotly.graph_objects as go
+
         fig = go.Figure()
         for class_name in dataset_classes:
             if class_name in self.excluded_classes:
@@ -152,6 +158,8 @@ class RocReport(SingleDatasetCheck):
 
 
 def get_cutoff_figure(tpr, fpr, thresholds, class_name=None):
+    import plotly.graph_objects as go
+
     index = sensitivity_specificity_cutoff(tpr, fpr)
     hovertemplate = 'TPR: %{y:.2%}<br>FPR: %{x:.2%}' + f'<br>Youden\'s Index: {thresholds[index]:.3}'
     if class_name:
@@ -12,12 +12,12 @@
 from typing import Callable, List, Optional, Tuple, Union, cast
 
 import numpy as np
-import plotly.express as px
 
-from deepchecks.core import CheckResult
+from deepchecks.core import CheckResult, DatasetKind
 from deepchecks.core.errors import DatasetValidationError, DeepchecksValueError
 from deepchecks.tabular import Context, SingleDatasetCheck
-from deepchecks.utils.performance.partition import partition_column
+from deepchecks.utils.metrics import run_scorer_by_groups
+from deepchecks.utils.performance.partition import partition_column_codes
 from deepchecks.utils.strings import format_number
 from deepchecks.utils.typing import Hashable
 
@@ -72,8 +72,10 @@ class SegmentPerformance(SingleDatasetCheck):
         """Run check."""
         if dataset_type == 'train':
             dataset = context.train
+            dataset_kind = DatasetKind.TRAIN
         else:
             dataset = context.test
+            dataset_kind = DatasetKind.TEST
 
         model = context.model
         scorer = context.get_single_scorer(self.user_scorer)
@@ -106,45 +108,45 @@ class SegmentPerformance(SingleDatasetCheck):
         if self.feature_2 not in (dataset.numerical_features + dataset.cat_features):
             raise DeepchecksValueError('"feature_2" must be numerical or categorical, but it neither.')
 
-        feature_1_filters = partition_column(dataset, self.feature_1, max_segments=self.max_segments)
-        feature_2_filters = partition_column(dataset, self.feature_2, max_segments=self.max_segments)
+        feature_1_codes, feature_1_labels = partition_column_codes(dataset, self.feature_1,
+                                                                   max_segments=self.max_segments)
+        feature_2_codes, feature_2_labels = partition_column_codes(dataset, self.feature_2,
+                                                                   max_segments=self.max_segments)
+        shape = (len(feature_1_labels), len(feature_2_labels))
 
-        scores = np.empty((len(feature_1_filters), len(feature_2_filters)), dtype=float)
-        counts = np.empty((len(feature_1_filters), len(feature_2_filters)), dtype=int)
+        # Each sample is assigned to its cell in the (flattened) grid, and all the cells are scored from the same
+        # predictions
+        in_grid = (feature_1_codes >= 0) & (feature_2_codes >= 0)
+        cell_codes = np.where(in_grid, feature_1_codes * shape[1] + feature_2_codes, -1)
+        counts = np.bincount(cell_codes[in_grid], minlength=shape[0] * shape[1]).reshape(shape)
+        scores = run_scorer_by_groups(scorer, model, dataset, cell_codes, shape[0] * shape[1],
+                                      **context.get_scorer_predictions(dataset_kind)).reshape(shape)
 
-        for i, feature_1_filter in enumerate(feature_1_filters):
-            data = dataset.data
-            feature_1_df = feature_1_filter.filter(data)
-            for j, feature_2_filter in enumerate(feature_2_filters):
-                feature_2_df = feature_2_filter.filter(feature_1_df)
+        # Plotly FigureWidget have bug with numpy nan, so replacing with python None
+        scores = scores.astype(object)
+        scores[np.isnan(scores.astype(np.float_))] = None
 
-                # Run on filtered data and save to matrix
-                if feature_2_df.empty:
-                    score = np.NaN
-                else:
-                    score = scorer(model, dataset.copy(feature_2_df))
-                scores[i, j] = score
-                counts[i, j] = len(feature_2_df)
+        value = {'scores': scores, 'counts': counts, 'feature_1': self.feature_1, 'feature_2': self.feature_2}
+        if not context.with_display:
+            return CheckResult(value)
+
+        import plotly.express as px  # pylint: disable=import-outside-toplevel
 
-        x = [v.label for v in feature_2_filters]
-        y = [v.label for v in feature_1_filters]
+        x = feature_2_labels
+        y = feature_1_labels
 
         scores_text = [[0]*scores.shape[1] for _ in range(scores.shape[0])]
 
         for i in range(len(y)):
             for j in range(len(x)):
                 score = scores[i, j]
-                if not np.isnan(score):
+                if score is not None:
                     scores_text[i][j] = f'{format_number(score)}\n({counts[i, j]})'
                 elif counts[i, j] == 0:
                     scores_text[i][j] = ''
                 else:
                     scores_text[i][j] = f'{score}\n({counts[i, j]})'
 
-        # Plotly FigureWidget have bug with numpy nan, so replacing with python None
-        scores = scores.astype(np.object)
-        scores[np.isnan(scores.astype(np.float_))] = None
-
         fig = px.imshow(scores, x=x, y=y, color_continuous_scale='rdylgn')
         fig.update_traces(text=scores_text, texttemplate='%{text}')
         fig.update_layout(
@@ -154,5 +156,4 @@ class SegmentPerformance(SingleDatasetCheck):
         fig.update_xaxes(title=self.feature_2, showgrid=False, tickangle=-30, side='bottom')
         fig.update_yaxes(title=self.feature_1, autorange='reversed', showgrid=False)
 
-        value = {'scores': scores, 'counts': counts, 'feature_1': self.feature_1, 'feature_2': self.feature_2}
         return CheckResult(value, display=fig)
@@ -14,17 +14,16 @@ from typing import Callable, Dict, Hashable, List
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 from sklearn.dummy import DummyClassifier, DummyRegressor
 from sklearn.pipeline import Pipeline
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 
-from deepchecks.core import CheckResult, ConditionResult
+from deepchecks.core import CheckResult, ConditionResult, DatasetKind
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, Dataset, TrainTestCheck
 from deepchecks.utils.distribution.preprocessing import ScaledNumerics
-from deepchecks.utils.metrics import ModelType, get_gain
+from deepchecks.utils.metrics import ModelType, get_gain, run_scorers
 from deepchecks.utils.simple_models import RandomModel
 from deepchecks.utils.strings import format_percent
 
@@ -132,9 +131,14 @@ class SimpleModelComparison(TrainTestCheck):
         simple_model = self._create_simple_model(train_dataset, task_type)
 
         models = [
-            (f'{type(model).__name__} model', 'Origin', model),
-            (f'Simple model - {self.simple_model_type}', 'Simple', simple_model)
+            (f'{type(model).__name__} model', 'Origin'),
+            (f'Simple model - {self.simple_model_type}', 'Simple')
         ]
+        # Calculate all scorers of each model together, the origin model predictions are cached on the context
+        models_scores = {
+            'Origin': run_scorers(scorers, model, test_dataset, **context.get_scorer_predictions(DatasetKind.TEST)),
+            'Simple': run_scorers(scorers, simple_model, test_dataset)
+        }
 
         # Multiclass have different return type from the scorer, list of score per class instead of single score
         if task_type in [ModelType.MULTICLASS, ModelType.BINARY]:
@@ -144,10 +148,10 @@ class SimpleModelComparison(TrainTestCheck):
             results_array = []
             # Dict in format { Scorer : Dict { Class : Dict { Origin/Simple : score } } }
             results_dict = {}
-            for scorer in scorers:
+            for scorer_index, scorer in enumerate(scorers):
                 model_dict = defaultdict(dict)
-                for model_name, model_type, model_instance in models:
-                    for class_score, class_value in zip(scorer(model_instance, test_dataset), classes):
+                for model_name, model_type in models:
+                    for class_score, class_value in zip(models_scores[model_type][scorer_index], classes):
                         model_dict[class_value][model_type] = class_score
                         results_array.append([model_name,
                                               model_type,
@@ -163,33 +167,16 @@ class SimpleModelComparison(TrainTestCheck):
                 columns=['Model', 'Type', 'Value', 'Metric', 'Class', 'Number of samples']
             )
 
-            # Plot the metrics in a graph, grouping by the model and class
-            fig = (
-                px.histogram(
-                    results_df,
-                    x=['Class', 'Model'],
-                    y='Value',
-                    color='Model',
-                    barmode='group',
-                    facet_col='Metric',
-                    facet_col_spacing=0.05,
-                    hover_data=['Number of samples'])
-                .update_xaxes(title=None, tickprefix='Class ', tickangle=60, type='category')
-                .update_yaxes(title=None, matches=None)
-                .for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
-                .for_each_yaxis(lambda yaxis: yaxis.update(showticklabels=True))
-            )
-
         else:
             classes = None
 
             results_array = []
             # Dict in format { Scorer : Dict { Origin/Simple : score } }
             results_dict = {}
-            for scorer in scorers:
+            for scorer_index, scorer in enumerate(scorers):
                 model_dict = defaultdict(dict)
-                for model_name, model_type, model_instance in models:
-                    score = scorer(model_instance, test_dataset)
+                for model_name, model_type in models:
+                    score = models_scores[model_type][scorer_index]
                     model_dict[model_type] = score
                     results_array.append([model_name,
                                           model_type,
@@ -204,6 +191,36 @@ class SimpleModelComparison(TrainTestCheck):
                 columns=['Model', 'Type', 'Value', 'Metric', 'Number of samples']
             )
 
+        # For each scorer calculate perfect score in order to calculate later the ratio in conditions
+        scorers_perfect = {scorer.name: scorer.score_perfect(test_dataset) for scorer in scorers}
+
+        value = {'scores': results_dict,
+                 'type': task_type,
+                 'scorers_perfect': scorers_perfect,
+                 'classes': classes}
+        if not context.with_display:
+            return CheckResult(value)
+
+        import plotly.express as px  # pylint: disable=import-outside-toplevel
+
+        if task_type in [ModelType.MULTICLASS, ModelType.BINARY]:
+            # Plot the metrics in a graph, grouping by the model and class
+            fig = (
+                px.histogram(
+                    results_df,
+                    x=['Class', 'Model'],
+                    y='Value',
+                    color='Model',
+                    barmode='group',
+                    facet_col='Metric',
+                    facet_col_spacing=0.05,
+                    hover_data=['Number of samples'])
+                .update_xaxes(title=None, tickprefix='Class ', tickangle=60, type='category')
+                .update_yaxes(title=None, matches=None)
+                .for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+                .for_each_yaxis(lambda yaxis: yaxis.update(showticklabels=True))
+            )
+        else:
             # Plot the metrics in a graph, grouping by the model
             fig = (
                 px.histogram(
@@ -221,14 +238,7 @@ class SimpleModelComparison(TrainTestCheck):
                 .for_each_yaxis(lambda yaxis: yaxis.update(showticklabels=True))
             )
 
-        # For each scorer calculate perfect score in order to calculate later the ratio in conditions
-        scorers_perfect = {scorer.name: scorer.score_perfect(test_dataset) for scorer in scorers}
-
-        return CheckResult({'scores': results_dict,
-                            'type': task_type,
-                            'scorers_perfect': scorers_perfect,
-                            'classes': classes
-                            }, display=fig)
+        return CheckResult(value, display=fig)
 
     def _create_simple_model(self, train_ds: Dataset, task_type: ModelType):
         """Create a simple model of given type (random/constant/tree) to the given dataset.
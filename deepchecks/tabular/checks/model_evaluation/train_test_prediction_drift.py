@@ -17,7 +17,7 @@ import numpy as np
 import pandas as pd
 
 from deepchecks import ConditionCategory
-from deepchecks.core import CheckResult, ConditionResult
+from deepchecks.core import CheckResult, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.utils.distribution.drift import (SUPPORTED_CATEGORICAL_METHODS, SUPPORTED_NUMERIC_METHODS,
                                                  calc_drift_and_plot)
@@ -102,11 +102,9 @@ class TrainTestPredictionDrift(TrainTestCheck):
             display: label distribution graph, comparing the train and test distributions.
         """
         train_dataset = context.train
-        test_dataset = context.test
-        model = context.model
 
-        train_prediction = np.array(model.predict(train_dataset.features_columns))
-        test_prediction = np.array(model.predict(test_dataset.features_columns))
+        train_prediction = np.array(context.get_predictions(DatasetKind.TRAIN))
+        test_prediction = np.array(context.get_predictions(DatasetKind.TEST))
 
         drift_score, method, display = calc_drift_and_plot(
             train_column=pd.Series(train_prediction.flatten()),
@@ -118,14 +116,17 @@ class TrainTestPredictionDrift(TrainTestCheck):
             max_num_categories_for_display=self.max_num_categories_for_display,
             show_categories_by=self.show_categories_by,
             categorical_drift_method=self.categorical_drift_method,
+            with_display=context.with_display,
         )
 
-        headnote = """<span>
-            The Drift score is a measure for the difference between two distributions, in this check - the test
-            and train distributions.<br> The check shows the drift score and distributions for the predictions.
-        </span>"""
-
-        displays = [headnote, display]
+        if context.with_display:
+            headnote = """<span>
+                The Drift score is a measure for the difference between two distributions, in this check - the test
+                and train distributions.<br> The check shows the drift score and distributions for the predictions.
+            </span>"""
+            displays = [headnote, display]
+        else:
+            displays = []
         values_dict = {'Drift score': drift_score, 'Method': method}
 
         return CheckResult(value=values_dict, display=displays, header='Train Test Prediction Drift')
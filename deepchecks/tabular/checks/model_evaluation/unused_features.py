@@ -13,7 +13,6 @@ from typing import Tuple
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 from sklearn.base import TransformerMixin
 from sklearn.compose import ColumnTransformer
 from sklearn.decomposition import PCA
@@ -111,7 +110,7 @@ class UnusedFeatures(TrainTestCheck):
         ) - 1
 
         unviable_feature_df = feature_df.iloc[(last_important_feature_index + 1):]
-        # Only display if there are features considered unimportant
+        last_variable_feature_index = 0
         if not unviable_feature_df.empty:
             unviable_feature_df.sort_values(by='Feature Variance', ascending=False, inplace=True)
             unviable_feature_ratio_to_avg_df = unviable_feature_df / (1 / len(feature_df))
@@ -119,6 +118,10 @@ class UnusedFeatures(TrainTestCheck):
                 unviable_feature_ratio_to_avg_df['Feature Variance'] > self.feature_variance_threshold
             )
 
+        # Only display if there are features considered unimportant
+        if context.with_display and not unviable_feature_df.empty:
+            import plotly.graph_objects as go  # pylint: disable=import-outside-toplevel
+
             # limit display to n_top_to_show params
             display_feature_df = pd.concat(
                 [feature_df.iloc[:(last_important_feature_index + 1)].head(self.n_top_fi_to_show),
@@ -10,20 +10,25 @@
 #
 """Module contains checks of train test validation checks."""
 
-from .category_mismatch_train_test import CategoryMismatchTrainTest
-from .datasets_size_comparison import DatasetsSizeComparison
-from .date_train_test_leakage_duplicates import DateTrainTestLeakageDuplicates
-from .date_train_test_leakage_overlap import DateTrainTestLeakageOverlap
-from .dominant_frequency_change import DominantFrequencyChange
-from .feature_label_correlation_change import FeatureLabelCorrelationChange
-from .identifier_leakage import IdentifierLeakage
-from .index_leakage import IndexTrainTestLeakage
-from .new_label_train_test import NewLabelTrainTest
-from .string_mismatch_comparison import StringMismatchComparison
-from .train_test_feature_drift import TrainTestFeatureDrift
-from .train_test_label_drift import TrainTestLabelDrift
-from .train_test_samples_mix import TrainTestSamplesMix
-from .whole_dataset_drift import WholeDatasetDrift
+from typing import TYPE_CHECKING
+
+from deepchecks.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .category_mismatch_train_test import CategoryMismatchTrainTest
+    from .datasets_size_comparison import DatasetsSizeComparison
+    from .date_train_test_leakage_duplicates import DateTrainTestLeakageDuplicates
+    from .date_train_test_leakage_overlap import DateTrainTestLeakageOverlap
+    from .dominant_frequency_change import DominantFrequencyChange
+    from .feature_label_correlation_change import FeatureLabelCorrelationChange
+    from .identifier_leakage import IdentifierLeakage
+    from .index_leakage import IndexTrainTestLeakage
+    from .new_label_train_test import NewLabelTrainTest
+    from .string_mismatch_comparison import StringMismatchComparison
+    from .train_test_feature_drift import TrainTestFeatureDrift
+    from .train_test_label_drift import TrainTestLabelDrift
+    from .train_test_samples_mix import TrainTestSamplesMix
+    from .whole_dataset_drift import WholeDatasetDrift
 
 __all__ = [
     'CategoryMismatchTrainTest',
@@ -41,3 +46,22 @@ __all__ = [
     'TrainTestSamplesMix',
     'WholeDatasetDrift',
 ]
+
+# Checks are imported on first access, so that importing the package doesn't import all the checks and their
+# dependencies
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'CategoryMismatchTrainTest': '.category_mismatch_train_test',
+    'DatasetsSizeComparison': '.datasets_size_comparison',
+    'DateTrainTestLeakageDuplicates': '.date_train_test_leakage_duplicates',
+    'DateTrainTestLeakageOverlap': '.date_train_test_leakage_overlap',
+    'DominantFrequencyChange': '.dominant_frequency_change',
+    'FeatureLabelCorrelationChange': '.feature_label_correlation_change',
+    'IdentifierLeakage': '.identifier_leakage',
+    'IndexTrainTestLeakage': '.index_leakage',
+    'NewLabelTrainTest': '.new_label_train_test',
+    'StringMismatchComparison': '.string_mismatch_comparison',
+    'TrainTestFeatureDrift': '.train_test_feature_drift',
+    'TrainTestLabelDrift': '.train_test_label_drift',
+    'TrainTestSamplesMix': '.train_test_samples_mix',
+    'WholeDatasetDrift': '.whole_dataset_drift',
+})
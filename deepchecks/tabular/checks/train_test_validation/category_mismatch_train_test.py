@@ -13,10 +13,10 @@ from typing import Dict, List, Union
 
 import pandas as pd
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
+from deepchecks.utils.dataframes import merge_value_counts, select_from_dataframe
 from deepchecks.utils.strings import format_percent
 from deepchecks.utils.typing import Hashable
 
@@ -61,34 +61,42 @@ class CategoryMismatchTrainTest(TrainTestCheck):
             value is a dictionary that lists new categories for each cat feature with its count
             displays a dataframe that shows columns with new categories
         """
-        test_dataset = context.test
         train_dataset = context.train
         cat_features = train_dataset.cat_features
 
-        test_df = select_from_dataframe(test_dataset.data, self.columns, self.ignore_columns)
-        train_df = select_from_dataframe(train_dataset.data, self.columns, self.ignore_columns)
-
         # After filtering the columns drop cat features that don't exist anymore
-        cat_features = set(cat_features).intersection(set(train_df.columns))
+        columns = select_from_dataframe(train_dataset.data.head(0), self.columns, self.ignore_columns).columns
+        cat_features = set(cat_features).intersection(set(columns))
+
+        unique_training_values = {feature: set() for feature in cat_features}
+        train_has_nulls = {feature: False for feature in cat_features}
+        for chunk in context.iter_chunks(DatasetKind.TRAIN):
+            for feature in cat_features:
+                train_column = chunk.data[feature]
+                unique_training_values[feature].update(train_column.unique())
+                train_has_nulls[feature] = train_has_nulls[feature] or train_column.isna().any()
+
+        # Values of the test data which aren't in the train data are counted in each chunk
+        chunks_new_category_counts = {feature: [] for feature in cat_features}
+        n_test_samples = 0
+        for chunk in context.iter_chunks(DatasetKind.TEST):
+            n_test_samples += chunk.n_samples
+            for feature in cat_features:
+                test_column = chunk.data[feature]
+                # np.nan != np.nan, so we remove these values if they exist in training
+                if train_has_nulls[feature]:
+                    test_column = test_column.dropna()
+                new_values = set(test_column.unique()) - unique_training_values[feature]
+                chunks_new_category_counts[feature].append(test_column[test_column.isin(new_values)].value_counts())
 
         new_categories = {}
         display_data = []
-        n_test_samples = test_dataset.n_samples
 
         for feature in cat_features:
-            train_column = train_df[feature]
-            test_column = test_df[feature]
-
-            # np.nan != np.nan, so we remove these values if they exist in training
-            if train_column.isna().any():
-                test_column = test_column.dropna()
-
-            unique_training_values = train_column.unique()
-            unique_test_values = test_column.unique()
-
-            new_category_values = sorted(list((set(unique_test_values) - set(unique_training_values))))
+            new_category_counts = merge_value_counts(chunks_new_category_counts[feature])
+            new_category_values = sorted(new_category_counts.index)
             if new_category_values:
-                new_category_counts = dict(test_column.value_counts()[new_category_values])
+                new_category_counts = dict(new_category_counts[new_category_values])
                 new_categories_ratio = sum(new_category_counts.values()) / n_test_samples
                 sorted_new_categories = dict(sorted(new_category_counts.items(), key=lambda x: x[1], reverse=True))
                 new_categories[feature] = sorted_new_categories
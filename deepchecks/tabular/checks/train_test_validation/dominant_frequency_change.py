@@ -9,22 +9,36 @@
 # ----------------------------------------------------------------------------
 #
 """module contains Dominant Frequency Change check."""
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from scipy.stats import chi2_contingency, fisher_exact
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
+from deepchecks.utils.dataframes import merge_value_counts
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
 from deepchecks.utils.strings import format_number, format_percent
+from deepchecks.utils.typing import Hashable
 
 __all__ = ['DominantFrequencyChange']
 
 
+def _value_counts(context: Context, kind: DatasetKind,
+                  columns: List[Hashable]) -> Tuple[Dict[Hashable, pd.Series], int]:
+    """Count the values of the columns over all the chunks of the dataset, and the number of samples."""
+    chunks_value_counts = {column: [] for column in columns}
+    n_samples = 0
+    for chunk in context.iter_chunks(kind):
+        n_samples += chunk.n_samples
+        for column in columns:
+            chunks_value_counts[column].append(chunk.data[column].value_counts(dropna=False))
+    return {column: merge_value_counts(counts) for column, counts in chunks_value_counts.items()}, n_samples
+
+
 class DominantFrequencyChange(TrainTestCheck):
     """Check if dominant values have increased significantly between test and reference data.
 
@@ -68,16 +82,19 @@ class DominantFrequencyChange(TrainTestCheck):
         train_dataset = context.train
         features_importance = context.features_importance
 
-        test_df = test_dataset.data
-        baseline_df = train_dataset.data
+        train_profile = context.train_profile
 
-        baseline_len = len(baseline_df)
-        test_len = len(test_df)
+        # The value counts of the whole train dataset are kept by its reference profile
+        if train_profile is None:
+            baseline_counts, baseline_len = _value_counts(context, DatasetKind.TRAIN, train_dataset.features)
+        else:
+            baseline_counts, baseline_len = train_profile.value_counts, train_profile.n_samples
+        test_counts, test_len = _value_counts(context, DatasetKind.TEST, train_dataset.features)
         p_dict = {}
 
         for column in train_dataset.features:
-            top_ref = baseline_df[column].value_counts(dropna=False)
-            top_test = test_df[column].value_counts(dropna=False)
+            top_ref = baseline_counts[column]
+            top_test = test_counts[column]
             p_dict[column] = None
 
             if len(top_ref) == 1 or top_ref.iloc[0] > top_ref.iloc[1] * self.dominance_ratio:
@@ -57,18 +57,22 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
         Random state for the ppscore.predictors function
     min_pps_to_show: float, default 0.05
         Minimum PPS to show a class in the graph
+    n_jobs : int , default: 1
+        Number of threads to calculate the PPS of the features with, -1 means using all the processors
     """
 
     def __init__(self, ppscore_params=None,
                  n_top_features: int = 5,
                  random_state: int = None,
                  min_pps_to_show: float = 0.05,
+                 n_jobs: int = 1,
                  **kwargs):
         super().__init__(**kwargs)
         self.ppscore_params = ppscore_params or {}
         self.n_top_features = n_top_features
         self.random_state = random_state
         self.min_pps_to_show = min_pps_to_show
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context) -> CheckResult:
         """Run check.
@@ -115,7 +119,9 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
                                                            test_dataset.label_name, self.ppscore_params,
                                                            self.n_top_features,
                                                            min_pps_to_show=self.min_pps_to_show,
-                                                           random_state=self.random_state)
+                                                           random_state=self.random_state,
+                                                           n_jobs=self.n_jobs,
+                                                           with_display=context.with_display)
 
         if display:
             display += text
@@ -12,7 +12,6 @@
 from typing import Dict
 
 import pandas as pd
-import plotly.express as px
 
 import deepchecks.ppscore as pps
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
@@ -32,11 +31,14 @@ class IdentifierLeakage(SingleDatasetCheck):
     ----------
     ppscore_params : any , default: None
         dictionary containing params to pass to ppscore predictor
+    n_jobs : int , default: 1
+        Number of threads to calculate the PPS of the identifiers with, -1 means using all the processors
     """
 
-    def __init__(self, ppscore_params=None, **kwargs):
+    def __init__(self, ppscore_params=None, n_jobs: int = 1, **kwargs):
         super().__init__(**kwargs)
         self.ppscore_params = ppscore_params or {}
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_type: str = 'train') -> CheckResult:
         """Run check.
@@ -76,11 +78,16 @@ class IdentifierLeakage(SingleDatasetCheck):
             df=relevant_data,
             y=label_name,
             random_seed=42,
-            **self.ppscore_params
+            **{'n_jobs': self.n_jobs, **self.ppscore_params}
         )
 
         df_pps = df_pps.set_index('x', drop=True)
         s_ppscore = df_pps['ppscore']
+        # display only if not all scores are 0
+        if not context.with_display or not s_ppscore.sum():
+            return CheckResult(value=s_ppscore.to_dict())
+
+        import plotly.express as px  # pylint: disable=import-outside-toplevel
 
         xaxis_layout = dict(
             title='Identifiers',
@@ -128,10 +135,7 @@ class IdentifierLeakage(SingleDatasetCheck):
                 'For Identifier columns (Index/Date) PPS should be nearly 0, otherwise date and index have some '
                 'predictive effect on the label.']
 
-        # display only if not all scores are 0
-        display = [figure, *text] if s_ppscore.sum() else None
-
-        return CheckResult(value=s_ppscore.to_dict(), display=display)
+        return CheckResult(value=s_ppscore.to_dict(), display=[figure, *text])
 
     def add_condition_pps_not_greater_than(self, max_pps: float = 0):
         """Add condition - require columns not to have a greater pps than given max.
@@ -13,7 +13,7 @@ from typing import Dict
 
 import pandas as pd
 
-from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.utils.strings import format_percent
 
@@ -44,19 +44,23 @@ class NewLabelTrainTest(TrainTestCheck):
         train_dataset = context.train
         context.assert_classification_task()
         train_dataset.assert_label()
-
-        n_test_samples = test_dataset.n_samples
-
-        train_label = train_dataset.label_col
-        test_label = test_dataset.label_col
-
-        unique_training_values = set(train_label.unique())
-        unique_test_values = set(test_label.unique())
-
-        new_labels = unique_test_values.difference(unique_training_values)
+        test_dataset.assert_label()
+
+        unique_training_values = set()
+        for chunk in context.iter_chunks(DatasetKind.TRAIN):
+            unique_training_values.update(chunk.label_col.unique())
+
+        # Test labels which aren't in the train labels are collected from each chunk of the test data
+        n_test_samples = 0
+        n_new_label = 0
+        new_labels = set()
+        for chunk in context.iter_chunks(DatasetKind.TEST):
+            test_label = chunk.label_col
+            n_test_samples += len(test_label)
+            new_labels.update(set(test_label.unique()).difference(unique_training_values))
+            n_new_label += int(test_label.isin(new_labels).sum())
 
         if new_labels:
-            n_new_label = len(test_label[test_label.isin(new_labels)])
 
             dataframe = pd.DataFrame(data=[[train_dataset.label_name, format_percent(n_new_label / n_test_samples),
                                             sorted(new_labels)]],
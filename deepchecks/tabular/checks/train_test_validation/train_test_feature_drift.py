@@ -17,7 +17,7 @@ from typing import List, Union
 from deepchecks.core import CheckResult
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, Dataset, TrainTestCheck
-from deepchecks.utils.distribution.drift import calc_drift_and_plot, drift_condition
+from deepchecks.utils.distribution.drift import calc_drift_scores, drift_condition, drift_plot
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['TrainTestFeatureDrift']
@@ -144,15 +144,20 @@ class TrainTestFeatureDrift(TrainTestCheck):
         train_dataset.assert_features()
         test_dataset.assert_features()
 
-        train_dataset = train_dataset.select(
-                self.columns, self.ignore_columns
-            ).sample(self.n_samples, random_state=self.random_state)
+        train_distributions = None
+        if context.train_profile is not None and self.n_samples >= train_dataset.n_samples:
+            # The profile's sample is used as is, along with the distributions it has already calculated
+            train_dataset = train_dataset.select(self.columns, self.ignore_columns)
+            train_distributions = context.train_profile.distributions
+        else:
+            train_dataset = train_dataset.select(
+                    self.columns, self.ignore_columns
+                ).sample(self.n_samples, random_state=self.random_state)
         test_dataset = test_dataset.select(
                 self.columns, self.ignore_columns
             ).sample(self.n_samples, random_state=self.random_state)
 
         values_dict = OrderedDict()
-        displays_dict = OrderedDict()
 
         features_order = (
             tuple(
@@ -164,55 +169,69 @@ class TrainTestFeatureDrift(TrainTestCheck):
             else None
         )
 
+        column_types = OrderedDict()
         for column in train_dataset.features:
             if column in train_dataset.numerical_features:
-                column_type = 'numerical'
+                column_types[column] = 'numerical'
             elif column in train_dataset.cat_features:
-                column_type = 'categorical'
-            else:
-                continue  # we only support categorical or numerical features
-            if features_importance is not None:
-                fi_rank = features_order.index(column) + 1
-                plot_title = f'{column} (#{int(fi_rank)} in FI)'
-            else:
-                plot_title = column
+                column_types[column] = 'categorical'
+            # we only support categorical or numerical features
 
-            value, method, display = calc_drift_and_plot(
-                train_column=train_dataset.data[column],
-                test_column=test_dataset.data[column],
-                value_name=column,
-                column_type=column_type,
-                plot_title=plot_title,
-                margin_quantile_filter=self.margin_quantile_filter,
-                max_num_categories_for_drift=self.max_num_categories_for_drift,
-                max_num_categories_for_display=self.max_num_categories_for_display,
-                show_categories_by=self.show_categories_by,
-                categorical_drift_method=self.categorical_drift_method,
-            )
+        drift_scores = calc_drift_scores(
+            train_df=train_dataset.data,
+            test_df=test_dataset.data,
+            column_types=column_types,
+            margin_quantile_filter=self.margin_quantile_filter,
+            max_num_categories_for_drift=self.max_num_categories_for_drift,
+            categorical_drift_method=self.categorical_drift_method,
+            train_distributions=train_distributions,
+        )
+        for column, (value, method) in drift_scores.items():
             values_dict[column] = {
                 'Drift score': value,
                 'Method': method,
                 'Importance': features_importance[column] if features_importance is not None else None
             }
-            displays_dict[column] = display
 
-        if self.sort_feature_by == 'feature importance' and features_importance is not None:
-            columns_order = features_order[:self.n_top_columns]
-        else:
-            columns_order = sorted(values_dict.keys(), key=lambda col: values_dict[col]['Drift score'],
-                                   reverse=True)[:self.n_top_columns]
+        if context.with_display:
+            if self.sort_feature_by == 'feature importance' and features_importance is not None:
+                columns_order = features_order[:self.n_top_columns]
+            else:
+                columns_order = sorted(values_dict.keys(), key=lambda col: values_dict[col]['Drift score'],
+                                       reverse=True)[:self.n_top_columns]
 
-        sorted_by = self.sort_feature_by if features_importance is not None else 'drift score'
+            sorted_by = self.sort_feature_by if features_importance is not None else 'drift score'
 
-        headnote = f"""<span>
-            The Drift score is a measure for the difference between two distributions, in this check - the test
-            and train distributions.<br> The check shows the drift score and distributions for the features, sorted by
-            {sorted_by} and showing only the top {self.n_top_columns} features, according to {sorted_by}.
-            <br>If available, the plot titles also show the feature importance (FI) rank.
-        </span>"""
+            headnote = f"""<span>
+                The Drift score is a measure for the difference between two distributions, in this check - the test
+                and train distributions.<br> The check shows the drift score and distributions for the features, sorted
+                by {sorted_by} and showing only the top {self.n_top_columns} features, according to {sorted_by}.
+                <br>If available, the plot titles also show the feature importance (FI) rank.
+            </span>"""
 
-        displays = [headnote] + [displays_dict[col] for col in columns_order
-                                 if col in train_dataset.cat_features + train_dataset.numerical_features]
+            # Only the shown columns are plotted
+            displays = [headnote]
+            for column in columns_order:
+                if column not in column_types:
+                    continue
+                if features_importance is not None:
+                    fi_rank = features_order.index(column) + 1
+                    plot_title = f'{column} (#{int(fi_rank)} in FI)'
+                else:
+                    plot_title = column
+                displays.append(drift_plot(
+                    train_column=train_dataset.data[column],
+                    test_column=test_dataset.data[column],
+                    value_name=column,
+                    column_type=column_types[column],
+                    score=values_dict[column]['Drift score'],
+                    scorer_name=values_dict[column]['Method'],
+                    plot_title=plot_title,
+                    max_num_categories_for_display=self.max_num_categories_for_display,
+                    show_categories_by=self.show_categories_by,
+                ))
+        else:
+            displays = []
 
         return CheckResult(value=values_dict, display=displays, header='Train Test Feature Drift')
 
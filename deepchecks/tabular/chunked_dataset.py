@@ -0,0 +1,157 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Module containing the chunked dataset, for tabular data that doesn't fit in memory."""
+import glob
+import os
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.tabular.dataset import Dataset
+from deepchecks.utils.typing import Hashable
+
+__all__ = ['ChunkedDataset']
+
+
+class ChunkedDataset:
+    """Tabular dataset that is read in chunks, for data that doesn't fit in memory.
+
+    The data is scanned once on creation, in order to count its rows and draw a uniform sample of them, on which the
+    dataset metadata (features, categorical features, label type) is inferred. When passed to a check or a suite,
+    checks that can process the data chunk by chunk (such as IsSingleValue, MixedNulls, DominantFrequencyChange,
+    NewLabelTrainTest and CategoryMismatchTrainTest) run on the whole data, while other checks run on the sample.
+
+    Parameters
+    ----------
+    chunks : Union[Iterable[pd.DataFrame], Callable[[], Iterable[pd.DataFrame]]]
+        the chunks of the data. As the data is read more than once, either a collection of DataFrames or a function
+        returning a new iterator over the chunks on every call.
+    sample_size : int , default: 100_000
+        number of rows to sample for the checks which don't process the data in chunks.
+    random_state : int , default: 42
+        random seed for sampling the rows.
+    **dataset_kwargs :
+        arguments of the Dataset, such as label (given by name), features and cat_features.
+    """
+
+    def __init__(
+            self,
+            chunks: t.Union[t.Iterable[pd.DataFrame], t.Callable[[], t.Iterable[pd.DataFrame]]],
+            sample_size: int = 100_000,
+            random_state: int = 42,
+            **dataset_kwargs
+    ):
+        if not callable(chunks) and iter(chunks) is chunks:
+            raise DeepchecksValueError('ChunkedDataset reads the chunks more than once, so chunks must be a '
+                                       'collection of DataFrames or a function returning an iterator over them')
+        self._chunks = chunks
+        self.sample_size = sample_size
+        self.random_state = random_state
+
+        sample_df, self.n_samples = self._sample_chunks(sample_size, random_state)
+        if sample_df is None:
+            raise DeepchecksValueError('Can\'t create a ChunkedDataset object without data')
+        self.sample = Dataset(sample_df, **dataset_kwargs)
+
+    @classmethod
+    def from_parquet(
+            cls,
+            path: t.Union[str, t.Sequence[str]],
+            columns: t.Optional[t.Sequence[Hashable]] = None,
+            batch_size: int = 65_536,
+            **kwargs
+    ) -> 'ChunkedDataset':
+        """Create a chunked dataset reading Parquet files in batches.
+
+        Files are memory-mapped, and only one batch of rows is converted to a DataFrame at a time.
+
+        Parameters
+        ----------
+        path : Union[str, Sequence[str]]
+            path of a Parquet file, a directory of Parquet files or a list of Parquet files paths.
+        columns : Optional[Sequence[Hashable]] , default: None
+            columns to read. If None, all columns are read.
+        batch_size : int , default: 65_536
+            maximal number of rows in a chunk.
+        **kwargs :
+            arguments of ChunkedDataset.
+        Returns
+        -------
+        ChunkedDataset
+            the chunked dataset of the files.
+        """
+        try:
+            import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                'ChunkedDataset.from_parquet requires the pyarrow python package. '
+                'To get it, run "pip install pyarrow".'
+            ) from e
+
+        if isinstance(path, str):
+            paths = sorted(glob.glob(os.path.join(path, '*.parquet'))) if os.path.isdir(path) else [path]
+        else:
+            paths = list(path)
+
+        def read_chunks():
+            for file_path in paths:
+                parquet_file = pq.ParquetFile(file_path, memory_map=True)
+                for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+                    yield batch.to_pandas()
+
+        return cls(read_chunks, **kwargs)
+
+    def _iter_dataframes(self) -> t.Iterator[pd.DataFrame]:
+        chunks = self._chunks() if callable(self._chunks) else self._chunks
+        n_rows = 0
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            if isinstance(chunk.index, pd.RangeIndex):
+                # Chunks usually restart their default index, so rows are indexed by their position in the whole data
+                chunk = chunk.set_axis(pd.RangeIndex(n_rows, n_rows + len(chunk)), axis=0)
+            n_rows += len(chunk)
+            yield chunk
+
+    def _sample_chunks(self, sample_size: int, random_state: int) -> t.Tuple[t.Optional[pd.DataFrame], int]:
+        """Draw a uniform sample of the rows in a single pass, keeping the rows with the smallest random keys."""
+        rng = np.random.default_rng(random_state)
+        sample, keys = None, np.empty(0)
+        n_rows = 0
+        for chunk in self._iter_dataframes():
+            n_rows += len(chunk)
+            chunk_keys = rng.random(len(chunk))
+            if len(keys) == sample_size:
+                # Only rows with smaller keys than the largest kept key can get into the sample
+                candidates = chunk_keys < keys.max()
+                chunk, chunk_keys = chunk[candidates], chunk_keys[candidates]
+            sample = chunk if sample is None else pd.concat([sample, chunk])
+            keys = np.concatenate([keys, chunk_keys])
+            if len(keys) > sample_size:
+                kept = np.sort(np.argpartition(keys, sample_size)[:sample_size])
+                sample, keys = sample.iloc[kept], keys[kept]
+        return sample, n_rows
+
+    def iter_chunks(self) -> t.Iterator[Dataset]:
+        """Iterate over the chunks of the data as datasets, with the metadata of the dataset.
+
+        Returns
+        -------
+        Iterator[Dataset]
+            the datasets of the chunks.
+        """
+        for chunk in self._iter_dataframes():
+            yield self.sample.copy(chunk)
+
+    def __len__(self) -> int:
+        """Return the number of rows in the data."""
+        return self.n_samples
@@ -9,6 +9,9 @@
 # ----------------------------------------------------------------------------
 #
 """Module for base tabular context."""
+import functools
+import os
+import threading
 import typing as t
 import warnings
 
@@ -18,12 +21,17 @@ import pandas as pd
 from deepchecks.core import DatasetKind
 from deepchecks.core.errors import (DatasetValidationError, DeepchecksNotSupportedError, DeepchecksValueError,
                                     ModelValidationError)
+from deepchecks.core.result_cache import ResultCache
+from deepchecks.tabular.chunked_dataset import ChunkedDataset
 from deepchecks.tabular.dataset import Dataset
+from deepchecks.tabular.reference_profile import ReferenceProfile
+from deepchecks.tabular.utils.column_profile import ColumnProfile
 from deepchecks.tabular.utils.validation import (ensure_predictions_proba, ensure_predictions_shape,
                                                  model_type_validation, validate_model)
+from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import calculate_feature_importance_or_none
 from deepchecks.utils.metrics import ModelType, get_default_scorers, init_validate_scorers, task_type_check
-from deepchecks.utils.typing import BasicModel
+from deepchecks.utils.typing import BasicModel, Hashable
 
 __all__ = [
     'Context'
@@ -136,10 +144,12 @@ class Context:
 
     Parameters
     ----------
-    train: Union[Dataset, pd.DataFrame] , default: None
-        Dataset or DataFrame object, representing data an estimator was fitted on
-    test: Union[Dataset, pd.DataFrame] , default: None
-        Dataset or DataFrame object, representing data an estimator predicts on
+    train: Union[Dataset, pd.DataFrame, ChunkedDataset, ReferenceProfile] , default: None
+        Dataset or DataFrame object, representing data an estimator was fitted on. A ReferenceProfile of the train
+        dataset can be passed instead, in which case checks run on its sample of the train dataset.
+    test: Union[Dataset, pd.DataFrame, ChunkedDataset] , default: None
+        Dataset or DataFrame object, representing data an estimator predicts on. For a ChunkedDataset, checks
+        that process data in chunks run on the whole data, and other checks run on its sample.
     model: BasicModel , default: None
         A scikit-learn-compatible fitted estimator instance
     model_name: str , default: ''
@@ -165,11 +175,20 @@ class Context:
         Array of the model prediction probabilities over the train dataset.
     y_proba_test: np.ndarray , default: None
         Array of the model prediction probabilities over the test dataset.
+    with_display : bool , default: True
+        flag that determines if checks should build their display (figures and tables), or only calculate the
+        check value and conditions results.
+    model_version : str , default: None
+        version identifying the model in the store of calculated feature importance. If not given, the model is
+        identified by its pickle.
+    feature_importance_cache : Union[ResultCache, str, os.PathLike] , default: None
+        on-disk cache, or its directory, to store calculated permutation feature importance in, shared between runs
+        and processes. The importance is always stored in memory for the current process.
     """
 
     def __init__(self,
-                 train: t.Union[Dataset, pd.DataFrame] = None,
-                 test: t.Union[Dataset, pd.DataFrame] = None,
+                 train: t.Union[Dataset, pd.DataFrame, ChunkedDataset, ReferenceProfile] = None,
+                 test: t.Union[Dataset, pd.DataFrame, ChunkedDataset] = None,
                  model: BasicModel = None,
                  model_name: str = '',
                  features_importance: pd.Series = None,
@@ -181,10 +200,23 @@ class Context:
                  y_pred_test: np.ndarray = None,
                  y_proba_train: np.ndarray = None,
                  y_proba_test: np.ndarray = None,
+                 with_display: bool = True,
+                 model_version: str = None,
+                 feature_importance_cache: t.Union[ResultCache, str, os.PathLike] = None,
                  ):
         # Validations
         if train is None and test is None and model is None:
             raise DeepchecksValueError('At least one dataset (or model) must be passed to the method!')
+        train_profile = None
+        if isinstance(train, ReferenceProfile):
+            train_profile = train
+            train = train.sample
+        chunked_datasets = {kind: dataset for kind, dataset in ((DatasetKind.TRAIN, train), (DatasetKind.TEST, test))
+                            if isinstance(dataset, ChunkedDataset)}
+        if isinstance(train, ChunkedDataset):
+            train = train.sample
+        if isinstance(test, ChunkedDataset):
+            test = test.sample
         if train is not None:
             train = Dataset.cast_to_dataset(train)
         if test is not None:
@@ -221,11 +253,15 @@ class Context:
             if not isinstance(features_importance, pd.Series):
                 raise DeepchecksValueError('features_importance must be a pandas Series')
         self._train = train
+        self._train_profile = train_profile
+        self._chunked_datasets = chunked_datasets
         self._test = test
         self._model = model
         self._feature_importance_force_permutation = feature_importance_force_permutation
         self._features_importance = features_importance
         self._feature_importance_timeout = feature_importance_timeout
+        self._model_version = model_version
+        self._feature_importance_cache = feature_importance_cache
         self._calculated_importance = features_importance is not None
         self._importance_type = None
         self._validated_model = False
@@ -233,6 +269,23 @@ class Context:
         self._user_scorers = scorers
         self._user_scorers_per_class = scorers_per_class
         self._model_name = model_name
+        self._with_display = with_display
+        # Predictions are computed lazily once per dataset and shared by all checks. Static predictions passed by
+        # the user are stored directly, so they are served without going through the dummy model validations.
+        self._predictions: t.Dict[DatasetKind, np.ndarray] = {}
+        self._probas: t.Dict[DatasetKind, np.ndarray] = {}
+        for kind, y_pred, y_proba in ((DatasetKind.TRAIN, y_pred_train, y_proba_train),
+                                      (DatasetKind.TEST, y_pred_test, y_proba_test)):
+            if y_pred is not None:
+                self._predictions[kind] = np.asarray(y_pred)
+                if y_proba is not None:
+                    self._probas[kind] = np.asarray(y_proba)
+        # Checks of a suite may run concurrently on the same context, so lazily computed values are guarded. The
+        # feature importance has its own lock, as computing it may take long and doesn't depend on the predictions.
+        self._lock = threading.RLock()
+        self._importance_lock = threading.Lock()
+        self._column_profiles: t.Dict[t.Tuple[DatasetKind, Hashable], ColumnProfile] = {}
+        self._column_profiles_lock = threading.Lock()
 
     # Properties
     # Validations note: We know train & test fit each other so all validations can be run only on train
@@ -244,6 +297,11 @@ class Context:
             raise DeepchecksNotSupportedError('Check is irrelevant for Datasets without train dataset')
         return self._train
 
+    @property
+    def train_profile(self) -> t.Optional[ReferenceProfile]:
+        """Return the reference profile of the train dataset if it was passed instead of it, otherwise None."""
+        return self._train_profile
+
     @property
     def test(self) -> Dataset:
         """Return test if exists, otherwise raise error."""
@@ -257,9 +315,11 @@ class Context:
         if self._model is None:
             raise DeepchecksNotSupportedError('Check is irrelevant for Datasets without model')
         if not self._validated_model:
-            if self._train:
-                validate_model(self._train, self._model)
-            self._validated_model = True
+            with self._lock:
+                if not self._validated_model:
+                    if self._train:
+                        validate_model(self._train, self._model)
+                    self._validated_model = True
         return self._model
 
     @property
@@ -267,31 +327,44 @@ class Context:
         """Return model name."""
         return self._model_name
 
+    @property
+    def with_display(self) -> bool:
+        """Return whether checks should build their display."""
+        return self._with_display
+
     @property
     def task_type(self) -> ModelType:
         """Return task type if model & train & label exists. otherwise, raise error."""
         if self._task_type is None:
-            self._task_type = task_type_check(self.model, self.train)
+            with self._lock:
+                if self._task_type is None:
+                    self._task_type = task_type_check(self.model, self.train)
         return self._task_type
 
     @property
     def features_importance(self) -> t.Optional[pd.Series]:
         """Return features importance, or None if not possible."""
         if not self._calculated_importance:
-            if self._model and (self._train or self._test):
-                permutation_kwargs = {'timeout': self._feature_importance_timeout}
-                dataset = self.test if self.have_test() else self.train
-                importance, importance_type = calculate_feature_importance_or_none(
-                    self._model, dataset, self._feature_importance_force_permutation, permutation_kwargs
-                )
-                self._features_importance = importance
-                self._importance_type = importance_type
-            else:
-                self._features_importance = None
-            self._calculated_importance = True
+            with self._importance_lock:
+                if not self._calculated_importance:
+                    self._calculate_features_importance()
 
         return self._features_importance
 
+    def _calculate_features_importance(self):
+        if self._model and (self._train or self._test):
+            permutation_kwargs = {'timeout': self._feature_importance_timeout}
+            dataset = self.test if self.have_test() else self.train
+            importance, importance_type = calculate_feature_importance_or_none(
+                self._model, dataset, self._feature_importance_force_permutation, permutation_kwargs,
+                model_version=self._model_version, store_cache=self._feature_importance_cache
+            )
+            self._features_importance = importance
+            self._importance_type = importance_type
+        else:
+            self._features_importance = None
+        self._calculated_importance = True
+
     @property
     def features_importance_type(self) -> t.Optional[str]:
         """Return feature importance type if feature importance is available, else None."""
@@ -385,6 +458,43 @@ class Context:
         single_scorer_dict = {scorer_name: scorers[scorer_name]}
         return init_validate_scorers(single_scorer_dict, self.model, self.train, class_avg, self.task_type)[0]
 
+    def get_predictions(self, kind: DatasetKind = DatasetKind.TRAIN) -> np.ndarray:
+        """Return the model predictions over the dataset of the given kind.
+
+        Predictions are calculated on first request and cached, so the model runs inference at most once per dataset
+        during the lifetime of the context.
+        """
+        if kind not in self._predictions:
+            with self._lock:
+                if kind not in self._predictions:
+                    dataset = self.get_data_by_kind(kind)
+                    self._predictions[kind] = np.asarray(self.model.predict(dataset.features_columns))
+        return self._predictions[kind]
+
+    def get_probabilities(self, kind: DatasetKind = DatasetKind.TRAIN) -> np.ndarray:
+        """Return the model predicted probabilities over the dataset of the given kind.
+
+        Probabilities are calculated on first request and cached, so the model runs inference at most once per
+        dataset during the lifetime of the context.
+        """
+        if kind not in self._probas:
+            model = self.model
+            if not hasattr(model, 'predict_proba'):
+                raise DeepchecksNotSupportedError('Check is irrelevant for models without predict_proba')
+            with self._lock:
+                if kind not in self._probas:
+                    dataset = self.get_data_by_kind(kind)
+                    self._probas[kind] = np.asarray(model.predict_proba(dataset.features_columns))
+        return self._probas[kind]
+
+    def get_scorer_predictions(self, kind: DatasetKind = DatasetKind.TRAIN) -> t.Dict[str, t.Callable]:
+        """Return the cached predictions of the given dataset kind as keyword arguments for a DeepcheckScorer.
+
+        The predictions are passed lazily, so probabilities are calculated only if a scorer actually needs them.
+        """
+        return {'y_pred': functools.partial(self.get_predictions, kind),
+                'y_proba': functools.partial(self.get_probabilities, kind)}
+
     def get_data_by_kind(self, kind: DatasetKind):
         """Return the relevant Dataset by given kind."""
         if kind == DatasetKind.TRAIN:
@@ -394,6 +504,41 @@ class Context:
         else:
             raise DeepchecksValueError(f'Unexpected dataset kind {kind}')
 
+    def iter_chunks(self, kind: DatasetKind) -> t.Iterator[Dataset]:
+        """Iterate over the whole dataset of the given kind in chunks.
+
+        A ChunkedDataset is read chunk by chunk, and a dataset in memory is returned as a single chunk. Checks that
+        merge the results of the chunks can therefore run on the whole data of chunked datasets.
+        """
+        if kind in self._chunked_datasets:
+            return self._chunked_datasets[kind].iter_chunks()
+        return iter([self.get_data_by_kind(kind)])
+
+    def get_column_profiles(
+        self,
+        kind: DatasetKind,
+        columns: t.Union[Hashable, t.List[Hashable], None] = None,
+        ignore_columns: t.Union[Hashable, t.List[Hashable], None] = None
+    ) -> t.Dict[Hashable, ColumnProfile]:
+        """Return the profiles of the selected columns of the dataset of the given kind.
+
+        Each column is profiled once over the whole dataset (chunk by chunk for a ChunkedDataset), and the profile is
+        shared by all the checks using it. Columns are selected the same way as by select_from_dataframe.
+        """
+        # Only the column names are selected, so the selection runs on an empty dataframe
+        selected_columns = list(select_from_dataframe(self.get_data_by_kind(kind).data.iloc[:0], columns,
+                                                      ignore_columns).columns)
+        with self._column_profiles_lock:
+            missing_columns = [column for column in selected_columns if (kind, column) not in self._column_profiles]
+            if missing_columns:
+                chunks_profiles = {column: [] for column in missing_columns}
+                for chunk in self.iter_chunks(kind):
+                    for column in missing_columns:
+                        chunks_profiles[column].append(ColumnProfile.from_column(chunk.data[column]))
+                for column, profiles in chunks_profiles.items():
+                    self._column_profiles[(kind, column)] = ColumnProfile.merge(profiles)
+            return {column: self._column_profiles[(kind, column)] for column in selected_columns}
+
     def get_is_sampled_footnote(self, n_samples: int, kind: DatasetKind = None):
         """Get footnote to display when the datasets are sampled."""
         message = ''
@@ -12,7 +12,6 @@
 # pylint: disable=inconsistent-quotes,protected-access
 import typing as t
 import warnings
-from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -101,6 +100,7 @@ class Dataset:
     _max_categorical_ratio: float
     _max_categories: int
     _label_type: t.Optional[str]
+    _classes: t.Optional[t.Tuple[str, ...]]
 
     def __init__(
             self,
@@ -291,6 +291,7 @@ class Dataset:
 
         unassigned_cols = [col for col in self._features if col not in self._cat_features]
         self._numerical_features = infer_numerical_features(self._data[unassigned_cols])
+        self._classes = None
 
     @classmethod
     def from_numpy(
@@ -408,6 +409,10 @@ class Dataset:
     def copy(self: TDataset, new_data: pd.DataFrame) -> TDataset:
         """Create a copy of this Dataset with new data.
 
+        When the new data is derived from the data of this dataset (same columns and dtypes, possibly fewer rows
+        or columns), the new dataset is built over it without copying it, and the already inferred metadata
+        (categorical and numerical features, label type) is carried over instead of being inferred again.
+
         Parameters
         ----------
         new_data (DataFrame): new data from which new dataset will be created
@@ -417,6 +422,9 @@ class Dataset:
         Dataset
             new dataset instance
         """
+        if self._shares_schema(new_data):
+            return self._derive(new_data)
+
         # Filter out if columns were dropped
         features = [feat for feat in self._features if feat in new_data.columns]
         cat_features = [feat for feat in self.cat_features if feat in new_data.columns]
@@ -432,6 +440,43 @@ class Dataset:
                    convert_datetime=self._convert_datetime, max_categorical_ratio=self._max_categorical_ratio,
                    max_categories=self._max_categories, label_type=self.label_type)
 
+    def _shares_schema(self, new_data: pd.DataFrame) -> bool:
+        """Return whether the columns of the given data are a subset of this dataset columns, with the same dtypes."""
+        if not isinstance(new_data, pd.DataFrame) or not new_data.columns.is_unique:
+            return False
+        if not new_data.columns.isin(self._data.columns).all():
+            return False
+        return new_data.dtypes.equals(self._data.dtypes[new_data.columns])
+
+    def _derive(self: TDataset, new_data: pd.DataFrame) -> TDataset:
+        """Create a dataset over the given data, which is derived from this dataset data, without validating it."""
+        if len(new_data) == 0:
+            raise DeepchecksValueError('Can\'t create a Dataset object with an empty dataframe')
+
+        cls = type(self)
+        dataset = cls.__new__(cls)
+        dataset.__dict__.update(self.__dict__)
+        dataset._data = new_data
+
+        # Filter out if columns were dropped
+        columns = new_data.columns
+        dataset._features = [feat for feat in self._features if feat in columns]
+        dataset._cat_features = [feat for feat in self._cat_features if feat in columns]
+        dataset._numerical_features = [feat for feat in self._numerical_features if feat in columns]
+        dataset._label_name = self._label_name if self._label_name in columns else None
+        dataset._index_name = self._index_name if self._index_name in columns else None
+        dataset._datetime_name = self._datetime_name if self._datetime_name in columns else None
+
+        if self._set_datetime_from_dataframe_index:
+            dataset._datetime_column = dataset.get_datetime_column_from_index(dataset._datetime_name)
+            if self._convert_datetime:
+                dataset._datetime_column = pd.to_datetime(dataset._datetime_column, **self._datetime_args)
+
+        # The classes are kept only if the rows are the same
+        if not (new_data.index is self._data.index and dataset._label_name is not None):
+            dataset._classes = None
+        return dataset
+
     def sample(self: TDataset, n_samples: int, replace: bool = False, random_state: t.Optional[int] = None,
                drop_na_label: bool = False) -> TDataset:
         """Create a copy of the dataset object, with the internal dataframe being a sample of the original dataframe.
@@ -744,7 +789,6 @@ class Dataset:
         return list(self._numerical_features)
 
     @property
-    @lru_cache(maxsize=128)
     def classes(self) -> t.Tuple[str, ...]:
         """Return the classes from label column in sorted list. if no label column defined, return empty list.
 
@@ -753,9 +797,12 @@ class Dataset:
         t.Tuple[str, ...]
             Sorted classes
         """
-        if self.label_name is not None:
-            return tuple(sorted(self.data[self.label_name].dropna().unique().tolist()))
-        return tuple()
+        if self._classes is None:
+            if self.label_name is not None:
+                self._classes = tuple(sorted(self.data[self.label_name].dropna().unique().tolist()))
+            else:
+                self._classes = tuple()
+        return self._classes
 
     @property
     def columns_info(self) -> t.Dict[Hashable, str]:
@@ -867,7 +914,8 @@ class Dataset:
             columns.append(self.label_name)
 
         new_data = select_from_dataframe(self._data, columns, ignore_columns)
-        if new_data.equals(self.data):
+        # Only columns are filtered, so the data is the same if all the columns are kept
+        if new_data.columns.equals(self._data.columns):
             return self
         else:
             return self.copy(new_data)
@@ -896,12 +944,14 @@ class Dataset:
                 'Received a "pandas.DataFrame" instance. It is recommended to pass a "deepchecks.tabular.Dataset" '
                 'instance by doing "Dataset(dataframe)"'
             )
-            obj = Dataset(obj)
+            # The constructor copies the dataframe
+            return Dataset(obj)
         elif not isinstance(obj, Dataset):
             raise DeepchecksValueError(
                 f'non-empty instance of Dataset or DataFrame was expected, instead got {type(obj).__name__}'
             )
-        return obj.copy(obj.data)
+        # Checks may modify the data in place, so the values are copied and only the inferred metadata is carried over
+        return obj.copy(obj.data.copy())
 
     @classmethod
     def datasets_share_features(cls, *datasets: 'Dataset') -> bool:
@@ -0,0 +1,104 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Module containing the reference profile of a dataset."""
+import pickle
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.tabular.dataset import Dataset
+from deepchecks.utils.typing import Hashable
+
+__all__ = ['ReferenceProfile']
+
+
+class ReferenceProfile:
+    """Profile of a reference (usually train) dataset, that can be passed instead of it to train-test checks.
+
+    The profile is computed once and can be saved to disk, so comparing new test data to a fixed reference dataset
+    doesn't require scanning the reference data again on every run. It contains:
+
+    - a sample of the dataset rows (the whole dataset if it's smaller than sample_size), which is used by checks as
+      the train dataset.
+    - the value counts of every feature over the whole dataset.
+    - the distributions drift is calculated on for every numerical and categorical feature of the sample: its sorted
+      values (and therefore its quantiles) or its category counts.
+
+    Checks that use the profile (TrainTestFeatureDrift, DominantFrequencyChange) return the same results as on the
+    whole dataset, as long as their sampling parameters match the profile's. Other checks run on the sample.
+
+    Parameters
+    ----------
+    dataset : Union[Dataset, pd.DataFrame]
+        the reference dataset.
+    sample_size : int , default: 100_000
+        number of rows to keep from the dataset.
+    random_state : int , default: 42
+        random seed for sampling the rows.
+    """
+
+    def __init__(self, dataset: t.Union[Dataset, pd.DataFrame], sample_size: int = 100_000, random_state: int = 42):
+        # The drift module is imported here, as it imports the display libraries
+        from deepchecks.utils.distribution.drift import \
+            calc_drift_distributions  # pylint: disable=import-outside-toplevel
+
+        dataset = Dataset.cast_to_dataset(dataset)
+        self.n_samples = dataset.n_samples
+        self.sample_size = sample_size
+        self.random_state = random_state
+        if dataset.n_samples > sample_size:
+            self.sample = dataset.sample(sample_size, random_state=random_state)
+        else:
+            self.sample = dataset.copy(dataset.data.copy())
+        self.value_counts: t.Dict[Hashable, pd.Series] = {
+            column: dataset.data[column].value_counts(dropna=False) for column in dataset.features
+        }
+        column_types = {column: 'numerical' if column in self.sample.numerical_features else 'categorical'
+                        for column in self.sample.numerical_features + self.sample.cat_features}
+        self.distributions: t.Dict[Hashable, t.Union[np.ndarray, pd.Series]] = \
+            calc_drift_distributions(self.sample.data, column_types)
+
+    def save(self, file: t.Union[str, t.BinaryIO]):
+        """Save the profile to a file.
+
+        Parameters
+        ----------
+        file : Union[str, BinaryIO]
+            path or binary file-like object to write the profile to.
+        """
+        if isinstance(file, str):
+            with open(file, 'wb') as f:
+                pickle.dump(self, f)
+        else:
+            pickle.dump(self, file)
+
+    @classmethod
+    def load(cls, file: t.Union[str, t.BinaryIO]) -> 'ReferenceProfile':
+        """Load a profile saved with ReferenceProfile.save.
+
+        Parameters
+        ----------
+        file : Union[str, BinaryIO]
+            path or binary file-like object to read the profile from.
+        Returns
+        -------
+        ReferenceProfile
+            the loaded profile.
+        """
+        if isinstance(file, str):
+            with open(file, 'rb') as f:
+                profile = pickle.load(f)
+        else:
+            profile = pickle.load(file)
+        if not isinstance(profile, cls):
+            raise DeepchecksValueError(f'Expected a saved {cls.__name__} but got {type(profile).__name__}')
+        return profile
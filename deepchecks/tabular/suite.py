@@ -10,19 +10,27 @@
 #
 """Module for base tabular abstractions."""
 # pylint: disable=broad-except
-from typing import Callable, Mapping, Optional, Tuple, Union
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
-from deepchecks.core.check_result import CheckFailure
+from deepchecks.core.check_result import CheckFailure, CheckResult
 from deepchecks.core.errors import DeepchecksNotSupportedError
+from deepchecks.core.result_cache import ResultCache
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.tabular.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
+from deepchecks.tabular.chunked_dataset import ChunkedDataset
 from deepchecks.tabular.context import Context
 from deepchecks.tabular.dataset import Dataset
+from deepchecks.tabular.reference_profile import ReferenceProfile
+from deepchecks.tabular.utils.fingerprint import run_fingerprint
 from deepchecks.utils.ipython import create_progress_bar
 from deepchecks.utils.typing import BasicModel
+from deepchecks.utils.validation import validate_n_jobs
 
 __all__ = ['Suite']
 
@@ -37,8 +45,8 @@ class Suite(BaseSuite):
 
     def run(
             self,
-            train_dataset: Optional[Union[Dataset, pd.DataFrame]] = None,
-            test_dataset: Optional[Union[Dataset, pd.DataFrame]] = None,
+            train_dataset: Optional[Union[Dataset, pd.DataFrame, ChunkedDataset, ReferenceProfile]] = None,
+            test_dataset: Optional[Union[Dataset, pd.DataFrame, ChunkedDataset]] = None,
             model: BasicModel = None,
             features_importance: pd.Series = None,
             feature_importance_force_permutation: bool = False,
@@ -49,14 +57,19 @@ class Suite(BaseSuite):
             y_pred_test: np.ndarray = None,
             y_proba_train: np.ndarray = None,
             y_proba_test: np.ndarray = None,
+            n_jobs: int = 1,
+            with_display: bool = True,
+            cache: Union[ResultCache, str, os.PathLike, None] = None,
+            model_version: Optional[str] = None,
+            feature_importance_cache: Union[ResultCache, str, os.PathLike, None] = None,
     ) -> SuiteResult:
         """Run all checks.
 
         Parameters
         ----------
-        train_dataset: Optional[Union[Dataset, pd.DataFrame]] , default None
-            object, representing data an estimator was fitted on
-        test_dataset : Optional[Union[Dataset, pd.DataFrame]] , default None
+        train_dataset: Optional[Union[Dataset, pd.DataFrame, ChunkedDataset, ReferenceProfile]] , default None
+            object, representing data an estimator was fitted on, or its reference profile
+        test_dataset : Optional[Union[Dataset, pd.DataFrame, ChunkedDataset]] , default None
             object, representing data an estimator predicts on
         model : BasicModel , default None
             A scikit-learn-compatible fitted estimator instance
@@ -81,11 +94,27 @@ class Suite(BaseSuite):
             Array of the model prediction probabilities over the train dataset.
         y_proba_test: np.ndarray , default: None
             Array of the model prediction probabilities over the test dataset.
+        n_jobs : int , default: 1
+            Number of checks to run concurrently. Checks run on a thread pool sharing the same context, so the data
+            and the cached predictions are not copied per check. -1 means using all processors.
+        with_display : bool , default: True
+            flag that determines if checks should build their display, if False the results hold only the check
+            values and conditions results.
+        cache : Union[ResultCache, str, os.PathLike, None] , default: None
+            cache, or directory of a cache, of check results. When given, checks which already ran on the same data,
+            model and parameters load their results from the cache instead of running again.
+        model_version : Optional[str] , default: None
+            version identifying the model in the cache and in the store of feature importance. If not given, the
+            model is identified by its pickle.
+        feature_importance_cache : Union[ResultCache, str, os.PathLike, None] , default: None
+            on-disk cache, or its directory, to store calculated permutation feature importance in, shared between
+            runs and processes. It can be the same cache as the check results cache.
         Returns
         -------
         SuiteResult
             All results by all initialized checks
         """
+        n_workers = validate_n_jobs(n_jobs)
         context = Context(train_dataset, test_dataset, model,
                           features_importance=features_importance,
                           feature_importance_force_permutation=feature_importance_force_permutation,
@@ -93,64 +122,109 @@ class Suite(BaseSuite):
                           scorers=scorers,
                           scorers_per_class=scorers_per_class,
                           y_pred_train=y_pred_train, y_pred_test=y_pred_test,
-                          y_proba_train=y_proba_train, y_proba_test=y_proba_test)
+                          y_proba_train=y_proba_train, y_proba_test=y_proba_test, with_display=with_display,
+                          model_version=model_version, feature_importance_cache=feature_importance_cache)
 
+        checks = list(self.checks.values())
         progress_bar = create_progress_bar(
-            iterable=list(self.checks.values()),
+            total=len(checks),
             name=self.name,
             unit='Check'
         )
+        run_check = functools.partial(Suite._run_check, context=context, train_dataset=train_dataset,
+                                      test_dataset=test_dataset, model=model)
+        if cache is not None:
+            fingerprint = run_fingerprint(
+                train_dataset, test_dataset, model, model_version,
+                features_importance=features_importance,
+                feature_importance_force_permutation=feature_importance_force_permutation,
+                feature_importance_timeout=feature_importance_timeout,
+                scorers=scorers, scorers_per_class=scorers_per_class,
+                y_pred_train=y_pred_train, y_pred_test=y_pred_test,
+                y_proba_train=y_proba_train, y_proba_test=y_proba_test, with_display=with_display
+            )
+            run_check = functools.partial(ResultCache.from_argument(cache).run_check, run=run_check,
+                                          run_fingerprint=fingerprint, mode='suite')
 
         # Run all checks
-        results = []
-        for check in progress_bar:
-            try:
+        if n_workers == 1:
+            checks_results = []
+            for check in checks:
                 progress_bar.set_postfix({'Check': check.name()}, refresh=False)
-                if isinstance(check, TrainTestCheck):
-                    if train_dataset is not None and test_dataset is not None:
-                        check_result = check.run_logic(context)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if not supplied with both train and test datasets'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, SingleDatasetCheck):
-                    if train_dataset is not None:
-                        # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
-                        # wrap it in try/except
-                        try:
-                            check_result = check.run_logic(context)
-                            # In case of single dataset not need to edit the header
-                            if test_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Train Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Train Dataset')
-                        results.append(check_result)
-                    if test_dataset is not None:
-                        try:
-                            check_result = check.run_logic(context, dataset_type='test')
-                            # In case of single dataset not need to edit the header
-                            if train_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Test Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Test Dataset')
-                        results.append(check_result)
-                    if train_dataset is None and test_dataset is None:
-                        msg = 'Check is irrelevant if dataset is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, ModelOnlyCheck):
-                    if model is not None:
-                        check_result = check.run_logic(context)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if model is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                else:
-                    raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
-            except Exception as exp:
-                results.append(CheckFailure(check, exp))
+                checks_results.append(run_check(check))
+                progress_bar.update()
+        else:
+            # Checks only read from the context, so it is shared by all the threads
+            checks_results = [None] * len(checks)
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = {executor.submit(run_check, check): index for index, check in enumerate(checks)}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    checks_results[index] = future.result()
+                    progress_bar.set_postfix({'Check': checks[index].name()}, refresh=False)
+                    progress_bar.update()
+        progress_bar.close()
 
+        # Keep the results in the order of the checks in the suite
+        results = [result for check_results in checks_results for result in check_results]
         return SuiteResult(self.name, results)
 
+    @classmethod
+    def _run_check(
+            cls,
+            check,
+            context: Context,
+            train_dataset: Optional[Union[Dataset, pd.DataFrame, ChunkedDataset, ReferenceProfile]],
+            test_dataset: Optional[Union[Dataset, pd.DataFrame, ChunkedDataset]],
+            model: BasicModel
+    ) -> List[Union[CheckResult, CheckFailure]]:
+        """Run a single check on the context and return its results."""
+        results = []
+        try:
+            if isinstance(check, TrainTestCheck):
+                if train_dataset is not None and test_dataset is not None:
+                    check_result = check.run_logic(context)
+                    results.append(check_result)
+                else:
+                    msg = 'Check is irrelevant if not supplied with both train and test datasets'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            elif isinstance(check, SingleDatasetCheck):
+                if train_dataset is not None:
+                    # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
+                    # wrap it in try/except
+                    try:
+                        check_result = check.run_logic(context)
+                        # In case of single dataset not need to edit the header
+                        if test_dataset is not None:
+                            check_result.header = f'{check_result.get_header()} - Train Dataset'
+                    except Exception as exp:
+                        check_result = CheckFailure(check, exp, ' - Train Dataset')
+                    results.append(check_result)
+                if test_dataset is not None:
+                    try:
+                        check_result = check.run_logic(context, dataset_type='test')
+                        # In case of single dataset not need to edit the header
+                        if train_dataset is not None:
+                            check_result.header = f'{check_result.get_header()} - Test Dataset'
+                    except Exception as exp:
+                        check_result = CheckFailure(check, exp, ' - Test Dataset')
+                    results.append(check_result)
+                if train_dataset is None and test_dataset is None:
+                    msg = 'Check is irrelevant if dataset is not supplied'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            elif isinstance(check, ModelOnlyCheck):
+                if model is not None:
+                    check_result = check.run_logic(context)
+                    results.append(check_result)
+                else:
+                    msg = 'Check is irrelevant if model is not supplied'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            else:
+                raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
+        except Exception as exp:
+            results.append(CheckFailure(check, exp))
+        return results
+
     @classmethod
     def _get_unsupported_failure(cls, check, msg):
         return CheckFailure(check, DeepchecksNotSupportedError(msg))
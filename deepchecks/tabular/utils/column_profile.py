@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Module containing the profile of a column, shared by the data integrity checks."""
+import typing as t
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_float_dtype, is_numeric_dtype
+
+from deepchecks.utils.strings import is_string_column
+
+__all__ = ['ColumnProfile', 'nan_type']
+
+
+class ColumnProfile:
+    """Summary of the values of a single column, calculated in a single vectorized pass over the column.
+
+    The profile holds the counts of the distinct values and of the different types of nulls. Anything that depends
+    only on the distinct values (their inferred type, string lengths or whether they're numbers) is calculated from
+    them lazily, once for all the checks using the profile.
+
+    Parameters
+    ----------
+    value_counts : pd.Series
+        counts of the non-null values, in the order of their first appearance in the column.
+    null_counts : Dict[str, int]
+        counts of the null values by their type (see nan_type).
+    n_samples : int
+        number of samples in the column, including nulls.
+    dtype
+        dtype of the column.
+    """
+
+    def __init__(self, value_counts: pd.Series, null_counts: t.Dict[str, int], n_samples: int, dtype):
+        self.value_counts = value_counts
+        self.null_counts = null_counts
+        self.n_samples = n_samples
+        self.dtype = dtype
+        self._is_string = None
+        self._inferred_type = None
+        self._string_lengths = None
+        self._is_number = None
+
+    @classmethod
+    def from_column(cls, column: pd.Series) -> 'ColumnProfile':
+        """Calculate the profile of the given column."""
+        codes, uniques = pd.factorize(column)
+        null_mask = codes == -1
+        counts = np.bincount(codes[~null_mask], minlength=len(uniques))
+        if null_mask.any():
+            # Categorical nulls are cast to object, as categorical columns map functions over the categories
+            null_types = column[null_mask].astype(object).apply(nan_type).value_counts()
+            null_counts = dict(null_types.items())
+        else:
+            null_counts = {}
+        return cls(pd.Series(counts, index=uniques), null_counts, len(column), column.dtype)
+
+    @classmethod
+    def merge(cls, profiles: t.Sequence['ColumnProfile']) -> 'ColumnProfile':
+        """Merge the profiles of chunks of the same column into the profile of the whole column."""
+        if len(profiles) == 1:
+            return profiles[0]
+        value_counts = pd.concat([profile.value_counts for profile in profiles])
+        value_counts = value_counts.groupby(level=0, sort=False, observed=True).sum()
+        null_counts = {}
+        for profile in profiles:
+            for null_type, count in profile.null_counts.items():
+                null_counts[null_type] = null_counts.get(null_type, 0) + count
+        # The dtype of the whole column is the one pandas gives to the concatenation of the chunks
+        dtype = pd.concat([pd.Series(dtype=profile.dtype) for profile in profiles]).dtype
+        return cls(value_counts, null_counts, sum(profile.n_samples for profile in profiles), dtype)
+
+    @property
+    def n_nulls(self) -> int:
+        """Return the number of null samples."""
+        return self.n_samples - self.n_values
+
+    @property
+    def n_values(self) -> int:
+        """Return the number of non-null samples."""
+        return int(self.value_counts.sum())
+
+    @property
+    def is_string(self) -> bool:
+        """Return whether the column is of string type, as determined by is_string_column."""
+        if self._is_string is None:
+            self._is_string = not is_numeric_dtype(self.dtype) and \
+                is_string_column(pd.Series(self.value_counts.index, dtype=object))
+        return self._is_string
+
+    @property
+    def inferred_type(self) -> str:
+        """Return the type of the non-null values, as inferred by pandas infer_dtype."""
+        if self._inferred_type is None:
+            self._inferred_type = infer_dtype(self.value_counts.index)
+        return self._inferred_type
+
+    @property
+    def string_lengths(self) -> np.ndarray:
+        """Return the length of the string representation of each of the distinct values."""
+        if self._string_lengths is None:
+            self._string_lengths = np.array([len(str(value)) for value in self.value_counts.index], dtype=int)
+        return self._string_lengths
+
+    @property
+    def is_number(self) -> np.ndarray:
+        """Return for each of the distinct values whether it can be converted to a number."""
+        if self._is_number is None:
+            self._is_number = np.array([_is_float(value) for value in self.value_counts.index], dtype=bool)
+        return self._is_number
+
+    def is_categorical(self, max_categorical_ratio: float = 0.01, max_categories: int = 30,
+                       max_float_categories: int = 5) -> bool:
+        """Return whether the non-null values are few enough to count as categorical, like is_categorical."""
+        n_unique = len(self.value_counts)
+        if is_float_dtype(self.dtype):
+            return n_unique <= max_float_categories
+        if self.n_values == 0:
+            return False
+        return (n_unique / self.n_values) < max_categorical_ratio and n_unique <= max_categories
+
+
+def nan_type(x):
+    """Return the name of the type of the given null value."""
+    if x is np.nan:  # pylint: disable=nan-comparison
+        return 'numpy.nan'
+    elif x is pd.NA:
+        return 'pandas.NA'
+    elif x is pd.NaT:
+        return 'pandas.NaT'
+    return str(x)
+
+
+def _is_float(value) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
@@ -0,0 +1,106 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Module containing a store of calculated feature importance, kept in memory and optionally on disk."""
+import os
+import threading
+import typing as t
+from collections import OrderedDict
+
+import pandas as pd
+
+from deepchecks.core.result_cache import ResultCache, hash_object
+from deepchecks.tabular.dataset import Dataset
+from deepchecks.tabular.utils.fingerprint import dataset_fingerprint
+
+__all__ = ['importance_key', 'load_importance', 'save_importance', 'clear_memory_store', 'MEMORY_STORE_SIZE']
+
+
+MEMORY_STORE_SIZE = 32
+
+_memory_store: 'OrderedDict[str, pd.Series]' = OrderedDict()
+_memory_store_lock = threading.Lock()
+
+
+def importance_key(
+    model: t.Any,
+    dataset: Dataset,
+    model_version: t.Optional[str] = None,
+    **calculation_kwargs
+) -> t.Optional[str]:
+    """Return the key of the feature importance of the model on the dataset, or None if it can't be fingerprinted.
+
+    Parameters
+    ----------
+    model : Any
+        the model, fingerprinted by its pickle unless a model_version is given
+    dataset : Dataset
+        the dataset the importance is calculated on
+    model_version : Optional[str] , default: None
+        user-supplied version identifying the model
+    **calculation_kwargs
+        parameters of the importance calculation
+
+    Returns
+    -------
+    Optional[str]
+        the key of the feature importance
+    """
+    model_fingerprint = f'version:{model_version}' if model_version is not None else hash_object(model)
+    data_fingerprint = dataset_fingerprint(dataset)
+    kwargs_fingerprint = hash_object(sorted(calculation_kwargs.items()))
+    if model_fingerprint is None or data_fingerprint is None or kwargs_fingerprint is None:
+        return None
+    return hash_object((model_fingerprint, data_fingerprint, kwargs_fingerprint))
+
+
+def _cache_key(key: str) -> str:
+    return f'importance-{key}'
+
+
+def load_importance(
+    key: str,
+    cache: t.Union[ResultCache, str, os.PathLike, None] = None
+) -> t.Optional[pd.Series]:
+    """Return the stored feature importance of the key, from memory or else from the on-disk cache, or None."""
+    with _memory_store_lock:
+        if key in _memory_store:
+            _memory_store.move_to_end(key)
+            return _memory_store[key].copy()
+    if cache is None:
+        return None
+    importance = ResultCache.from_argument(cache).load(_cache_key(key))
+    if importance is None:
+        return None
+    _remember(key, importance)
+    return importance.copy()
+
+
+def save_importance(key: str, importance: pd.Series, cache: t.Union[ResultCache, str, os.PathLike, None] = None):
+    """Store the feature importance of the key in memory, and in the on-disk cache if given.
+
+    The on-disk cache is a ResultCache, or the directory of one, so its entries are bounded by the cache size.
+    """
+    _remember(key, importance.copy())
+    if cache is not None:
+        ResultCache.from_argument(cache).store(_cache_key(key), importance)
+
+
+def _remember(key: str, importance: pd.Series):
+    with _memory_store_lock:
+        _memory_store[key] = importance
+        _memory_store.move_to_end(key)
+        while len(_memory_store) > MEMORY_STORE_SIZE:
+            _memory_store.popitem(last=False)
+
+
+def clear_memory_store():
+    """Remove all the feature importance stored in memory."""
+    with _memory_store_lock:
+        _memory_store.clear()
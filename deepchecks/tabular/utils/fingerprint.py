@@ -0,0 +1,94 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Utils module for fingerprinting the data and model checks run on."""
+import hashlib
+import typing as t
+
+import pandas as pd
+
+from deepchecks.core.result_cache import hash_object
+from deepchecks.tabular.dataset import Dataset
+
+__all__ = ['dataframe_fingerprint', 'dataset_fingerprint', 'run_fingerprint']
+
+
+def dataframe_fingerprint(df: pd.DataFrame) -> t.Optional[str]:
+    """Return a fingerprint of the dataframe contents, or None if it can't be hashed.
+
+    The values are hashed column by column with pandas vectorized hashing, and the columns names and dtypes are
+    hashed along with them.
+    """
+    try:
+        values_hash = pd.util.hash_pandas_object(df, index=True).values
+    except TypeError:
+        # Columns holding unhashable objects, such as lists
+        return hash_object(df)
+    digest = hashlib.sha256(values_hash.tobytes())
+    schema = hash_object((list(df.columns), [str(dtype) for dtype in df.dtypes], list(df.index.names)))
+    if schema is None:
+        return None
+    digest.update(schema.encode())
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(dataset: t.Union[Dataset, pd.DataFrame, None]) -> t.Optional[str]:
+    """Return a fingerprint of the dataset contents and metadata, or None if it can't be fingerprinted."""
+    if dataset is None:
+        return 'None'
+    if isinstance(dataset, pd.DataFrame):
+        return dataframe_fingerprint(dataset)
+    if type(dataset) is not Dataset:  # pylint: disable=unidiomatic-typecheck
+        # Datasets not held in memory, such as chunked datasets, can't be fingerprinted cheaply
+        return None
+    data_fingerprint = dataframe_fingerprint(dataset.data)
+    if data_fingerprint is None:
+        return None
+    # pylint: disable=protected-access
+    return hash_object((data_fingerprint, dataset.label_name, dataset.features, dataset.cat_features,
+                        dataset.index_name, dataset.datetime_name, dataset.label_type,
+                        dataset._set_index_from_dataframe_index, dataset._set_datetime_from_dataframe_index))
+
+
+def run_fingerprint(
+    train_dataset: t.Union[Dataset, pd.DataFrame, None],
+    test_dataset: t.Union[Dataset, pd.DataFrame, None],
+    model: t.Any,
+    model_version: t.Optional[str] = None,
+    **context_kwargs
+) -> t.Optional[str]:
+    """Return a fingerprint of all the inputs of a check run, or None if one of them can't be fingerprinted.
+
+    Parameters
+    ----------
+    train_dataset : Union[Dataset, pd.DataFrame, None]
+        the train dataset
+    test_dataset : Union[Dataset, pd.DataFrame, None]
+        the test dataset
+    model : Any
+        the model, fingerprinted by its pickle unless a model_version is given
+    model_version : Optional[str] , default: None
+        user-supplied version identifying the model
+    **context_kwargs
+        the rest of the context parameters, such as scorers or static predictions
+
+    Returns
+    -------
+    Optional[str]
+        fingerprint of the run
+    """
+    fingerprints = [dataset_fingerprint(train_dataset), dataset_fingerprint(test_dataset)]
+    if model_version is not None:
+        fingerprints.append(f'version:{model_version}')
+    else:
+        fingerprints.append(hash_object(model))
+    fingerprints.append(hash_object(sorted(context_kwargs.items())))
+    if any(fingerprint is None for fingerprint in fingerprints):
+        return None
+    return hash_object(fingerprints)
@@ -18,7 +18,7 @@ from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.typing import Hashable
 from deepchecks.utils.validation import ensure_hashable_or_mutable_sequence
 
-__all__ = ['validate_columns_exist', 'select_from_dataframe', 'un_numpy']
+__all__ = ['validate_columns_exist', 'select_from_dataframe', 'un_numpy', 'merge_value_counts']
 
 
 def un_numpy(val):
@@ -126,3 +126,22 @@ def select_from_dataframe(
         return df.drop(labels=ignore_columns, axis='columns')
     else:
         return df
+
+
+def merge_value_counts(value_counts: t.Sequence[pd.Series]) -> pd.Series:
+    """Merge value counts of chunks of the same data into the value counts of the whole data.
+
+    Parameters
+    ----------
+    value_counts : Sequence[pd.Series]
+        value counts of each chunk, as returned by pd.Series.value_counts.
+
+    Returns
+    -------
+    pd.Series
+        the summed counts of each value, sorted by count in descending order.
+    """
+    if len(value_counts) == 1:
+        return value_counts[0]
+    merged = pd.concat(value_counts).groupby(level=0, sort=False, dropna=False).sum()
+    return merged.sort_values(ascending=False, kind='mergesort')
@@ -10,12 +10,11 @@
 #
 """Common utilities for distribution checks."""
 from numbers import Number
-from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from plotly.subplots import make_subplots
-from scipy.stats import chi2_contingency, wasserstein_distance
+from scipy.stats import chi2_contingency
 
 from deepchecks import ConditionCategory, ConditionResult
 from deepchecks.core.errors import DeepchecksValueError, NotEnoughSamplesError
@@ -24,8 +23,8 @@ from deepchecks.utils.distribution.plot import drift_score_bar_traces, feature_d
 from deepchecks.utils.distribution.preprocessing import preprocess_2_cat_cols_to_same_bins
 from deepchecks.utils.strings import format_number, format_percent
 
-__all__ = ['calc_drift_and_plot', 'get_drift_method', 'SUPPORTED_CATEGORICAL_METHODS', 'SUPPORTED_NUMERIC_METHODS',
-           'drift_condition']
+__all__ = ['calc_drift_and_plot', 'calc_drift_scores', 'calc_drift_distributions', 'drift_plot', 'get_drift_method',
+           'SUPPORTED_CATEGORICAL_METHODS', 'SUPPORTED_NUMERIC_METHODS', 'drift_condition']
 
 
 PSI_MIN_PERCENTAGE = 0.01
@@ -77,10 +76,15 @@ def cramers_v(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.S
 
     """
     dist1_counts, dist2_counts, _ = preprocess_2_cat_cols_to_same_bins(dist1=dist1, dist2=dist2)
-    contingency_matrix = pd.DataFrame([dist1_counts, dist2_counts])
+    return _cramers_v_from_counts(dist1_counts, dist2_counts)
+
+
+def _cramers_v_from_counts(dist1_counts: np.ndarray, dist2_counts: np.ndarray) -> float:
+    """Calculate the bias-corrected Cramer's V statistic from the category counts of two distributions."""
+    contingency_matrix = np.array([dist1_counts, dist2_counts])
 
     chi2 = chi2_contingency(contingency_matrix)[0]
-    n = contingency_matrix.sum().sum()
+    n = contingency_matrix.sum()
     phi2 = chi2/n
     r, k = contingency_matrix.shape
 
@@ -112,15 +116,10 @@ def psi(expected_percents: np.ndarray, actual_percents: np.ndarray):
         The PSI score
 
     """
-    psi_value = 0
-    for i in range(len(expected_percents)):
-        # In order for the value not to diverge, we cap our min percentage value
-        e_perc = max(expected_percents[i], PSI_MIN_PERCENTAGE)
-        a_perc = max(actual_percents[i], PSI_MIN_PERCENTAGE)
-        value = (e_perc - a_perc) * np.log(e_perc / a_perc)
-        psi_value += value
-
-    return psi_value
+    # In order for the value not to diverge, we cap our min percentage value
+    e_perc = np.maximum(expected_percents, PSI_MIN_PERCENTAGE)
+    a_perc = np.maximum(actual_percents, PSI_MIN_PERCENTAGE)
+    return np.sum((e_perc - a_perc) * np.log(e_perc / a_perc))
 
 
 def earth_movers_distance(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series],
@@ -153,27 +152,250 @@ def earth_movers_distance(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.n
         if the value of margin_quantile_filter is not in range [0, 0.5)
 
     """
+    _validate_margin_quantile_filter(margin_quantile_filter)
+    return _sorted_earth_movers_distance(np.sort(dist1), np.sort(dist2), margin_quantile_filter)
+
+
+def _validate_margin_quantile_filter(margin_quantile_filter: float):
     if not isinstance(margin_quantile_filter, Number) or margin_quantile_filter < 0 or margin_quantile_filter >= 0.5:
         raise DeepchecksValueError(
             f'margin_quantile_filter expected a value in range [0, 0.5), instead got {margin_quantile_filter}')
 
+
+def _filter_sorted_margins(dist: np.ndarray, qt_min: float, qt_max: float) -> np.ndarray:
+    """Return the values of a sorted array within [qt_min, qt_max], which are a contiguous slice of it."""
+    return dist[np.searchsorted(dist, qt_min, 'left'):np.searchsorted(dist, qt_max, 'right')]
+
+
+def _sorted_earth_movers_distance(dist1: np.ndarray, dist2: np.ndarray, margin_quantile_filter: float,
+                                  dist1_quantiles: Optional[np.ndarray] = None,
+                                  dist2_quantiles: Optional[np.ndarray] = None):
+    """Calculate the Earth Movers Distance of two sorted float arrays.
+
+    Same as scipy's wasserstein_distance on the filtered and scaled distributions, without sorting them again.
+    Quantiles of the margins, if already known, can be passed in order not to calculate them for every column.
+    """
     if margin_quantile_filter != 0:
-        dist1_qt_min, dist1_qt_max = np.quantile(dist1, [margin_quantile_filter, 1-margin_quantile_filter])
-        dist2_qt_min, dist2_qt_max = np.quantile(dist2, [margin_quantile_filter, 1-margin_quantile_filter])
-        dist1 = dist1[(dist1_qt_max >= dist1) & (dist1 >= dist1_qt_min)]
-        dist2 = dist2[(dist2_qt_max >= dist2) & (dist2 >= dist2_qt_min)]
+        quantiles = [margin_quantile_filter, 1-margin_quantile_filter]
+        if dist1_quantiles is None:
+            dist1_quantiles = np.quantile(dist1, quantiles)
+        if dist2_quantiles is None:
+            dist2_quantiles = np.quantile(dist2, quantiles)
+        dist1 = _filter_sorted_margins(dist1, *dist1_quantiles)
+        dist2 = _filter_sorted_margins(dist2, *dist2_quantiles)
 
-    val_max = np.max([np.max(dist1), np.max(dist2)])
-    val_min = np.min([np.min(dist1), np.min(dist2)])
+    val_max = max(dist1[-1], dist2[-1])
+    val_min = min(dist1[0], dist2[0])
 
     if val_max == val_min:
         return 0
 
-    # Scale the distribution between 0 and 1:
+    # Scale the distribution between 0 and 1, which keeps them sorted:
     dist1 = (dist1 - val_min) / (val_max - val_min)
     dist2 = (dist2 - val_min) / (val_max - val_min)
 
-    return wasserstein_distance(dist1, dist2)
+    all_values = np.concatenate((dist1, dist2))
+    all_values.sort(kind='mergesort')
+    deltas = np.diff(all_values)
+    dist1_cdf = dist1.searchsorted(all_values[:-1], 'right') / dist1.size
+    dist2_cdf = dist2.searchsorted(all_values[:-1], 'right') / dist2.size
+    return np.sum(np.multiply(np.abs(dist1_cdf - dist2_cdf), deltas))
+
+
+def _sorted_numeric_columns(df: pd.DataFrame, columns: List[Hashable], margin_quantile_filter: float
+                            ) -> Dict[Hashable, Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """Sort all the given columns at once, returning the sorted values of each column and their margin quantiles."""
+    values = np.sort(df[columns].to_numpy(dtype='float', na_value=np.nan), axis=0)
+    # Missing values are sorted last
+    counts = np.count_nonzero(~np.isnan(values), axis=0)
+
+    quantiles = [None] * len(columns)
+    if margin_quantile_filter != 0 and columns:
+        # Quantiles of all the columns without missing values are calculated in a single pass
+        with np.errstate(invalid='ignore'):
+            quantiles = np.quantile(values, [margin_quantile_filter, 1-margin_quantile_filter], axis=0).T
+
+    return {column: (values[:counts[i], i], quantiles[i] if counts[i] == len(values) else None)
+            for i, column in enumerate(columns)}
+
+
+def _numeric_drift_scores(train_df: pd.DataFrame, test_df: pd.DataFrame, columns: List[Hashable],
+                          margin_quantile_filter: float, train_distributions: Dict[Hashable, np.ndarray]
+                          ) -> Dict[Hashable, float]:
+    """Calculate the Earth Movers Distance of all numerical columns together."""
+    train_sorted = {column: (train_distributions[column], None) for column in columns if column in train_distributions}
+    train_sorted.update(_sorted_numeric_columns(train_df, [column for column in columns if column not in train_sorted],
+                                                margin_quantile_filter))
+    test_sorted = _sorted_numeric_columns(test_df, columns, margin_quantile_filter)
+
+    scores = {}
+    for column in columns:
+        train_values, train_quantiles = train_sorted[column]
+        test_values, test_quantiles = test_sorted[column]
+        scores[column] = _sorted_earth_movers_distance(train_values, test_values, margin_quantile_filter,
+                                                       train_quantiles, test_quantiles)
+    return scores
+
+
+def _category_counts(column: pd.Series) -> pd.Series:
+    """Count the categories of a column without missing values using their integer codes."""
+    codes, categories = pd.factorize(column)
+    return pd.Series(np.bincount(codes, minlength=len(categories)), index=pd.Index(np.asarray(categories)))
+
+
+def _align_category_counts(train_counts: pd.Series, test_counts: pd.Series) -> Tuple[np.ndarray, np.ndarray, List]:
+    """Return the counts of two distributions over the union of their categories, and the categories list."""
+    positions = train_counts.index.get_indexer(test_counts.index)
+    new_categories = positions == -1
+    n_new_categories = np.count_nonzero(new_categories)
+    positions[new_categories] = len(train_counts) + np.arange(n_new_categories)
+
+    categories = list(train_counts.index) + list(test_counts.index[new_categories])
+    dist1_counts = np.append(train_counts.to_numpy(), np.zeros(n_new_categories, dtype=int))
+    dist2_counts = np.zeros(len(categories), dtype=int)
+    dist2_counts[positions] = test_counts.to_numpy()
+    return dist1_counts, dist2_counts, categories
+
+
+def _psi_from_counts(train_counts: np.ndarray, test_counts: np.ndarray, categories: List,
+                     max_num_categories: Optional[int]) -> float:
+    """Calculate the PSI from category counts, binning the smaller differences as preprocess_2_cat_cols_to_same_bins."""
+    train_size, test_size = train_counts.sum(), test_counts.sum()
+    if max_num_categories is not None and len(categories) > max_num_categories:
+        differences = np.abs(train_counts - test_counts)
+        top_categories = sorted(range(len(categories)), key=lambda i: (-differences[i], categories[i]))
+        top_categories = top_categories[:max_num_categories]
+        train_counts = np.append(train_counts[top_categories], train_size - train_counts[top_categories].sum())
+        test_counts = np.append(test_counts[top_categories], test_size - test_counts[top_categories].sum())
+    return psi(expected_percents=train_counts / train_size, actual_percents=test_counts / test_size)
+
+
+def calc_drift_distributions(df: pd.DataFrame,
+                             column_types: Dict[Hashable, str]) -> Dict[Hashable, Union[np.ndarray, pd.Series]]:
+    """
+    Calculate the distributions the drift scores of the given columns are calculated on.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        data to calculate the distributions of
+    column_types: Dict[Hashable, str]
+        the columns, mapped to their type (either "numerical" or "categorical")
+    Returns
+    -------
+    Dict[Hashable, Union[np.ndarray, pd.Series]]
+        sorted values (without missing values) of each numerical column, and counts of each category of each
+        categorical column
+    """
+    numerical_columns = [column for column, column_type in column_types.items() if column_type == 'numerical']
+    distributions = {column: values.copy()
+                     for column, (values, _) in _sorted_numeric_columns(df, numerical_columns, 0).items()}
+    for column, column_type in column_types.items():
+        if column_type == 'categorical':
+            distributions[column] = _category_counts(df[column].dropna())
+    return {column: distributions[column] for column in column_types}
+
+
+def calc_drift_scores(train_df: pd.DataFrame,
+                      test_df: pd.DataFrame,
+                      column_types: Dict[Hashable, str],
+                      margin_quantile_filter: float = 0.025,
+                      max_num_categories_for_drift: int = 10,
+                      categorical_drift_method='cramer_v',
+                      min_samples: int = 10,
+                      train_distributions: Optional[Dict[Hashable, Union[np.ndarray, pd.Series]]] = None
+                      ) -> Dict[Hashable, Tuple[float, str]]:
+    """
+    Calculate the drift scores of multiple columns together.
+
+    Numerical columns are sorted all at once and scored with the Earth Movers Distance on the sorted values, and
+    categorical columns are scored on the counts of their categories' codes. Scores are the same as the ones returned
+    by calc_drift_and_plot for each column.
+
+    Parameters
+    ----------
+    train_df: pd.DataFrame
+        train data
+    test_df: pd.DataFrame
+        test data with the same columns as the train data
+    column_types: Dict[Hashable, str]
+        the columns to score, mapped to their type (either "numerical" or "categorical")
+    margin_quantile_filter: float, default: 0.025
+        float in range [0,0.5), representing which margins (high and low quantiles) of the distribution will be filtered
+        out of the EMD calculation. This is done in order for extreme values not to affect the calculation
+        disproportionally. This filter is applied to both distributions, in both margins.
+    max_num_categories_for_drift: int, default: 10
+        Max number of allowed categories. If there are more, they are binned into an "Other" category.
+    categorical_drift_method: str, default: "cramer_v"
+        decides which method to use on categorical variables. Possible values are:
+        "cramers_v" for Cramer's V, "PSI" for Population Stability Index (PSI).
+    min_samples: int, default: 10
+        Minimum number of samples for each column in order to calculate draft
+    train_distributions: Optional[Dict[Hashable, Union[np.ndarray, pd.Series]]], default: None
+        distributions of train_df columns, as returned by calc_drift_distributions. These columns are not scanned
+        again in train_df.
+    Returns
+    -------
+    Dict[Hashable, Tuple[float, str]]
+        drift score and scoring method of each column, in the order of column_types
+
+    Raises
+    ------
+    NotEnoughSamplesError
+        if any of the columns has less than min_samples non-missing values in one of the datasets
+    """
+    train_distributions = train_distributions or {}
+    for column, column_type in column_types.items():
+        if column_type not in ('numerical', 'categorical'):
+            # Should never reach here
+            raise DeepchecksValueError(f'Unsupported column type for drift: {column_type}')
+        if column not in train_distributions:
+            train_size = train_df[column].count()
+        elif column_type == 'numerical':
+            train_size = len(train_distributions[column])
+        else:
+            train_size = train_distributions[column].sum()
+        test_size = test_df[column].count()
+        if train_size < min_samples or test_size < min_samples:
+            raise NotEnoughSamplesError(f'For drift need {min_samples} samples but got {train_size} for train '
+                                        f'and {test_size} for test')
+
+    numerical_columns = [column for column, column_type in column_types.items() if column_type == 'numerical']
+    categorical_columns = [column for column, column_type in column_types.items() if column_type == 'categorical']
+
+    scores = {}
+    if numerical_columns:
+        _validate_margin_quantile_filter(margin_quantile_filter)
+        numerical_scores = _numeric_drift_scores(train_df, test_df, numerical_columns, margin_quantile_filter,
+                                                 train_distributions)
+        scores.update({column: (score, 'Earth Mover\'s Distance') for column, score in numerical_scores.items()})
+
+    if categorical_columns and categorical_drift_method not in ('cramer_v', 'PSI'):
+        raise ValueError('Excpected categorical_drift_method to be one '
+                         f'of [Cramer, PSI], recieved: {categorical_drift_method}')
+
+    def train_counts(column):
+        if column in train_distributions:
+            return train_distributions[column]
+        return _category_counts(train_df[column].dropna())
+
+    for column in categorical_columns:
+        train_column, test_column = train_df[column], test_df[column]
+        if categorical_drift_method == 'cramer_v':
+            counts = _align_category_counts(train_counts(column), _category_counts(test_column.dropna()))
+            scores[column] = (_cramers_v_from_counts(*counts[:2]), 'Cramer\'s V')
+        elif test_column.hasnans or train_column.hasnans:
+            # PSI is calculated on the whole columns, so missing values are kept the way they always were
+            expected, actual, _ = \
+                preprocess_2_cat_cols_to_same_bins(dist1=train_column, dist2=test_column,
+                                                   max_num_categories=max_num_categories_for_drift)
+            score = psi(expected_percents=expected / len(train_column), actual_percents=actual / len(test_column))
+            scores[column] = (score, 'PSI')
+        else:
+            counts = _align_category_counts(train_counts(column), _category_counts(test_column))
+            scores[column] = (_psi_from_counts(*counts, max_num_categories_for_drift), 'PSI')
+
+    return {column: scores[column] for column in column_types}
 
 
 def calc_drift_and_plot(train_column: pd.Series,
@@ -186,7 +408,8 @@ def calc_drift_and_plot(train_column: pd.Series,
                         max_num_categories_for_display: int = 10,
                         show_categories_by: str = 'largest_difference',
                         categorical_drift_method='cramer_v',
-                        min_samples: int = 10) -> Tuple[float, str, Callable]:
+                        min_samples: int = 10,
+                        with_display: bool = True) -> Tuple[float, str, Optional[Callable]]:
     """
     Calculate drift score per column.
 
@@ -221,53 +444,100 @@ def calc_drift_and_plot(train_column: pd.Series,
         "cramers_v" for Cramer's V, "PSI" for Population Stability Index (PSI).
     min_samples: int, default: 10
         Minimum number of samples for each column in order to calculate draft
+    with_display: bool, default: True
+        flag that determines if the graph should be created, if False only the drift score is calculated
     Returns
     -------
-    Tuple[float, str, Callable]
+    Tuple[float, str, Optional[Callable]]
         drift score of the difference between the two columns' distributions (Earth movers distance for
         numerical, PSI for categorical)
+        graph comparing the two distributions (density for numerical, stack bar for categorical), None if
+        with_display is False
+    """
+    score, scorer_name = calc_drift_scores(
+        train_df=pd.DataFrame({value_name: train_column}),
+        test_df=pd.DataFrame({value_name: test_column}),
+        column_types={value_name: column_type},
+        margin_quantile_filter=margin_quantile_filter,
+        max_num_categories_for_drift=max_num_categories_for_drift,
+        categorical_drift_method=categorical_drift_method,
+        min_samples=min_samples
+    )[value_name]
+
+    if not with_display:
+        return score, scorer_name, None
+
+    return score, scorer_name, drift_plot(
+        train_column=train_column,
+        test_column=test_column,
+        value_name=value_name,
+        column_type=column_type,
+        score=score,
+        scorer_name=scorer_name,
+        plot_title=plot_title,
+        max_num_categories_for_display=max_num_categories_for_display,
+        show_categories_by=show_categories_by
+    )
+
+
+def drift_plot(train_column: pd.Series,
+               test_column: pd.Series,
+               value_name: Hashable,
+               column_type: str,
+               score: float,
+               scorer_name: str,
+               plot_title: Optional[str] = None,
+               max_num_categories_for_display: int = 10,
+               show_categories_by: str = 'largest_difference') -> Callable:
+    """
+    Create the drift graph of a column, showing its drift score and distribution in both datasets.
+
+    Parameters
+    ----------
+    train_column: pd.Series
+        column from train dataset
+    test_column: pd.Series
+        same column from test dataset
+    value_name: Hashable
+        title of the x axis, if plot_title is None then also the title of the whole plot.
+    column_type: str
+        type of column (either "numerical" or "categorical")
+    score: float
+        drift score of the column, as calculated by calc_drift_scores
+    scorer_name: str
+        name of the drift scoring method
+    plot_title: str or None
+        if None use value_name as title otherwise use this.
+    max_num_categories_for_display: int, default: 10
+        Max number of categories to show in plot.
+    show_categories_by: str, default: 'largest_difference'
+        Specify which categories to show for categorical features' graphs, as the number of shown categories is limited
+        by max_num_categories_for_display. Possible values:
+        - 'train_largest': Show the largest train categories.
+        - 'test_largest': Show the largest test categories.
+        - 'largest_difference': Show the largest difference between categories.
+    Returns
+    -------
+    Callable
         graph comparing the two distributions (density for numerical, stack bar for categorical)
     """
+    from plotly.subplots import make_subplots  # pylint: disable=import-outside-toplevel
+
     train_dist = train_column.dropna().values.reshape(-1)
     test_dist = test_column.dropna().values.reshape(-1)
 
-    if len(train_dist) < min_samples or len(test_dist) < min_samples:
-        raise NotEnoughSamplesError(f'For drift need {min_samples} samples but got {len(train_dist)} for train '
-                                    f'and {len(test_dist)} for test')
-
     if column_type == 'numerical':
-        scorer_name = 'Earth Mover\'s Distance'
-
         train_dist = train_dist.astype('float')
         test_dist = test_dist.astype('float')
-
-        score = earth_movers_distance(dist1=train_dist, dist2=test_dist, margin_quantile_filter=margin_quantile_filter)
         bar_traces, bar_x_axis, bar_y_axis = drift_score_bar_traces(score)
-
         dist_traces, dist_x_axis, dist_y_axis = feature_distribution_traces(train_dist, test_dist, value_name)
-    elif column_type == 'categorical':
-        if categorical_drift_method == 'cramer_v':
-            scorer_name = 'Cramer\'s V'
-            score = cramers_v(dist1=train_dist, dist2=test_dist)
-        elif categorical_drift_method == 'PSI':
-            scorer_name = 'PSI'
-            expected, actual, _ = \
-                preprocess_2_cat_cols_to_same_bins(dist1=train_column, dist2=test_column,
-                                                   max_num_categories=max_num_categories_for_drift)
-            expected_percents, actual_percents = expected / len(train_column), actual / len(test_column)
-            score = psi(expected_percents=expected_percents, actual_percents=actual_percents)
-        else:
-            raise ValueError('Excpected categorical_drift_method to be one '
-                             f'of [Cramer, PSI], recieved: {categorical_drift_method}')
+    else:
         bar_traces, bar_x_axis, bar_y_axis = drift_score_bar_traces(score, bar_max=1)
         dist_traces, dist_x_axis, dist_y_axis = feature_distribution_traces(
             train_dist, test_dist, value_name, is_categorical=True,
             max_num_categories=max_num_categories_for_display,
             show_categories_by=show_categories_by
         )
-    else:
-        # Should never reach here
-        raise DeepchecksValueError(f'Unsupported column type for drift: {column_type}')
 
     all_categories = list(set(train_column).union(set(test_column)))
     add_footnote = column_type == 'categorical' and len(all_categories) > max_num_categories_for_display
@@ -314,7 +584,7 @@ def calc_drift_and_plot(train_column: pd.Series,
         title=dict(text=plot_title or value_name, x=0.5, xanchor='center'),
         bargroupgap=0)
 
-    return score, scorer_name, fig
+    return fig
 
 
 def drift_condition(max_allowed_categorical_score: float,
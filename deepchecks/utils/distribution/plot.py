@@ -9,13 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """A module containing utils for plotting distributions."""
+# pylint: disable=import-outside-toplevel
 import typing as t
 from functools import cmp_to_key
 from numbers import Number
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objs as go
 from scipy.stats import gaussian_kde
 from typing_extensions import Literal as L
 
@@ -28,6 +28,9 @@ from deepchecks.utils.dataframes import un_numpy
 from deepchecks.utils.distribution.preprocessing import preprocess_2_cat_cols_to_same_bins
 from deepchecks.utils.plot import colors
 
+if t.TYPE_CHECKING:
+    import plotly.graph_objs as go
+
 # For numerical plots, below this number of unique values we draw bar plots, else KDE
 MAX_NUMERICAL_UNIQUE_FOR_BARS = 20
 # For numerical plots, where the total unique is above MAX_NUMERICAL_UNIQUE_FOR_BARS, if any of the single
@@ -60,7 +63,7 @@ def get_density(data, xs) -> np.ndarray:
     return density(xs)
 
 
-def drift_score_bar_traces(drift_score: float, bar_max: float = None) -> Tuple[List[go.Bar], Dict, Dict]:
+def drift_score_bar_traces(drift_score: float, bar_max: float = None) -> Tuple[List['go.Bar'], Dict, Dict]:
     """Create a traffic light bar traces for drift score.
 
     Parameters
@@ -74,6 +77,8 @@ def drift_score_bar_traces(drift_score: float, bar_max: float = None) -> Tuple[L
     Tuple[List[go.Bar], Dict, Dict]
         list of plotly bar traces.
     """
+    import plotly.graph_objs as go
+
     traffic_light_colors = [((0, 0.1), '#01B8AA'),
                             ((0.1, 0.2), '#F2C80F'),
                             ((0.2, 0.3), '#FE9666'),
@@ -135,7 +140,7 @@ def feature_distribution_traces(
     max_num_categories: int = 10,
     show_categories_by: CategoriesSortingKind = 'largest_difference',
     quantile_cut: float = 0.02
-) -> Tuple[List[go.Trace], Dict, Dict]:
+) -> Tuple[List['go.Trace'], Dict, Dict]:
     """Create traces for comparison between train and test column.
 
     Parameters
@@ -170,6 +175,8 @@ def feature_distribution_traces(
     Dict
         general layout
     """
+    import plotly.graph_objs as go
+
     if is_categorical:
         n_of_categories = len(set(train_column).union(test_column))
         range_max = (
@@ -276,6 +283,8 @@ def _create_bars_data_for_mixed_kde_plot(counts: np.ndarray, max_kde_value: floa
 
 
 def _create_distribution_scatter_plot(xs, ys, mean, median, is_train):
+    import plotly.graph_objs as go
+
     traces = []
     name = 'Train' if is_train else 'Test'
     traces.append(go.Scatter(x=xs, y=ys, fill='tozeroy', name=f'{name} Dataset',
@@ -303,6 +312,8 @@ def _create_distribution_bar_graphs(
     Tuple[Any, Any]:
         a tuple instance with figues traces, yaxis layout
     """
+    import plotly.graph_objs as go
+
     expected, actual, categories_list = preprocess_2_cat_cols_to_same_bins(
         dist1=train_column,
         dist2=test_column
@@ -13,23 +13,24 @@
 
 # TODO: move tabular functionality to the tabular sub-package
 
+import threading
 import time
 import typing as t
 import warnings
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 from pandas.core.dtypes.common import is_float_dtype, is_numeric_dtype
-from sklearn.inspection import permutation_importance
 from sklearn.pipeline import Pipeline
 
 from deepchecks import tabular
 from deepchecks.core import errors
+from deepchecks.core.result_cache import ResultCache
 from deepchecks.tabular.utils.validation import validate_model
 from deepchecks.utils.metrics import DeepcheckScorer, get_default_scorers, init_validate_scorers, task_type_check
 from deepchecks.utils.typing import Hashable
-from deepchecks.utils.validation import ensure_hashable_or_mutable_sequence
+from deepchecks.utils.validation import ensure_hashable_or_mutable_sequence, validate_n_jobs
 
 __all__ = [
     'calculate_feature_importance',
@@ -50,6 +51,8 @@ def calculate_feature_importance_or_none(
         dataset: t.Union['tabular.Dataset', pd.DataFrame],
         force_permutation: bool = False,
         permutation_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
+        model_version: t.Optional[str] = None,
+        store_cache: t.Union[ResultCache, str, None] = None
 ) -> t.Tuple[t.Optional[pd.Series], t.Optional[str]]:
     """Calculate features effect on the label or None if the input is incorrect.
 
@@ -63,6 +66,12 @@ def calculate_feature_importance_or_none(
         force permutation importance calculation
     permutation_kwargs : t.Optional[t.Dict[str, t.Any]] , default: None
         kwargs for permutation importance calculation
+    model_version : t.Optional[str] , default: None
+        version identifying the model in the store of permutation importance. If not given, the model is identified
+        by its pickle.
+    store_cache : t.Union[ResultCache, str, None] , default: None
+        on-disk cache, or its directory, to store the permutation importance in, so it is shared between processes.
+        It is always stored in memory.
 
     Returns
     -------
@@ -80,6 +89,8 @@ def calculate_feature_importance_or_none(
             dataset=dataset,
             force_permutation=force_permutation,
             permutation_kwargs=permutation_kwargs,
+            model_version=model_version,
+            store_cache=store_cache
         )
 
         return fi, calculation_type
@@ -109,6 +120,8 @@ def calculate_feature_importance(
         dataset: t.Union['tabular.Dataset', pd.DataFrame],
         force_permutation: bool = False,
         permutation_kwargs: t.Dict[str, t.Any] = None,
+        model_version: t.Optional[str] = None,
+        store_cache: t.Union[ResultCache, str, None] = None
 ) -> t.Tuple[pd.Series, str]:
     """Calculate features effect on the label.
 
@@ -122,6 +135,12 @@ def calculate_feature_importance(
         force permutation importance calculation
     permutation_kwargs : t.Dict[str, t.Any] , default: None
         kwargs for permutation importance calculation
+    model_version : t.Optional[str] , default: None
+        version identifying the model in the store of permutation importance. If not given, the model is identified
+        by its pickle.
+    store_cache : t.Union[ResultCache, str, None] , default: None
+        on-disk cache, or its directory, to store the permutation importance in, so it is shared between processes.
+        It is always stored in memory.
 
     Returns
     -------
@@ -154,7 +173,8 @@ def calculate_feature_importance(
                                   'feature importance, please use the Dataset object.'
         else:
             try:
-                importance = _calc_permutation_importance(model, dataset, **permutation_kwargs)
+                importance = _stored_permutation_importance(model, dataset, permutation_kwargs, model_version,
+                                                            store_cache)
                 calc_type = 'permutation_importance'
             except errors.DeepchecksTimeoutError as e:
                 permutation_failure = f'{e.message}\n using model\'s built-in feature importance instead'
@@ -178,7 +198,8 @@ def calculate_feature_importance(
             pre_text = 'Could not find built-in feature importance on the model, '
         warnings.warn(pre_text + 'using permutation feature importance calculation instead')
 
-        importance = _calc_permutation_importance(model, dataset, **permutation_kwargs)
+        importance = _stored_permutation_importance(model, dataset, permutation_kwargs, model_version,
+                                                    store_cache)
         calc_type = 'permutation_importance'
 
     # If after all importance is still none raise error
@@ -211,7 +232,29 @@ def _built_in_importance(
     return None, None
 
 
-@lru_cache(maxsize=32)
+def _stored_permutation_importance(
+        model: t.Any,
+        dataset: 'tabular.Dataset',
+        permutation_kwargs: t.Dict[str, t.Any],
+        model_version: t.Optional[str],
+        store_cache: t.Union[ResultCache, str, None]
+) -> pd.Series:
+    """Return the stored permutation importance of the model on the dataset, or calculate and store it."""
+    # The store fingerprints datasets, so it can't be imported with this module
+    from deepchecks.tabular.utils import feature_importance_store  # pylint: disable=import-outside-toplevel
+
+    key = feature_importance_store.importance_key(model, dataset, model_version, **permutation_kwargs)
+    if key is not None:
+        importance = feature_importance_store.load_importance(key, store_cache)
+        if importance is not None:
+            return importance
+
+    importance = _calc_permutation_importance(model, dataset, **permutation_kwargs)
+    if key is not None:
+        feature_importance_store.save_importance(key, importance, store_cache)
+    return importance
+
+
 def _calc_permutation_importance(
         model: t.Any,
         dataset: 'tabular.Dataset',
@@ -220,10 +263,18 @@ def _calc_permutation_importance(
         random_state: int = 42,
         n_samples: int = 10_000,
         alternative_scorer: t.Optional[DeepcheckScorer] = None,
-        timeout: int = None
+        timeout: int = None,
+        n_jobs: int = -1,
+        min_repeats: int = 5,
+        tolerance: float = 0.05
 ) -> pd.Series:
     """Calculate permutation feature importance. Return nonzero value only when std doesn't mask signal.
 
+    The features are permuted in rounds, each round scoring the model once for every feature which has not yet
+    converged. A feature converges once the 95% confidence interval of its importance is narrower than `tolerance`
+    times the largest importance, and it isn't permuted anymore. The permutations are the same as the ones of
+    scikit-learn's `permutation_importance`, so without early stopping the importance is the same.
+
     Parameters
     ----------
     model: t.Any
@@ -231,7 +282,7 @@ def _calc_permutation_importance(
     dataset: tabular.Dataset
         dataset used to fit the model
     n_repeats: int, default: 30
-        Number of times to permute a feature
+        Maximal number of times to permute a feature
     mask_high_variance_features : bool , default: False
         If true, features for which calculated permutation importance values
         varied greatly would be returned has having 0 feature importance
@@ -244,10 +295,17 @@ def _calc_permutation_importance(
         Scorer to use for evaluation of the model performance in the permutation_importance function. If not defined,
         the default deepchecks scorers are used.
     timeout: int, default: None
-        Allowed runtime of permutation_importance, in seconds. As we can't limit the actual runtime of the function,
-        the timeout parameter is used for estimation of the runtime, done be measuring the inference time of the model
-        and multiplying it by number of repeats and features. If the expected runtime is bigger than timeout, the
-        calculation is skipped.
+        Allowed runtime of permutation_importance, in seconds. If a single round of permutations is projected to
+        take longer than timeout, measured by the inference time of the model, the calculation is skipped.
+        Otherwise, the calculation stops when the timeout is reached and the importance is estimated from the
+        rounds which were completed.
+    n_jobs: int, default: -1
+        Number of threads scoring the permuted features concurrently. -1 means using all processors.
+    min_repeats: int, default: 5
+        Number of times every feature is permuted before checking whether its importance converged.
+    tolerance: float, default: 0.05
+        Width of the confidence interval of a feature importance, relative to the largest importance, under which
+        the feature is not permuted anymore. 0 disables early stopping.
 
     Returns
     -------
@@ -256,6 +314,7 @@ def _calc_permutation_importance(
     """
     if dataset.label_name is None:
         raise errors.DatasetValidationError("Expected dataset with label.")
+    n_workers = validate_n_jobs(n_jobs)
 
     if len(dataset.features) == 1:
         return pd.Series([1], index=dataset.features)
@@ -272,40 +331,51 @@ def _calc_permutation_importance(
         single_scorer_dict = {scorer_name: default_scorers[scorer_name]}
         scorer = init_validate_scorers(single_scorer_dict, model, dataset, model_type=task_type)[0]
 
+    features = dataset_sample.features_columns
+    label = dataset_sample.label_col
+
     start_time = time.time()
-    scorer(model, dataset_sample)
+    baseline_score = scorer.scorer(model, features, label)
     calc_time = time.time() - start_time
 
-    predicted_time_to_run = int(np.ceil(calc_time * n_repeats * len(dataset.features)))
+    predicted_time_to_run = int(np.ceil(calc_time * n_repeats * len(dataset.features) / n_workers))
 
     if timeout is not None:
-        if predicted_time_to_run > timeout:
+        # At least one round of permutations is needed for every feature to have an importance
+        predicted_round_time = int(np.ceil(calc_time * len(dataset.features) / n_workers))
+        if predicted_round_time > timeout:
             raise errors.DeepchecksTimeoutError(
                 f'Skipping permutation importance calculation: calculation was projected to finish in '
-                f'{predicted_time_to_run} seconds, but timeout was configured to {timeout} seconds')
+                f'{predicted_round_time} seconds, but timeout was configured to {timeout} seconds')
         else:
-            print(f'Calculating permutation feature importance. Expected to finish in {predicted_time_to_run} seconds')
+            print(f'Calculating permutation feature importance. Expected to finish in '
+                  f'{min(predicted_time_to_run, timeout)} seconds')
     else:
         warnings.warn(f'Calculating permutation feature importance without time limit. Expected to finish in '
                       f'{predicted_time_to_run} seconds')
 
-    r = permutation_importance(
-        model,
-        dataset_sample.features_columns,
-        dataset_sample.label_col,
-        n_repeats=n_repeats,
-        random_state=random_state,
-        n_jobs=-1,
-        scoring=scorer.scorer
-    )
-
+    importances = _permutation_scores(model, scorer.scorer, features, label, baseline_score, n_repeats, random_state,
+                                      n_workers, min_repeats, tolerance,
+                                      deadline=None if timeout is None else start_time + timeout)
+    n_repeats_done = np.array([len(feature_importances) for feature_importances in importances])
+    if (n_repeats_done == 0).any():
+        raise errors.DeepchecksTimeoutError(
+            f'Skipping permutation importance calculation: calculation did not finish a single round of permutations '
+            f'in {timeout} seconds')
+    if timeout is not None and time.time() - start_time > timeout:
+        warnings.warn(f'Permutation feature importance calculation reached the timeout of {timeout} seconds, the '
+                      f'importance is estimated from {n_repeats_done.min()} to {n_repeats_done.max()} permutations '
+                      f'of each feature')
+
+    importances_mean = np.array([np.mean(feature_importances) for feature_importances in importances])
+    importances_std = np.array([np.std(feature_importances) for feature_importances in importances])
     significance_mask = (
-        r.importances_mean - r.importances_std > 0
+        importances_mean - importances_std > 0
         if mask_high_variance_features
-        else r.importances_mean > 0
+        else importances_mean > 0
     )
 
-    feature_importances = r.importances_mean * significance_mask
+    feature_importances = importances_mean * significance_mask
     total = feature_importances.sum()
 
     if total != 0:
@@ -314,6 +384,77 @@ def _calc_permutation_importance(
     return pd.Series(feature_importances, index=dataset.features)
 
 
+def _permutation_scores(
+        model: t.Any,
+        scorer: t.Callable,
+        features: pd.DataFrame,
+        label: pd.Series,
+        baseline_score: float,
+        n_repeats: int,
+        random_state: int,
+        n_workers: int,
+        min_repeats: int,
+        tolerance: float,
+        deadline: t.Optional[float]
+) -> t.List[t.List[float]]:
+    """Return the decrease of the score when permuting each feature, for every permutation done before the deadline."""
+    # Same permutations as scikit-learn's permutation_importance: a single seed is drawn from the random state, and
+    # the rows of every feature are shuffled again on each repeat
+    rng = np.random.RandomState(np.random.RandomState(random_state).randint(np.iinfo(np.int32).max + 1))
+    shuffling_idx = np.arange(len(features))
+    permutation = np.arange(len(features))
+    columns = list(features.columns)
+    local = threading.local()
+
+    def score_permuted(task):
+        column_index, rows = task
+        if deadline is not None and time.time() > deadline:
+            return None
+        # Every thread permutes the columns of its own copy of the data
+        if not hasattr(local, 'features'):
+            local.features = features.copy()
+        column = columns[column_index]
+        local.features[column] = features[column].values[rows]
+        try:
+            return scorer(model, local.features, label)
+        finally:
+            local.features[column] = features[column].values
+
+    importances = [[] for _ in columns]
+    active = list(range(len(columns)))
+    executor = ThreadPoolExecutor(max_workers=n_workers) if n_workers > 1 else None
+    try:
+        for repeat in range(n_repeats):
+            rng.shuffle(shuffling_idx)
+            permutation = permutation[shuffling_idx]
+            tasks = [(column_index, permutation) for column_index in active]
+            scores = executor.map(score_permuted, tasks) if executor else map(score_permuted, tasks)
+
+            timed_out = False
+            for column_index, score in zip(active, scores):
+                if score is None:
+                    timed_out = True
+                else:
+                    importances[column_index].append(baseline_score - score)
+            if timed_out or not active:
+                break
+
+            if tolerance > 0 and repeat + 1 >= min_repeats:
+                means = np.array([np.mean(feature_importances) for feature_importances in importances])
+                max_importance = np.abs(means).max()
+                # Half width of the 95% confidence interval of the mean importance
+                half_widths = {column_index: 1.96 * np.std(importances[column_index]) / np.sqrt(repeat + 1)
+                               for column_index in active}
+                active = [column_index for column_index in active
+                          if half_widths[column_index] > tolerance * max_importance]
+                if not active:
+                    break
+    finally:
+        if executor:
+            executor.shutdown()
+    return importances
+
+
 def get_importance(name: str, feature_importances: pd.Series, ds: 'tabular.Dataset') -> int:
     """Return importance based on feature importance or label/date/index first."""
     if name in feature_importances.keys():
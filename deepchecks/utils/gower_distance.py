@@ -11,12 +11,13 @@
 """Module for calculating distance matrix via Gower method."""
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import OrdinalEncoder
 
-from deepchecks.utils.array_math import fast_sum_by_row
+from deepchecks.utils.validation import validate_n_jobs
 
 
 def gower_matrix(data: np.ndarray, cat_features: np.array) -> np.ndarray:
@@ -57,7 +58,8 @@ def gower_matrix(data: np.ndarray, cat_features: np.array) -> np.ndarray:
     return result
 
 
-def calculate_nearest_neighbours_distances(cat_data: pd.DataFrame, numeric_data: pd.DataFrame, num_neighbours: int):
+def calculate_nearest_neighbours_distances(cat_data: pd.DataFrame, numeric_data: pd.DataFrame, num_neighbours: int,
+                                           chunk_size: int = 2 ** 22, n_jobs: int = 1):
     """
     Calculate distance matrix for a dataset using Gower's method.
 
@@ -66,7 +68,8 @@ def calculate_nearest_neighbours_distances(cat_data: pd.DataFrame, numeric_data:
     categorical features it is an indicator whether the values are the same.
     See https://www.jstor.org/stable/2528823 for further details.
     This method minimizes memory usage by saving in memory and returning only the closest neighbours of each sample.
-    In addition, it can deal with missing values.
+    The distances are calculated in tiles of samples against the whole dataset, each tile is vectorized and the
+    tiles can be calculated concurrently. In addition, it can deal with missing values.
     Parameters
     ----------
     cat_data: pd.DataFrame
@@ -76,6 +79,11 @@ def calculate_nearest_neighbours_distances(cat_data: pd.DataFrame, numeric_data:
     num_neighbours: int
         Number of neighbours to return. For example, for n=2 for each sample returns the distances to the two closest
         samples in the dataset.
+    chunk_size: int , default: 2 ** 22
+        Maximum number of pairwise distances to calculate at once in a single tile. Memory usage is a few arrays of
+        chunk_size floats per concurrent tile.
+    n_jobs: int , default: 1
+        Number of tiles to calculate concurrently. -1 means using all processors.
     Returns
     -------
     numpy.ndarray
@@ -83,6 +91,7 @@ def calculate_nearest_neighbours_distances(cat_data: pd.DataFrame, numeric_data:
     numpy.ndarray
         representing the indexes of the nearest neighbours.
     """
+    n_workers = validate_n_jobs(n_jobs)
     num_samples = cat_data.shape[0]
     num_features = cat_data.shape[1] + numeric_data.shape[1]
     distances, indexes = np.zeros((num_samples, num_neighbours)), np.zeros((num_samples, num_neighbours))
@@ -94,32 +103,46 @@ def calculate_nearest_neighbours_distances(cat_data: pd.DataFrame, numeric_data:
     numeric_feature_ranges = np.nanmax(numeric_data, axis=0) - np.nanmin(numeric_data, axis=0)
     numeric_data = np.nan_to_num(numeric_data, nan=np.inf)
 
-    # do not warn on operations that include usage of math involving inf
-    original_error_state = np.geterr()['invalid']
-    np.seterr(invalid='ignore')
+    def calculate_tile(start: int):
+        end = min(start + tile_size, num_samples)
+        # do not warn on operations that include usage of math involving inf
+        with np.errstate(invalid='ignore'):
+            dist_to_samples = _calculate_distances_to_samples(start, end, cat_data, numeric_data,
+                                                              numeric_feature_ranges, num_features)
+        # partition to find the closest samples (including self), then order only the closest ones
+        min_dist_indexes = np.argpartition(dist_to_samples, num_neighbours, axis=1)[:, :num_neighbours]
+        min_dist = np.take_along_axis(dist_to_samples, min_dist_indexes, axis=1)
+        order = np.argsort(min_dist, axis=1, kind='stable')
+        indexes[start:end, :] = np.take_along_axis(min_dist_indexes, order, axis=1)
+        distances[start:end, :] = np.take_along_axis(min_dist, order, axis=1)
+
+    tile_size = max(1, chunk_size // max(num_samples, 1))
+    tiles_starts = range(0, num_samples, tile_size)
+    if n_workers == 1 or len(tiles_starts) == 1:
+        for start in tiles_starts:
+            calculate_tile(start)
+    else:
+        # numpy releases the GIL on the vectorized operations, and each tile writes to its own rows of the result
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for _ in executor.map(calculate_tile, tiles_starts):
+                pass
 
-    for i in range(num_samples):  # TODO: parallelize this loop
-        dist_to_sample_i = _calculate_distances_to_sample(i, cat_data, numeric_data, numeric_feature_ranges,
-                                                          num_features)
-        # sort to find the closest samples (including self)
-        min_dist_indexes = np.argpartition(dist_to_sample_i, num_neighbours)[:num_neighbours]
-        min_dist_indexes_ordered = sorted(min_dist_indexes, key=lambda x, arr=dist_to_sample_i: arr[x], reverse=False)
-        indexes[i, :] = min_dist_indexes_ordered
-        distances[i, :] = dist_to_sample_i[min_dist_indexes_ordered]
-
-    np.seterr(invalid=original_error_state)
     return np.nan_to_num(distances, nan=np.nan, posinf=np.nan, neginf=np.nan), indexes
 
 
-def _calculate_distances_to_sample(sample_index: int, cat_data: np.ndarray, numeric_data: np.ndarray,
-                                   numeric_feature_ranges: np.ndarray, num_features: int):
+def _calculate_distances_to_samples(start: int, end: int, cat_data: np.ndarray, numeric_data: np.ndarray,
+                                    numeric_feature_ranges: np.ndarray, num_features: int):
     """
-    Calculate Gower's distance between a single sample to the rest of the samples in the dataset.
+    Calculate Gower's distance between a tile of samples to all the samples in the dataset.
 
+    The distances are accumulated feature by feature, so memory usage is bounded by the size of the tile and does
+    not depend on the number of features.
     Parameters
     ----------
-    sample_index
-        The index of the sample to compare to the rest of the samples.
+    start
+        The index of the first sample in the tile.
+    end
+        The index after the last sample in the tile.
     cat_data
         The categorical features part of the dataset(after preprocessing).
     numeric_data
@@ -131,21 +154,29 @@ def _calculate_distances_to_sample(sample_index: int, cat_data: np.ndarray, nume
     Returns
     -------
     numpy.ndarray
-        The distances to the rest of the samples.
+        The distances matrix of shape (end - start, number of samples).
     """
-    numeric_feat_dist_to_sample = numeric_data - numeric_data[sample_index, :]
-    np.abs(numeric_feat_dist_to_sample, out=numeric_feat_dist_to_sample)
-    # if a numeric feature value is null for one of the two samples, the distance over it is ignored
-    null_dist_locations = np.logical_or(numeric_feat_dist_to_sample == np.inf, numeric_feat_dist_to_sample == np.nan)
-    null_numeric_features_per_sample = fast_sum_by_row(null_dist_locations)
-    numeric_feat_dist_to_sample[null_dist_locations] = 0
-    numeric_feat_dist_to_sample = numeric_feat_dist_to_sample.astype('float64')
-    np.divide(numeric_feat_dist_to_sample, numeric_feature_ranges, out=numeric_feat_dist_to_sample)
-
-    cat_feature_dist_to_sample = (cat_data - cat_data[sample_index, :]) != 0
-
-    dist_to_sample = fast_sum_by_row(cat_feature_dist_to_sample) + fast_sum_by_row(numeric_feat_dist_to_sample)
-    return dist_to_sample / (-null_numeric_features_per_sample + num_features)  # can have inf values
+    shape = (end - start, numeric_data.shape[0])
+    dist_to_samples = np.zeros(shape)
+    null_numeric_features_per_sample = np.zeros(shape)
+    feature_dist = np.empty(shape)
+    for feature_index in range(numeric_data.shape[1]):
+        column = numeric_data[:, feature_index].astype('float64')
+        np.subtract(column[start:end, np.newaxis], column[np.newaxis, :], out=feature_dist)
+        np.abs(feature_dist, out=feature_dist)
+        # if a numeric feature value is null for one of the two samples, the distance over it is ignored
+        if np.isinf(column).any():
+            null_dist_locations = np.isinf(feature_dist)
+            null_numeric_features_per_sample += null_dist_locations
+            np.copyto(feature_dist, 0, where=null_dist_locations)
+        np.divide(feature_dist, numeric_feature_ranges[feature_index], out=feature_dist)
+        dist_to_samples += feature_dist
+
+    for feature_index in range(cat_data.shape[1]):
+        column = cat_data[:, feature_index]
+        dist_to_samples += column[start:end, np.newaxis] != column[np.newaxis, :]
+
+    return dist_to_samples / (-null_numeric_features_per_sample + num_features)  # can have inf values
 
 
 def calculate_distance(vec1: np.array, vec2: np.array, range_per_feature: np.array) -> float:
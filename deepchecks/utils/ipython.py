@@ -8,7 +8,7 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
-# pylint: disable=assignment-from-none
+# pylint: disable=assignment-from-none,import-outside-toplevel
 """Utils module containing useful global functions."""
 import io
 import os
@@ -19,11 +19,9 @@ import typing as t
 from functools import lru_cache
 
 import tqdm
-from ipykernel.zmqshell import ZMQInteractiveShell
-from IPython import get_ipython
-from IPython.display import display
-from IPython.terminal.interactiveshell import TerminalInteractiveShell
-from tqdm.notebook import tqdm as tqdm_notebook
+
+if t.TYPE_CHECKING:
+    from tqdm.notebook import tqdm as tqdm_notebook  # pylint: disable=unused-import
 
 __all__ = [
     'is_notebook',
@@ -35,10 +33,33 @@ __all__ = [
     'is_widgets_use_possible',
     'is_terminal_interactive_shell',
     'is_zmq_interactive_shell',
-    'ProgressBarGroup'
+    'ProgressBarGroup',
+    'display',
+    'display_html'
 ]
 
 
+def _get_ipython():
+    """Return the running IPython shell, or None if not running in an IPython shell."""
+    # A shell can be running only if IPython was already imported, so it's not imported just to find out
+    if 'IPython' not in sys.modules:
+        return None
+    from IPython import get_ipython
+    return get_ipython()
+
+
+def display(*objs, **kwargs):
+    """Display objects using IPython display, IPython is imported only when called."""
+    from IPython.display import display as ipython_display
+    return ipython_display(*objs, **kwargs)
+
+
+def display_html(*objs, **kwargs):
+    """Display HTML objects using IPython display, IPython is imported only when called."""
+    from IPython.display import display_html as ipython_display_html
+    return ipython_display_html(*objs, **kwargs)
+
+
 @lru_cache(maxsize=None)
 def is_notebook() -> bool:
     """Check if we're in an interactive context (Notebook, GUI support) or terminal-based.
@@ -49,7 +70,7 @@ def is_notebook() -> bool:
         True if we are in a notebook context, False otherwise
     """
     try:
-        shell = get_ipython()
+        shell = _get_ipython()
         return hasattr(shell, 'config')
     except NameError:
         return False  # Probably standard Python interpreter
@@ -58,13 +79,21 @@ def is_notebook() -> bool:
 @lru_cache(maxsize=None)
 def is_terminal_interactive_shell() -> bool:
     """Check whether we are in a terminal interactive shell or not."""
-    return isinstance(get_ipython(), TerminalInteractiveShell)
+    shell = _get_ipython()
+    if shell is None:
+        return False
+    from IPython.terminal.interactiveshell import TerminalInteractiveShell
+    return isinstance(shell, TerminalInteractiveShell)
 
 
 @lru_cache(maxsize=None)
 def is_zmq_interactive_shell() -> bool:
     """Check whether we are in a web-based interactive shell or not."""
-    return isinstance(get_ipython(), ZMQInteractiveShell)
+    shell = _get_ipython()
+    if shell is None:
+        return False
+    from ipykernel.zmqshell import ZMQInteractiveShell
+    return isinstance(shell, ZMQInteractiveShell)
 
 
 @lru_cache(maxsize=None)
@@ -122,7 +151,7 @@ def is_widgets_enabled() -> bool:
 @lru_cache(maxsize=None)
 def is_colab_env() -> bool:
     """Check if we are in the google colab enviroment."""
-    return 'google.colab' in str(get_ipython())
+    return 'google.colab' in str(_get_ipython())
 
 
 @lru_cache(maxsize=None)
@@ -173,7 +202,7 @@ def create_progress_bar(
     total: t.Optional[int] = None,
     iterable: t.Optional[t.Sequence[t.Any]] = None,
 ) -> t.Union[
-    tqdm_notebook,
+    'tqdm_notebook',
     PlainNotebookProgressBar,
     tqdm.tqdm
 ]:
@@ -198,6 +227,7 @@ def create_progress_bar(
     barlen = iterlen if iterlen > 5 else 5
 
     if is_zmq_interactive_shell() and is_widgets_enabled():
+        from tqdm.notebook import tqdm as tqdm_notebook
         return tqdm_notebook(
             **kwargs,
             colour='#9d60fb',
@@ -246,7 +276,7 @@ class ProgressBarGroup:
 
     register: t.List[t.Union[
         DummyProgressBar,
-        tqdm_notebook,
+        'tqdm_notebook',
         PlainNotebookProgressBar,
         tqdm.tqdm
     ]]
@@ -261,7 +291,7 @@ class ProgressBarGroup:
         total: t.Optional[int] = None,
         iterable: t.Optional[t.Sequence[t.Any]] = None,
     ) -> t.Union[
-        tqdm_notebook,
+        'tqdm_notebook',
         PlainNotebookProgressBar,
         tqdm.tqdm
     ]:
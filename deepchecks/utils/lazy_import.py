@@ -0,0 +1,50 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Utils module for lazy loading of package attributes."""
+import importlib
+import sys
+import typing as t
+
+__all__ = ['lazy_attributes']
+
+
+def lazy_attributes(
+    package: str,
+    attributes: t.Mapping[str, str]
+) -> t.Tuple[t.Callable[[str], t.Any], t.Callable[[], t.List[str]]]:
+    """Create module level __getattr__ and __dir__ functions (PEP 562) that import attributes on first access.
+
+    Importing the package doesn't import the modules defining its attributes, each module is imported only when one
+    of its attributes is accessed, after which the attribute is cached on the package.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, usually its __name__.
+    attributes : Mapping[str, str]
+        Mapping from attribute name to the (relative) name of the module defining it.
+
+    Returns
+    -------
+    Tuple[Callable[[str], Any], Callable[[], List[str]]]
+        The __getattr__ and __dir__ functions of the package.
+    """
+    def getattr_(name: str) -> t.Any:
+        if name not in attributes:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(attributes[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> t.List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return getattr_, dir_
@@ -13,13 +13,15 @@
 # TODO: move tabular functionality to the tabular sub-package
 
 import enum
+import functools
 import typing as t
 import warnings
 from numbers import Number
 
 import numpy as np
 from sklearn.base import BaseEstimator, ClassifierMixin
-from sklearn.metrics import f1_score, get_scorer, make_scorer, precision_score, recall_score
+from sklearn.metrics import (accuracy_score, f1_score, get_scorer, make_scorer, mean_absolute_error, mean_squared_error,
+                             precision_recall_fscore_support, precision_score, r2_score, recall_score)
 
 from deepchecks import tabular  # pylint: disable=unused-import; it is used for type annotations
 from deepchecks.core import errors
@@ -36,6 +38,8 @@ __all__ = [
     'DEFAULT_MULTICLASS_SCORERS',
     'MULTICLASS_SCORERS_NON_AVERAGE',
     'DeepcheckScorer',
+    'run_scorers',
+    'run_scorer_by_groups',
     'get_gain',
     'init_validate_scorers',
     'get_default_scorers'
@@ -84,6 +88,58 @@ DEFAULT_SCORERS_DICT = {
 }
 
 
+class _CachedPredictionsModel:
+    """Model wrapper returning precomputed predictions for a specific features dataframe.
+
+    Predictions may be given either as arrays or as callables returning arrays, in which case they are computed only
+    when first requested. Any other data or attribute access is delegated to the wrapped model.
+
+    Parameters
+    ----------
+    model : BasicModel
+        the wrapped model
+    features : pd.DataFrame
+        the features dataframe the predictions were calculated for
+    y_pred : t.Union[np.ndarray, t.Callable[[], np.ndarray]] , default: None
+        predictions over the features, or a callable returning them
+    y_proba : t.Union[np.ndarray, t.Callable[[], np.ndarray]] , default: None
+        predicted probabilities over the features, or a callable returning them
+    """
+
+    def __init__(self, model, features, y_pred=None, y_proba=None):
+        self._model = model
+        self._features = features
+        self._y_pred = y_pred
+        self._y_proba = y_proba
+
+    def predict(self, data):
+        """Return the cached predictions if called on the cached features, else run the wrapped model."""
+        if data is self._features and self._y_pred is not None:
+            if callable(self._y_pred):
+                self._y_pred = np.asarray(self._y_pred())
+            return self._y_pred
+        return self._model.predict(data)
+
+    def predict_proba(self, data):
+        """Return the cached probabilities if called on the cached features, else run the wrapped model."""
+        if data is self._features and self._y_proba is not None and hasattr(self._model, 'predict_proba'):
+            if callable(self._y_proba):
+                self._y_proba = np.asarray(self._y_proba())
+            return self._y_proba
+        return self._model.predict_proba(data)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+def _masked(values, mask: t.Optional[np.ndarray]):
+    """Return a callable lazily resolving the given values (array or callable) and applying the mask on them."""
+    def resolve():
+        resolved = np.asarray(values() if callable(values) else values)
+        return resolved if mask is None else resolved[mask]
+    return resolve
+
+
 class DeepcheckScorer:
     """Encapsulate scorer function with extra methods.
 
@@ -124,9 +180,40 @@ class DeepcheckScorer:
     def _run_score(self, model, dataset: 'tabular.Dataset'):
         return self.scorer(model, dataset.features_columns, dataset.label_col)
 
-    def __call__(self, model, dataset: 'tabular.Dataset'):
-        """Run score with labels null filtering."""
-        return self._run_score(model, self.filter_nulls(dataset))
+    def get_prediction_score_func(self) -> t.Optional[t.Tuple[t.Callable, int, t.Dict]]:
+        """Return the metric function, sign and kwargs if the scorer is a sklearn scorer based on model.predict.
+
+        Such scorers can be calculated directly from the predictions, without the model and the features. For any
+        other scorer (probability based, or a custom callable) returns None.
+        """
+        score_func = getattr(self.scorer, '_score_func', None)
+        if score_func is None:
+            return None
+        # Newer sklearn versions hold the response method on the scorer, older ones use a dedicated scorer class
+        response_method = getattr(self.scorer, '_response_method', None)
+        if response_method is None and type(self.scorer).__name__ == '_PredictScorer':
+            response_method = 'predict'
+        if response_method != 'predict':
+            return None
+        return score_func, self.scorer._sign, self.scorer._kwargs  # pylint: disable=protected-access
+
+    def __call__(self, model, dataset: 'tabular.Dataset', y_pred=None, y_proba=None):
+        """Run score with labels null filtering.
+
+        Parameters
+        ----------
+        model : BasicModel
+            the model to score
+        dataset : tabular.Dataset
+            the dataset to score the model on
+        y_pred : t.Union[np.ndarray, t.Callable[[], np.ndarray]] , default: None
+            precomputed model predictions over the dataset (or a callable returning them), used instead of running
+            the model inference
+        y_proba : t.Union[np.ndarray, t.Callable[[], np.ndarray]] , default: None
+            precomputed model predicted probabilities over the dataset (or a callable returning them), used instead
+            of running the model inference
+        """
+        return run_scorers([self], model, dataset, y_pred, y_proba)[0]
 
     def score_perfect(self, dataset: 'tabular.Dataset'):
         """Calculate the perfect score of the current scorer for given dataset."""
@@ -180,6 +267,195 @@ class DeepcheckScorer:
         return self.sklearn_scorer_name is not None and self.sklearn_scorer_name.startswith('neg_')
 
 
+# Metrics which are all calculated by sklearn precision_recall_fscore_support, mapped to their index in its output
+_PRECISION_RECALL_FSCORE_INDEX = {precision_score: 0, recall_score: 1, f1_score: 2}
+_PRECISION_RECALL_FSCORE_KWARGS = frozenset({'labels', 'pos_label', 'average', 'sample_weight', 'zero_division'})
+_PRECISION_RECALL_FSCORE_WARN_FOR = {0: 'precision', 1: 'recall', 2: 'f-score'}
+# precision_recall_fscore_support defaults to average=None, while precision, recall and f1 default to binary average
+_PRECISION_RECALL_FSCORE_DEFAULTS = {'average': 'binary'}
+
+
+def run_scorers(
+    scorers: t.Sequence[DeepcheckScorer],
+    model: BasicModel,
+    dataset: 'tabular.Dataset',
+    y_pred=None,
+    y_proba=None
+) -> t.List[t.Any]:
+    """Calculate all the given scorers on the dataset, sharing a single inference pass between them.
+
+    Null labels are filtered once for all the scorers. Scorers based on model.predict (like the default scorers) are
+    calculated directly from the predictions, where precision, recall and f1 scorers with the same parameters are
+    calculated together in a single vectorized pass. Any other scorer (probability based, or a custom callable) is
+    called with a model wrapper serving the same predictions, so the model runs inference at most once.
+
+    Parameters
+    ----------
+    scorers : t.Sequence[DeepcheckScorer]
+        the scorers to calculate
+    model : BasicModel
+        the model to score
+    dataset : tabular.Dataset
+        the dataset to score the model on
+    y_pred : t.Union[np.ndarray, t.Callable[[], np.ndarray]] , default: None
+        precomputed model predictions over the dataset (or a callable returning them). If not given, the predictions
+        are calculated using the model when needed
+    y_proba : t.Union[np.ndarray, t.Callable[[], np.ndarray]] , default: None
+        precomputed model predicted probabilities over the dataset (or a callable returning them). If not given, the
+        probabilities are calculated using the model when needed
+
+    Returns
+    -------
+    t.List[t.Any]
+        the scores, in the order of the given scorers
+    """
+    valid_idx = dataset.data[dataset.label_name].notna().to_numpy()
+    if valid_idx.all():
+        data = dataset.data
+        mask = None
+    else:
+        data = dataset.data[valid_idx]
+        mask = valid_idx
+    features = data[dataset.features]
+    y_true = data[dataset.label_name]
+
+    y_pred = _masked(y_pred, mask) if y_pred is not None else functools.partial(model.predict, features)
+    if y_proba is not None:
+        y_proba = _masked(y_proba, mask)
+    cached_model = _CachedPredictionsModel(model, features, y_pred, y_proba)
+
+    results = [None] * len(scorers)
+    # Group precision / recall / f1 scorers by their parameters in order to calculate each group at once
+    prf_groups: t.Dict[t.FrozenSet, t.List[t.Tuple[int, int, int]]] = {}
+    for scorer_index, scorer in enumerate(scorers):
+        score_func_info = scorer.get_prediction_score_func()
+        if score_func_info is None:
+            results[scorer_index] = scorer.scorer(cached_model, features, y_true)
+            continue
+        score_func, sign, kwargs = score_func_info
+        prf_index = _PRECISION_RECALL_FSCORE_INDEX.get(score_func)
+        if prf_index is not None and set(kwargs).issubset(_PRECISION_RECALL_FSCORE_KWARGS):
+            try:
+                key = frozenset({**_PRECISION_RECALL_FSCORE_DEFAULTS, **kwargs}.items())
+            except TypeError:
+                # Unhashable parameters (like a list of labels) can't be grouped
+                key = None
+            if key is not None:
+                prf_groups.setdefault(key, []).append((scorer_index, prf_index, sign))
+                continue
+        results[scorer_index] = sign * score_func(y_true, cached_model.predict(features), **kwargs)
+
+    for key, group in prf_groups.items():
+        warn_for = tuple(_PRECISION_RECALL_FSCORE_WARN_FOR[prf_index] for _, prf_index, _ in group)
+        prf_scores = precision_recall_fscore_support(y_true, cached_model.predict(features), warn_for=warn_for,
+                                                     **dict(key))
+        for scorer_index, prf_index, sign in group:
+            results[scorer_index] = sign * prf_scores[prf_index]
+
+    return results
+
+
+def _grouped_sums(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    return np.bincount(groups, weights=values, minlength=n_groups)
+
+
+def _grouped_accuracy(y_true, y_pred, groups, n_groups, counts):
+    return _grouped_sums((y_true == y_pred).astype(float), groups, n_groups) / counts
+
+
+def _grouped_mean_squared_error(y_true, y_pred, groups, n_groups, counts, squared=True):
+    mse = _grouped_sums((y_true - y_pred) ** 2, groups, n_groups) / counts
+    return mse if squared else np.sqrt(mse)
+
+
+def _grouped_mean_absolute_error(y_true, y_pred, groups, n_groups, counts):
+    return _grouped_sums(np.abs(y_true - y_pred), groups, n_groups) / counts
+
+
+def _grouped_r2(y_true, y_pred, groups, n_groups, counts):
+    residual_sum_of_squares = _grouped_sums((y_true - y_pred) ** 2, groups, n_groups)
+    group_means = _grouped_sums(y_true, groups, n_groups) / counts
+    total_sum_of_squares = _grouped_sums((y_true - group_means[groups]) ** 2, groups, n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = 1 - residual_sum_of_squares / total_sum_of_squares
+    # Same as sklearn: a constant label gets 1 if predicted perfectly and 0 otherwise, and R2 of a single sample is nan
+    r2[total_sum_of_squares == 0] = (residual_sum_of_squares[total_sum_of_squares == 0] == 0).astype(float)
+    r2[counts < 2] = np.nan
+    return r2
+
+
+# Metric functions which can be calculated for all groups at once, with the keyword arguments they support
+_GROUPED_SCORE_FUNCS = {
+    accuracy_score: (_grouped_accuracy, frozenset()),
+    mean_squared_error: (_grouped_mean_squared_error, frozenset({'squared'})),
+    mean_absolute_error: (_grouped_mean_absolute_error, frozenset()),
+    r2_score: (_grouped_r2, frozenset())
+}
+
+
+def run_scorer_by_groups(
+    scorer: DeepcheckScorer,
+    model: BasicModel,
+    dataset: 'tabular.Dataset',
+    groups: np.ndarray,
+    n_groups: int,
+    y_pred,
+    y_proba=None
+) -> np.ndarray:
+    """Calculate the scorer on each group of samples of the dataset, using precomputed predictions.
+
+    Accuracy, mean squared error, mean absolute error and R2 scorers are calculated for all the groups at once from
+    per-group sums of the predictions. Any other scorer is calculated separately on every group, with the predictions
+    of the group's samples.
+
+    Parameters
+    ----------
+    scorer : DeepcheckScorer
+        the scorer to calculate
+    model : BasicModel
+        the model to score
+    dataset : tabular.Dataset
+        the dataset to score the model on
+    groups : np.ndarray
+        the group index (between 0 and n_groups - 1) of every sample of the dataset, or -1 for samples in no group
+    n_groups : int
+        number of groups
+    y_pred : t.Union[np.ndarray, t.Callable[[], np.ndarray]]
+        model predictions over the dataset (or a callable returning them)
+    y_proba : t.Union[np.ndarray, t.Callable[[], np.ndarray]] , default: None
+        model predicted probabilities over the dataset (or a callable returning them)
+
+    Returns
+    -------
+    np.ndarray
+        the score of every group, nan for groups without samples
+    """
+    groups = np.asarray(groups)
+    y_pred = _masked(y_pred, None)
+    score_func_info = scorer.get_prediction_score_func()
+    if score_func_info is not None and score_func_info[0] in _GROUPED_SCORE_FUNCS:
+        score_func, sign, kwargs = score_func_info
+        grouped_score_func, supported_kwargs = _GROUPED_SCORE_FUNCS[score_func]
+        if set(kwargs).issubset(supported_kwargs):
+            mask = (groups >= 0) & dataset.data[dataset.label_name].notna().to_numpy()
+            counts = np.bincount(groups[mask], minlength=n_groups)
+            y_true = dataset.data[dataset.label_name].to_numpy()[mask]
+            # Like sklearn metrics, predictions given as a column vector are flattened
+            predictions = y_pred().reshape(len(groups), -1)[mask].squeeze(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = grouped_score_func(y_true, predictions, groups[mask], n_groups, counts, **kwargs)
+            scores = sign * scores
+            scores[counts == 0] = np.nan
+            return scores
+
+    scores = np.full(n_groups, np.nan)
+    for group in np.unique(groups[groups >= 0]):
+        group_mask = groups == group
+        scores[group] = scorer(model, dataset.copy(dataset.data[group_mask]), y_pred=_masked(y_pred, group_mask),
+                               y_proba=None if y_proba is None else _masked(y_proba, group_mask))
+    return scores
+
+
 def task_type_check(
     model: BasicModel,
     dataset: 'tabular.Dataset'
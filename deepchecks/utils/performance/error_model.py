@@ -13,7 +13,6 @@ from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 from category_encoders import TargetEncoder
 from sklearn.compose import ColumnTransformer
 from sklearn.ensemble import RandomForestRegressor
@@ -145,6 +144,8 @@ def error_model_display(error_fi: pd.Series,
     Tuple[List, Dict]:
         List of display elements and Dict of segment description
     """
+    import plotly.express as px  # pylint: disable=import-outside-toplevel
+
     n_samples_display = min(n_display_samples, len(dataset))
     error_col_name = 'Deepchecks model error'
     display_error = pd.Series(error_model_predicted, name=error_col_name, index=dataset.data.index)
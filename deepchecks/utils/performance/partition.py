@@ -10,7 +10,7 @@
 #
 """Module of functions to partition columns into segments."""
 from copy import deepcopy
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -22,7 +22,7 @@ from deepchecks.utils.typing import Hashable
 # TODO: move tabular functionality to the tabular sub-package
 
 
-__all__ = ['partition_column', 'DeepchecksFilter']
+__all__ = ['partition_column', 'partition_column_codes', 'DeepchecksFilter']
 
 
 class DeepchecksFilter:
@@ -148,3 +148,61 @@ def partition_column(
             filters.append(DeepchecksFilter(f, 'Others'))
 
         return filters
+
+
+def partition_column_codes(
+    dataset: Dataset,
+    column_name: Hashable,
+    max_segments: int,
+    max_cat_proportions: float = 0.9
+) -> Tuple[np.ndarray, List[str]]:
+    """Split column into segments, returning the segment of every sample instead of a filter for every segment.
+
+    The segments (and their labels) are the same as the ones of `partition_column`, but all the samples are assigned
+    to their segments at once instead of filtering the data separately for every segment.
+
+    Parameters
+    ----------
+    dataset : Dataset
+    column_name : Hashable
+        column to partition.
+    max_segments : int
+        maximum number of segments to split into.
+    max_cat_proportions : float , default: 0.9
+        (for categorical) ratio to aggregate largest values to show.
+
+    Returns
+    -------
+    Tuple[np.ndarray, List[str]]
+        the index of the segment of every sample (-1 for samples which are in no segment, like nulls), and the
+        labels of the segments
+    """
+    column = dataset.data[column_name]
+    if column_name in dataset.numerical_features:
+        percentile_values = numeric_segmentation_edges(column, max_segments)
+        values = column.to_numpy(dtype=float, na_value=np.nan)
+        # If for some reason only single value in the column (and column not categorical) we will get single item
+        if len(percentile_values) == 1:
+            return np.where(values == percentile_values[0], 0, -1), [str(percentile_values[0])]
+
+        # The last range is closed, so values equal to the last edge are in the last segment
+        codes = np.digitize(values, percentile_values[1:-1])
+        codes[np.isnan(values)] = -1
+        labels = [f'[{format_number(start)} - {format_number(end)})'
+                  for start, end in zip(percentile_values[:-2], percentile_values[1:-1])]
+        labels.append(f'[{format_number(percentile_values[-2])} - {format_number(percentile_values[-1])}]')
+        return codes, labels
+    elif column_name in dataset.cat_features:
+        # Get sorted histogram
+        cat_hist_dict = column.value_counts()
+        # Get index of last value in histogram to show
+        n_large_cats = largest_category_index_up_to_ratio(cat_hist_dict, max_segments, max_cat_proportions)
+
+        large_cats = cat_hist_dict.index[:n_large_cats]
+        codes = pd.Categorical(column, categories=large_cats).codes.astype(int)
+        labels = [str(value) for value in large_cats]
+        if len(cat_hist_dict) > n_large_cats:
+            codes[codes == -1] = n_large_cats
+            labels.append('Others')
+
+        return codes, labels
@@ -9,11 +9,8 @@
 # ----------------------------------------------------------------------------
 #
 """Utils module containing utilities for plotting."""
-import matplotlib.pyplot as plt
+# pylint: disable=import-outside-toplevel
 import numpy as np
-import plotly.graph_objects as go
-from matplotlib.cm import ScalarMappable
-from matplotlib.colors import LinearSegmentedColormap
 
 from deepchecks.utils.strings import format_number_if_not_nan
 
@@ -76,6 +73,9 @@ def create_colorbar_barchart_for_check(
         name of the check that called this function
 
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.cm import ScalarMappable
+
     fig, ax = plt.subplots(figsize=(15, 4))  # pylint: disable=unused-variable
 
     try:
@@ -124,6 +124,9 @@ def shifted_color_map(cmap, start=0, midpoint=0.5, stop=1.0, name: str = 'shifte
         The point between start and stop where the colors will start being transparent.
 
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LinearSegmentedColormap
+
     if transparent_from is None:
         transparent_from = stop
 
@@ -186,6 +189,8 @@ def create_confusion_matrix_figure(confusion_matrix: np.ndarray, x: np.ndarray,
         confusion matrix figure
 
     """
+    import plotly.graph_objects as go
+
     if normalized:
         confusion_matrix_norm = confusion_matrix.astype('float') / \
             confusion_matrix.sum(axis=1)[:, np.newaxis] * 100
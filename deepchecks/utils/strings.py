@@ -20,12 +20,11 @@ from collections import defaultdict
 from copy import copy
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from string import ascii_uppercase, digits
 
 import numpy as np
 import pandas as pd
-from ipywidgets import Widget
-from ipywidgets.embed import dependency_state, embed_minimal_html
 from packaging.version import Version
 from pandas.core.dtypes.common import is_numeric_dtype
 
@@ -38,6 +37,8 @@ try:
 except ImportError:
     from importlib_resources import files
 
+if t.TYPE_CHECKING:
+    from ipywidgets import Widget  # pylint: disable=unused-import
 
 __all__ = [
     'string_baseform',
@@ -62,9 +63,13 @@ __all__ = [
     'get_docs_link',
 ]
 
-# Creating a translation table for the string.translate() method to be used in string base form method
-DEL_CHARS = ''.join(c for c in map(chr, range(sys.maxunicode)) if not c.isalnum())
-DEL_MAP = str.maketrans('', '', DEL_CHARS)
+
+@lru_cache(maxsize=None)
+def _get_del_map() -> t.Dict[int, None]:
+    """Create a translation table for the string.translate() method to be used in string base form method."""
+    # Scanning all the unicode characters takes a while, so it's done on first use rather than on import
+    del_chars = ''.join(c for c in map(chr, range(sys.maxunicode)) if not c.isalnum())
+    return str.maketrans('', '', del_chars)
 
 
 def get_ellipsis(long_string: str, max_length: int):
@@ -115,7 +120,7 @@ def get_docs_summary(obj, with_doc_link: bool = True):
 
 
 def widget_to_html(
-    widget: Widget,
+    widget: 'Widget',
     html_out: t.Union[str, t.TextIO],
     title: t.Optional[str] = None,
     requirejs: bool = True
@@ -133,6 +138,8 @@ def widget_to_html(
     requirejs: bool , default: True
         If to save with all javascript dependencies
     """
+    from ipywidgets.embed import dependency_state, embed_minimal_html  # pylint: disable=import-outside-toplevel
+
     my_resources = files('deepchecks.core')
     with open(os.path.join(my_resources, 'resources', 'suite_output.html'), 'r', encoding='utf8') as html_file:
         html_formatted = re.sub('{', '{{', html_file.read())
@@ -147,7 +154,7 @@ def widget_to_html(
 
 
 def widget_to_html_string(
-    widget: Widget,
+    widget: 'Widget',
     title: t.Optional[str] = None,
     requirejs: bool = True
 ) -> str:
@@ -257,7 +264,7 @@ def string_baseform(string: Hashable) -> Hashable:
     """
     if not isinstance(string, str):
         return string
-    return string.translate(DEL_MAP).lower()
+    return string.translate(_get_del_map()).lower()
 
 
 def is_string_column(column: pd.Series) -> bool:
@@ -12,13 +12,16 @@
 
 # TODO: move tabular functionality to the tabular sub-package
 
+import os
 import typing as t
+from numbers import Integral
 
 from deepchecks.core import errors
 from deepchecks.utils.typing import Hashable
 
 __all__ = [
     'ensure_hashable_or_mutable_sequence',
+    'validate_n_jobs',
 ]
 
 
@@ -45,3 +48,21 @@ def ensure_hashable_or_mutable_sequence(
     raise errors.DeepchecksValueError(message.format(
         type=type(value).__name__
     ))
+
+
+def validate_n_jobs(n_jobs: int) -> int:
+    """Validate the number of parallel jobs and return the number of workers to use.
+
+    Parameters
+    ----------
+    n_jobs : int
+        number of parallel jobs, either a positive number or -1 for using all the processors.
+
+    Returns
+    -------
+    int
+        the number of workers.
+    """
+    if not isinstance(n_jobs, Integral) or isinstance(n_jobs, bool) or (n_jobs < 1 and n_jobs != -1):
+        raise errors.DeepchecksValueError(f'n_jobs must be -1 or a positive integer, but got: {n_jobs!r}')
+    return (os.cpu_count() or 1) if n_jobs == -1 else int(n_jobs)
@@ -9,12 +9,15 @@
 # ----------------------------------------------------------------------------
 #
 """Contains code for BatchWrapper."""
+import threading
 from operator import itemgetter
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Tuple, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple, TypeVar, cast
 
 import torch
 
 from deepchecks.core import DatasetKind
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.vision.utils.image_properties import calculate_default_properties, default_image_properties
 
 if TYPE_CHECKING:
     from deepchecks.vision.context import Context
@@ -23,6 +26,9 @@ if TYPE_CHECKING:
 __all__ = ['Batch']
 
 
+_DEFAULT_IMAGE_PROPERTIES_NAMES = {prop['method']: prop['name'] for prop in default_image_properties}
+
+
 class Batch:
     """Represents dataset batch returned by the dataloader during iteration."""
 
@@ -40,14 +46,25 @@ class Batch:
         self._labels = None
         self._predictions = None
         self._images = None
+        # Checks may be updated with the same batch concurrently, the locks make sure each of the lazy properties is
+        # calculated only once
+        self._labels_lock = threading.Lock()
+        self._predictions_lock = threading.Lock()
+        self._images_lock = threading.Lock()
+        # Results of the vision properties, shared by all the checks that calculate the same property on the batch
+        self._properties: Dict[Tuple[str, Callable], List] = {}
+        self._properties_locks: Dict[Tuple[str, Callable], threading.Lock] = {}
+        self._properties_lock = threading.Lock()
 
     @property
     def labels(self):
         """Return labels for the batch, formatted in deepchecks format."""
         if self._labels is None:
-            dataset = self._context.get_data_by_kind(self._dataset_kind)
-            dataset.assert_labels_valid()
-            self._labels = dataset.batch_to_labels(self._batch)
+            with self._labels_lock:
+                if self._labels is None:
+                    dataset = self._context.get_data_by_kind(self._dataset_kind)
+                    dataset.assert_labels_valid()
+                    self._labels = dataset.batch_to_labels(self._batch)
         return self._labels
 
     def _do_static_pred(self):
@@ -59,31 +76,70 @@ class Batch:
             return preds[indexes]
         return itemgetter(*indexes)(preds)
 
+    def _calculate_predictions(self):
+        dataset = self._context.get_data_by_kind(self._dataset_kind)
+        if self._context.static_predictions is not None:
+            self._context.assert_predictions_valid(self._dataset_kind)
+            return self._do_static_pred()
+        # Calling model will raise error if model was not given
+        # (assert_predictions_valid doesn't raise an error if no model was given)
+        model = self._context.model
+        self._context.assert_predictions_valid(self._dataset_kind)
+        return dataset.infer_on_batch(self._batch, model, self._context.device)
+
     @property
     def predictions(self):
         """Return predictions for the batch, formatted in deepchecks format."""
         if self._predictions is None:
-            dataset = self._context.get_data_by_kind(self._dataset_kind)
-            if self._context.static_predictions is not None:
-                self._context.assert_predictions_valid(self._dataset_kind)
-                self._predictions = self._do_static_pred()
-            else:
-                # Calling model will raise error if model was not given
-                # (assert_predictions_valid doesn't raise an error if no model was given)
-                model = self._context.model
-                self._context.assert_predictions_valid(self._dataset_kind)
-                self._predictions = dataset.infer_on_batch(self._batch, model, self._context.device)
+            with self._predictions_lock:
+                if self._predictions is None:
+                    self._predictions = self._calculate_predictions()
         return self._predictions
 
     @property
     def images(self):
         """Return images for the batch, formatted in deepchecks format."""
         if self._images is None:
-            dataset = self._context.get_data_by_kind(self._dataset_kind)
-            dataset.assert_images_valid()
-            self._images = [image.astype('uint8') for image in dataset.batch_to_images(self._batch)]
+            with self._images_lock:
+                if self._images is None:
+                    dataset = self._context.get_data_by_kind(self._dataset_kind)
+                    dataset.assert_images_valid()
+                    self._images = [image.astype('uint8') for image in dataset.batch_to_images(self._batch)]
         return self._images
 
+    def is_calculated(self, data_name: str) -> bool:
+        """Return whether the lazy images, labels or predictions of the batch were already calculated."""
+        return getattr(self, f'_{data_name}') is not None
+
+    def vision_property(self, property_method: Callable, input_type: str = 'images') -> List:
+        """Return the results of the given property method on the batch, calculating it only once per batch.
+
+        Parameters
+        ----------
+        property_method : Callable
+            The method of the property, receives the batch images, labels or predictions and returns a value per
+            sample.
+        input_type : str , default: 'images'
+            The batch data the property is calculated on, one of 'images', 'labels' or 'predictions'.
+        Returns
+        -------
+        List
+            The property values of the batch samples. The list is shared by all the callers and must not be modified.
+        """
+        if input_type not in ('images', 'labels', 'predictions'):
+            raise DeepchecksValueError(f'Unknown property input type: {input_type}')
+        if input_type == 'images' and property_method in _DEFAULT_IMAGE_PROPERTIES_NAMES:
+            # The default image properties are all calculated together in a single pass over the images
+            return self.vision_property(calculate_default_properties)[_DEFAULT_IMAGE_PROPERTIES_NAMES[property_method]]
+        key = (input_type, property_method)
+        if key not in self._properties:
+            with self._properties_lock:
+                property_lock = self._properties_locks.setdefault(key, threading.Lock())
+            with property_lock:
+                if key not in self._properties:
+                    self._properties[key] = property_method(getattr(self, input_type))
+        return self._properties[key]
+
     def __getitem__(self, index: int):
         """Return batch item by index."""
         return self._batch[index]
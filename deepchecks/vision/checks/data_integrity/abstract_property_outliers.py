@@ -58,6 +58,10 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
         The scale to multiply the IQR range for the outliers detection
     """
 
+    # The batch data the properties are calculated on, one of 'images', 'labels' or 'predictions'. Subclasses which
+    # leave it unset must implement get_relevant_data, and their properties are not shared with other checks
+    property_input_type: t.Optional[str] = None
+
     def __init__(self,
                  properties: t.List[t.Dict[str, t.Any]] = None,
                  n_show_top: int = 5,
@@ -65,6 +69,13 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
                  iqr_scale: float = 1.5,
                  **kwargs):
         super().__init__(**kwargs)
+        if self.property_input_type is None:
+            if type(self).get_relevant_data is AbstractPropertyOutliers.get_relevant_data:
+                raise DeepchecksValueError(f'{type(self).__name__} must either set property_input_type or implement '
+                                           f'get_relevant_data')
+        elif self.property_input_type not in ('images', 'labels', 'predictions'):
+            raise DeepchecksValueError(f'property_input_type must be one of images, labels or predictions, but got '
+                                       f'{self.property_input_type}')
         if properties is not None:
             self.user_properties = label_prediction_properties.validate_properties(properties)
             # Validate no property have class_id as output_type
@@ -98,7 +109,10 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
 
         for single_property in self._properties_funcs:
             prop_name = single_property['name']
-            property_values = single_property['method'](data_for_properties)
+            if self.property_input_type is None:
+                property_values = single_property['method'](data_for_properties)
+            else:
+                property_values = batch.vision_property(single_property['method'], self.property_input_type)
             _ensure_property_shape(property_values, data_for_properties, prop_name)
             self._properties_results[prop_name].extend(property_values)
 
@@ -205,10 +219,9 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
 
         return CheckResult(result, display=''.join(display))
 
-    @abstractmethod
     def get_relevant_data(self, batch: Batch):
         """Get the data on which the check calculates outliers."""
-        pass
+        return getattr(batch, self.property_input_type)
 
     @abstractmethod
     def draw_image(self, data: VisionData, sample_index: int, index_of_value_in_sample: int,
@@ -14,7 +14,6 @@ import typing as t
 import numpy as np
 
 from deepchecks.core.errors import DeepchecksProcessError
-from deepchecks.vision import Batch
 from deepchecks.vision.checks.data_integrity.abstract_property_outliers import AbstractPropertyOutliers
 from deepchecks.vision.utils import label_prediction_properties
 from deepchecks.vision.utils.image_functions import draw_bboxes
@@ -48,6 +47,8 @@ class LabelPropertyOutliers(AbstractPropertyOutliers):
         The scale to multiply the IQR range for the outliers detection
     """
 
+    property_input_type = 'labels'
+
     def __init__(self,
                  label_properties: t.List[t.Dict[str, t.Any]] = None,
                  n_show_top: int = 5,
@@ -68,10 +69,6 @@ class LabelPropertyOutliers(AbstractPropertyOutliers):
             raise DeepchecksProcessError(f'task type {data.task_type} does not have default label '
                                          f'properties defined.')
 
-    def get_relevant_data(self, batch: Batch):
-        """Get the data on which the check calculates outliers for."""
-        return batch.labels
-
     def draw_image(self, data: VisionData, sample_index: int, index_of_value_in_sample: int,
                    num_properties_in_sample: int) -> np.ndarray:
         """Return an image to show as output of the display.
@@ -94,7 +94,7 @@ class ImageSegmentPerformance(SingleDatasetCheck):
         # Initialize a list of all properties per image sample
         batch_properties = [{} for _ in range(len(images))]
         for single_property in self.image_properties:
-            for index, image_result in enumerate(single_property['method'](images)):
+            for index, image_result in enumerate(batch.vision_property(single_property['method'])):
                 batch_properties[index][single_property['name']] = image_result
 
         batch_data = zip(labels, predictions, batch_properties)
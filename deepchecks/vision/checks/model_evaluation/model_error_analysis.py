@@ -111,12 +111,11 @@ class ModelErrorAnalysis(TrainTestCheck):
                 'be unreacheable was reached.'
             )
 
-        images = batch.images
         predictions = batch.predictions
         labels = batch.labels
 
         for single_property in self.image_properties:
-            properties[single_property['name']].extend(single_property['method'](images))
+            properties[single_property['name']].extend(batch.vision_property(single_property['method']))
 
         if dataset.task_type == TaskType.CLASSIFICATION:
             def scoring_func(predictions, labels):
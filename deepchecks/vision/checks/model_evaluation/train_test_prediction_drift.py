@@ -168,7 +168,7 @@ class TrainTestPredictionDrift(TrainTestCheck):
         for prediction_property in self._prediction_properties:
             # Flatten the properties since I don't care in this check about the property-per-sample coupling
             properties[prediction_property['name']] += properties_flatten(
-                prediction_property['method'](batch.predictions)
+                batch.vision_property(prediction_property['method'], 'predictions')
             )
 
     def compute(self, context: Context) -> CheckResult:
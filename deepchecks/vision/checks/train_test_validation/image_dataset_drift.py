@@ -92,10 +92,9 @@ class ImageDatasetDrift(TrainTestCheck):
             properties = self._train_properties
         else:
             properties = self._test_properties
-        images = batch.images
 
         for single_property in self.image_properties:
-            properties[single_property['name']].extend(single_property['method'](images))
+            properties[single_property['name']].extend(batch.vision_property(single_property['method']))
 
     def compute(self, context: Context) -> CheckResult:
         """Train a Domain Classifier on image property data that was collected during update() calls.
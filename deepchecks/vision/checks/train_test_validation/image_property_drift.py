@@ -19,7 +19,7 @@ from deepchecks.core import CheckResult, ConditionResult, DatasetKind
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.core.errors import DeepchecksValueError, NotEnoughSamplesError
 from deepchecks.utils.dict_funcs import get_max_entry_from_dict
-from deepchecks.utils.distribution.drift import calc_drift_and_plot
+from deepchecks.utils.distribution.drift import calc_drift_scores, drift_plot
 from deepchecks.utils.strings import format_number
 from deepchecks.vision import Batch, Context, TrainTestCheck
 from deepchecks.vision.utils.image_properties import default_image_properties, get_column_type, validate_properties
@@ -131,19 +131,22 @@ class ImagePropertyDrift(TrainTestCheck):
                 f'Internal Error - Should not reach here! unknown dataset_kind: {dataset_kind}'
             )
 
-        images = batch.images
-
         if self.classes_to_display:
             # use only images belonging (or containing an annotation belonging) to one of the classes in
             # classes_to_display
             classes = context.train.get_classes(batch.labels)
-            images = [
-                image for idx, image in enumerate(images)
+            indices_to_use = [
+                idx for idx in range(len(batch.images))
                 if any(cls in map(self._class_to_string, classes[idx]) for cls in self.classes_to_display)
             ]
+        else:
+            indices_to_use = None
 
         for single_property in self.image_properties:
-            property_list = single_property['method'](images)
+            # The properties are calculated once per batch for all the checks, and filtered here by the classes
+            property_list = batch.vision_property(single_property['method'])
+            if indices_to_use is not None:
+                property_list = [property_list[idx] for idx in indices_to_use]
             properties[single_property['name']].extend(property_list)
 
     def compute(self, context: Context) -> CheckResult:
@@ -177,30 +180,38 @@ class ImagePropertyDrift(TrainTestCheck):
                 'Use \'min_samples\' parameter to change the requirement.'
             )
 
-        figures = {}
-        drifts = {}
+        column_types = {}
         not_enough_samples = []
-
         for single_property in self.image_properties:
             property_name = single_property['name']
-
-            try:
-                score, _, figure = calc_drift_and_plot(
-                    train_column=df_train[property_name],
-                    test_column=df_test[property_name],
-                    value_name=property_name,
-                    column_type=get_column_type(single_property['output_type']),
-                    margin_quantile_filter=self.margin_quantile_filter,
-                    max_num_categories_for_drift=self.max_num_categories_for_drift,
-                    max_num_categories_for_display=self.max_num_categories_for_display,
-                    show_categories_by=self.show_categories_by,
-                    min_samples=self.min_samples
-                )
-
-                figures[property_name] = figure
-                drifts[property_name] = score
-            except NotEnoughSamplesError:
+            if df_train[property_name].count() < self.min_samples or \
+                    df_test[property_name].count() < self.min_samples:
                 not_enough_samples.append(property_name)
+            else:
+                column_types[property_name] = get_column_type(single_property['output_type'])
+
+        drift_scores = calc_drift_scores(
+            train_df=df_train,
+            test_df=df_test,
+            column_types=column_types,
+            margin_quantile_filter=self.margin_quantile_filter,
+            max_num_categories_for_drift=self.max_num_categories_for_drift,
+            min_samples=self.min_samples
+        )
+        drifts = {property_name: score for property_name, (score, _) in drift_scores.items()}
+        figures = {
+            property_name: drift_plot(
+                train_column=df_train[property_name],
+                test_column=df_test[property_name],
+                value_name=property_name,
+                column_type=column_type,
+                score=drift_scores[property_name][0],
+                scorer_name=drift_scores[property_name][1],
+                max_num_categories_for_display=self.max_num_categories_for_display,
+                show_categories_by=self.show_categories_by
+            )
+            for property_name, column_type in column_types.items()
+        }
 
         if drifts:
             columns_order = sorted(properties, key=lambda col: drifts.get(col, 0), reverse=True)
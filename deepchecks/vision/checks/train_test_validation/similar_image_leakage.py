@@ -10,7 +10,7 @@
 #
 """Module contains the similar image leakage check."""
 import random
-from typing import List, Tuple, TypeVar
+from typing import List, Optional, Tuple, TypeVar
 
 import numpy as np
 from imagehash import average_hash
@@ -75,12 +75,13 @@ class SimilarImageLeakage(TrainTestCheck):
 
     def update(self, context: Context, batch: Batch, dataset_kind: DatasetKind):
         """Calculate image hashes for train and test."""
-        hashed_images = [average_hash(fromarray(img.squeeze()), hash_size=self.hash_size) for img in batch.images]
+        hashed_images = _pack_hashes([average_hash(fromarray(img.squeeze()), hash_size=self.hash_size).hash
+                                      for img in batch.images], self.hash_size)
 
         if dataset_kind == DatasetKind.TRAIN:
-            self._hashed_train_images += hashed_images
+            self._hashed_train_images.append(hashed_images)
         else:
-            self._hashed_test_images += hashed_images
+            self._hashed_test_images.append(hashed_images)
 
     def compute(self, context: Context) -> CheckResult:
         """Find similar images by comparing image hashes between train and test.
@@ -92,20 +93,18 @@ class SimilarImageLeakage(TrainTestCheck):
                 order of the images deepchecks received the images.
             display: pairs of similar images
         """
-        train_hashes = np.array(self._hashed_train_images)
+        n_words = _n_hash_words(self.hash_size)
+        train_hashes = np.concatenate(self._hashed_train_images or [np.empty((0, n_words), dtype=np.uint64)])
+        test_hashes = np.concatenate(self._hashed_test_images or [np.empty((0, n_words), dtype=np.uint64)])
 
+        # For each test image with similarities, take the first similar image in train
+        test_indices, train_indices = _find_first_similar(train_hashes, test_hashes, self.min_pixel_diff - 1,
+                                                          self.hash_size ** 2)
         similar_indices = {
-            'train': [],
-            'test': []
+            'train': train_indices.tolist(),
+            'test': test_indices.tolist()
         }
 
-        for i, h in enumerate(self._hashed_test_images):
-            is_similar = (train_hashes - h) < self.min_pixel_diff
-            if any(is_similar):
-                # For each test image with similarities, append the first similar image in train
-                similar_indices['train'].append(np.argwhere(is_similar)[0][0])
-                similar_indices['test'].append(i)
-
         display_indices = random.sample(range(len(similar_indices['test'])),
                                         min(self.n_top_show, len(similar_indices['test'])))
 
@@ -178,6 +177,202 @@ class SimilarImageLeakage(TrainTestCheck):
                                   f'{threshold}', condition)
 
 
+def _n_hash_words(hash_size: int) -> int:
+    return max(1, int(np.ceil(hash_size ** 2 / 64)))
+
+
+def _pack_hashes(hashes: List[np.ndarray], hash_size: int) -> np.ndarray:
+    """Pack boolean hashes of hash_size*hash_size bits into an array of uint64 words per hash."""
+    n_words = _n_hash_words(hash_size)
+    packed = np.zeros((len(hashes), n_words * 8), dtype=np.uint8)
+    if hashes:
+        bits = np.packbits(np.array(hashes, dtype=bool).reshape(len(hashes), -1), axis=1)
+        packed[:, :bits.shape[1]] = bits
+    return packed.view(np.uint64)
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Return the number of set bits in each row of uint64 words."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    # Parallel bit count over each 64 bits word
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & np.uint64(0x3333333333333333)) + ((words >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((words * np.uint64(0x0101010101010101)) >> np.uint64(56)).sum(axis=-1, dtype=np.int64)
+
+
+def _find_first_similar(
+        train_hashes: np.ndarray,
+        test_hashes: np.ndarray,
+        max_distance: int,
+        n_bits: int,
+        use_multi_index: Optional[bool] = None,
+        block_size: int = 2 ** 22
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find for each test hash the first train hash within the given Hamming distance.
+
+    Parameters
+    ----------
+    train_hashes : np.ndarray
+        Packed train hashes, array of uint64 words per hash.
+    test_hashes : np.ndarray
+        Packed test hashes, array of uint64 words per hash.
+    max_distance : int
+        Maximal number of differing bits for hashes to be considered similar.
+    n_bits : int
+        Number of bits in each hash.
+    use_multi_index : Optional[bool] , default: None
+        Whether to look up candidates by exact matches of hash segments (by the pigeonhole principle two hashes within
+        max_distance bits share at least one of max_distance + 1 segments) instead of comparing all pairs. If None,
+        the lookup is used when the segments are long enough to be selective.
+    block_size : int , default: 2 ** 22
+        Maximal number of hash pairs compared at once.
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The indices of the test hashes that have a similar train hash, and the index of the first similar train hash
+        of each of them.
+    """
+    if max_distance < 0 or len(train_hashes) == 0 or len(test_hashes) == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+    if use_multi_index is None:
+        use_multi_index = n_bits // (max_distance + 1) >= 16
+    # Comparing all pairs is done on blocks of test hashes, so no more than block_size pairs are held at once
+    rows_per_block = max(1, block_size // len(train_hashes))
+    if use_multi_index:
+        segments_index = _segments_index(train_hashes, max_distance, n_bits)
+        # The lookup cost depends on the number of candidates rather than the number of train hashes, so it goes over
+        # larger blocks, limited by the size of their unpacked bits
+        rows_per_block = max(rows_per_block, block_size // n_bits)
+
+    test_indices, train_indices = [], []
+    for start in range(0, len(test_hashes), rows_per_block):
+        block = test_hashes[start:start + rows_per_block]
+        pairs = None
+        if use_multi_index:
+            pairs = _multi_index_candidates(segments_index, block, n_bits, max_pairs=block_size)
+        if pairs is not None:
+            block_test_indices, block_train_indices = _first_similar_of_candidates(
+                train_hashes, block, pairs, max_distance)
+        else:
+            block_test_indices, block_train_indices = _first_similar_of_all_pairs(
+                train_hashes, block, max_distance, block_size)
+        test_indices.append(block_test_indices + start)
+        train_indices.append(block_train_indices)
+    return np.concatenate(test_indices), np.concatenate(train_indices)
+
+
+def _first_similar_of_all_pairs(
+        train_hashes: np.ndarray,
+        test_hashes: np.ndarray,
+        max_distance: int,
+        block_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the first similar train hash of each test hash by comparing all pairs, block_size pairs at a time."""
+    test_indices, train_indices = [np.empty(0, dtype=int)], [np.empty(0, dtype=int)]
+    rows_per_block = max(1, block_size // len(train_hashes))
+    for start in range(0, len(test_hashes), rows_per_block):
+        block = test_hashes[start:start + rows_per_block]
+        is_similar = _popcount(block[:, None, :] ^ train_hashes[None, :, :]) <= max_distance
+        has_similar = np.flatnonzero(is_similar.any(axis=1))
+        test_indices.append(has_similar + start)
+        train_indices.append(is_similar[has_similar].argmax(axis=1))
+    return np.concatenate(test_indices), np.concatenate(train_indices)
+
+
+def _first_similar_of_candidates(
+        train_hashes: np.ndarray,
+        test_hashes: np.ndarray,
+        pairs: Tuple[np.ndarray, np.ndarray],
+        max_distance: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the first similar train hash of each test hash out of the candidate (test, train) index pairs."""
+    test_indices, train_indices = pairs
+    distances = _popcount(test_hashes[test_indices] ^ train_hashes[train_indices])
+    similar = distances <= max_distance
+    test_indices, train_indices = test_indices[similar], train_indices[similar]
+    # Keep the smallest train index of every test index
+    order = np.lexsort((train_indices, test_indices))
+    test_indices, train_indices = test_indices[order], train_indices[order]
+    first = np.ones(len(test_indices), dtype=bool)
+    first[1:] = test_indices[1:] != test_indices[:-1]
+    return test_indices[first], train_indices[first]
+
+
+def _segments_index(
+        train_hashes: np.ndarray,
+        max_distance: int,
+        n_bits: int
+) -> List[Tuple[int, int, np.ndarray, np.ndarray]]:
+    """Index the train hashes by each of max_distance + 1 hash segments.
+
+    Returns for each segment its bits range, the order of the train hashes sorted by the segment key and the sorted
+    keys.
+    """
+    train_bits = np.unpackbits(train_hashes.view(np.uint8), axis=1)[:, :n_bits]
+    bounds = np.linspace(0, n_bits, max_distance + 2).astype(int)
+    segments_index = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        train_keys = _segment_keys(train_bits[:, start:end])
+        order = np.argsort(train_keys, kind='stable')
+        segments_index.append((start, end, order, train_keys[order]))
+    return segments_index
+
+
+def _multi_index_candidates(
+        segments_index: List[Tuple[int, int, np.ndarray, np.ndarray]],
+        test_hashes: np.ndarray,
+        n_bits: int,
+        max_pairs: int
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Return the (test, train) index pairs sharing at least one of the indexed hash segments.
+
+    Returns None if there are more than max_pairs candidate pairs, in which case comparing all pairs is cheaper.
+    """
+    test_bits = np.unpackbits(test_hashes.view(np.uint8), axis=1)[:, :n_bits]
+
+    lookups = []
+    n_pairs = 0
+    # Count the candidates of all the segments before expanding any of them
+    for start, end, order, sorted_keys in segments_index:
+        test_keys = _segment_keys(test_bits[:, start:end])
+        left = np.searchsorted(sorted_keys, test_keys, side='left')
+        counts = np.searchsorted(sorted_keys, test_keys, side='right') - left
+        n_pairs += counts.sum()
+        if n_pairs > max_pairs:
+            return None
+        lookups.append((order, left, counts))
+
+    test_indices, train_indices = [], []
+    for order, left, counts in lookups:
+        # Expand each test hash to all the train hashes with the same segment
+        segment_test_indices = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.arange(len(segment_test_indices)) - np.repeat(np.cumsum(counts) - counts, counts)
+        test_indices.append(segment_test_indices)
+        train_indices.append(order[np.repeat(left, counts) + offsets])
+
+    return np.concatenate(test_indices), np.concatenate(train_indices)
+
+
+def _segment_keys(bits: np.ndarray) -> np.ndarray:
+    """Return a uint64 key for each row of bits.
+
+    Segments of more than 64 bits are hashed into a single key, collisions only add candidates which are later
+    filtered by their distance.
+    """
+    packed = np.packbits(bits, axis=1)
+    n_words = max(1, int(np.ceil(packed.shape[1] / 8)))
+    padded = np.zeros((len(packed), n_words * 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    words = padded.view(np.uint64)
+    keys = words[:, 0].copy()
+    for i in range(1, n_words):
+        keys = keys * np.uint64(0x100000001B3) ^ words[:, i]
+    return keys
+
+
 HTML_TEMPLATE = """
 <h3><b>Similar Images</b></h3>
 <div>
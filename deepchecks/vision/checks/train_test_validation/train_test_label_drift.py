@@ -170,7 +170,9 @@ class TrainTestLabelDrift(TrainTestCheck):
 
         for label_property in self._label_properties:
             # Flatten the properties since I don't care in this check about the property-per-sample coupling
-            properties[label_property['name']] += properties_flatten(label_property['method'](batch.labels))
+            properties[label_property['name']] += properties_flatten(
+                batch.vision_property(label_property['method'], 'labels')
+            )
 
     def compute(self, context: Context) -> CheckResult:
         """Calculate drift on label properties samples that were collected during update() calls.
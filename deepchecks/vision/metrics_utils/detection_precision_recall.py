@@ -154,77 +154,88 @@ class AveragePrecisionRecall(Metric):
             acc["NP"].append(image_evals["NP"])
 
     def _evaluate_image(self, detections, ground_truths, ious):
-        """Evaluate image."""
+        """Evaluate image.
+
+        The detections are matched to the ground truths for all the iou thresholds and area ranges at once, and the
+        results for each max detections are taken from the matching of the top confidence detections.
+        """
         # Sort detections by decreasing confidence
         confidences = self.get_confidences(detections)
-        areas = self.get_detection_areas(detections)
         sorted_confidence_ids = np.argsort(confidences, kind="stable")[::-1]
-        orig_ious = ious
-        orig_gt = ground_truths
-        ground_truth_area = np.array(self.get_labels_areas(ground_truths))
+        top_detections_idx = sorted_confidence_ids[:max(self.max_detections_per_class)]
+        ious = np.asarray(ious)[top_detections_idx]
+
+        # Ignore flags in the shape of (area ranges, boxes)
+        ground_truth_to_ignore = self._get_ignore_areas(self.get_labels_areas(ground_truths))
+        detection_area_to_ignore = self._get_ignore_areas(
+            np.asarray(self.get_detection_areas(detections))[top_detections_idx]
+        )
+
+        # Index of the matched ground truth in the shape of (area ranges, iou thresholds, detections), -1 if unmatched
+        detection_matches = self._get_best_matches(ious, ground_truth_to_ignore)
+        is_matched = detection_matches > -1
+        # A matched detection is ignored if its ground truth is ignored, otherwise by its own area
+        detections_to_ignore = detection_area_to_ignore[:, None, :].repeat(len(self.iou_thresholds), axis=1)
+        area_i, iou_i, d_idx = np.nonzero(is_matched)
+        detections_to_ignore[area_i, iou_i, d_idx] = ground_truth_to_ignore[area_i, detection_matches[is_matched]]
+        n_not_ignored_ground_truths = (~ground_truth_to_ignore).sum(axis=1)
+        top_confidences = np.asarray(confidences)[top_detections_idx]
 
         scores = {}
         matched = {}
         n_gts = {}
-        for min_iou in self.iou_thresholds:
+        for iou_i, min_iou in enumerate(self.iou_thresholds):
             for top_n_detections in self.max_detections_per_class:
-                for area_size in self.area_ranges_names:
-                    # sort list of dts and chop by max dets
-                    top_detections_idx = sorted_confidence_ids[:top_n_detections]
-                    ious = orig_ious[top_detections_idx]
-                    ground_truth_to_ignore = [self._is_ignore_area(gt_area, area_size) for gt_area in ground_truth_area]
-
-                    # sort gts by ignore last
-                    gt_sort = np.argsort(ground_truth_to_ignore, kind="stable")
-                    ground_truths = [orig_gt[idx] for idx in gt_sort]
-                    ground_truth_to_ignore = [ground_truth_to_ignore[idx] for idx in gt_sort]
-
-                    ious = ious[:, gt_sort]
-
-                    detection_matches = \
-                        self._get_best_matches(top_detections_idx, min_iou, ground_truths, ground_truth_to_ignore, ious)
-
-                    # generate ignore list for dts
-                    detections_to_ignore = [
-                        ground_truth_to_ignore[detection_matches[d_idx]] if d_idx in detection_matches
-                        else self._is_ignore_area(areas[real_index], area_size)
-                        for d_idx, real_index in enumerate(top_detections_idx)
-                    ]
-
-                    # get score for non-ignored dts
-                    scores[(area_size, top_n_detections, min_iou)] = \
-                        [confidences[real_index] for d_idx, real_index in enumerate(top_detections_idx)
-                         if not detections_to_ignore[d_idx]]
-                    matched[(area_size, top_n_detections, min_iou)] = \
-                        [d_idx in detection_matches for d_idx, real_index in enumerate(top_detections_idx)
-                         if not detections_to_ignore[d_idx]]
-                    n_gts[(area_size, top_n_detections, min_iou)] = \
-                        len([g_idx for g_idx in range(len(ground_truths)) if not ground_truth_to_ignore[g_idx]])
+                for area_i, area_size in enumerate(self.area_ranges_names):
+                    # Detections are matched greedily by confidence, so the matches of the top n detections are the
+                    # same as when matching only them
+                    not_ignored = ~detections_to_ignore[area_i, iou_i, :top_n_detections]
+                    key = (area_size, top_n_detections, min_iou)
+                    scores[key] = top_confidences[:top_n_detections][not_ignored].tolist()
+                    matched[key] = is_matched[area_i, iou_i, :top_n_detections][not_ignored].tolist()
+                    n_gts[key] = int(n_not_ignored_ground_truths[area_i])
         return {"scores": scores, "matched": matched, "NP": n_gts}
 
-    def _get_best_matches(self, dt, min_iou, ground_truths, ground_truth_to_ignore, ious):
-        ground_truth_matched = {}
-        detection_matches = {}
-
-        for d_idx in range(len(dt)):
-            # information about best match so far (best_match=-1 -> unmatched)
-            best_iou = min(min_iou, 1 - 1e-10)
-            best_match = -1
-            for g_idx in range(len(ground_truths)):
-                # if this gt already matched, continue
-                if g_idx in ground_truth_matched:
-                    continue
-                # if dt matched and currently on ignore gt, stop
-                # this exists to allow for matching ignored ground truth, so that we ignore this detection
-                if best_match > -1 and ground_truth_to_ignore[g_idx]:
-                    break
-
-                if ious[d_idx, g_idx] >= best_iou:
-                    best_iou = ious[d_idx, g_idx]
-                    best_match = g_idx
-            if best_match != -1:
-                detection_matches[d_idx] = best_match
-                ground_truth_matched[best_match] = d_idx
+    def _get_best_matches(self, ious: np.ndarray, ground_truth_to_ignore: np.ndarray) -> np.ndarray:
+        """Match greedily each detection, by decreasing confidence, to the unmatched ground truth with the best iou.
+
+        Ground truths which are not ignored are preferred, and among equal ious the last ground truth is matched. The
+        matching is done for all the iou thresholds and area ranges at once.
+
+        Parameters
+        ----------
+        ious : np.ndarray
+            Matrix of ious in the shape of (detections sorted by decreasing confidence, ground truths)
+        ground_truth_to_ignore : np.ndarray
+            Ignore flags of the ground truths in the shape of (area ranges, ground truths)
+        Returns
+        -------
+        np.ndarray
+            Index of the matched ground truth in the shape of (area ranges, iou thresholds, detections), -1 if the
+            detection is unmatched.
+        """
+        n_detections, n_ground_truths = ious.shape
+        n_areas = ground_truth_to_ignore.shape[0]
+        min_ious = np.minimum(self.iou_thresholds, 1 - 1e-10)[None, :, None]
+        detection_matches = -np.ones((n_areas, len(self.iou_thresholds), n_detections), dtype=int)
+        if n_ground_truths == 0:
+            return detection_matches
+
+        ground_truth_matched = np.zeros((n_areas, len(self.iou_thresholds), n_ground_truths), dtype=bool)
+        ignored = ground_truth_to_ignore[:, None, :]
+        # Reversed order of the ground truths, so argmax returns the last of equal ious
+        reverse = np.arange(n_ground_truths)[::-1]
+        for d_idx in range(n_detections):
+            detection_ious = ious[d_idx]
+            can_match = ~ground_truth_matched & (detection_ious >= min_ious)
+            best = np.full(ground_truth_matched.shape[:2], -1)
+            for candidates in (can_match & ignored, can_match & ~ignored):
+                candidates_ious = np.where(candidates, detection_ious, -np.inf)[..., reverse]
+                has_match = candidates.any(axis=2)
+                best = np.where(has_match, reverse[candidates_ious.argmax(axis=2)], best)
+            detection_matches[..., d_idx] = best
+            area_i, iou_i = np.nonzero(best > -1)
+            ground_truth_matched[area_i, iou_i, best[area_i, iou_i]] = True
         return detection_matches
 
     def _compute_ap_recall(self, scores, matched, n_positives, recall_thresholds=None):
@@ -261,6 +272,11 @@ class AveragePrecisionRecall(Metric):
             return np.mean(i_pr), rc[-1]
         return 0, 0
 
+    def _get_ignore_areas(self, areas) -> np.ndarray:
+        """Return ignore flags of the bounding boxes areas in the shape of (area ranges, boxes)."""
+        return np.array([[self._is_ignore_area(area_bb, area_size) for area_bb in areas]
+                         for area_size in self.area_ranges_names], dtype=bool).reshape(len(self.area_ranges_names), -1)
+
     def _is_ignore_area(self, area_bb, area_size):
         """Generate ignored gt list by area_range."""
         if area_size == "small":
@@ -10,8 +10,10 @@
 #
 """Module for base vision abstractions."""
 # pylint: disable=broad-except,not-callable
+import contextlib
 from collections import OrderedDict
-from typing import Dict, List, Mapping, Optional, Tuple, Union
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import torch
 from ignite.metrics import Metric
@@ -22,6 +24,7 @@ from deepchecks.core.checks import DatasetKind
 from deepchecks.core.errors import DeepchecksNotSupportedError
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.utils.ipython import ProgressBarGroup
+from deepchecks.utils.validation import validate_n_jobs
 from deepchecks.vision.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
 from deepchecks.vision.batch_wrapper import Batch
 from deepchecks.vision.context import Context
@@ -50,6 +53,7 @@ class Suite(BaseSuite):
             n_samples: Optional[int] = 10_000,
             train_predictions: Union[List[torch.Tensor], torch.Tensor] = None,
             test_predictions: Union[List[torch.Tensor], torch.Tensor] = None,
+            n_jobs: int = 1,
     ) -> SuiteResult:
         """Run all checks.
 
@@ -74,11 +78,16 @@ class Suite(BaseSuite):
             A seed to set for pseudo-random functions
         n_samples : int, default: 10,000
             number of samples to draw from the dataset.
+        n_jobs : int , default: 1
+            Number of threads updating the checks with each batch. When different from 1, the next batch is loaded
+            and predicted on in the background while the checks consume the current one. -1 means using all
+            processors.
         Returns
         -------
         SuiteResult
             All results by all initialized checks
         """
+        n_jobs = validate_n_jobs(n_jobs)
         run_train_test_checks = train_dataset is not None and test_dataset is not None
         non_single_checks = {k: check for k, check in self.checks.items() if not isinstance(check, SingleDatasetCheck)}
 
@@ -117,7 +126,8 @@ class Suite(BaseSuite):
                     run_train_test_checks=run_train_test_checks,
                     results=results,
                     dataset_kind=DatasetKind.TRAIN,
-                    progressbar_factory=progressbar_factory
+                    progressbar_factory=progressbar_factory,
+                    n_jobs=n_jobs
                 )
 
             if test_dataset is not None:
@@ -126,7 +136,8 @@ class Suite(BaseSuite):
                     run_train_test_checks=run_train_test_checks,
                     results=results,
                     dataset_kind=DatasetKind.TEST,
-                    progressbar_factory=progressbar_factory
+                    progressbar_factory=progressbar_factory,
+                    n_jobs=n_jobs
                 )
 
             # Need to compute only on not SingleDatasetCheck, since they computed inside the loop
@@ -159,7 +170,8 @@ class Suite(BaseSuite):
         run_train_test_checks: bool,
         results: Dict[Union[str, int], BaseCheckResult],
         dataset_kind: DatasetKind,
-        progressbar_factory: ProgressBarGroup
+        progressbar_factory: ProgressBarGroup,
+        n_jobs: int = 1
     ):
         type_suffix = ' - Test Dataset' if dataset_kind == DatasetKind.TEST else ' - Train Dataset'
         vision_data = context.get_data_by_kind(dataset_kind)
@@ -182,32 +194,32 @@ class Suite(BaseSuite):
             unit='Batch'
         )
 
-        # Run on all the batches
-        batch_start_index = 0
-        for batch in batches_pbar:
-            batch = Batch(batch, context, dataset_kind, batch_start_index)
-            vision_data.update_cache(batch)
-            for check_idx, check in self.checks.items():
+        with contextlib.ExitStack() as stack:
+            if n_jobs == 1:
+                loader = executor = None
+            else:
+                loader = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=n_jobs))
+
+            # Run on all the batches
+            for batch in self._iterate_batches(batches_pbar, context, dataset_kind, loader):
+                vision_data.update_cache(batch)
                 # If index in results the check already failed before
-                if check_idx in results:
-                    continue
-                try:
-                    if isinstance(check, TrainTestCheck):
-                        if run_train_test_checks is True:
-                            check.update(context, batch, dataset_kind=dataset_kind)
-                        else:
-                            msg = 'Check is irrelevant if not supplied with both train and test datasets'
-                            results[check_idx] = self._get_unsupported_failure(check, msg)
-                    elif isinstance(check, SingleDatasetCheck):
-                        check.update(context, batch, dataset_kind=dataset_kind)
-                    elif isinstance(check, ModelOnlyCheck):
-                        pass
-                    else:
-                        raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
-                except Exception as exp:
-                    results[check_idx] = CheckFailure(check, exp, type_suffix)
+                checks_to_update = [(idx, check) for idx, check in self.checks.items() if idx not in results]
 
-            batch_start_index += len(batch)
+                def update_check(check, batch=batch):
+                    return self._update_check(check, context, batch, dataset_kind, run_train_test_checks,
+                                              type_suffix)
+
+                if executor is None:
+                    failures = [update_check(check) for _, check in checks_to_update]
+                else:
+                    # Each check holds its own state, so different checks can be updated with the batch concurrently
+                    failures = list(executor.map(update_check, [check for _, check in checks_to_update]))
+
+                for (check_idx, _), failure in zip(checks_to_update, failures):
+                    if failure is not None:
+                        results[check_idx] = failure
 
         # SingleDatasetChecks have different handling. If we had failure in them need to add suffix to the index of
         # the results, else need to compute it.
@@ -234,6 +246,82 @@ class Suite(BaseSuite):
                     except Exception as exp:
                         results[index_of_kind] = CheckFailure(check, exp, type_suffix)
 
+    @classmethod
+    def _update_check(
+        cls,
+        check,
+        context: Context,
+        batch: Batch,
+        dataset_kind: DatasetKind,
+        run_train_test_checks: bool,
+        type_suffix: str
+    ) -> Optional[CheckFailure]:
+        """Update the check with the batch, return the failure of the check if there was one."""
+        try:
+            if isinstance(check, TrainTestCheck):
+                if run_train_test_checks is True:
+                    check.update(context, batch, dataset_kind=dataset_kind)
+                else:
+                    msg = 'Check is irrelevant if not supplied with both train and test datasets'
+                    return cls._get_unsupported_failure(check, msg)
+            elif isinstance(check, SingleDatasetCheck):
+                check.update(context, batch, dataset_kind=dataset_kind)
+            elif isinstance(check, ModelOnlyCheck):
+                pass
+            else:
+                raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
+        except Exception as exp:
+            return CheckFailure(check, exp, type_suffix)
+        return None
+
+    @classmethod
+    def _iterate_batches(
+        cls,
+        batches: Iterable,
+        context: Context,
+        dataset_kind: DatasetKind,
+        loader: Optional[Executor] = None
+    ) -> Iterator[Batch]:
+        """Iterate over the batches of the data loader wrapped as Batch objects.
+
+        If a loader executor is given, the next batch is loaded in the background while the current batch is consumed.
+        Its labels and predictions are calculated in the background as well, but only once the checks used them on a
+        previous batch, so the model isn't run for checks that don't need it.
+        """
+        iterator = iter(batches)
+        batch_start_index = 0
+        used_batch_data = set()
+
+        def load_next_batch():
+            nonlocal batch_start_index
+            batch = next(iterator, None)
+            if batch is None:
+                return None
+            batch = Batch(batch, context, dataset_kind, batch_start_index)
+            batch_start_index += len(batch)
+            if loader is not None:
+                for data_name in ('labels', 'predictions'):
+                    if data_name in used_batch_data:
+                        # Errors are raised again by the checks that use the labels or predictions
+                        with contextlib.suppress(Exception):
+                            getattr(batch, data_name)
+            return batch
+
+        if loader is None:
+            batch = load_next_batch()
+            while batch is not None:
+                yield batch
+                batch = load_next_batch()
+        else:
+            next_batch = loader.submit(load_next_batch)
+            batch = next_batch.result()
+            while batch is not None:
+                next_batch = loader.submit(load_next_batch)
+                yield batch
+                used_batch_data.update(data_name for data_name in ('labels', 'predictions')
+                                       if batch.is_calculated(data_name))
+                batch = next_batch.result()
+
     @classmethod
     def _get_unsupported_failure(cls, check, msg):
         return CheckFailure(check, DeepchecksNotSupportedError(msg))
@@ -10,7 +10,8 @@
 #
 """Module containing the image formatter class for the vision module."""
 import warnings
-from typing import Any, Dict, List, Tuple
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Tuple
 
 import numpy as np
 from skimage.color import rgb2gray
@@ -27,6 +28,7 @@ __all__ = ['default_image_properties',
            'mean_green_relative_intensity',
            'get_size',
            'get_dimension',
+           'calculate_default_properties',
            'validate_properties',
            'get_column_type']
 
@@ -43,14 +45,12 @@ def area(batch: List[np.ndarray]) -> List[int]:
 
 def brightness(batch: List[np.ndarray]) -> List[float]:
     """Calculate brightness on each image in the batch."""
-    return [img.mean() if _is_grayscale(img) else rgb2gray(img).mean()
-            for img in batch]
+    return _apply_on_stacked_images(batch, lambda images: _gray(images).mean(axis=(1, 2)))
 
 
 def rms_contrast(batch: List[np.array]) -> List[float]:
     """Return RMS contrast of image."""
-    return [img.std() if _is_grayscale(img) else rgb2gray(img).std()
-            for img in batch]
+    return _apply_on_stacked_images(batch, lambda images: _gray(images).std(axis=(1, 2)))
 
 
 def mean_red_relative_intensity(batch: List[np.ndarray]) -> List[float]:
@@ -91,30 +91,83 @@ def _rgb_relative_intensity_mean(batch: List[np.ndarray]) -> List[Tuple[float, f
         List of 3-dimensional arrays, each dimension is the normalized mean of the color channel. An array is
         returned for each image.
     """
-    return [_normalize_pixelwise(img).mean(axis=(1, 2)) if not _is_grayscale(img) else (None, None, None)
-            for img in batch]
+    return _apply_on_stacked_images(batch, _stacked_rgb_relative_intensity_mean)
 
 
-def _normalize_pixelwise(img: np.ndarray) -> np.ndarray:
-    """Normalize the pixel values of an image.
+def calculate_default_properties(batch: List[np.ndarray]) -> Dict[str, List]:
+    """Calculate all the default image properties on the batch in a single pass.
+
+    Images of the same shape are stacked into a single array, so the gray scale conversion and the pixelwise
+    normalization of each image are done once for all of the properties.
 
     Parameters
     ----------
-    img: np.ndarray
-        The image to normalize.
+    batch: List[np.ndarray]
+        A list of arrays, each arrays represents an image in the required deepchecks format.
 
     Returns
     -------
-    np.ndarray
-        The normalized image.
+    Dict[str, List]
+        The values of each of the default image properties by the property name, in the same format as returned by
+        the property methods.
     """
-    s = img.sum(axis=2)
-    return np.array([np.divide(img[:, :, i], s, out=np.zeros_like(img[:, :, i], dtype='float64'), where=s != 0)
-                     for i in range(3)])
+    def calculate(images: np.ndarray) -> List[Tuple]:
+        gray = _gray(images)
+        intensities = _stacked_rgb_relative_intensity_mean(images)
+        return list(zip(gray.mean(axis=(1, 2)), gray.std(axis=(1, 2)), intensities))
+
+    values = _apply_on_stacked_images(batch, calculate)
+    sizes = _sizes(batch)
+    return {
+        'Aspect Ratio': [x[0] / x[1] for x in sizes],
+        'Area': [np.prod(x) for x in sizes],
+        'Brightness': [x[0] for x in values],
+        'RMS Contrast': [x[1] for x in values],
+        'Mean Red Relative Intensity': [x[2][0] for x in values],
+        'Mean Green Relative Intensity': [x[2][1] for x in values],
+        'Mean Blue Relative Intensity': [x[2][2] for x in values],
+    }
+
 
+def _apply_on_stacked_images(batch: List[np.ndarray], func: Callable[[np.ndarray], Any],
+                             max_stacked_pixels: int = 2 ** 18) -> List:
+    """Apply a function on stacks of the images in the batch and return its results in the order of the batch.
 
-def _is_grayscale(img):
-    return get_dimension(img) == 1
+    Images of the same shape are stacked together into arrays of up to max_stacked_pixels values, and the function
+    receives each stack and returns a result per image of the stack.
+    """
+    indices_by_shape = defaultdict(list)
+    for index, img in enumerate(batch):
+        indices_by_shape[img.shape].append(index)
+
+    results = [None] * len(batch)
+    for shape, indices in indices_by_shape.items():
+        stack_size = max(1, max_stacked_pixels // max(1, int(np.prod(shape))))
+        for start in range(0, len(indices), stack_size):
+            stack_indices = indices[start:start + stack_size]
+            stack_results = func(np.stack([batch[index] for index in stack_indices]))
+            for index, result in zip(stack_indices, stack_results):
+                results[index] = result
+    return results
+
+
+def _gray(images: np.ndarray) -> np.ndarray:
+    """Return the gray scale of a stack of images, grayscale images are returned as is."""
+    if images.shape[3] == 1:
+        return images[..., 0]
+    if images.shape[3] == 3:
+        return rgb2gray(images)
+    return np.stack([rgb2gray(img) for img in images])
+
+
+def _stacked_rgb_relative_intensity_mean(images: np.ndarray) -> List:
+    """Calculate the normalized mean of each channel (rgb) for a stack of images, see _rgb_relative_intensity_mean."""
+    if images.shape[3] == 1:
+        return [(None, None, None)] * len(images)
+    s = images.sum(axis=3, dtype='float64')
+    inverse_s = np.divide(1.0, s, out=np.zeros_like(s), where=s != 0)
+    # Mean over the pixels of each channel divided by the pixel sum of all channels
+    return list(np.einsum('nhwc,nhw->nc', images, inverse_s) / (images.shape[1] * images.shape[2]))
 
 
 def get_size(img) -> Tuple[int, int]:
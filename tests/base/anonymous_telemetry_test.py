@@ -0,0 +1,57 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Tests for the anonymous telemetry."""
+import threading
+import time
+from unittest import mock
+
+from hamcrest import assert_that, equal_to, less_than
+
+from deepchecks.analytics import anonymous_telemetry
+
+
+class _SlowConnection:
+    """HTTPS connection that never gets a response before its timeout."""
+
+    requests = []
+    release = threading.Event()
+
+    def __init__(self, host, timeout):
+        self.timeout = timeout
+
+    def request(self, method, url):
+        self.requests.append((method, url))
+        self.release.wait(self.timeout)
+
+    def getresponse(self):
+        raise TimeoutError()
+
+
+def test_import_event_does_not_block(tmp_path):
+    with mock.patch.object(anonymous_telemetry, 'ANALYTICS_DISABLED', False), \
+            mock.patch.object(anonymous_telemetry, 'MODULE_DIR', tmp_path), \
+            mock.patch('http.client.HTTPSConnection', _SlowConnection):
+        start = time.time()
+        thread = anonymous_telemetry.send_anonymous_import_event()
+        elapsed = time.time() - start
+
+        assert_that(elapsed, less_than(0.5))
+        assert_that(thread.daemon, equal_to(True))
+        _SlowConnection.release.set()
+        thread.join(5)
+
+    assert_that(thread.is_alive(), equal_to(False))
+    assert_that(len(_SlowConnection.requests), equal_to(1))
+
+
+def test_import_event_disabled():
+    with mock.patch.object(anonymous_telemetry, 'ANALYTICS_DISABLED', True):
+        assert_that(anonymous_telemetry.send_anonymous_import_event(), equal_to(None))
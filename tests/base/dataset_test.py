@@ -11,11 +11,12 @@
 """Contains unit tests for the Dataset class."""
 import typing as t
 import warnings
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 from hamcrest import (all_of, assert_that, calling, contains_exactly, equal_to, greater_than, has_item, has_length,
-                      has_property, instance_of, is_, not_none, raises)
+                      has_property, instance_of, is_, is_not, not_none, raises)
 from sklearn.datasets import load_iris, make_classification
 
 from deepchecks.core.errors import DeepchecksValueError
@@ -826,6 +827,66 @@ def test_sample_drop_nan_labels(iris):
     assert_that(sample, has_length(50))
 
 
+def test_derived_datasets_keep_metadata(iris):
+    # Arrange
+    iris = iris.copy()
+    iris['date'] = pd.date_range('2021-01-01', periods=len(iris)).astype(str)
+    dataset = Dataset(iris, label='target', cat_features=['petal width (cm)'], datetime_name='date')
+    # Act
+    with patch.object(Dataset, '_infer_categorical_features') as infer_cat_features, \
+            patch.object(Dataset, '_infer_label_type') as infer_label_type:
+        sample = dataset.sample(50, random_state=0)
+        selected = dataset.select(ignore_columns=['petal width (cm)'])
+        train, test = dataset.train_test_split()
+        casted = Dataset.cast_to_dataset(dataset)
+    # Assert
+    infer_cat_features.assert_not_called()
+    infer_label_type.assert_not_called()
+    assert_that(sample.data.equals(dataset.data.loc[sample.data.index]), is_(True))
+    for derived in (sample, train, test, casted):
+        assert_that(derived.cat_features, equal_to(['petal width (cm)']))
+        assert_that(derived.numerical_features, equal_to(dataset.numerical_features))
+        assert_that(derived.label_type, equal_to(dataset.label_type))
+        assert_that(derived.datetime_name, equal_to('date'))
+    assert_that(selected.cat_features, equal_to([]))
+    assert_that(selected.features, is_not(has_item('petal width (cm)')))
+    assert_that(np.shares_memory(casted.data['target'], dataset.data['target']), is_(False))
+
+
+def test_cast_to_dataset_copies_data(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    # Act
+    casted = Dataset.cast_to_dataset(dataset)
+    casted.data.loc[0, 'sepal length (cm)'] = 99
+    # Assert
+    assert_that(dataset.data.loc[0, 'sepal length (cm)'], equal_to(iris.loc[0, 'sepal length (cm)']))
+    assert_that(casted.cat_features, equal_to(dataset.cat_features))
+
+
+def test_derived_dataset_classes(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    # Act
+    sample = dataset.copy(iris[iris['target'] != 2])
+    selected = dataset.select(ignore_columns=['sepal length (cm)'])
+    # Assert
+    assert_that(dataset.classes, equal_to((0, 1, 2)))
+    assert_that(sample.classes, equal_to((0, 1)))
+    assert_that(selected.classes, equal_to((0, 1, 2)))
+
+
+def test_copy_with_new_schema(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    new_data = iris.assign(**{'sepal length (cm)': iris['sepal length (cm)'].astype(str)})
+    # Act
+    copied = dataset.copy(new_data)
+    # Assert
+    assert_that(copied.data is new_data, is_(False))
+    assert_that(copied.numerical_features, is_not(has_item('sepal length (cm)')))
+
+
 def test__ensure_not_empty_dataset__with_empty_dataset():
     # Assert
     assert_that(
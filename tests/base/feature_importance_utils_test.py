@@ -9,21 +9,26 @@
 # ----------------------------------------------------------------------------
 #
 """Test feature importance utils"""
+import time
 import warnings
 
+import numpy as np
 import pandas as pd
 import pytest
 from hamcrest import (any_of, assert_that, calling, close_to, contains_exactly, contains_string, equal_to, has_length,
-                      is_, none, not_none, raises)
+                      is_, less_than, none, not_none, raises)
 from sklearn.ensemble import AdaBoostClassifier
+from sklearn.inspection import permutation_importance
 from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.neural_network import MLPClassifier
 from sklearn.pipeline import Pipeline
 
 from deepchecks.core.errors import DeepchecksValueError, ModelValidationError
 from deepchecks.tabular.dataset import Dataset
-from deepchecks.utils.features import (calculate_feature_importance, calculate_feature_importance_or_none,
-                                       column_importance_sorter_df, column_importance_sorter_dict)
+from deepchecks.utils.features import (_calc_permutation_importance, calculate_feature_importance,
+                                       calculate_feature_importance_or_none, column_importance_sorter_df,
+                                       column_importance_sorter_dict)
+from deepchecks.utils.metrics import get_default_scorers, init_validate_scorers, task_type_check
 
 
 def test_adaboost(iris_split_dataset_and_model):
@@ -245,3 +250,71 @@ def test_permutation_importance_with_nan_labels(iris_split_dataset_and_model):
     # Assert
     assert_that(feature_importances.sum(), close_to(1, 0.0001))
     assert_that(fi_type, is_('permutation_importance'))
+
+
+class _SlowModel:
+    """Classifier wrapper sleeping on every inference."""
+
+    def __init__(self, model, delay):
+        self.model = model
+        self.delay = delay
+
+    def predict(self, data):
+        time.sleep(self.delay)
+        return self.model.predict(data)
+
+    def predict_proba(self, data):
+        time.sleep(self.delay)
+        return self.model.predict_proba(data)
+
+    @property
+    def classes_(self):
+        return self.model.classes_
+
+
+def test_permutation_importance_same_as_sklearn(iris_split_dataset_and_model):
+    # Arrange
+    train_ds, _, adaboost = iris_split_dataset_and_model
+    scorer = get_default_scorers(task_type_check(adaboost, train_ds))
+    scorer = init_validate_scorers(scorer, adaboost, train_ds)[0]
+    # The importance is calculated on a shuffled sample of the dataset
+    sample = train_ds.sample(10_000, drop_na_label=True, random_state=42)
+    sklearn_result = permutation_importance(adaboost, sample.features_columns, sample.label_col,
+                                            n_repeats=30, random_state=42, scoring=scorer.scorer)
+    expected = sklearn_result.importances_mean * (sklearn_result.importances_mean > 0)
+
+    # Act
+    feature_importances = _calc_permutation_importance(adaboost, train_ds, alternative_scorer=scorer, tolerance=0,
+                                                       n_jobs=2)
+    early_stopped = _calc_permutation_importance(adaboost, train_ds, alternative_scorer=scorer)
+
+    # Assert
+    assert_that(np.allclose(feature_importances.values, expected / expected.sum()), is_(True))
+    assert_that(np.allclose(early_stopped.values, expected / expected.sum(), atol=0.05), is_(True))
+
+
+def test_permutation_importance_stops_on_timeout(iris_split_dataset_and_model):
+    # Arrange
+    train_ds, _, adaboost = iris_split_dataset_and_model
+    model = _SlowModel(adaboost, delay=0.05)
+
+    # Act
+    start = time.time()
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        feature_importances = _calc_permutation_importance(model, train_ds, timeout=1, n_jobs=1, tolerance=0)
+
+    # Assert
+    assert_that(time.time() - start, less_than(2))
+    assert_that(str(w[-1].message), contains_string('Permutation feature importance calculation reached the '
+                                                    'timeout of 1 seconds'))
+    assert_that(feature_importances.sum(), close_to(1, 0.0001))
+
+
+def test_permutation_importance_with_invalid_n_jobs(iris_split_dataset_and_model):
+    # Arrange
+    train_ds, _, adaboost = iris_split_dataset_and_model
+
+    # Act & Assert
+    assert_that(calling(_calc_permutation_importance).with_args(adaboost, train_ds, n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be -1 or a positive integer, but got: 0'))
@@ -0,0 +1,95 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Tests that importing deepchecks and computing check values doesn't import the display stack."""
+import re
+import subprocess
+import sys
+import textwrap
+
+from hamcrest import assert_that, empty, equal_to, less_than
+
+DISPLAY_MODULES = ['plotly', 'matplotlib', 'IPython', 'ipywidgets', 'wandb', 'nbformat', 'pandas.io.formats.style']
+
+
+def _imported_display_modules(code: str):
+    code = textwrap.dedent(code) + textwrap.dedent(f"""
+        import sys
+        print('imported:' + ','.join(m for m in {DISPLAY_MODULES!r} if m in sys.modules))
+    """)
+    process = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=False)
+    assert_that(process.returncode, equal_to(0), process.stderr)
+    imported = [line for line in process.stdout.splitlines() if line.startswith('imported:')][-1]
+    return [m for m in imported[len('imported:'):].split(',') if m]
+
+
+def test_import_deepchecks():
+    assert_that(_imported_display_modules('import deepchecks'), empty())
+
+
+def test_import_tabular_checks():
+    assert_that(_imported_display_modules("""
+        import deepchecks.tabular
+        import deepchecks.tabular.checks
+    """), empty())
+
+
+def test_run_suite_values_only():
+    assert_that(_imported_display_modules("""
+        import numpy as np
+        import pandas as pd
+        from deepchecks.core import CheckResult
+        from deepchecks.tabular import Dataset
+        from deepchecks.tabular.suites import data_integrity
+
+        rng = np.random.default_rng(42)
+        df = pd.DataFrame({'a': rng.normal(size=300), 'b': rng.choice(['x', 'y', 'z'], 300),
+                           'c': rng.integers(0, 5, 300), 'label': rng.integers(0, 2, 300)})
+        df.loc[::10, 'a'] = None
+        result = data_integrity().run(Dataset(df, cat_features=['b'], label='label'), with_display=False)
+        assert all(isinstance(check_result, CheckResult) for check_result in result.results)
+    """), empty())
+
+
+def test_run_full_suite_values_only():
+    assert_that(_imported_display_modules("""
+        from sklearn.datasets import load_iris
+        from sklearn.ensemble import AdaBoostClassifier
+        from deepchecks.tabular import Dataset
+        from deepchecks.tabular.suites import full_suite
+
+        df = load_iris(as_frame=True).frame
+        train_df = df.sample(frac=0.6, random_state=42)
+        test_df = df.drop(train_df.index)
+        model = AdaBoostClassifier(random_state=42).fit(train_df.drop(columns='target'), train_df['target'])
+        train = Dataset(train_df, label='target', cat_features=[])
+        test = Dataset(test_df, label='target', cat_features=[])
+        result = full_suite().run(train, test, model, with_display=False)
+        assert result.results
+    """), empty())
+
+
+def test_import_time_budget():
+    # Benchmark the import of deepchecks.tabular with `python -X importtime`, which reports the time spent on
+    # every imported module. The deepchecks modules themselves should stay a small part of the total import time,
+    # which is spent mostly on its dependencies (pandas, scipy and sklearn), and no display module is imported.
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import deepchecks.tabular'],
+                             capture_output=True, text=True, check=False)
+    assert_that(process.returncode, equal_to(0), process.stderr)
+
+    self_times = {}
+    for line in process.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)', line)
+        if match:
+            self_times[match.group(2)] = int(match.group(1))
+
+    assert_that([m for m in DISPLAY_MODULES if m in self_times], empty())
+    deepchecks_time = sum(time for name, time in self_times.items() if name.split('.')[0] == 'deepchecks')
+    assert_that(deepchecks_time / sum(self_times.values()), less_than(0.25))
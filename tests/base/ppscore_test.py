@@ -0,0 +1,53 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Tests for the PPS calculation."""
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, calling, equal_to, raises
+
+from deepchecks import ppscore as pps
+from deepchecks.core.errors import DeepchecksValueError
+
+
+def _dataframe():
+    np.random.seed(42)
+    df = pd.DataFrame(np.random.randn(300, 3), columns=['x1', 'x2', 'x3'])
+    df['x4'] = np.random.choice(['a', 'b', 'c'], 300)
+    df.loc[::5, 'x3'] = np.nan
+    df['label'] = np.where(df['x1'] > 0.5, 'high', np.where(df['x2'] > 0, 'mid', 'low'))
+    return df
+
+
+def test_predictors_same_as_score_per_feature():
+    df = _dataframe()
+
+    result = pps.predictors(df, 'label', sorted=False, output='list', n_jobs=2)
+
+    expected = [pps.score(df, column, 'label') for column in ['x1', 'x2', 'x3', 'x4']]
+    assert_that(result, equal_to(expected))
+
+
+def test_predictors_per_class_same_as_one_vs_all_predictors():
+    df = _dataframe()
+
+    result = pps.predictors_per_class(df, 'label', n_jobs=2)
+
+    for class_name in ['high', 'mid', 'low']:
+        one_vs_all = df.copy()
+        one_vs_all['label'] = one_vs_all['label'].apply(lambda x, c=class_name: 1 if x == c else 0)
+        expected = pps.predictors(one_vs_all, 'label')
+        assert_that(result[class_name].equals(expected), equal_to(True))
+
+
+def test_predictors_with_invalid_n_jobs():
+    df = _dataframe()
+
+    assert_that(calling(pps.predictors).with_args(df, 'label', n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be -1 or a positive integer, but got: 0'))
@@ -0,0 +1,102 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Tests for the check results cache."""
+import os
+
+from hamcrest import assert_that, equal_to, has_length, instance_of, less_than_or_equal_to
+
+from deepchecks.core import CheckResult
+from deepchecks.core.result_cache import ResultCache
+from deepchecks.tabular import Suite, TrainTestCheck
+from deepchecks.tabular.checks import MixedNulls, PerformanceReport
+
+
+class _CountingCheck(TrainTestCheck):
+    """Check counting the number of times it actually ran."""
+
+    runs = 0
+
+    def __init__(self, value=1, with_local_display=False, **kwargs):
+        super().__init__(**kwargs)
+        self.value = value
+        self.with_local_display = with_local_display
+
+    def run_logic(self, context):
+        type(self).runs += 1
+        display = [lambda: None] if self.with_local_display else None
+        return CheckResult({'value': self.value, 'train': context.train.n_samples}, display=display)
+
+    def add_condition_value_positive(self):
+        return self.add_condition('Value is positive', lambda result: result['value'] > 0)
+
+
+def test_suite_results_are_cached(iris_split_dataset_and_model, tmp_path):
+    train, test, clf = iris_split_dataset_and_model
+    suite = Suite('test', _CountingCheck().add_condition_value_positive(), MixedNulls(), PerformanceReport())
+    _CountingCheck.runs = 0
+
+    first = suite.run(train, test, clf, cache=str(tmp_path), with_display=False)
+    second = suite.run(train, test, clf, cache=str(tmp_path), with_display=False)
+
+    assert_that(_CountingCheck.runs, equal_to(1))
+    assert_that(os.listdir(tmp_path), has_length(3))
+    assert_that([result.get_header() for result in second.results],
+                equal_to([result.get_header() for result in first.results]))
+    for result, expected in zip(second.results, first.results):
+        assert_that(result, instance_of(CheckResult))
+        assert_that(repr(result.value), equal_to(repr(expected.value)))
+        assert_that(result.check is expected.check, equal_to(True))
+        assert_that([c.is_pass for c in result.conditions_results],
+                    equal_to([c.is_pass for c in expected.conditions_results]))
+
+
+def test_cache_key_changes(iris_split_dataset_and_model, tmp_path):
+    train, test, clf = iris_split_dataset_and_model
+    cache = ResultCache(tmp_path)
+    _CountingCheck.runs = 0
+
+    _CountingCheck().run(train, test, clf, cache=cache)
+    _CountingCheck().run(train, test, clf, cache=cache)
+    assert_that(_CountingCheck.runs, equal_to(1))
+
+    _CountingCheck(value=2).run(train, test, clf, cache=cache)
+    _CountingCheck().run(train.sample(50, random_state=0), test, clf, cache=cache)
+    _CountingCheck().run(train, test, clf, cache=cache, model_version='1')
+    _CountingCheck().run(train, test, clf, cache=cache, model_version='1')
+    assert_that(_CountingCheck.runs, equal_to(4))
+
+
+def test_unpicklable_results_are_not_cached(iris_split_dataset_and_model, tmp_path):
+    train, test, clf = iris_split_dataset_and_model
+    _CountingCheck.runs = 0
+
+    for _ in range(2):
+        result = _CountingCheck(with_local_display=True).run(train, test, clf, cache=str(tmp_path))
+        assert_that(result.value['value'], equal_to(1))
+
+    assert_that(_CountingCheck.runs, equal_to(2))
+    assert_that(os.listdir(tmp_path), has_length(0))
+
+
+def test_least_recently_used_results_are_evicted(iris_split_dataset_and_model, tmp_path):
+    train, test, clf = iris_split_dataset_and_model
+    cache = ResultCache(tmp_path)
+    _CountingCheck(value=0).run(train, test, clf, cache=cache)
+    entry_size = cache.size
+    cache.max_size = entry_size * 2
+
+    for value in range(1, 4):
+        _CountingCheck(value=value).run(train, test, clf, cache=cache)
+    _CountingCheck.runs = 0
+    _CountingCheck(value=3).run(train, test, clf, cache=cache)
+    _CountingCheck(value=0).run(train, test, clf, cache=cache)
+
+    assert_that(_CountingCheck.runs, equal_to(1))
+    assert_that(cache.size, less_than_or_equal_to(cache.max_size))
@@ -108,6 +108,14 @@ def test_nan(df_with_nan_row, df_with_single_nan_in_col):
     assert_that(check_obj.run(df).value, equal_to(0))
 
 
+def test_nan_duplicates_instances():
+    duplicate_data = pd.DataFrame({'col1': [1, np.nan, 1, np.nan, 2, np.nan],
+                                   'col2': ['a', None, 'a', None, 'b', None]})
+    result = DataDuplicates().run(duplicate_data)
+    assert_that(result.value, close_to(0.5, 0.01))
+    assert_that(result.display[2].index.to_list(), equal_to([('1, 3, 5', 3), ('0, 2', 2)]))
+
+
 def test_condition_fail():
     # Arrange
     duplicate_data = pd.DataFrame({'col1': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
@@ -11,13 +11,14 @@
 """Boosting overfit tests."""
 from statistics import mean
 
-from hamcrest import assert_that, close_to, has_length
+import numpy as np
+from hamcrest import assert_that, close_to, equal_to, has_length
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
-from deepchecks.tabular.checks.model_evaluation.boosting_overfit import BoostingOverfit
+from deepchecks.tabular.checks.model_evaluation.boosting_overfit import BoostingOverfit, PartialBoostingModel
 from deepchecks.tabular.dataset import Dataset
 from tests.base.utils import equal_condition_result
 
@@ -228,3 +229,19 @@ def test_condition_score_percentage_decline_not_greater_than_not_pass(diabetes,
         name='Test score over iterations doesn\'t decline by more than 1% from the best score',
         details='Found score decline of -3.64%'
     ))
+
+
+def test_staged_predictions_same_as_partial_models(iris_split_dataset_and_model_xgb, iris_split_dataset_and_model_lgbm,
+                                                   iris_split_dataset_and_model_cat):
+    for train, test, clf in (iris_split_dataset_and_model_xgb, iris_split_dataset_and_model_lgbm,
+                             iris_split_dataset_and_model_cat):
+        steps = [1, 2, 5, 10]
+        features = test.features_columns
+
+        staged = list(PartialBoostingModel.staged_predictions(clf, features, steps))
+
+        assert_that(staged, has_length(len(steps)))
+        for step, (y_pred, y_proba) in zip(steps, staged):
+            partial_model = PartialBoostingModel(clf, step)
+            assert_that(np.array_equal(y_pred, np.ravel(partial_model.predict(features))), equal_to(True))
+            assert_that(np.allclose(y_proba, partial_model.predict_proba(features)), equal_to(True))
@@ -11,9 +11,10 @@
 import re
 import typing as t
 
-from hamcrest import assert_that, instance_of, matches_regexp, only_contains
+from hamcrest import assert_that, calling, equal_to, has_length, instance_of, matches_regexp, only_contains, raises
 
 from deepchecks.core import CheckResult, ConditionCategory
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular.checks.model_evaluation import ModelInferenceTime
 from deepchecks.tabular.dataset import Dataset
 from tests.base.utils import SCIENTIFIC_NOTATION_REGEXP, equal_condition_result
@@ -95,3 +96,67 @@ def test_model_inference_time_check_with_condition_that_should_not_pass(
         name=name,
         details=details_pattern
     ))
+
+
+def test_model_inference_time_benchmark(
+    iris_split_dataset_and_model: t.Tuple[Dataset, Dataset, object]
+):
+    # Arrange
+    _, test, model = iris_split_dataset_and_model
+    check = ModelInferenceTime(benchmark=True, batch_sizes=[1, 10, 1000], n_threads=[1, 2], n_repeats=5)
+
+    # Act
+    result = check.run(test, model)
+
+    # Assert
+    assert_that(result.value, has_length(3 * 2 * 2))
+    assert_that(list(result.value.columns),
+                equal_to(['Method', 'Batch Size', 'Threads', 'p50', 'p95', 'p99', 'Throughput']))
+    assert_that(sorted(result.value['Batch Size'].unique()), equal_to([1, 10, test.n_samples]))
+    assert_that(set(result.value['Method']), equal_to({'predict', 'predict_proba'}))
+    assert_that((result.value['p50'] <= result.value['p99']).all(), equal_to(True))
+    assert_that((result.value['Throughput'] > 0).all(), equal_to(True))
+
+
+def test_model_inference_time_benchmark_conditions(
+    iris_split_dataset_and_model: t.Tuple[Dataset, Dataset, object]
+):
+    # Arrange
+    _, test, model = iris_split_dataset_and_model
+    check = ModelInferenceTime(benchmark=True, batch_sizes=[10], prediction_methods=['predict'], n_repeats=5) \
+        .add_condition_latency_percentile_not_greater_than(95, 10) \
+        .add_condition_latency_percentile_not_greater_than(50, 0.00000001) \
+        .add_condition_throughput_is_not_less_than(1e9)
+
+    # Act
+    result = check.run(test, model)
+    latency_pass, latency_fail, throughput_fail = check.conditions_decision(result)
+
+    # Assert
+    assert_that(latency_pass, equal_condition_result(  # type: ignore
+        is_pass=True,
+        name='p95 inference latency is not greater than 10 seconds',
+        details=re.compile(fr'Found maximal p95 latency \(seconds\): {SCIENTIFIC_NOTATION_REGEXP.pattern}')
+    ))
+    assert_that(latency_fail, equal_condition_result(  # type: ignore
+        is_pass=False,
+        name='p50 inference latency is not greater than 1e-08 seconds',
+        details=re.compile(r'Found 1 out of 1 benchmarks with p50 latency \(seconds\) above threshold')
+    ))
+    assert_that(throughput_fail, equal_condition_result(  # type: ignore
+        is_pass=False,
+        name='Inference throughput is not less than 1,000,000,000 rows per second',
+        details=re.compile(r'Found 1 out of 1 benchmarks with throughput \(rows per second\) below threshold')
+    ))
+
+
+def test_model_inference_time_latency_condition_with_unknown_percentile():
+    # Arrange
+    check = ModelInferenceTime(benchmark=True)
+
+    # Act & Assert
+    assert_that(
+        calling(check.add_condition_latency_percentile_not_greater_than).with_args(90),
+        raises(DeepchecksValueError, r'percentile must be one of the percentiles of the check \[50, 95, 99\], '
+                                     r'but got 90')
+    )
@@ -10,10 +10,11 @@
 #
 """Tests for partition columns function."""
 import hamcrest as h
+import numpy as np
 import pandas as pd
 
 from deepchecks.tabular.dataset import Dataset
-from deepchecks.utils.performance.partition import partition_column
+from deepchecks.utils.performance.partition import partition_column, partition_column_codes
 
 
 def test_column_partition_numerical(diabetes):
@@ -61,3 +62,20 @@ def test_column_partition_categorical():
         h.has_entries({'count': 3, 'label': '3'}),
         h.has_entries({'count': 5, 'label': 'Others'}),
     ))
+
+
+def test_column_partition_codes_same_as_filters(diabetes):
+    # Arrange
+    train, _ = diabetes
+    df = pd.DataFrame(data={'num': [1, 1, 1, 1, 1, 1, 1, 1, np.nan, 5, 5, 8, 9, 10, 11],
+                            'cat': [1, 1, 1, 1, 2, 2, 1, 2, 2, 3, 4, np.nan, 3, 8, 9]})
+    dataset = Dataset(df, cat_features=['cat'])
+    for data, column, max_segments in ((train, 'age', 5), (dataset, 'num', 5), (dataset, 'cat', 3)):
+        # Act
+        codes, labels = partition_column_codes(data, column, max_segments)
+        filters = partition_column(data, column, max_segments)
+        # Assert
+        h.assert_that(labels, h.equal_to([v.label for v in filters]))
+        for code, segment_filter in enumerate(filters):
+            h.assert_that(list(data.data.index[codes == code]),
+                          h.equal_to(list(segment_filter.filter(data.data).index)))
@@ -9,11 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """Tests for segment performance check."""
+import numpy as np
 from hamcrest import assert_that, calling, close_to, equal_to, has_entries, has_property, raises
 
 from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
 from deepchecks.tabular.checks.model_evaluation.segment_performance import SegmentPerformance
 from deepchecks.tabular.dataset import Dataset
+from deepchecks.utils.performance.partition import partition_column
 
 
 def test_dataset_wrong_input():
@@ -88,3 +90,27 @@ def test_segment_top_features(diabetes_split_dataset_and_model):
         'counts': has_property('shape', (10, 10))
     }))
     assert_that(result['counts'].sum(), equal_to(146))
+
+
+def test_segment_performance_scores_same_as_scorer_per_segment(diabetes_split_dataset_and_model):
+    # Arrange
+    _, val, model = diabetes_split_dataset_and_model
+    check = SegmentPerformance(feature_1='age', feature_2='bmi', max_segments=50,
+                               alternative_scorer=('MAE', 'neg_mean_absolute_error'))
+
+    # Act
+    result = check.run(val, model, with_display=False).value
+
+    # Assert
+    age_filters = partition_column(val, 'age', max_segments=50)
+    bmi_filters = partition_column(val, 'bmi', max_segments=50)
+    assert_that(result['scores'].shape, equal_to((len(age_filters), len(bmi_filters))))
+    for i, age_filter in enumerate(age_filters):
+        for j, bmi_filter in enumerate(bmi_filters):
+            cell_data = bmi_filter.filter(age_filter.filter(val.data))
+            assert_that(result['counts'][i, j], equal_to(len(cell_data)))
+            if cell_data.empty:
+                assert_that(result['scores'][i, j], equal_to(None))
+            else:
+                expected = -np.abs(model.predict(cell_data[val.features]) - cell_data[val.label_name]).mean()
+                assert_that(result['scores'][i, j], close_to(expected, 1e-10))
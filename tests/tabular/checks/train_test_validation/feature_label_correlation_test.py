@@ -291,3 +291,24 @@ def test_train_test_condition_pps_train_fail():
         name=f'Train features\' Predictive Power Score is not greater than {condition_value}',
         details='Found 1 out of 5 features in train dataset with PPS above threshold: {\'x2\': \'0.84\'}'
     ))
+
+
+def test_feature_label_correlation_in_parallel_same_as_sequential():
+    df, _ = util_generate_dataframe_and_expected()
+    df.loc[::7, 'x3'] = np.nan
+    dataset = Dataset(df, label='label')
+
+    sequential = FeatureLabelCorrelation(random_state=42).run(dataset)
+    parallel = FeatureLabelCorrelation(random_state=42, n_jobs=3).run(dataset)
+
+    assert_that(parallel.value, equal_to(sequential.value))
+
+
+def test_trainval_feature_label_correlation_in_parallel_same_as_sequential():
+    df, df2, _ = util_generate_second_similar_dataframe_and_expected()
+    train_dataset, test_dataset = Dataset(df, label='label'), Dataset(df2, label='label')
+
+    sequential = FeatureLabelCorrelationChange(random_state=42).run(train_dataset, test_dataset)
+    parallel = FeatureLabelCorrelationChange(random_state=42, n_jobs=3).run(train_dataset, test_dataset)
+
+    assert_that(parallel.value, equal_to(sequential.value))
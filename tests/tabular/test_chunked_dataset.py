@@ -0,0 +1,118 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Tests for the chunked dataset."""
+import numpy as np
+import pandas as pd
+import pytest
+from hamcrest import assert_that, calling, equal_to, has_length, instance_of, raises
+
+from deepchecks.core import CheckResult
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.tabular import ChunkedDataset, Dataset, Suite
+from deepchecks.tabular.checks import (CategoryMismatchTrainTest, DominantFrequencyChange, IsSingleValue,
+                                       MixedDataTypes, MixedNulls, NewLabelTrainTest, SpecialCharacters,
+                                       TrainTestFeatureDrift)
+from deepchecks.tabular.utils.column_profile import ColumnProfile
+
+
+def _data(size, random_state):
+    rng = np.random.default_rng(random_state)
+    df = pd.DataFrame({
+        'numeric': rng.normal(size=size),
+        'dominant': rng.choice([0, 1, 2], size, p=[0.9, 0.05, 0.05] if random_state else [0.4, 0.3, 0.3]),
+        'category': rng.choice(['a', 'b', 'c', 'd', 'null'], size, p=[0.3, 0.3, 0.2, 0.1, 0.1]),
+        'single': 'x',
+        'label': rng.choice([0, 1, 2] if random_state else [0, 1], size),
+    })
+    df.loc[rng.random(size) < 0.1, 'category'] = np.nan
+    df.loc[rng.random(size) < 0.05, 'category'] = None
+    df['category'] = df['category'].astype(object)
+    df.loc[df.index[:20], 'category'] = 'e' if random_state else 'a'
+    return df
+
+
+def _chunks(df, chunk_size):
+    return [df.iloc[start:start + chunk_size].reset_index(drop=True) for start in range(0, len(df), chunk_size)]
+
+
+def _datasets(chunk_size=300, **kwargs):
+    train_df, test_df = _data(1000, 0), _data(900, 1)
+    dataset_kwargs = {'label': 'label', 'cat_features': ['dominant', 'category', 'single']}
+    train, test = Dataset(train_df, **dataset_kwargs), Dataset(test_df, **dataset_kwargs)
+    chunked_train = ChunkedDataset(_chunks(train_df, chunk_size), **dataset_kwargs, **kwargs)
+    chunked_test = ChunkedDataset(lambda: iter(_chunks(test_df, chunk_size)), **dataset_kwargs, **kwargs)
+    return train, test, chunked_train, chunked_test
+
+
+def test_chunked_dataset_sample():
+    train, _, chunked_train, _ = _datasets(sample_size=100)
+
+    assert_that(chunked_train.n_samples, equal_to(train.n_samples))
+    assert_that(chunked_train.sample.n_samples, equal_to(100))
+    # Sampled rows are indexed by their position in the whole data
+    assert_that(chunked_train.sample.data.equals(train.data.loc[chunked_train.sample.data.index]), equal_to(True))
+    assert_that(chunked_train.sample.cat_features, equal_to(train.cat_features))
+    assert_that([chunk.n_samples for chunk in chunked_train.iter_chunks()], equal_to([300, 300, 300, 100]))
+
+
+def test_chunked_dataset_smaller_than_sample():
+    train, _, chunked_train, _ = _datasets(chunk_size=70)
+    assert_that(chunked_train.sample.data.equals(train.data), equal_to(True))
+
+
+def test_chunked_dataset_with_iterator():
+    assert_that(calling(ChunkedDataset).with_args(iter(_chunks(_data(100, 0), 30))), raises(DeepchecksValueError))
+
+
+def test_streaming_checks_same_as_on_dataset():
+    train, test, chunked_train, chunked_test = _datasets(sample_size=100)
+
+    for check in (IsSingleValue(), MixedNulls(), SpecialCharacters(), MixedDataTypes()):
+        for dataset, chunked_dataset in ((train, chunked_train), (test, chunked_test)):
+            assert_that(repr(check.run(chunked_dataset).value), equal_to(repr(check.run(dataset).value)))
+
+    for check in (DominantFrequencyChange(), NewLabelTrainTest(), CategoryMismatchTrainTest()):
+        result = check.run(chunked_train, chunked_test)
+        expected = check.run(train, test)
+        assert_that(repr(result.value), equal_to(repr(expected.value)))
+
+
+def test_merged_column_profile_same_as_whole_column():
+    df = _data(1000, 0)
+
+    for column in df.columns:
+        profile = ColumnProfile.from_column(df[column])
+        merged = ColumnProfile.merge([ColumnProfile.from_column(chunk[column]) for chunk in _chunks(df, 300)])
+
+        assert_that(merged.value_counts.equals(profile.value_counts), equal_to(True))
+        assert_that(merged.null_counts, equal_to(profile.null_counts))
+        assert_that((merged.n_samples, merged.dtype), equal_to((profile.n_samples, profile.dtype)))
+
+
+def test_suite_on_chunked_datasets():
+    _, _, chunked_train, chunked_test = _datasets(sample_size=100)
+
+    result = Suite('test', TrainTestFeatureDrift(), MixedNulls()).run(chunked_train, chunked_test)
+
+    assert_that(result.results, has_length(3))
+    for check_result in result.results:
+        assert_that(check_result, instance_of(CheckResult))
+
+
+def test_chunked_dataset_from_parquet(tmp_path):
+    pytest.importorskip('pyarrow')
+    train_df = _data(1000, 0)
+    train_df.iloc[:600].to_parquet(tmp_path / 'part-0.parquet')
+    train_df.iloc[600:].to_parquet(tmp_path / 'part-1.parquet')
+
+    chunked_train = ChunkedDataset.from_parquet(str(tmp_path), batch_size=250, label='label')
+
+    assert_that(chunked_train.n_samples, equal_to(1000))
+    assert_that([chunk.n_samples for chunk in chunked_train.iter_chunks()], equal_to([250, 250, 100, 250, 150]))
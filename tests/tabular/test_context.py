@@ -0,0 +1,227 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Tests for the tabular context."""
+import os
+from unittest.mock import patch
+
+import numpy as np
+from hamcrest import assert_that, calling, close_to, equal_to, has_length, is_not, less_than_or_equal_to, raises
+
+from deepchecks.core import CheckResult, DatasetKind, ResultCache
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
+from deepchecks.tabular import Context
+from deepchecks.tabular.checks import (CalibrationScore, ConfusionMatrixReport, IsSingleValue, MixedDataTypes,
+                                       MixedNulls, PerformanceReport, RocReport, SimpleModelComparison,
+                                       SpecialCharacters, StringLengthOutOfBounds, StringMismatch,
+                                       TrainTestFeatureDrift, TrainTestLabelDrift)
+from deepchecks.tabular.suite import Suite
+from deepchecks.tabular.utils import feature_importance_store
+from deepchecks.tabular.utils.column_profile import ColumnProfile
+from deepchecks.utils import features
+
+
+class _CountingModel:
+    """Classifier wrapper counting the number of inference calls."""
+
+    def __init__(self, model):
+        self.model = model
+        self.predict_calls = 0
+        self.predict_proba_calls = 0
+        self.predicted_sizes = []
+
+    def predict(self, data):
+        self.predict_calls += 1
+        self.predicted_sizes.append(len(data))
+        return self.model.predict(data)
+
+    def predict_proba(self, data):
+        self.predict_proba_calls += 1
+        self.predicted_sizes.append(len(data))
+        return self.model.predict_proba(data)
+
+    @property
+    def classes_(self):
+        return self.model.classes_
+
+    def fit(self, *args, **kwargs):
+        pass
+
+
+def test_predictions_are_cached(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    model = _CountingModel(clf)
+    context = Context(train, test, model)
+    # Model validation runs a single predict on one sample
+    calls_after_validation = (context.model.predict_calls, context.model.predict_proba_calls)
+
+    first = context.get_predictions(DatasetKind.TEST)
+    second = context.get_predictions(DatasetKind.TEST)
+    probas = context.get_probabilities(DatasetKind.TEST)
+    context.get_probabilities(DatasetKind.TEST)
+
+    assert_that(first is second, equal_to(True))
+    assert_that(np.array_equal(first, clf.predict(test.features_columns)), equal_to(True))
+    assert_that(np.allclose(probas, clf.predict_proba(test.features_columns)), equal_to(True))
+    assert_that(model.predict_calls, equal_to(calls_after_validation[0] + 1))
+    assert_that(model.predict_proba_calls, equal_to(calls_after_validation[1] + 1))
+
+
+def test_static_predictions_are_used(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    y_pred_test = clf.predict(test.features_columns)
+    context = Context(train, test, y_pred_train=clf.predict(train.features_columns), y_pred_test=y_pred_test)
+
+    assert_that(np.array_equal(context.get_predictions(DatasetKind.TEST), y_pred_test), equal_to(True))
+    assert_that(calling(context.get_probabilities).with_args(DatasetKind.TEST),
+                raises(DeepchecksNotSupportedError))
+
+
+def test_scorer_with_cached_predictions(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    model = _CountingModel(clf)
+    context = Context(train, test, model)
+    scorers = context.get_scorers()
+    expected = [scorer(clf, test) for scorer in scorers]
+    predict_calls = model.predict_calls
+
+    scores = [scorer(model, test, **context.get_scorer_predictions(DatasetKind.TEST)) for scorer in scorers]
+
+    for score, expected_score in zip(scores, expected):
+        assert_that(score, close_to(expected_score, 1e-10))
+    # All scorers share a single inference over the test dataset
+    assert_that(model.predict_calls, equal_to(predict_calls + 1))
+
+
+def test_suite_runs_inference_once_per_dataset(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    model = _CountingModel(clf)
+    suite = Suite('test', ConfusionMatrixReport(), RocReport(), PerformanceReport())
+
+    suite.run(train, test, model)
+
+    # Apart from validations on a few samples, predict and predict_proba run once on each dataset
+    full_runs = [size for size in model.predicted_sizes if size in (len(train), len(test))]
+    assert_that(sorted(full_runs), equal_to(sorted([len(train), len(test)] * 2)))
+
+
+def test_suite_run_in_parallel_same_as_sequential(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    suite = Suite('test', ConfusionMatrixReport(), RocReport(), PerformanceReport(), SimpleModelComparison())
+
+    sequential = suite.run(train, test, clf)
+    model = _CountingModel(clf)
+    parallel = suite.run(train, test, model, n_jobs=2)
+
+    assert_that([result.get_header() for result in parallel.results],
+                equal_to([result.get_header() for result in sequential.results]))
+    for parallel_result, sequential_result in zip(parallel.results, sequential.results):
+        assert_that(isinstance(parallel_result, CheckResult), equal_to(True))
+        assert_that(isinstance(sequential_result, CheckResult), equal_to(True))
+    # Checks running concurrently still share a single inference on each dataset
+    full_runs = [size for size in model.predicted_sizes if size in (len(train), len(test))]
+    assert_that(sorted(full_runs), equal_to(sorted([len(train), len(test)] * 2)))
+
+
+def test_suite_run_with_invalid_n_jobs(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    suite = Suite('test', ConfusionMatrixReport())
+
+    for n_jobs in [0, -2, 1.5]:
+        assert_that(calling(suite.run).with_args(train, test, clf, n_jobs=n_jobs),
+                    raises(DeepchecksValueError, 'n_jobs must be -1 or a positive integer'))
+
+
+def test_check_run_without_display(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+
+    for check in (RocReport(), CalibrationScore(), ConfusionMatrixReport()):
+        with_display = check.run(test, clf)
+        without_display = check.run(test, clf, with_display=False)
+
+        assert_that(with_display.display, is_not(equal_to([])))
+        assert_that(without_display.display, equal_to([]))
+        assert_that(without_display.get_header(), equal_to(with_display.get_header()))
+        assert_that(repr(without_display.value), equal_to(repr(with_display.value)))
+
+
+def test_suite_run_without_display(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    suite = Suite('test', TrainTestFeatureDrift(), TrainTestLabelDrift(), PerformanceReport())
+
+    with_display = suite.run(train, test, clf)
+    without_display = suite.run(train, test, clf, with_display=False)
+
+    for result, expected in zip(without_display.results, with_display.results):
+        assert_that(result.display, equal_to([]))
+        assert_that(repr(result.value), equal_to(repr(expected.value)))
+
+
+def test_permutation_importance_is_stored(iris_split_dataset_and_model, tmp_path):
+    train, test, clf = iris_split_dataset_and_model
+    feature_importance_store.clear_memory_store()
+
+    with patch.object(features, '_calc_permutation_importance', wraps=features._calc_permutation_importance) as calc:
+        importance = Context(train, test, clf, feature_importance_force_permutation=True,
+                             feature_importance_cache=str(tmp_path)).features_importance
+        # A new context over a copy of the same data gets the importance from memory
+        from_memory = Context(train.copy(train.data.copy()), test.copy(test.data.copy()), clf,
+                              feature_importance_force_permutation=True).features_importance
+        # Another process gets it from the directory
+        feature_importance_store.clear_memory_store()
+        from_disk = Context(train, test, clf, feature_importance_force_permutation=True,
+                            feature_importance_cache=str(tmp_path)).features_importance
+
+    assert_that(calc.call_count, equal_to(1))
+    assert_that(os.listdir(tmp_path), has_length(1))
+    assert_that(from_memory.equals(importance), equal_to(True))
+    assert_that(from_disk.equals(importance), equal_to(True))
+
+
+def test_permutation_importance_store_key(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    feature_importance_store.clear_memory_store()
+
+    with patch.object(features, '_calc_permutation_importance', wraps=features._calc_permutation_importance) as calc:
+        Context(train, test, clf, feature_importance_force_permutation=True, model_version='1').features_importance
+        Context(train, test, clf, feature_importance_force_permutation=True, model_version='1').features_importance
+        Context(train, test, clf, feature_importance_force_permutation=True, model_version='2').features_importance
+        Context(train, train, clf, feature_importance_force_permutation=True, model_version='2').features_importance
+
+    assert_that(calc.call_count, equal_to(3))
+
+
+def test_stored_permutation_importance_is_evicted(iris_split_dataset_and_model, tmp_path):
+    train, test, clf = iris_split_dataset_and_model
+    feature_importance_store.clear_memory_store()
+    cache = ResultCache(tmp_path)
+    Context(train, test, clf, feature_importance_force_permutation=True, model_version='0',
+            feature_importance_cache=cache).features_importance
+    cache.max_size = cache.size * 2
+
+    for model_version in ('1', '2', '3'):
+        Context(train, test, clf, feature_importance_force_permutation=True, model_version=model_version,
+                feature_importance_cache=cache).features_importance
+
+    # The least recently used importance entries are evicted once the cache is full
+    assert_that(os.listdir(tmp_path), has_length(2))
+    assert_that(cache.size, less_than_or_equal_to(cache.max_size))
+
+
+def test_column_profiles_are_shared(iris_split_dataset_and_model):
+    train, test, clf = iris_split_dataset_and_model
+    suite = Suite('test', MixedNulls(), SpecialCharacters(), StringMismatch(), MixedDataTypes(), IsSingleValue(),
+                  StringLengthOutOfBounds())
+
+    with patch.object(ColumnProfile, 'from_column', wraps=ColumnProfile.from_column) as from_column:
+        suite.run(train, test, clf)
+
+    # Every column of each dataset is profiled once for all the checks
+    assert_that(from_column.call_count, equal_to(len(train.data.columns) + len(test.data.columns)))
@@ -0,0 +1,71 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+"""Tests for the reference profile of a dataset."""
+import io
+
+import pandas as pd
+from hamcrest import assert_that, calling, close_to, equal_to, raises
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.tabular import Dataset, ReferenceProfile
+from deepchecks.tabular.checks import DominantFrequencyChange, TrainTestFeatureDrift, WholeDatasetDrift
+
+
+def _assert_drift_values_equal(result, expected):
+    assert_that(list(result.keys()), equal_to(list(expected.keys())))
+    for column, value in expected.items():
+        assert_that(result[column]['Method'], equal_to(value['Method']))
+        assert_that(result[column]['Drift score'], close_to(value['Drift score'], 1e-12))
+
+
+def test_checks_on_profile_same_as_on_dataset(drifted_data):
+    train, test = drifted_data
+    profile = ReferenceProfile(train)
+
+    for check in (TrainTestFeatureDrift(), TrainTestFeatureDrift(categorical_drift_method='PSI')):
+        _assert_drift_values_equal(check.run(profile, test).value, check.run(train, test).value)
+    assert_that(repr(DominantFrequencyChange().run(profile, test).value),
+                equal_to(repr(DominantFrequencyChange().run(train, test).value)))
+    assert_that(WholeDatasetDrift().run(profile, test).value,
+                equal_to(WholeDatasetDrift().run(train, test).value))
+
+
+def test_sampled_profile(drifted_data):
+    train, test = drifted_data
+    profile = ReferenceProfile(train, sample_size=500)
+
+    assert_that(profile.sample.n_samples, equal_to(500))
+    assert_that(profile.n_samples, equal_to(train.n_samples))
+    # The drift is calculated on the same sample the check would have used, and value counts are of the whole data
+    _assert_drift_values_equal(TrainTestFeatureDrift(n_samples=500).run(profile, test).value,
+                               TrainTestFeatureDrift(n_samples=500).run(train, test).value)
+    assert_that(repr(DominantFrequencyChange(dominance_ratio=1).run(profile, test).value),
+                equal_to(repr(DominantFrequencyChange(dominance_ratio=1).run(train, test).value)))
+
+
+def test_save_and_load_profile(drifted_data):
+    train, test = drifted_data
+    file = io.BytesIO()
+    ReferenceProfile(train).save(file)
+    file.seek(0)
+
+    profile = ReferenceProfile.load(file)
+
+    assert_that(isinstance(profile.sample, Dataset), equal_to(True))
+    assert_that(pd.testing.assert_frame_equal(profile.sample.data, train.data), equal_to(None))
+    _assert_drift_values_equal(TrainTestFeatureDrift().run(profile, test).value,
+                               TrainTestFeatureDrift().run(train, test).value)
+
+
+def test_load_wrong_object():
+    file = io.BytesIO()
+    pd.DataFrame({'a': [1, 2, 3]}).to_pickle(file)
+    file.seek(0)
+    assert_that(calling(ReferenceProfile.load).with_args(file), raises(DeepchecksValueError))
@@ -10,10 +10,11 @@
 #
 """Test drift utils"""
 import numpy as np
+import pandas as pd
 from hamcrest import assert_that, calling, close_to, equal_to, raises
 
-from deepchecks.core.errors import DeepchecksValueError
-from deepchecks.utils.distribution.drift import earth_movers_distance
+from deepchecks.core.errors import DeepchecksValueError, NotEnoughSamplesError
+from deepchecks.utils.distribution.drift import calc_drift_and_plot, calc_drift_scores, earth_movers_distance, psi
 
 
 def test_emd():
@@ -53,3 +54,56 @@ def test_emd_raises_exception():
         calling(earth_movers_distance).with_args(dist1, dist2, -1),
         raises(DeepchecksValueError, r'margin_quantile_filter expected a value in range \[0, 0.5\), instead got -1')
     )
+
+
+def test_psi():
+    expected = np.array([0.5, 0.3, 0.2, 0])
+    actual = np.array([0.4, 0.4, 0.1, 0.1])
+    res = psi(expected, actual)
+    assert_that(res, close_to(0.1 * np.log(1.25) - 0.1 * np.log(0.75) + 0.1 * np.log(2) + 0.09 * np.log(10), 1e-10))
+
+
+def _drift_data(size, shift, random_state):
+    rng = np.random.default_rng(random_state)
+    data = pd.DataFrame({
+        'numeric': rng.normal(shift, 1, size),
+        'rounded': np.round(rng.normal(shift, 2, size)),
+        'with_nulls': rng.exponential(1 + shift, size),
+        'category': rng.choice(['a', 'b', 'c', 'd'], size, p=[0.4 - shift / 10, 0.3, 0.2, 0.1 + shift / 10]),
+        'many_categories': rng.integers(0, 20 + int(10 * shift), size),
+    })
+    data.loc[rng.random(size) < 0.1, 'with_nulls'] = np.nan
+    return data
+
+
+def test_drift_scores_same_as_single_columns():
+    train, test = _drift_data(1000, 0, 0), _drift_data(800, 0.5, 1)
+    column_types = {'numeric': 'numerical', 'rounded': 'numerical', 'with_nulls': 'numerical',
+                    'category': 'categorical', 'many_categories': 'categorical'}
+
+    for categorical_drift_method in ('cramer_v', 'PSI'):
+        for margin_quantile_filter in (0, 0.025):
+            scores = calc_drift_scores(train, test, column_types, margin_quantile_filter=margin_quantile_filter,
+                                       categorical_drift_method=categorical_drift_method)
+
+            assert_that(list(scores.keys()), equal_to(list(column_types.keys())))
+            for column, column_type in column_types.items():
+                score, method, _ = calc_drift_and_plot(train[column], test[column], column, column_type,
+                                                       margin_quantile_filter=margin_quantile_filter,
+                                                       categorical_drift_method=categorical_drift_method,
+                                                       with_display=False)
+                assert_that(scores[column][1], equal_to(method))
+                assert_that(scores[column][0], close_to(score, 1e-12))
+                if column_type == 'numerical':
+                    expected = earth_movers_distance(train[column].dropna().values, test[column].dropna().values,
+                                                     margin_quantile_filter)
+                    assert_that(scores[column][0], equal_to(expected))
+
+
+def test_drift_scores_not_enough_samples():
+    train, test = _drift_data(100, 0, 0), _drift_data(100, 0, 1)
+    assert_that(
+        calling(calc_drift_scores).with_args(train, test, {'numeric': 'numerical', 'with_nulls': 'numerical'},
+                                             min_samples=95),
+        raises(NotEnoughSamplesError)
+    )
@@ -9,11 +9,15 @@
 # ----------------------------------------------------------------------------
 #
 """Test metrics utils"""
-from hamcrest import assert_that, calling, equal_to, raises
+import numpy as np
+from hamcrest import assert_that, calling, close_to, equal_to, raises
+from sklearn.metrics import f1_score, fbeta_score, make_scorer, precision_score, recall_score, roc_auc_score
 from sklearn.svm import SVC
 
 from deepchecks.core.errors import DeepchecksValueError
-from deepchecks.utils.metrics import ModelType, task_type_check
+from deepchecks.utils.metrics import (DEFAULT_MULTICLASS_SCORERS, DEFAULT_REGRESSION_SCORERS,
+                                      MULTICLASS_SCORERS_NON_AVERAGE, DeepcheckScorer, ModelType, run_scorer_by_groups,
+                                      run_scorers, task_type_check)
 
 
 def test_task_type_check_binary(iris_dataset_single_class, iris_random_forest_single_class):
@@ -89,3 +93,73 @@ def test_task_type_check_class_with_no_proba(iris_dataset_single_class):
                        r'Model is a sklearn classification model \(a subclass of ClassifierMixin\), but lacks the'
                        r' predict_proba method. Please train the model with probability=True, or skip \/ ignore this'
                        r' check.'))
+
+
+def test_run_scorers_same_as_sklearn_scorers(iris_split_dataset_and_model):
+    _, test_ds, clf = iris_split_dataset_and_model
+    scorers = [DeepcheckScorer(scorer, name) for name, scorer in {
+        **MULTICLASS_SCORERS_NON_AVERAGE,
+        **DEFAULT_MULTICLASS_SCORERS,
+        'F2': make_scorer(fbeta_score, beta=2, average='macro'),
+        'AUC': make_scorer(roc_auc_score, needs_proba=True, multi_class='ovr'),
+        'Custom': lambda model, features, label: (model.predict(features) == label).mean()
+    }.items()]
+
+    scores = run_scorers(scorers, clf, test_ds)
+
+    for scorer, score in zip(scorers, scores):
+        expected = scorer.scorer(clf, test_ds.features_columns, test_ds.label_col)
+        assert_that(np.allclose(score, expected), equal_to(True))
+
+
+def test_run_scorers_with_predictions_and_null_labels(diabetes_split_dataset_and_model):
+    _, test_ds, clf = diabetes_split_dataset_and_model
+    data = test_ds.data.copy()
+    data.loc[data.index[:10], test_ds.label_name] = np.nan
+    test_ds = test_ds.copy(data)
+    valid_data = data[data[test_ds.label_name].notna()]
+    scorers = [DeepcheckScorer(scorer, name) for name, scorer in DEFAULT_REGRESSION_SCORERS.items()]
+    y_pred = clf.predict(test_ds.features_columns)
+
+    scores = run_scorers(scorers, clf, test_ds, y_pred=y_pred)
+
+    for scorer, score in zip(scorers, scores):
+        expected = scorer.scorer(clf, valid_data[test_ds.features], valid_data[test_ds.label_name])
+        assert_that(score, close_to(expected, 1e-10))
+
+
+def test_run_scorer_by_groups_same_as_scorer_per_group(diabetes_split_dataset_and_model):
+    _, test_ds, clf = diabetes_split_dataset_and_model
+    data = test_ds.data.copy()
+    data.loc[data.index[:10], test_ds.label_name] = np.nan
+    test_ds = test_ds.copy(data)
+    # The last group is empty, and some samples are in no group
+    groups = np.arange(len(data)) % 6 - 1
+    scorers = [DeepcheckScorer(scorer, name) for name, scorer in {
+        **DEFAULT_REGRESSION_SCORERS,
+        'R2': 'r2',
+        'Custom': lambda model, features, label: (model.predict(features) - label).abs().max()
+    }.items()]
+    y_pred = clf.predict(test_ds.features_columns)
+
+    for scorer in scorers:
+        scores = run_scorer_by_groups(scorer, clf, test_ds, groups, 6, y_pred=y_pred)
+
+        for group in range(5):
+            expected = scorer(clf, test_ds.copy(data[groups == group]))
+            assert_that(scores[group], close_to(expected, 1e-10))
+        assert_that(np.isnan(scores[5]), equal_to(True))
+
+
+def test_run_scorers_precision_recall_f1_default_average(iris_dataset_single_class, iris_random_forest_single_class):
+    scorers = [DeepcheckScorer(make_scorer(precision_score), 'Precision'),
+               DeepcheckScorer(make_scorer(recall_score), 'Recall'),
+               DeepcheckScorer(make_scorer(f1_score), 'F1')]
+
+    scores = run_scorers(scorers, iris_random_forest_single_class, iris_dataset_single_class)
+
+    for scorer, score in zip(scorers, scores):
+        expected = scorer.scorer(iris_random_forest_single_class, iris_dataset_single_class.features_columns,
+                                 iris_dataset_single_class.label_col)
+        assert_that(np.ndim(score), equal_to(0))
+        assert_that(score, close_to(expected, 1e-10))
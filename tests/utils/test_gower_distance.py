@@ -79,3 +79,19 @@ def test_compare_other_package_iris(iris_dataset):
     for i in range(data.shape[0]):
         closest_to_i = gower.gower_topn(data.iloc[i:i + 1, :4], data.iloc[:, :4], n=3)
         assert (closest_to_i['values'].round(5) == dist[i, :]).all()
+
+
+def test_nn_matrix_same_for_any_chunk_size():
+    # Arrange
+    data = pd.DataFrame({'col1': ['a', 'a', 'c', 'b', 'a', 'a', None, 'a', 'c', 'a', 'a', 'a', 'a', 'b'],
+                         'col2': [1, 2, 1, 7, 1, 1, None, 1, 3, 1, 5, 1, 1, 1000],
+                         'col3': [0.5, 0.1, None, 0.3, 0.2, 0.5, 0.9, 0.1, 0.1, 0.4, 0.3, 0.2, 0.7, 0.5]})
+    expected_dist, expected_idx = gower_distance.calculate_nearest_neighbours_distances(
+        data[['col1']], data[['col2', 'col3']], 4)
+    # Act
+    for chunk_size, n_jobs in [(1, 1), (30, 1), (30, 3)]:
+        dist, idx = gower_distance.calculate_nearest_neighbours_distances(
+            data[['col1']], data[['col2', 'col3']], 4, chunk_size=chunk_size, n_jobs=n_jobs)
+        # Assert
+        assert_that(np.allclose(dist, expected_dist, equal_nan=True))
+        assert_that((idx == expected_idx).all())
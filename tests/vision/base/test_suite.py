@@ -19,6 +19,7 @@ from torch.utils.data import DataLoader
 from deepchecks.core import CheckResult, DatasetKind
 from deepchecks.core.errors import DatasetValidationError, DeepchecksNotSupportedError, DeepchecksValueError
 from deepchecks.vision.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
+from deepchecks.vision.checks import ImageDatasetDrift, ImagePropertyDrift, ImagePropertyOutliers
 from deepchecks.vision.datasets.classification import mnist
 from deepchecks.vision.datasets.detection import coco
 from deepchecks.vision.suite import Suite
@@ -66,6 +67,90 @@ def test_suite_execution():
     assert_that(executions, is_({'initialize_run': 3, 'update': 8, 'compute': 3}))
 
 
+def test_suite_execution_in_parallel():
+    coco_dataset = coco.load_dataset(object_type='VisionData')
+    executions = defaultdict(int)
+    updated_batches = defaultdict(list)
+
+    class DummyCheck(SingleDatasetCheck):
+        def initialize_run(self, context, dataset_kind: DatasetKind):
+            executions["initialize_run"] += 1
+
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            updated_batches[dataset_kind].append(batch.batch_start_index)
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            executions["compute"] += 1
+            return CheckResult(len(updated_batches[dataset_kind]))
+
+    class DummyTrainTestCheck(TrainTestCheck):
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            raise DeepchecksValueError('bad update')
+
+        def compute(self, context) -> CheckResult:
+            executions["compute"] += 1
+            return CheckResult(1)
+
+    suite = Suite("test",
+                  DummyCheck(),
+                  DummyTrainTestCheck())
+    result = suite.run(train_dataset=coco_dataset, test_dataset=coco_dataset, n_jobs=2)
+
+    # Batches are still consumed in order, and the failing check is not updated again after its first failure
+    for dataset_kind in (DatasetKind.TRAIN, DatasetKind.TEST):
+        assert_that(updated_batches[dataset_kind], equal_to(sorted(updated_batches[dataset_kind])))
+        assert_that(len(updated_batches[dataset_kind]), equal_to(len(coco_dataset)))
+    assert_that(result.results[0].value, is_(len(coco_dataset)))
+    assert_that(result.results[2].exception, instance_of(DeepchecksValueError))
+    assert_that(executions, is_({'initialize_run': 2, 'compute': 2}))
+
+
+def test_suite_in_parallel_infers_only_for_checks_using_predictions(coco_train_visiondata,
+                                                                    mock_trained_yolov5_object_detection):
+    inferred_batches = []
+
+    class CountingModel:
+        def __call__(self, batch):
+            inferred_batches.append(len(batch))
+            return mock_trained_yolov5_object_detection(batch)
+
+        def to(self, device):  # pylint: disable=unused-argument
+            return self
+
+    suite = Suite('test', ImagePropertyOutliers())
+
+    sequential = suite.run(train_dataset=coco_train_visiondata, model=CountingModel())
+    sequential_inferred_batches = len(inferred_batches)
+    parallel = suite.run(train_dataset=coco_train_visiondata, model=CountingModel(), n_jobs=2)
+
+    assert_that(parallel.results[0], instance_of(CheckResult))
+    assert_that(parallel.results[0].value, equal_to(sequential.results[0].value))
+    # No check uses the predictions, so the batches are not inferred in the background
+    assert_that(len(inferred_batches) - sequential_inferred_batches, equal_to(sequential_inferred_batches))
+
+
+def test_suite_calculates_shared_properties_once_per_batch():
+    coco_dataset = coco.load_dataset(object_type='VisionData')
+    calls = defaultdict(int)
+
+    def brightness(images):
+        calls['brightness'] += 1
+        return [image.mean() for image in images]
+
+    properties = [{'name': 'Brightness', 'method': brightness, 'output_type': 'numerical'}]
+    suite = Suite('test',
+                  ImagePropertyOutliers(image_properties=properties),
+                  ImagePropertyDrift(image_properties=properties),
+                  ImageDatasetDrift(image_properties=properties))
+
+    result = suite.run(train_dataset=coco_dataset, test_dataset=coco_dataset)
+
+    for check_result in result.results:
+        assert_that(check_result, instance_of(CheckResult))
+    # One call per batch of each dataset, although three checks use the property
+    assert_that(calls['brightness'], equal_to(2 * len(coco_dataset)))
+
+
 def test_suite_execution_with_initalize_exeption():
     coco_dataset = coco.load_dataset(object_type='VisionData')
     executions = defaultdict(int)
@@ -13,7 +13,7 @@ from hamcrest import (all_of, any_of, assert_that, calling, close_to, contains_e
 from hamcrest.core.matcher import Matcher
 
 from deepchecks import CheckResult
-from deepchecks.core.errors import DeepchecksProcessError
+from deepchecks.core.errors import DeepchecksProcessError, DeepchecksValueError
 from deepchecks.vision.checks import ImagePropertyOutliers
 from deepchecks.vision.utils.image_properties import default_image_properties
 from tests.vision.vision_conftest import *
@@ -152,3 +152,29 @@ def test_property_with_nones(mnist_dataset_train, device):
             'upper_limit': is_(1)
         })
     }))
+
+
+def test_subclass_implementing_only_get_relevant_data(mnist_dataset_train, device):
+    # Arrange
+    class LegacyImagePropertyOutliers(ImagePropertyOutliers):
+        property_input_type = None
+
+        def get_relevant_data(self, batch):
+            return batch.images
+
+    # Act
+    result = LegacyImagePropertyOutliers().run(mnist_dataset_train, device=device)
+    expected = ImagePropertyOutliers().run(mnist_dataset_train, device=device)
+    # Assert
+    assert_that(result.value, equal_to(expected.value))
+
+
+def test_unknown_property_input_type_exception():
+    # Arrange
+    class WrongInputImagePropertyOutliers(ImagePropertyOutliers):
+        property_input_type = 'image'
+
+    # Act - Assert check raise exception
+    assert_that(calling(WrongInputImagePropertyOutliers),
+                raises(DeepchecksValueError, 'property_input_type must be one of images, labels or predictions, but '
+                                             'got image'))
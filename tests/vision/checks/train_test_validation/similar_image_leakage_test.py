@@ -10,6 +10,7 @@
 #
 """Test functions of the VISION train test label drift."""
 from copy import copy
+from itertools import product
 
 import numpy as np
 from hamcrest import assert_that, equal_to
@@ -17,6 +18,7 @@ from PIL import Image
 from torch.utils.data import DataLoader
 
 from deepchecks.vision.checks import SimilarImageLeakage
+from deepchecks.vision.checks.train_test_validation.similar_image_leakage import _find_first_similar, _pack_hashes
 from deepchecks.vision.utils.test_utils import get_modified_dataloader
 from tests.base.utils import equal_condition_result
 
@@ -123,3 +125,29 @@ def test_train_test_condition_fail(coco_train_visiondata, coco_test_visiondata,
         name=f'Number of similar images between train and test is not greater than {condition_value}',
         details='Number of similar images between train and test datasets: 64'
     ))
+
+
+def test_hash_lookup_same_as_pairwise_comparison():
+    # Arrange
+    random = np.random.RandomState(42)
+    train = random.rand(300, 8, 8) > 0.5
+    test = random.rand(200, 8, 8) > 0.5
+    test[:50] = train[random.randint(0, 300, 50)] ^ (random.rand(50, 8, 8) < 0.05)
+    train[100:110] = train[5]
+    distances = (test.reshape(200, 1, -1) != train.reshape(1, 300, -1)).sum(axis=2)
+    train_hashes, test_hashes = _pack_hashes(list(train), 8), _pack_hashes(list(test), 8)
+
+    for max_distance in range(8):
+        is_similar = distances <= max_distance
+        expected_test = np.flatnonzero(is_similar.any(axis=1))
+        expected_train = is_similar[expected_test].argmax(axis=1)
+        # A small block size splits the test hashes into many blocks, and makes the lookup fall back to comparing
+        # all pairs on blocks with too many candidates
+        for use_multi_index, block_size in product((False, True), (1000, 64)):
+            # Act
+            test_indices, train_indices = _find_first_similar(train_hashes, test_hashes, max_distance, 64,
+                                                              use_multi_index=use_multi_index,
+                                                              block_size=block_size)
+            # Assert
+            assert_that(test_indices.tolist(), equal_to(expected_test.tolist()))
+            assert_that(train_indices.tolist(), equal_to(expected_train.tolist()))
@@ -8,9 +8,12 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
-from hamcrest import assert_that, close_to, has_items, has_length
+import numpy as np
+import torch
+from hamcrest import assert_that, close_to, equal_to, has_items, has_length
 
 from deepchecks.vision import VisionData
+from deepchecks.vision.metrics_utils.iou_utils import jaccard_iou, jaccard_iou_matrix
 from deepchecks.vision.metrics_utils.metrics import calculate_metrics
 from deepchecks.vision.metrics_utils.object_detection_precision_recall import ObjectDetectionAveragePrecision
 
@@ -60,3 +63,36 @@ def test_equal_pycocotools(coco_test_visiondata: VisionData, mock_trained_yolov5
     assert_that(metric.get_classes_scores_at(res['recall'], area='large', max_dets=100, get_mean_val=False,
                 zeroed_negative=False), has_items([-1]))
     assert_that(metric.get_classes_scores_at(res['recall'], get_mean_val=False, zeroed_negative=False), has_items([-1]))
+
+
+def test_iou_matrix_same_as_single_ious():
+    random = np.random.RandomState(42)
+    detected = [np.append(random.uniform(0, 50, 4), [0.5, 0]).astype(np.float32) for _ in range(7)]
+    ground_truth = [np.insert(random.uniform(0, 50, 4).astype(np.float32), 0, 0) for _ in range(5)]
+    ground_truth.append(np.insert(detected[0][:4], 0, 0))
+
+    ious = jaccard_iou_matrix(detected, ground_truth)
+
+    expected = [[jaccard_iou(dt, gt) for gt in ground_truth] for dt in detected]
+    assert_that(ious.tolist(), equal_to(np.array(expected, dtype=np.float64).tolist()))
+    assert_that(jaccard_iou_matrix([], ground_truth).shape, equal_to((0, 6)))
+
+
+def test_ap_max_detections_same_as_separately():
+    random = np.random.RandomState(42)
+    ground_truth = torch.tensor(np.column_stack([random.randint(0, 2, 30), random.uniform(0, 200, (30, 2)),
+                                                 random.uniform(5, 120, (30, 2))]), dtype=torch.float32)
+    detected = torch.tensor(np.column_stack([ground_truth[:, 1:].numpy() + random.normal(0, 4, (30, 4)),
+                                             random.rand(30), ground_truth[:, 0].numpy()]), dtype=torch.float32)
+
+    metric = ObjectDetectionAveragePrecision(return_option=None, max_dets=(1, 5, 100))
+    metric.update(([detected], [ground_truth]))
+    res = metric.compute()[0]
+
+    for dets_i, max_dets in enumerate((1, 5, 100)):
+        single_metric = ObjectDetectionAveragePrecision(return_option=None, max_dets=(max_dets,))
+        single_metric.update(([detected], [ground_truth]))
+        single_res = single_metric.compute()[0]
+        for key in ('precision', 'recall'):
+            assert_that(np.array_equal(res[key][:, :, dets_i], single_res[key][:, :, 0], equal_nan=True),
+                        equal_to(True))
@@ -9,10 +9,11 @@
 # ----------------------------------------------------------------------------
 #
 # pylint: disable=inconsistent-quotes, redefined-builtin
-from hamcrest import assert_that, calling, raises
+import numpy as np
+from hamcrest import assert_that, calling, close_to, contains_exactly, equal_to, is_, raises
 
 from deepchecks.core.errors import DeepchecksValueError
-from deepchecks.vision.utils.image_properties import default_image_properties
+from deepchecks.vision.utils.image_properties import calculate_default_properties, default_image_properties
 from deepchecks.vision.utils.image_properties import validate_properties as validate_image_properties
 from deepchecks.vision.utils.label_prediction_properties import DEFAULT_OBJECT_DETECTION_LABEL_PROPERTIES
 from deepchecks.vision.utils.label_prediction_properties import \
@@ -23,6 +24,25 @@ def test_image_properties_validation():
     validate_image_properties(default_image_properties)
 
 
+def test_default_properties_calculated_together_same_as_separately():
+    random = np.random.RandomState(42)
+    shapes = [(32, 40, 3)] * 5 + [(20, 20, 1)] * 3 + [(10, 12, 3), (5, 5, 3)]
+    batch = [random.randint(0, 256, shape).astype('uint8') for shape in shapes]
+    batch[-1][:] = 0
+
+    properties = calculate_default_properties(batch)
+
+    assert_that(list(properties.keys()), contains_exactly(*[prop['name'] for prop in default_image_properties]))
+    for prop in default_image_properties:
+        expected = prop['method'](batch)
+        assert_that(len(properties[prop['name']]), equal_to(len(batch)))
+        for value, expected_value in zip(properties[prop['name']], expected):
+            if expected_value is None:
+                assert_that(value, is_(None))
+            else:
+                assert_that(value, close_to(expected_value, 1e-10))
+
+
 def test_image_properties_validation_with_instance_of_incorrect_type_provided():
     assert_that(
         calling(validate_image_properties).with_args(object()),